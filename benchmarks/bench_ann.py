@@ -0,0 +1,113 @@
+# Recall@k and query latency of the IVF index against exact search.
+
+# Synthetic corpus: concept vectors drawn around shared "topic" centres,
+# so neighbourhoods look like real embedding clusters.
+
+# Usage:
+#   python -m benchmarks.bench_ann --candidates 20000 --concepts 25
+
+import argparse
+import json
+import time
+
+import numpy as np
+
+from resume_intelligence.core.retrieval.ann import IVFIndex
+from resume_intelligence.core.semantics.concept import (
+    Concept,
+    ConceptSource,
+    ConceptType,
+)
+
+_TYPES = [ConceptType.SKILL, ConceptType.TOOL, ConceptType.PRACTICE]
+
+
+def _clustered(rng, n, dim, centres, spread):
+    picks = centres[rng.integers(0, len(centres), n)]
+    vectors = picks + spread * rng.standard_normal((n, dim), dtype=np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def _concepts(rng, n, source):
+    return [
+        Concept(
+            text=f"concept {i}",
+            confidence=0.8,
+            sentences=["synthetic"],
+            source=source,
+            type=_TYPES[rng.integers(0, len(_TYPES))],
+        )
+        for i in range(n)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--candidates", type=int, default=20_000)
+    parser.add_argument("--concepts", type=int, default=25)
+    parser.add_argument("--jd-concepts", type=int, default=30)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--topics", type=int, default=500)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--probes", type=int, nargs="+", default=[1, 4, 8, 16, 32])
+    parser.add_argument("--top-n", type=int, default=50)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    centres = rng.standard_normal((args.topics, args.dim), dtype=np.float32)
+    centres /= np.linalg.norm(centres, axis=1, keepdims=True)
+
+    index = IVFIndex()
+    start = time.perf_counter()
+    for c in range(args.candidates):
+        index.add(
+            f"cand-{c}",
+            _concepts(rng, args.concepts, ConceptSource.RESUME),
+            _clustered(rng, args.concepts, args.dim, centres, 0.05),
+        )
+    index.build()
+    build_seconds = time.perf_counter() - start
+
+    jd_concepts = _concepts(rng, args.jd_concepts, ConceptSource.JD)
+    jd_vectors = _clustered(rng, args.jd_concepts, args.dim, centres, 0.05)
+
+    start = time.perf_counter()
+    exact = index.rank_candidates(
+        jd_concepts, jd_vectors, top_n=args.top_n, n_probe=len(index.centroids)
+    )
+    exact_seconds = time.perf_counter() - start
+    exact_ids = {r.candidate_id for r in exact}
+
+    report = {
+        "rows": len(index),
+        "lists": len(index.centroids),
+        "build_seconds": round(build_seconds, 2),
+        "exact_rank_seconds": round(exact_seconds, 4),
+        "probes": [],
+    }
+
+    for n_probe in args.probes:
+        start = time.perf_counter()
+        ranked = index.rank_candidates(
+            jd_concepts, jd_vectors, top_n=args.top_n, n_probe=n_probe
+        )
+        seconds = time.perf_counter() - start
+
+        report["probes"].append({
+            "n_probe": n_probe,
+            f"recall@{args.k}": round(
+                index.recall_at_k(jd_vectors, k=args.k, n_probe=n_probe), 4
+            ),
+            f"candidate_overlap@{args.top_n}": round(
+                len(exact_ids & {r.candidate_id for r in ranked})
+                / max(len(exact_ids), 1),
+                4,
+            ),
+            "rank_seconds": round(seconds, 4),
+        })
+
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+# Latency under concurrent load: AsyncPipeline vs running the blocking
+# pipeline naively with asyncio.to_thread, on DOCX resumes.
+
+# Requests arrive open-loop (Poisson, --rate per second); latency is
+# measured from arrival to result. The simulated model
+# (benchmarks/common.py) has a fixed cost per call plus a per-text cost
+# and runs one call at a time, like a single loaded model. The facade runs twice: with its embedding cache disabled, and with the
+# default cache, which is safe to share because only the model thread
+# touches it. The naive calls hit the model directly, as the blocking API
+# does.
+
+# Usage:
+#   python -m benchmarks.bench_async --requests 200 --rate 5
+
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import tempfile
+import time
+
+import numpy as np
+
+from benchmarks.common import SimulatedModel
+from benchmarks.corpus import jd_text, resume_text, write_docx, write_txt
+from resume_intelligence.core.async_pipeline import AsyncPipeline
+from resume_intelligence.core.matching.ats_score import compute_ats_score
+from resume_intelligence.core.matching.embedder import CachedEmbedder
+from resume_intelligence.core.matching.matcher import ConceptMatcher
+from resume_intelligence.core.pipeline import analyze_file
+from resume_intelligence.core.semantics.concept import ConceptSource
+
+
+def _naive_match(model, resume_path: str, jd_path: str):
+    jd_concepts = analyze_file(jd_path, ConceptSource.JD)
+    resume_concepts = analyze_file(resume_path, ConceptSource.RESUME)
+    results = ConceptMatcher(model).match(jd_concepts, resume_concepts)
+    return compute_ats_score(jd_concepts, results), results
+
+
+async def _load(call, paths, jd_path, rate, seed):
+    rng = np.random.default_rng(seed)
+    gaps = rng.exponential(1.0 / rate, size=len(paths))
+    latencies = []
+
+    async def one(path):
+        arrival = time.perf_counter()
+        await call(path, jd_path)
+        latencies.append(time.perf_counter() - arrival)
+
+    start = time.perf_counter()
+    tasks = []
+    for path, gap in zip(paths, gaps):
+        await asyncio.sleep(gap)
+        tasks.append(asyncio.ensure_future(one(path)))
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - start
+
+    ms = np.array(latencies) * 1000
+    return {
+        "p50_ms": round(float(np.percentile(ms, 50)), 1),
+        "p99_ms": round(float(np.percentile(ms, 99)), 1),
+        "max_ms": round(float(ms.max()), 1),
+        "throughput_per_s": round(len(paths) / elapsed, 2),
+    }
+
+
+async def _naive(model, paths, jd_path, rate):
+    async def call(path, jd):
+        return await asyncio.to_thread(_naive_match, model, path, jd)
+
+    return await _load(call, paths, jd_path, rate, seed=1)
+
+
+async def _facade(model, paths, jd_path, rate, workers, cache):
+    embedder = model if cache else CachedEmbedder(model, max_entries=0)
+    async with AsyncPipeline(embedder, extract_workers=workers) as pipeline:
+        async def call(path, jd):
+            return await pipeline.match_files(path, jd)
+
+        stats = await _load(call, paths, jd_path, rate, seed=1)
+        stats["requests_per_model_call"] = round(
+            pipeline.batcher.requests / max(pipeline.batcher.model_calls, 1), 2
+        )
+        return stats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--rate", type=float, default=5.0)
+    parser.add_argument("--sentences", type=int, default=30)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    # Roughly a small sentence-transformer on CPU
+    parser.add_argument("--call-ms", type=float, default=10.0)
+    parser.add_argument("--text-ms", type=float, default=0.3)
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp(prefix="ri-async-")
+    try:
+        jd_path = os.path.join(directory, "jd.txt")
+        write_txt(jd_path, jd_text(0, 0, args.sentences // 2))
+
+        paths = []
+        for i in range(args.requests):
+            path = os.path.join(directory, f"resume_{i:04d}.docx")
+            write_docx(path, resume_text(0, i, args.sentences))
+            paths.append(path)
+
+        naive_model = SimulatedModel(args.call_ms, args.text_ms)
+        naive = asyncio.run(_naive(naive_model, paths, jd_path, args.rate))
+        naive["model_calls"] = naive_model.calls
+
+        facades = {}
+        for name, cache in (("async_pipeline_no_cache", False), ("async_pipeline", True)):
+            model = SimulatedModel(args.call_ms, args.text_ms)
+            facades[name] = asyncio.run(
+                _facade(model, paths, jd_path, args.rate, args.workers, cache)
+            )
+            facades[name]["model_calls"] = model.calls
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    print(json.dumps({
+        "requests": args.requests,
+        "rate_per_s": args.rate,
+        "extract_workers": args.workers,
+        "naive_threads": naive,
+        **facades,
+        "p99_speedup": {
+            name: round(naive["p99_ms"] / stats["p99_ms"], 2)
+            for name, stats in facades.items()
+        },
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
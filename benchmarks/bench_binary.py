@@ -0,0 +1,106 @@
+# Binary-quantized index: memory per million concepts, query latency and
+# bucket agreement with exact (full float32) scoring.
+
+# Usage:
+#   python -m benchmarks.bench_binary --candidates 20000 --concepts 25
+
+import argparse
+import json
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from resume_intelligence.core.matching.matcher import (
+    PARTIAL_MATCH_THRESHOLD,
+    STRONG_MATCH_THRESHOLD,
+)
+from resume_intelligence.core.retrieval.binary import BinaryIndex
+from resume_intelligence.core.semantics.concept import ConceptSource
+from benchmarks.bench_ann import _clustered, _concepts
+
+
+def _bucket(score: float) -> str:
+    if score >= STRONG_MATCH_THRESHOLD:
+        return "matched"
+    if score >= PARTIAL_MATCH_THRESHOLD:
+        return "partial"
+    return "missing"
+
+
+def _buckets(hits, n_jd):
+    return {
+        (candidate, j): _bucket(float(entry.scores[j]))
+        for candidate, entry in hits.items()
+        for j in range(n_jd)
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--candidates", type=int, default=20_000)
+    parser.add_argument("--concepts", type=int, default=25)
+    parser.add_argument("--jd-concepts", type=int, default=30)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--topics", type=int, default=500)
+    parser.add_argument("--survivors", type=int, nargs="+", default=[256, 1024, 4096])
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    centres = rng.standard_normal((args.topics, args.dim), dtype=np.float32)
+    centres /= np.linalg.norm(centres, axis=1, keepdims=True)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        index = BinaryIndex(os.path.join(tmp, "vectors.f32"), dim=args.dim)
+        for c in range(args.candidates):
+            index.add(
+                f"cand-{c}",
+                _concepts(rng, args.concepts, ConceptSource.RESUME),
+                _clustered(rng, args.concepts, args.dim, centres, 0.05),
+            )
+
+        rows = len(index)
+        jd_concepts = _concepts(rng, args.jd_concepts, ConceptSource.JD)
+        jd_vectors = _clustered(rng, args.jd_concepts, args.dim, centres, 0.05)
+
+        start = time.perf_counter()
+        exact = index.candidate_hits(jd_concepts, jd_vectors, n_survivors=rows)
+        exact_seconds = time.perf_counter() - start
+        exact_buckets = _buckets(exact, args.jd_concepts)
+
+        report = {
+            "rows": rows,
+            "resident_mb_per_million": round(
+                index.memory_bytes() / rows * 1e6 / 2 ** 20, 1
+            ),
+            "float32_mb_per_million": round(args.dim * 4 * 1e6 / 2 ** 20, 1),
+            "exact_seconds": round(exact_seconds, 4),
+            "survivors": [],
+        }
+
+        for n_survivors in args.survivors:
+            start = time.perf_counter()
+            hits = index.candidate_hits(
+                jd_concepts, jd_vectors, n_survivors=n_survivors
+            )
+            seconds = time.perf_counter() - start
+
+            approx_buckets = _buckets(hits, args.jd_concepts)
+            keys = set(exact_buckets) | set(approx_buckets)
+            agree = sum(
+                exact_buckets.get(k, "missing") == approx_buckets.get(k, "missing")
+                for k in keys
+            )
+
+            report["survivors"].append({
+                "n_survivors": n_survivors,
+                "query_seconds": round(seconds, 4),
+                "bucket_agreement": round(agree / max(len(keys), 1), 4),
+            })
+
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+# Per-call latency of `match` through the CLI: cold (a fresh process does
+# everything) vs warm (a fresh CLI process forwarding to the daemon), plus
+# the bare socket round trip.
+
+# Both paths start a new interpreter per call, so start-up and import
+# costs are included. The default offline embedder leaves out the model
+# load; pass --embedder "" to measure with the real model.
+
+# Usage:
+#   python -m benchmarks.bench_daemon --calls 10
+#   python -m benchmarks.bench_daemon --embedder ""
+
+import argparse
+import importlib
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from resume_intelligence.app.daemon import DaemonClient
+
+
+def _summary(seconds):
+    ms = sorted(s * 1000 for s in seconds)
+    return {
+        "median_ms": round(statistics.median(ms), 1),
+        "p90_ms": round(ms[int(0.9 * (len(ms) - 1))], 1),
+        "min_ms": round(ms[0], 1),
+    }
+
+
+def _cli_call(resume, jd, embedder, daemon):
+    if daemon:
+        command = [sys.executable, "-m", "resume_intelligence.app.cli", "match", resume, jd, "--daemon"]
+    elif embedder:
+        command = [
+            sys.executable, "-m", "benchmarks.bench_daemon",
+            "--cli-call", resume, jd, "--embedder", embedder,
+        ]
+    else:
+        command = [sys.executable, "-m", "resume_intelligence.app.cli", "match", resume, jd]
+
+    start = time.perf_counter()
+    subprocess.run(command, check=True, stdout=subprocess.DEVNULL)
+    return time.perf_counter() - start
+
+
+def _run_cli(resume, jd, embedder):
+    # Child side of a cold call: the real CLI with the offline embedder
+    # swapped in
+    from resume_intelligence.app import cli
+    from resume_intelligence.core.matching import matcher
+
+    module_name, _, class_name = embedder.partition(":")
+    matcher.ConceptEmbedder = getattr(importlib.import_module(module_name), class_name)
+
+    cli.app(["match", resume, jd], standalone_mode=False)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=10)
+    parser.add_argument("--sentences", type=int, default=30)
+    parser.add_argument("--embedder", default="benchmarks.common:HashingEmbedder")
+    parser.add_argument("--cli-call", nargs=2, metavar=("RESUME", "JD"))
+    args = parser.parse_args()
+
+    if args.cli_call:
+        _run_cli(*args.cli_call, args.embedder)
+        return
+
+    from benchmarks.corpus import jd_text, resume_text, write_txt
+
+    directory = tempfile.mkdtemp(prefix="ri-bench-")
+    socket_path = os.path.join(directory, "d.sock")
+    os.environ["RESUME_INTELLIGENCE_SOCKET"] = socket_path
+
+    resume = os.path.join(directory, "resume.txt")
+    jd = os.path.join(directory, "jd.txt")
+    write_txt(resume, resume_text(0, 0, args.sentences))
+    write_txt(jd, jd_text(0, 0, args.sentences // 2))
+
+    try:
+        cold = [_cli_call(resume, jd, args.embedder, False) for _ in range(args.calls)]
+
+        # Started directly (not via the CLI) to pass the embedder through
+        start = time.perf_counter()
+        command = [
+            sys.executable, "-m", "resume_intelligence.app.daemon",
+            "--socket", socket_path, "--idle-timeout", "120",
+        ]
+        if args.embedder:
+            command += ["--embedder", args.embedder]
+        subprocess.Popen(command, start_new_session=True)
+
+        client = DaemonClient(socket_path)
+        while not client.is_running():
+            time.sleep(0.05)
+        startup = time.perf_counter() - start
+
+        warm = [_cli_call(resume, jd, args.embedder, True) for _ in range(args.calls)]
+
+        body = {"resume": {"path": resume}, "jd": {"path": jd}}
+        round_trips = []
+        for _ in range(args.calls):
+            start = time.perf_counter()
+            client.request("/match", body)
+            round_trips.append(time.perf_counter() - start)
+
+        client.request("/shutdown")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    cold_summary, warm_summary = _summary(cold), _summary(warm)
+    print(json.dumps({
+        "calls": args.calls,
+        "embedder": args.embedder or "default model",
+        "cold_cli": cold_summary,
+        "warm_cli": warm_summary,
+        "socket_round_trip": _summary(round_trips),
+        "daemon_startup_ms": round(startup * 1000, 1),
+        "warm_speedup": round(cold_summary["median_ms"] / warm_summary["median_ms"], 2),
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
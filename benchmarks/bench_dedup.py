@@ -0,0 +1,67 @@
+# MinHash LSH near-duplicate grouping: clustering time, cluster sizes and
+# pipeline compute saved on a corpus with injected near-duplicates.
+
+# Usage:
+#   python -m benchmarks.bench_dedup --resumes 2000 --duplicate-rate 0.3
+
+import argparse
+import json
+import time
+
+import numpy as np
+
+from benchmarks.corpus import experience_line, resume_text
+from resume_intelligence.core.dedup import NearDuplicateIndex, run_deduplicated
+from resume_intelligence.core.document import Document
+from resume_intelligence.core.normalizer import normalize_document
+from resume_intelligence.core.pipeline import analyze_text
+from resume_intelligence.core.semantics.concept import ConceptSource
+
+
+def _edited(rng: np.random.Generator, text: str) -> str:
+    # One sentence rewritten: a typical re-application
+    lines = text.split("\n")
+    lines[rng.integers(len(lines))] = experience_line(rng)
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--resumes", type=int, default=2000)
+    parser.add_argument("--sentences", type=int, default=20)
+    parser.add_argument("--duplicate-rate", type=float, default=0.3)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    texts = []
+    for i in range(args.resumes):
+        if texts and rng.random() < args.duplicate_rate:
+            texts.append(_edited(rng, texts[rng.integers(len(texts))]))
+        else:
+            texts.append(resume_text(0, i, args.sentences))
+
+    documents = {}
+    for i, text in enumerate(texts):
+        doc = Document(raw_text=text)
+        normalize_document(doc)
+        documents[i] = doc
+
+    start = time.perf_counter()
+    index = NearDuplicateIndex()
+    for doc_id, doc in documents.items():
+        index.add(doc_id, doc)
+    cluster_seconds = time.perf_counter() - start
+
+    _, report = run_deduplicated(
+        documents,
+        lambda doc: analyze_text(doc.raw_text, ConceptSource.RESUME),
+        index=index,
+    )
+
+    result = report.as_dict()
+    result["cluster_seconds"] = round(cluster_seconds, 3)
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
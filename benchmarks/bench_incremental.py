@@ -0,0 +1,89 @@
+# Per-edit latency: AnalysisSession vs a full re-analysis, for one-
+# sentence edits to a resume, as in an editor re-scoring on every change.
+
+# Both sides use the same simulated model (fixed cost per call plus a
+# per-text cost). The full path re-embeds everything, as the CLI does;
+# the session only embeds concept texts it hasn't seen.
+
+# Usage:
+#   python -m benchmarks.bench_incremental --edits 50 --sentences 80
+
+import argparse
+import json
+import time
+
+import numpy as np
+
+from benchmarks.common import SimulatedModel
+from benchmarks.corpus import experience_line, jd_text, resume_text
+from resume_intelligence.core.incremental import AnalysisSession
+from resume_intelligence.core.matching.ats_score import compute_ats_score
+from resume_intelligence.core.matching.matcher import ConceptMatcher
+from resume_intelligence.core.pipeline import analyze_text
+from resume_intelligence.core.semantics.concept import ConceptSource
+
+
+def _full(model, resume, jd):
+    jd_concepts = analyze_text(jd, ConceptSource.JD)
+    resume_concepts = analyze_text(resume, ConceptSource.RESUME)
+    results = ConceptMatcher(model).match(jd_concepts, resume_concepts)
+    return compute_ats_score(jd_concepts, results)
+
+
+def _stats(seconds):
+    ms = np.array(seconds) * 1000
+    return {
+        "p50_ms": round(float(np.percentile(ms, 50)), 2),
+        "p99_ms": round(float(np.percentile(ms, 99)), 2),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--edits", type=int, default=50)
+    parser.add_argument("--sentences", type=int, default=80)
+    parser.add_argument("--call-ms", type=float, default=10.0)
+    parser.add_argument("--text-ms", type=float, default=0.3)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    jd = jd_text(0, 0, args.sentences // 2)
+    lines = resume_text(0, 0, args.sentences).split("\n")
+
+    # Each edit rewrites one sentence somewhere in the resume
+    versions = []
+    for _ in range(args.edits):
+        lines[int(rng.integers(len(lines)))] = experience_line(rng)
+        versions.append("\n".join(lines))
+
+    model = SimulatedModel(args.call_ms, args.text_ms)
+    session = AnalysisSession(model)
+    session.update(resume_text=versions[0], jd_text=jd)
+
+    full, incremental, reextracted, embedded = [], [], [], []
+    for text in versions[1:]:
+        start = time.perf_counter()
+        expected = _full(model, text, jd)
+        full.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        update = session.update(resume_text=text)
+        incremental.append(time.perf_counter() - start)
+
+        assert update.ats_score == expected
+        reextracted.append(update.resume.reextracted_sentences)
+        embedded.append(update.texts_embedded)
+
+    print(json.dumps({
+        "edits": len(versions) - 1,
+        "resume_sentences": args.sentences,
+        "full": _stats(full),
+        "incremental": _stats(incremental),
+        "mean_sentences_reextracted": round(float(np.mean(reextracted)), 2),
+        "mean_texts_embedded": round(float(np.mean(embedded)), 2),
+        "p50_speedup": round(float(np.median(full) / np.median(incremental)), 2),
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+# Inverted concept index as a pre-filter: recall of the full semantic
+# top-N inside the pre-selected pool, pool size and ranking time.
+
+# Usage:
+#   python -m benchmarks.bench_inverted --resumes 2000 --pool 200
+
+import argparse
+import json
+import os
+import tempfile
+import time
+
+from benchmarks.common import HashingEmbedder
+from benchmarks.corpus import jd_text, write_resumes
+from resume_intelligence.core.corpus.indexer import CorpusIndexer
+from resume_intelligence.core.corpus.store import CorpusStore
+from resume_intelligence.core.pipeline import analyze_text
+from resume_intelligence.core.retrieval.inverted import InvertedConceptIndex
+from resume_intelligence.core.semantics.concept import ConceptSource
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--resumes", type=int, default=2000)
+    parser.add_argument("--sentences", type=int, default=20)
+    parser.add_argument("--top-n", type=int, default=20)
+    parser.add_argument("--pool", type=int, nargs="+", default=[50, 200, 500])
+    parser.add_argument("--dim", type=int, default=384)
+    args = parser.parse_args()
+
+    embedder = HashingEmbedder(args.dim)
+    jd_concepts = analyze_text(
+        jd_text(99, 0, 12), ConceptSource.JD
+    )
+    jd_vectors = embedder.embed_texts([c.text for c in jd_concepts])
+
+    with tempfile.TemporaryDirectory() as tmp:
+        folder = os.path.join(tmp, "resumes")
+        os.makedirs(folder)
+        write_resumes(folder, args.resumes, args.sentences)
+
+        with CorpusStore(os.path.join(tmp, "store")) as store:
+            CorpusIndexer(store, embedder).index(folder)
+
+            start = time.perf_counter()
+            inverted = InvertedConceptIndex.from_store(store)
+            build_seconds = time.perf_counter() - start
+
+            start = time.perf_counter()
+            full = store.rank_candidates(jd_concepts, jd_vectors, top_n=args.top_n)
+            full_seconds = time.perf_counter() - start
+            truth = {r.candidate_id for r in full}
+
+            report = {
+                "resumes": args.resumes,
+                "terms": len(inverted.terms),
+                "build_seconds": round(build_seconds, 3),
+                "full_rank_seconds": round(full_seconds, 4),
+                "pools": [],
+            }
+
+            for pool in args.pool:
+                start = time.perf_counter()
+                selected = [c for c, _ in inverted.preselect(jd_concepts, limit=pool)]
+                ranked = store.rank_candidates(
+                    jd_concepts, jd_vectors, top_n=args.top_n, resume_ids=selected
+                )
+                seconds = time.perf_counter() - start
+
+                report["pools"].append({
+                    "pool": len(selected),
+                    "pool_fraction": round(len(selected) / args.resumes, 4),
+                    f"recall@{args.top_n}": round(
+                        len(truth & {r.candidate_id for r in ranked})
+                        / max(len(truth), 1),
+                        4,
+                    ),
+                    "prefilter_rank_seconds": round(seconds, 4),
+                })
+
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+# Throughput and memory of the staged Pipeline vs matching one resume at
+# a time (parse → analyze → match, as the match command does), on PDF
+# resumes from the synthetic corpus.
+
+# Pipeline runs parse, analyze, embed and match concurrently, so the
+# model thread works while the next resumes are still being parsed. The model is the simulated one
+# from benchmarks/common.py (fixed cost per call plus per text, all sleep).
+
+# Memory: the pipeline runs twice, over N and 4 × N resumes (the corpus
+# cycled), and reports RSS growth during each run. With backpressure the
+# growth should not scale with the input length.
+
+# Usage:
+#   python -m benchmarks.bench_pipeline --resumes 100 --workers 2
+
+import argparse
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from itertools import islice, cycle
+
+from benchmarks.common import SimulatedModel
+from benchmarks.corpus import build_corpus
+from resume_intelligence.core.instrumentation import rss_bytes
+from resume_intelligence.core.matching.ats_score import compute_ats_score
+from resume_intelligence.core.matching.embedder import CachedEmbedder
+from resume_intelligence.core.matching.matcher import ConceptMatcher
+from resume_intelligence.core.orchestrator import Pipeline
+from resume_intelligence.core.pipeline import analyze_file
+from resume_intelligence.core.semantics.concept import ConceptSource
+
+
+class _RssPeak:
+    # Highest RSS seen while the block runs, sampled every 5 ms
+
+    def __enter__(self):
+        self.start = self.peak = rss_bytes() or 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(0.005):
+            self.peak = max(self.peak, rss_bytes() or 0)
+
+    @property
+    def growth_mb(self) -> float:
+        return round((self.peak - self.start) / 2**20, 1)
+
+
+def _sequential(paths, jd_concepts, embedder):
+    matcher = ConceptMatcher(CachedEmbedder(embedder))
+    for path in paths:
+        results = matcher.match(jd_concepts, analyze_file(path, ConceptSource.RESUME))
+        yield compute_ats_score(jd_concepts, results)
+
+
+def _timed(rows, n):
+    start = time.perf_counter()
+    count = sum(1 for _ in rows)
+    elapsed = time.perf_counter() - start
+    assert count == n
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--resumes", type=int, default=100)
+    parser.add_argument("--size", default="medium")
+    parser.add_argument("--workers", type=int, default=max(1, (os.cpu_count() or 1) - 1))
+    parser.add_argument("--batch-size", type=int, default=16)
+    parser.add_argument("--call-ms", type=float, default=10.0)
+    parser.add_argument("--text-ms", type=float, default=0.3)
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp(prefix="ri-pipeline-")
+    try:
+        corpus = build_corpus(directory, args.resumes, args.size, ["pdf"])
+        paths = corpus.resumes["pdf"]
+        jd_concepts = analyze_file(corpus.jd_path, ConceptSource.JD)
+
+        sequential_seconds = _timed(
+            _sequential(paths, jd_concepts, SimulatedModel(args.call_ms, args.text_ms)),
+            len(paths),
+        )
+
+        staged = {}
+        with Pipeline(
+            jd_concepts,
+            SimulatedModel(args.call_ms, args.text_ms),
+            parse_workers=max(1, args.workers // 2),
+            analyze_workers=max(1, args.workers - args.workers // 2),
+            batch_size=args.batch_size,
+        ) as pipeline:
+            for scale in (1, 4):
+                n = scale * len(paths)
+                pipeline.report.wall_seconds = 0.0
+                with _RssPeak() as rss:
+                    seconds = _timed(pipeline.run(islice(cycle(paths), n)), n)
+                staged[f"{scale}x"] = {
+                    "resumes": n,
+                    "resumes_per_second": round(n / seconds, 2),
+                    "rss_growth_mb": rss.growth_mb,
+                }
+            report = pipeline.report.as_dict()
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    print(json.dumps({
+        "resumes": args.resumes,
+        "workers": args.workers,
+        "sequential_per_second": round(len(paths) / sequential_seconds, 2),
+        "pipeline": staged,
+        "speedup": round(
+            staged["1x"]["resumes_per_second"] * sequential_seconds / len(paths), 2
+        ),
+        "max_in_flight": pipeline.max_in_flight,
+        "utilisation": {
+            name: stats["utilisation"] for name, stats in report["stages"].items()
+        },
+        "bottleneck": report["bottleneck"],
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
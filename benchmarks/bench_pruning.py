@@ -0,0 +1,93 @@
+# Upper-bound pruning for top-K ranking: fraction of resumes skipped and
+# time saved versus scoring every stored resume, with exactness checked.
+
+# Synthetic corpus: each candidate works in one "field" and its concept
+# vectors sit around that field's topic centres, so a JD is close to a
+# minority of the store, as with real embeddings.
+
+# Usage:
+#   python -m benchmarks.bench_pruning --resumes 5000 --top-n 1 10 50
+
+import argparse
+import json
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from benchmarks.bench_ann import _clustered, _concepts
+from resume_intelligence.core.corpus.store import CorpusStore
+from resume_intelligence.core.semantics.concept import ConceptSource
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--resumes", type=int, default=5000)
+    parser.add_argument("--concepts", type=int, default=40)
+    parser.add_argument("--jd-concepts", type=int, default=30)
+    parser.add_argument("--fields", type=int, default=20)
+    parser.add_argument("--topics-per-field", type=int, default=10)
+    parser.add_argument("--spread", type=float, default=0.02)
+    parser.add_argument("--top-n", type=int, nargs="+", default=[1, 10, 50])
+    parser.add_argument("--dim", type=int, default=384)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    centres = rng.standard_normal(
+        (args.fields, args.topics_per_field, args.dim), dtype=np.float32
+    )
+    centres /= np.linalg.norm(centres, axis=2, keepdims=True)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        with CorpusStore(os.path.join(tmp, "store")) as store:
+            for i in range(args.resumes):
+                field = centres[rng.integers(args.fields)]
+                store.add_resume(
+                    f"cand-{i:06d}",
+                    _concepts(rng, args.concepts, ConceptSource.RESUME),
+                    _clustered(rng, args.concepts, args.dim, field, args.spread),
+                )
+
+            jd_concepts = _concepts(rng, args.jd_concepts, ConceptSource.JD)
+            jd_vectors = _clustered(
+                rng, args.jd_concepts, args.dim, centres[0], args.spread
+            )
+
+            start = time.perf_counter()
+            store.candidate_bounds()
+            bounds_seconds = time.perf_counter() - start
+
+            report = {
+                "resumes": args.resumes,
+                "stored_concepts": store.rows,
+                "bounds_build_seconds": round(bounds_seconds, 3),
+                "runs": [],
+            }
+
+            for top_n in args.top_n:
+                start = time.perf_counter()
+                exact = store.rank_candidates(jd_concepts, jd_vectors, top_n=top_n)
+                exact_seconds = time.perf_counter() - start
+
+                start = time.perf_counter()
+                pruned, prune_report = store.rank_candidates_pruned(
+                    jd_concepts, jd_vectors, top_n=top_n
+                )
+                pruned_seconds = time.perf_counter() - start
+
+                report["runs"].append({
+                    "top_n": top_n,
+                    "exact_seconds": round(exact_seconds, 4),
+                    "pruned_seconds": round(pruned_seconds, 4),
+                    "identical": [
+                        (r.candidate_id, r.ats_score) for r in exact
+                    ] == [(r.candidate_id, r.ats_score) for r in pruned],
+                    **prune_report.as_dict(),
+                })
+
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+# Interactive latency under bulk load: ScoringService with the priority
+# scheduler vs holding the model for a whole ranking job.
+
+# Bulk clients post /rank jobs of --rank-size resumes back to back while
+# interactive /match requests arrive open-loop (Poisson, --rate per
+# second). Latency is measured from arrival to response. "no_preemption"
+# sets rank_batch to the job size, so a ranking holds the model from
+# start to finish, as the service did before the scheduler. The model is
+# the simulated one from benchmarks/common.py (all sleep), and documents are
+# inline text, parsed in threads.
+
+# Usage:
+#   python -m benchmarks.bench_scheduler --seconds 20 --rate 5 --bulk-clients 2
+
+import argparse
+import json
+import threading
+import time
+
+import numpy as np
+
+from benchmarks.common import SimulatedModel
+from benchmarks.corpus import jd_text, resume_text
+from resume_intelligence.app.service import ScoringService
+
+
+def _run(args, rank_batch: int) -> dict:
+    service = ScoringService(
+        SimulatedModel(args.call_ms, args.text_ms),
+        workers=0,
+        max_concurrent=args.bulk_clients + 64,
+        timeout=120.0,
+        rank_batch=rank_batch,
+    )
+    jd = {"text": jd_text(0, 0, 20)}
+    stop = threading.Event()
+    bulk_resumes = []
+
+    def bulk(client: int) -> None:
+        job = 0
+        while not stop.is_set():
+            # Fresh resumes per job, so the embedding cache can't absorb it
+            resumes = [
+                {"id": str(i), "text": resume_text(client * 1000 + job, i, 20)}
+                for i in range(args.rank_size)
+            ]
+            service.handle("POST", "/rank", {"jd": jd, "resumes": resumes})
+            bulk_resumes.append(len(resumes))
+            job += 1
+
+    latencies = []
+
+    def interactive(index: int) -> None:
+        arrival = time.perf_counter()
+        service.handle("POST", "/match", {
+            "resume": {"text": resume_text(999_999, index, 20)}, "jd": jd,
+        })
+        latencies.append(time.perf_counter() - arrival)
+
+    try:
+        workers = [
+            threading.Thread(target=bulk, args=(c,), daemon=True)
+            for c in range(args.bulk_clients)
+        ]
+        for thread in workers:
+            thread.start()
+        time.sleep(1.0)  # let the bulk jobs get going
+
+        rng = np.random.default_rng(0)
+        requests = []
+        start = time.perf_counter()
+        index = 0
+        while time.perf_counter() - start < args.seconds:
+            time.sleep(rng.exponential(1.0 / args.rate))
+            thread = threading.Thread(target=interactive, args=(index,))
+            thread.start()
+            requests.append(thread)
+            index += 1
+        for thread in requests:
+            thread.join()
+        elapsed = time.perf_counter() - start
+
+        stop.set()
+        for thread in workers:
+            thread.join()
+        scheduler = service.scheduler.as_dict()
+    finally:
+        service.close()
+
+    ms = np.array(latencies) * 1000
+    return {
+        "interactive_requests": len(latencies),
+        "interactive_p50_ms": round(float(np.percentile(ms, 50)), 1),
+        "interactive_p99_ms": round(float(np.percentile(ms, 99)), 1),
+        "bulk_resumes_per_second": round(sum(bulk_resumes) / elapsed, 1),
+        "scheduler": {
+            name: {
+                key: stats[key]
+                for key in ("granted", "peak_queued", "wait_p50_ms", "wait_p99_ms", "busy_seconds_total")
+            }
+            for name, stats in scheduler.items()
+        },
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seconds", type=float, default=20.0)
+    parser.add_argument("--rate", type=float, default=5.0)
+    parser.add_argument("--bulk-clients", type=int, default=2)
+    parser.add_argument("--rank-size", type=int, default=200)
+    parser.add_argument("--rank-batch", type=int, default=16)
+    parser.add_argument("--call-ms", type=float, default=10.0)
+    parser.add_argument("--text-ms", type=float, default=0.3)
+    args = parser.parse_args()
+
+    baseline = _run(args, rank_batch=args.rank_size)
+    scheduled = _run(args, rank_batch=args.rank_batch)
+
+    print(json.dumps({
+        "rate_per_s": args.rate,
+        "bulk_clients": args.bulk_clients,
+        "rank_size": args.rank_size,
+        "no_preemption": baseline,
+        "scheduled": scheduled,
+        "interactive_p99_speedup": round(
+            baseline["interactive_p99_ms"] / scheduled["interactive_p99_ms"], 2
+        ),
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
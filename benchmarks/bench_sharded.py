@@ -0,0 +1,135 @@
+# Scatter-gather ranking: query latency as the corpus is split over more
+# shards, with the merged top-N checked against one unsharded store.
+
+# The corpus is bench_pruning's (candidates clustered by field). For each
+# shard count the store is partitioned afresh and ShardedRanker runs
+# --queries JDs (one per field, cycled) after a warm-up query.
+
+# wall_p50_ms is measured on this machine, where every shard shares its
+# CPUs; critical_path_p50_ms is the slowest shard's CPU time per query,
+# i.e. the latency with one node per shard (plus network). The last row
+# repeats the largest shard count with one shard stopped, to show the
+# partial-result path: the deadline bounds latency, and coverage drops.
+
+# Usage:
+#   python -m benchmarks.bench_sharded --resumes 8000 --shards 1 2 4 8
+
+import argparse
+import json
+import os
+import signal
+import tempfile
+
+import numpy as np
+
+from benchmarks.bench_ann import _clustered, _concepts
+from resume_intelligence.core.corpus.sharded import ShardedRanker, partition_store
+from resume_intelligence.core.corpus.store import CorpusStore
+from resume_intelligence.core.semantics.concept import ConceptSource
+
+
+def _ranked(candidates):
+    return [(c.candidate_id, c.ats_score) for c in candidates]
+
+
+def _run(directories, jds, expected, top_n, timeout, stall=False) -> dict:
+    walls, critical, resumes = [], [], []
+    exact = True
+
+    with ShardedRanker(directories, timeout=timeout) as ranker:
+        # Cold shards build their pruning bounds; don't hold them to the deadline
+        ranker.rank(*jds[0], top_n=top_n, timeout=600.0)
+        if stall:
+            os.kill(ranker.shard_pids()[0], signal.SIGSTOP)
+        try:
+            for (jd_concepts, jd_vectors), truth in zip(jds, expected):
+                ranking = ranker.rank(jd_concepts, jd_vectors, top_n=top_n)
+                walls.append(ranking.seconds)
+                critical.append(max(ranking.shard_cpu_seconds.values(), default=0.0))
+                resumes.append(ranking.resumes)
+                exact &= ranking.complete and _ranked(ranking.candidates) == truth
+        finally:
+            if stall:
+                os.kill(ranker.shard_pids()[0], signal.SIGCONT)
+        missing = ranking.missing
+
+    return {
+        "shards": len(directories),
+        "wall_p50_ms": round(float(np.percentile(walls, 50)) * 1000, 2),
+        "wall_p99_ms": round(float(np.percentile(walls, 99)) * 1000, 2),
+        "critical_path_p50_ms": round(float(np.percentile(critical, 50)) * 1000, 2),
+        "resumes_covered": int(np.mean(resumes)),
+        "exact": exact,
+        "missing": {str(k): v for k, v in missing.items()},
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--resumes", type=int, default=8000)
+    parser.add_argument("--concepts", type=int, default=40)
+    parser.add_argument("--jd-concepts", type=int, default=30)
+    parser.add_argument("--fields", type=int, default=20)
+    parser.add_argument("--topics-per-field", type=int, default=10)
+    parser.add_argument("--spread", type=float, default=0.02)
+    parser.add_argument("--shards", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--top-n", type=int, default=10)
+    parser.add_argument("--timeout", type=float, default=2.0)
+    parser.add_argument("--dim", type=int, default=384)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    centres = rng.standard_normal(
+        (args.fields, args.topics_per_field, args.dim), dtype=np.float32
+    )
+    centres /= np.linalg.norm(centres, axis=2, keepdims=True)
+
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        with CorpusStore(os.path.join(tmp, "store")) as store:
+            for i in range(args.resumes):
+                field = centres[rng.integers(args.fields)]
+                store.add_resume(
+                    f"cand-{i:06d}",
+                    _concepts(rng, args.concepts, ConceptSource.RESUME),
+                    _clustered(rng, args.concepts, args.dim, field, args.spread),
+                )
+
+            jds = [
+                (
+                    _concepts(rng, args.jd_concepts, ConceptSource.JD),
+                    _clustered(
+                        rng, args.jd_concepts, args.dim,
+                        centres[q % args.fields], args.spread,
+                    ),
+                )
+                for q in range(args.queries)
+            ]
+            expected = [
+                _ranked(store.rank_candidates_pruned(c, v, args.top_n)[0])
+                for c, v in jds
+            ]
+
+            for n_shards in args.shards:
+                directories = partition_store(
+                    store, os.path.join(tmp, f"shards-{n_shards}"), n_shards
+                )
+                rows.append(_run(directories, jds, expected, args.top_n, args.timeout))
+
+            if max(args.shards) > 1:
+                rows.append(dict(
+                    _run(directories, jds, expected, args.top_n, args.timeout, stall=True),
+                    stalled_shard=0,
+                ))
+
+    print(json.dumps({
+        "resumes": args.resumes,
+        "cpus": os.cpu_count(),
+        "timeout_s": args.timeout,
+        "runs": rows,
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+# Memory per ranking worker: corpus embeddings in shared memory vs a
+# private copy in every worker.
+
+# copy   → each worker receives the matrix and row tables pickled
+#          through its initializer (a spawn pool, as on macOS/Windows; a
+#          fork pool would share the parent's pages copy-on-write)
+# shared → SharedRanker: one published snapshot, workers attach to it
+
+# Both rank the same JD over the same store. Per worker the benchmark
+# reads /proc/<pid>/smaps_rollup after a query: RSS counts shared pages
+# in every process that touched them, PSS splits them between those
+# processes, and private bytes are the worker's own. Linux only.
+
+# Usage:
+#   python -m benchmarks.bench_shared --resumes 4000 --concepts 40 --workers 4
+
+import argparse
+import json
+import multiprocessing
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List
+
+import numpy as np
+
+from benchmarks.common import HashingEmbedder
+from resume_intelligence.core.corpus.shared import SharedRanker
+from resume_intelligence.core.corpus.store import CorpusStore, prepare_jd, score_rows
+from resume_intelligence.core.retrieval.ann import merge_hits
+from resume_intelligence.core.semantics.concept import Concept, ConceptSource, ConceptType
+
+
+_TYPES = [ConceptType.SKILL, ConceptType.TOOL, ConceptType.PRACTICE]
+
+_copy = None
+
+
+def _init_copy(pids, embeddings, row_types, row_resumes):
+    global _copy
+    pids.put(os.getpid())
+    _copy = (embeddings, row_types, row_resumes)
+
+
+def _score_copy(jd, threshold, block_rows, start, end):
+    return score_rows(*_copy, jd, threshold, block_rows, start=start, end=end)
+
+
+def _memory(pid: int) -> Dict[str, float]:
+    fields = {}
+    with open(f"/proc/{pid}/smaps_rollup", encoding="ascii") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == "kB":
+                fields[parts[0].rstrip(":")] = int(parts[1]) * 1024
+    private = fields.get("Private_Clean", 0) + fields.get("Private_Dirty", 0)
+    return {
+        "rss_mb": fields.get("Rss", 0) / 2**20,
+        "pss_mb": fields.get("Pss", 0) / 2**20,
+        "private_mb": private / 2**20,
+    }
+
+
+def _summary(pids: List[int]) -> Dict:
+    per_worker = [_memory(pid) for pid in pids]
+    return {
+        key: round(float(np.mean([w[key] for w in per_worker])), 1)
+        for key in ("rss_mb", "pss_mb", "private_mb")
+    } | {
+        "started": len(per_worker),
+        "total_pss_mb": round(sum(w["pss_mb"] for w in per_worker), 1),
+    }
+
+
+def _concept(text: str, concept_type: ConceptType, source: ConceptSource) -> Concept:
+    return Concept(text=text, confidence=0.8, sentences=[text], source=source, type=concept_type)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--resumes", type=int, default=4000)
+    parser.add_argument("--concepts", type=int, default=40)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--block-rows", type=int, default=16384)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    embedder = HashingEmbedder(args.dim)
+    jd_concepts = [
+        _concept(f"jd concept {i}", _TYPES[i % 3], ConceptSource.JD) for i in range(20)
+    ]
+    jd_vectors = embedder.embed_texts([c.text for c in jd_concepts])
+
+    with tempfile.TemporaryDirectory() as tmp, CorpusStore(tmp, embedder.model_name) as store:
+        for i in range(args.resumes):
+            concepts = [
+                _concept(f"concept {i} {j}", _TYPES[j % 3], ConceptSource.RESUME)
+                for j in range(args.concepts)
+            ]
+            store.add_resume(
+                f"r{i:06d}", concepts,
+                rng.standard_normal((args.concepts, args.dim)).astype(np.float32),
+            )
+        matrix_mb = store.embeddings.nbytes / 2**20
+
+        with SharedRanker(store, args.workers, args.block_rows) as ranker:
+            start = time.perf_counter()
+            expected = ranker.rank_candidates(jd_concepts, jd_vectors, top_n=20)
+            shared_seconds = time.perf_counter() - start
+            shared = _summary(ranker.worker_pids())
+            ranges = ranker._ranges(store.rows)
+
+        row_types, row_resumes = store._row_table()
+        arrays = (np.array(store.embeddings), row_types, row_resumes)
+        spawn = multiprocessing.get_context("spawn")
+        pids = spawn.SimpleQueue()
+        start = time.perf_counter()
+        with ProcessPoolExecutor(
+            args.workers,
+            mp_context=spawn,
+            initializer=_init_copy,
+            initargs=(pids,) + arrays,
+        ) as pool:
+            jd = prepare_jd(jd_concepts, jd_vectors)
+            hits = {}
+            futures = [
+                pool.submit(_score_copy, jd, 0.55, args.block_rows, a, b) for a, b in ranges
+            ]
+            for future in futures:
+                merge_hits(hits, future.result())
+            copied = store.rank_hits(jd_concepts, store.name_hits(hits), 20)
+            copy_seconds = time.perf_counter() - start
+            copy_pids = []
+            while not pids.empty():
+                copy_pids.append(pids.get())
+            copy = _summary(copy_pids)
+        del arrays
+
+    assert copied == expected
+
+    print(json.dumps({
+        "rows": args.resumes * args.concepts,
+        "matrix_mb": round(matrix_mb, 1),
+        "workers": args.workers,
+        "copy_per_worker": copy,
+        "shared_per_worker": shared,
+        "copy_first_query_seconds": round(copy_seconds, 3),
+        "shared_first_query_seconds": round(shared_seconds, 3),
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
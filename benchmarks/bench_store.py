@@ -0,0 +1,88 @@
+# Re-ranking a corpus for a new JD: full pipeline per resume versus the
+# persistent corpus store (JD processing + similarity only).
+
+# Usage:
+#   python -m benchmarks.bench_store --resumes 500
+
+import argparse
+import json
+import os
+import tempfile
+import time
+
+from benchmarks.common import HashingEmbedder
+from benchmarks.corpus import jd_text, write_resumes
+from resume_intelligence.core.corpus.store import CorpusStore
+from resume_intelligence.core.matching.ats_score import compute_ats_score
+from resume_intelligence.core.matching.matcher import ConceptMatcher
+from resume_intelligence.core.pipeline import analyze_file, analyze_text
+from resume_intelligence.core.semantics.concept import ConceptSource
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--resumes", type=int, default=500)
+    parser.add_argument("--sentences", type=int, default=40)
+    parser.add_argument("--dim", type=int, default=384)
+    args = parser.parse_args()
+
+    embedder = HashingEmbedder(args.dim)
+    jd = jd_text(99, 0, 15)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        corpus_dir = os.path.join(tmp, "resumes")
+        os.makedirs(corpus_dir)
+        paths = write_resumes(corpus_dir, args.resumes, args.sentences)["txt"]
+
+        # Without the store: every stage for every resume
+        start = time.perf_counter()
+        jd_concepts = analyze_text(jd, ConceptSource.JD)
+        matcher = ConceptMatcher(embedder)
+        baseline = {}
+        for path in paths:
+            resume_concepts = analyze_file(path, ConceptSource.RESUME)
+            results = matcher.match(jd_concepts, resume_concepts)
+            baseline[os.path.basename(path)] = compute_ats_score(jd_concepts, results)
+        without_store = time.perf_counter() - start
+
+        # One-off ingest into the store
+        start = time.perf_counter()
+        with CorpusStore(os.path.join(tmp, "store"), embedder.model_name) as store:
+            for path in paths:
+                concepts = analyze_file(path, ConceptSource.RESUME)
+                store.add_resume(
+                    os.path.basename(path),
+                    concepts,
+                    embedder.embed_texts([c.text for c in concepts]),
+                    path=path,
+                )
+        ingest = time.perf_counter() - start
+
+        # With the store: JD processing + similarity only
+        start = time.perf_counter()
+        with CorpusStore(os.path.join(tmp, "store")) as store:
+            jd_concepts = analyze_text(jd, ConceptSource.JD)
+            jd_vectors = embedder.embed_texts([c.text for c in jd_concepts])
+            ranked = store.rank_candidates(
+                jd_concepts, jd_vectors, top_n=args.resumes
+            )
+            rows = store.rows
+        with_store = time.perf_counter() - start
+
+        mismatches = sum(
+            baseline[r.candidate_id] != r.ats_score for r in ranked
+        )
+
+    print(json.dumps({
+        "resumes": args.resumes,
+        "stored_concepts": rows,
+        "rerank_without_store_seconds": round(without_store, 3),
+        "store_ingest_seconds": round(ingest, 3),
+        "rerank_with_store_seconds": round(with_store, 3),
+        "speedup": round(without_store / with_store, 1),
+        "ats_mismatches": mismatches,
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
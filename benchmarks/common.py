@@ -0,0 +1,68 @@
+# Offline embedders shared by the benchmarks and the test suite, so both
+# run on the same data model without downloading one. Synthetic documents
+# come from benchmarks/corpus.py.
+
+import hashlib
+import threading
+import time
+from typing import List
+
+import numpy as np
+
+
+class HashingEmbedder:
+    """
+    Deterministic hashed bag-of-words embedder, L2-normalized.
+
+    Texts sharing words get positive similarity, identical texts get 1.0.
+    Counts calls and texts embedded, for cache and batching checks.
+    """
+
+    model_name = "hashing-bow"
+
+    def __init__(self, dim: int = 384):
+        self.dim = dim
+        self.calls = 0
+        self.texts_embedded = 0
+
+    def embed_texts(self, texts: List[str]) -> List[List[float]]:
+        self.calls += 1
+        self.texts_embedded += len(texts)
+        return self._hash(texts)
+
+    def _hash(self, texts: List[str]) -> List[List[float]]:
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for i, text in enumerate(texts):
+            for token in text.split():
+                digest = hashlib.md5(token.encode("utf-8")).digest()
+                vectors[i, int.from_bytes(digest[:4], "little") % self.dim] += 1.0
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return (vectors / norms).tolist()
+
+
+class SimulatedModel(HashingEmbedder):
+    """
+    HashingEmbedder with the latency of a loaded model: a fixed cost per
+    call plus a cost per text, one call at a time. The cost is all sleep,
+    so like torch on its own cores or a GPU it releases the GIL and uses
+    no host CPU; vectors are memoized only to keep the hashing stand-in
+    out of the measurement.
+    """
+
+    def __init__(self, call_ms: float, text_ms: float):
+        super().__init__()
+        self.call_ms = call_ms
+        self.text_ms = text_ms
+        self._lock = threading.Lock()
+        self._memo = {}
+
+    def embed_texts(self, texts):
+        with self._lock:
+            self.calls += 1
+            self.texts_embedded += len(texts)
+            time.sleep((self.call_ms + self.text_ms * len(texts)) / 1000)
+
+            missing = [t for t in dict.fromkeys(texts) if t not in self._memo]
+            self._memo.update(zip(missing, self._hash(missing)))
+            return [self._memo[t] for t in texts]
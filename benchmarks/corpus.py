@@ -0,0 +1,283 @@
+# Deterministic synthetic resumes and job descriptions, as TXT, DOCX or
+# PDF, for benchmarks that must run offline and repeat exactly.
+
+# The same (seed, index, sentences) always yields the same text, and the
+# same text yields the same file bytes for TXT and PDF (DOCX embeds a
+# timestamp, so only its text is stable). Documents use the layout the
+# normalizer sees in practice: a contact header, section headings,
+# bulleted experience lines and a comma-separated skills line.
+
+# Usage:
+#   python -m benchmarks.corpus OUT_DIR --resumes 100 --size medium --formats txt,docx,pdf
+
+import argparse
+import json
+import os
+from dataclasses import dataclass
+from typing import Dict, List
+
+import numpy as np
+from docx import Document as DocxDocument
+
+
+SKILLS = [
+    "api integration", "state management", "unit testing", "data analysis",
+    "machine learning", "system design", "code review", "performance tuning",
+    "query optimization", "access control", "incident response",
+    "continuous integration", "stream processing", "feature engineering",
+    "load balancing", "schema design", "test automation", "capacity planning",
+]
+
+TOOLS = [
+    "python", "docker", "kubernetes", "postgresql", "redis", "kafka",
+    "terraform", "react", "flutter", "spark", "airflow", "jenkins",
+    "grafana", "elasticsearch", "aws", "gcp",
+]
+
+VERBS = [
+    "built", "developed", "implemented", "designed", "optimized", "tested",
+    "deployed", "integrated", "reviewed", "automated", "migrated", "led",
+]
+
+OBJECTS = [
+    "backend services", "data pipelines", "mobile apps", "internal tools",
+    "payment flows", "search features", "monitoring dashboards",
+    "deployment pipelines", "reporting jobs", "microservices",
+]
+
+ROLES = [
+    "software engineer", "backend engineer", "data engineer",
+    "mobile developer", "platform engineer", "machine learning engineer",
+]
+
+# (resume sentences, JD sentences)
+SIZES: Dict[str, tuple] = {
+    "small": (20, 8),
+    "medium": (60, 20),
+    "large": (200, 40),
+}
+
+FORMATS = ("txt", "docx", "pdf")
+
+
+def _pick(rng: np.random.Generator, items: List[str], n: int) -> List[str]:
+    return [items[i] for i in rng.choice(len(items), size=n, replace=False)]
+
+
+def experience_line(rng: np.random.Generator) -> str:
+    """
+    One bulleted experience sentence, as resume_text writes them.
+    """
+    skill, tool = _pick(rng, SKILLS, 1)[0], _pick(rng, TOOLS, 1)[0]
+    return (
+        f"• {VERBS[int(rng.integers(len(VERBS)))].capitalize()} "
+        f"{OBJECTS[int(rng.integers(len(OBJECTS)))]} using {tool} "
+        f"with a focus on {skill}."
+    )
+
+
+def resume_text(seed: int, index: int, sentences: int) -> str:
+    """
+    Synthetic resume with about ``sentences`` content sentences.
+    """
+    rng = np.random.default_rng([seed, index, 0])
+    role = ROLES[int(rng.integers(len(ROLES)))]
+
+    lines = [
+        f"Candidate {index:06d}",
+        f"candidate{index:06d}@example.com | +1 555 {index % 10_000:04d}",
+        "",
+        "SUMMARY",
+        f"{role.capitalize()} with {int(rng.integers(2, 15))} years of experience "
+        f"in {' and '.join(_pick(rng, SKILLS, 2))}.",
+        "",
+        "EXPERIENCE",
+    ]
+
+    for i in range(max(sentences - 2, 1)):
+        if i % 6 == 0:
+            lines.append(f"Company {int(rng.integers(1000))} - {role} ({2010 + i % 12}-{2012 + i % 12})")
+        lines.append(experience_line(rng))
+
+    lines += ["", "SKILLS", ", ".join(_pick(rng, TOOLS, 6) + _pick(rng, SKILLS, 4)) + "."]
+    return "\n".join(lines)
+
+
+def jd_text(seed: int, index: int, sentences: int) -> str:
+    """
+    Synthetic job description with about ``sentences`` sentences.
+    """
+    rng = np.random.default_rng([seed, index, 1])
+    role = ROLES[int(rng.integers(len(ROLES)))]
+
+    lines = [f"We are hiring a {role}.", "", "REQUIREMENTS"]
+    templates = [
+        "Experience with {tool} and {skill} is required.",
+        "Strong knowledge of {skill} and {skill2}.",
+        "Hands-on {tool} experience for {skill}.",
+        "You will own {skill} for our {obj}.",
+    ]
+    for i in range(max(sentences - 1, 1)):
+        skill, skill2 = _pick(rng, SKILLS, 2)
+        lines.append("- " + templates[i % len(templates)].format(
+            tool=TOOLS[int(rng.integers(len(TOOLS)))],
+            skill=skill,
+            skill2=skill2,
+            obj=OBJECTS[int(rng.integers(len(OBJECTS)))],
+        ))
+    return "\n".join(lines)
+
+
+# -------------------------
+# Writers
+# -------------------------
+def write_txt(path: str, text: str) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+def write_docx(path: str, text: str) -> None:
+    document = DocxDocument()
+    for line in text.split("\n"):
+        document.add_paragraph(line)
+    document.save(path)
+
+
+def _pdf_string(line: str) -> bytes:
+    raw = line.encode("cp1252", errors="replace")
+    return raw.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)")
+
+
+def write_pdf(path: str, text: str, lines_per_page: int = 60) -> None:
+    """
+    Minimal text-only PDF (Helvetica, WinAnsi), one line per text row.
+    """
+    lines = text.split("\n")
+    pages = [
+        lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)
+    ] or [[]]
+
+    # 1 catalog, 2 page tree, 3 font, then (page, content) per page
+    objects: List[bytes] = [
+        b"",
+        b"",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica "
+        b"/Encoding /WinAnsiEncoding >>",
+    ]
+    kids = []
+    for page_lines in pages:
+        stream = b"BT /F1 10 Tf 12 TL 50 800 Td\n" + b"".join(
+            b"(" + _pdf_string(line) + b") Tj T*\n" for line in page_lines
+        ) + b"ET"
+        page_id, content_id = len(objects) + 1, len(objects) + 2
+        kids.append(page_id)
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+            b"/Resources << /Font << /F1 3 0 R >> >> "
+            + f"/Contents {content_id} 0 R >>".encode()
+        )
+        objects.append(
+            f"<< /Length {len(stream)} >>\nstream\n".encode() + stream + b"\nendstream"
+        )
+
+    objects[0] = b"<< /Type /Catalog /Pages 2 0 R >>"
+    objects[1] = (
+        f"<< /Type /Pages /Kids [{' '.join(f'{k} 0 R' for k in kids)}] "
+        f"/Count {len(kids)} >>"
+    ).encode()
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n".encode() + body + b"\nendobj\n"
+
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    out += b"".join(f"{offset:010d} 00000 n \n".encode() for offset in offsets)
+    out += (
+        f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\n"
+        f"startxref\n{xref}\n%%EOF\n"
+    ).encode()
+
+    with open(path, "wb") as f:
+        f.write(bytes(out))
+
+
+WRITERS = {"txt": write_txt, "docx": write_docx, "pdf": write_pdf}
+
+
+# -------------------------
+# Corpus
+# -------------------------
+def write_resumes(
+    directory: str,
+    count: int,
+    sentences: int,
+    formats=("txt",),
+    seed: int = 0,
+) -> Dict[str, List[str]]:
+    """
+    Write resumes 0 … count-1 into ``directory`` in every format;
+    returns format → paths.
+    """
+    os.makedirs(directory, exist_ok=True)
+    paths: Dict[str, List[str]] = {fmt: [] for fmt in formats}
+    for i in range(count):
+        text = resume_text(seed, i, sentences)
+        for fmt in formats:
+            path = os.path.join(directory, f"resume_{i:06d}.{fmt}")
+            WRITERS[fmt](path, text)
+            paths[fmt].append(path)
+    return paths
+
+
+@dataclass
+class Corpus:
+    directory: str
+    jd_path: str
+    resumes: Dict[str, List[str]]  # format → paths
+
+
+def build_corpus(
+    directory: str,
+    resumes: int = 20,
+    size: str = "small",
+    formats=FORMATS,
+    seed: int = 0,
+) -> Corpus:
+    """
+    Write ``resumes`` resumes per format and one JD into ``directory``.
+
+    Resume ``i`` has the same content in every format (parsers differ
+    only in how they keep blank lines).
+    """
+    resume_sentences, jd_sentences = SIZES[size]
+    paths = write_resumes(directory, resumes, resume_sentences, formats, seed)
+
+    jd_path = os.path.join(directory, "jd.txt")
+    write_txt(jd_path, jd_text(seed, 0, jd_sentences))
+
+    return Corpus(directory=directory, jd_path=jd_path, resumes=paths)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("directory")
+    parser.add_argument("--resumes", type=int, default=20)
+    parser.add_argument("--size", choices=sorted(SIZES), default="small")
+    parser.add_argument("--formats", default=",".join(FORMATS))
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    corpus = build_corpus(
+        args.directory, args.resumes, args.size, args.formats.split(","), args.seed
+    )
+    print(json.dumps({
+        "jd": corpus.jd_path,
+        "resumes": {fmt: len(paths) for fmt, paths in corpus.resumes.items()},
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,424 @@
+# Benchmark suite: every pipeline stage plus the end-to-end path, on the
+# deterministic synthetic corpus (benchmarks/corpus.py) with the offline
+# hashing embedder, so it runs anywhere and repeats exactly.
+
+# run     → times each case and writes JSON (results + environment)
+# compare → flags cases that got slower than a stored baseline by more
+#           than --threshold, exiting 1 if any did
+
+# run --memory adds one extra, untimed pass per case under the memory
+# profiler (resume_intelligence/core/instrumentation.py): the case's peak
+# and retained traced bytes, sampled RSS and the per-stage breakdown.
+# compare then also flags cases whose peak grew past --threshold and
+# --floor-kib. Tracing slows the pass down, which is why it never shares
+# a round with the timings.
+
+# Each case runs one warm-up round and then --rounds timed rounds with the
+# collector paused, as timeit does; a round covers the whole corpus.
+# compare uses the best round by default: on a shared machine, noise only
+# ever adds time, so minimums repeat far better than medians. Timings are
+# only comparable on the same machine, so record the baseline where the
+# comparison runs. The embed case times the stub model and the cache
+# around it, not a real model.
+
+# Usage:
+#   python -m benchmarks.suite run --size medium --resumes 20 --out baseline.json
+#   python -m benchmarks.suite run --size medium --resumes 20 --out current.json
+#   python -m benchmarks.suite compare baseline.json current.json --threshold 0.10
+#   python -m benchmarks.suite run --memory --cases parse,end_to_end --out memory.json
+
+import argparse
+import gc
+import hashlib
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from benchmarks.common import HashingEmbedder
+from benchmarks.corpus import FORMATS, SIZES, Corpus, build_corpus
+from resume_intelligence.core.document import Document
+from resume_intelligence.core.instrumentation import Recorder, profiling, stage
+from resume_intelligence.core.matching.ats_score import compute_ats_score
+from resume_intelligence.core.matching.embedder import CachedEmbedder
+from resume_intelligence.core.matching.matcher import TYPE_COMPATIBILITY, ConceptMatcher
+from resume_intelligence.core.matching.similarity import top_k_similarity
+from resume_intelligence.core.normalizer import normalize_document
+from resume_intelligence.core.parser import parse_document
+from resume_intelligence.core.pipeline import analyze_file
+from resume_intelligence.core.semantics.concept import ConceptSource
+from resume_intelligence.core.semantics.consolidator import consolidate_concepts
+from resume_intelligence.core.semantics.extractor import extract_concepts
+
+
+# name → (one round, items per round)
+Cases = Dict[str, Tuple[Callable[[], object], int]]
+
+
+def _end_to_end(paths: List[str], jd_path: str) -> List[float]:
+    # A fresh cache per round, as a new batch run would start with
+    embedder = CachedEmbedder(HashingEmbedder())
+    jd_concepts = analyze_file(jd_path, ConceptSource.JD)
+    matcher = ConceptMatcher(embedder)
+
+    scores = []
+    for path in paths:
+        resume_concepts = analyze_file(path, ConceptSource.RESUME)
+        results = matcher.match(jd_concepts, resume_concepts)
+        scores.append(compute_ats_score(jd_concepts, results))
+    return scores
+
+
+def build_cases(corpus: Corpus) -> Cases:
+    """
+    Every case over ``corpus``, with its inputs prepared up front.
+    """
+    formats = list(corpus.resumes)
+    paths = corpus.resumes[formats[0]]
+    n = len(paths)
+
+    jd_concepts = analyze_file(corpus.jd_path, ConceptSource.JD)
+    texts = [parse_document(p) for p in paths]
+
+    docs = []
+    for text in texts:
+        doc = Document(raw_text=text)
+        docs.append(normalize_document(doc))
+    extracted = [extract_concepts(d, ConceptSource.RESUME) for d in docs]
+    consolidated = [consolidate_concepts(e) for e in extracted]
+    concept_texts = [[c.text for c in concepts] for concepts in consolidated]
+
+    model = HashingEmbedder()
+    warm = CachedEmbedder(model, max_entries=None)
+    jd_vectors = np.asarray(warm.embed_texts([c.text for c in jd_concepts]), dtype=np.float32)
+    resume_vectors = [np.asarray(warm.embed_texts(t), dtype=np.float32) for t in concept_texts]
+    jd_types = [c.type for c in jd_concepts]
+    matches = [ConceptMatcher(warm).match(jd_concepts, c) for c in consolidated]
+
+    def normalize_all():
+        for text in texts:
+            normalize_document(Document(raw_text=text))
+
+    def embed_all():
+        cache = CachedEmbedder(model)
+        for t in concept_texts:
+            cache.embed_texts(t)
+
+    def similarity_all():
+        for vectors, concepts in zip(resume_vectors, consolidated):
+            top_k_similarity(
+                jd_vectors,
+                vectors,
+                k=1,
+                jd_types=jd_types,
+                resume_types=[c.type for c in concepts],
+                compatibility=TYPE_COMPATIBILITY,
+            )
+
+    cases: Cases = {}
+    for fmt in formats:
+        cases[f"parse_{fmt}"] = (
+            lambda ps=corpus.resumes[fmt]: [parse_document(p) for p in ps], n
+        )
+    cases["normalize"] = (normalize_all, n)
+    cases["extract"] = (
+        lambda: [extract_concepts(d, ConceptSource.RESUME) for d in docs], n
+    )
+    cases["consolidate"] = (lambda: [consolidate_concepts(e) for e in extracted], n)
+    cases["embed"] = (embed_all, n)
+    cases["similarity"] = (similarity_all, n)
+    cases["match"] = (
+        lambda: [ConceptMatcher(warm).match(jd_concepts, c) for c in consolidated], n
+    )
+    cases["score"] = (
+        lambda: [compute_ats_score(jd_concepts, m) for m in matches], n
+    )
+    for fmt in formats:
+        cases[f"end_to_end_{fmt}"] = (
+            lambda ps=corpus.resumes[fmt]: _end_to_end(ps, corpus.jd_path), n
+        )
+    return cases
+
+
+def time_case(fn: Callable[[], object], items: int, rounds: int) -> Dict:
+    fn()  # warm-up: imports, caches, allocator
+
+    # Like timeit: collector pauses would land in arbitrary rounds
+    seconds = []
+    for _ in range(rounds):
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            fn()
+            seconds.append(time.perf_counter() - start)
+        finally:
+            gc.enable()
+
+    ms = [s * 1000 for s in seconds]
+    median = statistics.median(ms)
+    return {
+        "median_ms": round(median, 3),
+        "min_ms": round(min(ms), 3),
+        "max_ms": round(max(ms), 3),
+        "rounds": rounds,
+        "items": items,
+        "per_item_us": round(median * 1000 / max(items, 1), 2),
+    }
+
+
+def memory_case(fn: Callable[[], object], top: int = 3) -> Dict:
+    fn()  # warm-up: first-call caches are not the case's own memory
+
+    with profiling(Recorder(memory=True)) as recorder:
+        with stage("case"):
+            fn()
+
+    total = recorder.stages.pop("case").memory
+    return {
+        "peak_bytes": total.peak_bytes,
+        "retained_bytes": total.retained_bytes,
+        "rss_peak_bytes": total.rss_peak_bytes,
+        "stages": {
+            name: stats["memory"]
+            for name, stats in recorder.as_dict(top).items() if "memory" in stats
+        },
+    }
+
+
+def _environment() -> Dict:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "commit": commit,
+    }
+
+
+def run_suite(
+    size: str = "small",
+    resumes: int = 20,
+    formats=FORMATS,
+    rounds: int = 5,
+    seed: int = 0,
+    only: Optional[List[str]] = None,
+    memory: bool = False,
+) -> Dict:
+    """
+    Build the corpus in a temporary directory and time every case.
+
+    Args:
+        only: Case names or name prefixes to run (all if None)
+        memory: Also profile each case's memory in a separate pass
+    """
+    directory = tempfile.mkdtemp(prefix="ri-suite-")
+    try:
+        corpus = build_corpus(directory, resumes, size, formats, seed)
+        cases = build_cases(corpus)
+        if only:
+            cases = {
+                name: case for name, case in cases.items()
+                if any(name.startswith(prefix) for prefix in only)
+            }
+
+        results = {
+            name: time_case(fn, items, rounds) for name, (fn, items) in cases.items()
+        }
+        memory_results = (
+            {name: memory_case(fn) for name, (fn, _) in cases.items()} if memory else None
+        )
+
+        # Scores must not change between runs of the same code; a changed
+        # checksum between two commits means their outputs differ
+        scores = _end_to_end(corpus.resumes[list(corpus.resumes)[0]], corpus.jd_path)
+        checksum = hashlib.sha256(json.dumps(scores).encode()).hexdigest()[:16]
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    report = {
+        "config": {
+            "size": size,
+            "resumes": resumes,
+            "formats": list(formats),
+            "rounds": rounds,
+            "seed": seed,
+        },
+        "environment": _environment(),
+        "output_checksum": checksum,
+        "cases": results,
+    }
+    if memory_results is not None:
+        report["memory"] = memory_results
+    return report
+
+
+def compare(
+    baseline: Dict,
+    current: Dict,
+    threshold: float = 0.10,
+    floor_ms: float = 0.5,
+    stat: str = "min_ms",
+    floor_bytes: int = 64 * 1024,
+) -> Dict:
+    """
+    Classify each case by ``stat`` (min_ms or median_ms) against the
+    baseline.
+
+    A case regresses when it is more than ``threshold`` (relative) and
+    ``floor_ms`` (absolute) slower; the floor keeps sub-millisecond cases
+    from flagging on timer noise. When both runs profiled memory, peak
+    traced bytes are classified the same way, with ``floor_bytes``.
+    """
+    rows = {}
+    for name, stats in current["cases"].items():
+        base = baseline["cases"].get(name)
+        if base is None:
+            rows[name] = {"status": "new", "current_ms": stats[stat]}
+            continue
+
+        delta = stats[stat] - base[stat]
+        ratio = stats[stat] / base[stat] if base[stat] else float("inf")
+        if ratio > 1 + threshold and delta > floor_ms:
+            status = "regression"
+        elif ratio < 1 - threshold and -delta > floor_ms:
+            status = "improvement"
+        else:
+            status = "ok"
+
+        rows[name] = {
+            "status": status,
+            "baseline_ms": base[stat],
+            "current_ms": stats[stat],
+            "change": f"{ratio - 1:+.1%}",
+        }
+
+    for name in baseline["cases"]:
+        if name not in current["cases"]:
+            rows[name] = {"status": "missing", "baseline_ms": baseline["cases"][name][stat]}
+
+    memory_rows = {}
+    base_memory = baseline.get("memory") or {}
+    for name, stats in (current.get("memory") or {}).items():
+        base = base_memory.get(name)
+        if base is None:
+            continue
+        delta = stats["peak_bytes"] - base["peak_bytes"]
+        ratio = stats["peak_bytes"] / base["peak_bytes"] if base["peak_bytes"] else float("inf")
+        if ratio > 1 + threshold and delta > floor_bytes:
+            status = "regression"
+        elif ratio < 1 - threshold and -delta > floor_bytes:
+            status = "improvement"
+        else:
+            status = "ok"
+        memory_rows[name] = {
+            "status": status,
+            "baseline_peak_bytes": base["peak_bytes"],
+            "current_peak_bytes": stats["peak_bytes"],
+            "change": f"{ratio - 1:+.1%}",
+        }
+
+    same_setup = baseline.get("config") == current.get("config")
+    base_env, env = baseline.get("environment", {}), current.get("environment", {})
+    same_machine = all(
+        base_env.get(key) == env.get(key) for key in ("platform", "machine", "cpu_count")
+    )
+
+    return {
+        "stat": stat,
+        "threshold": threshold,
+        "floor_ms": floor_ms,
+        "same_config": same_setup,
+        "same_machine": same_machine,
+        "output_changed": (
+            same_setup
+            and baseline.get("output_checksum") != current.get("output_checksum")
+        ),
+        "regressions": [name for name, row in rows.items() if row["status"] == "regression"],
+        "cases": rows,
+        "memory_regressions": [
+            name for name, row in memory_rows.items() if row["status"] == "regression"
+        ],
+        "memory": memory_rows,
+    }
+
+
+def _load(path: str) -> Dict:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser()
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Time every case and write JSON")
+    run.add_argument("--size", choices=sorted(SIZES), default="small")
+    run.add_argument("--resumes", type=int, default=20)
+    run.add_argument("--formats", default=",".join(FORMATS))
+    run.add_argument("--rounds", type=int, default=5)
+    run.add_argument("--seed", type=int, default=0)
+    run.add_argument("--cases", default=None, help="Comma-separated names or prefixes")
+    run.add_argument("--out", default=None, help="Result file (stdout if omitted)")
+    run.add_argument(
+        "--memory", action="store_true", help="Also profile each case's memory"
+    )
+
+    cmp = commands.add_parser("compare", help="Flag regressions against a baseline")
+    cmp.add_argument("baseline")
+    cmp.add_argument("current")
+    cmp.add_argument("--threshold", type=float, default=0.10)
+    cmp.add_argument("--floor-ms", type=float, default=0.5)
+    cmp.add_argument("--stat", choices=["min_ms", "median_ms"], default="min_ms")
+    cmp.add_argument("--floor-kib", type=float, default=64.0)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        results = run_suite(
+            size=args.size,
+            resumes=args.resumes,
+            formats=args.formats.split(","),
+            rounds=args.rounds,
+            seed=args.seed,
+            only=args.cases.split(",") if args.cases else None,
+            memory=args.memory,
+        )
+        text = json.dumps(results, indent=2)
+        if args.out:
+            with open(args.out, "w", encoding="utf-8") as f:
+                f.write(text + "\n")
+        print(text)
+        return 0
+
+    report = compare(
+        _load(args.baseline),
+        _load(args.current),
+        args.threshold,
+        args.floor_ms,
+        args.stat,
+        int(args.floor_kib * 1024),
+    )
+    print(json.dumps(report, indent=2))
+    return 1 if report["regressions"] or report["memory_regressions"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,27 +1,236 @@
+# Command-line entry point.
+
+# Pipeline modules (scipy, sklearn, pdfplumber, ...) are imported inside
+# the commands that use them: a `match --daemon` call only forwards its
+# arguments, and start-up imports would otherwise dominate its latency.
+
+import os
+
 import typer
 from rich.console import Console
+from rich.progress import BarColumn, MofNCompleteColumn, Progress, TimeRemainingColumn
 from rich.table import Table
 from pathlib import Path
 
-from resume_intelligence.core.document import Document
-from resume_intelligence.core.normalizer import normalize_document
-from resume_intelligence.core.parser import parse_document
-from resume_intelligence.core.semantics.extractor import extract_concepts
-from resume_intelligence.core.semantics.consolidator import consolidate_concepts
 from resume_intelligence.core.semantics.concept import ConceptSource
-from resume_intelligence.core.matching.matcher import ConceptMatcher
-from resume_intelligence.core.matching.ats_score import compute_ats_score
-from resume_intelligence.core.exception import DocumentParseError
+from resume_intelligence.core.matching.embedder import DEFAULT_MODEL, ConceptEmbedder
+from resume_intelligence.core.exception import (
+    CorpusStoreError,
+    DocumentParseError,
+    RequestError,
+)
+from resume_intelligence.core.instrumentation import (
+    Recorder,
+    disable as disable_instrumentation,
+    enable as enable_instrumentation,
+    profiling,
+)
+from resume_intelligence.app.daemon import (
+    DEFAULT_IDLE_TIMEOUT,
+    DaemonClient,
+    DaemonUnavailable,
+    results_from_dict,
+    spawn_daemon,
+)
 
 
 app = typer.Typer(help="ATS-grade Resume ↔ Job Description Matcher")
+daemon_app = typer.Typer(help="Manage the warm background daemon")
+app.add_typer(daemon_app, name="daemon")
 console = Console()
 
 
+def _match_in_process(resume: Path, jd: Path, cascade: bool):
+    from resume_intelligence.core.document import Document
+    from resume_intelligence.core.normalizer import normalize_document
+    from resume_intelligence.core.parser import parse_document
+    from resume_intelligence.core.semantics.extractor import extract_concepts
+    from resume_intelligence.core.semantics.consolidator import consolidate_concepts
+    from resume_intelligence.core.matching.matcher import ConceptMatcher
+    from resume_intelligence.core.matching.lexical import LexicalPrefilter
+    from resume_intelligence.core.matching.ats_score import compute_ats_score
+
+    # -------------------------
+    # Parse & normalize resume
+    # -------------------------
+    console.print("📄 Parsing resume...")
+    resume_text = parse_document(str(resume))
+    resume_doc = Document(raw_text=resume_text)
+    normalize_document(resume_doc)
+
+    # -------------------------
+    # Parse & normalize JD
+    # -------------------------
+    console.print("📄 Parsing job description...")
+    jd_text = parse_document(str(jd))
+    jd_doc = Document(raw_text=jd_text)
+    normalize_document(jd_doc)
+
+    # -------------------------
+    # Extract & consolidate concepts
+    # -------------------------
+    console.print("🧠 Extracting resume concepts...")
+    resume_concepts = consolidate_concepts(
+        extract_concepts(resume_doc, ConceptSource.RESUME)
+    )
+
+    console.print("🧠 Extracting JD concepts...")
+    jd_concepts = consolidate_concepts(
+        extract_concepts(jd_doc, ConceptSource.JD)
+    )
+
+    if not jd_concepts:
+        raise ValueError("No valid concepts found in job description.")
+
+    # -------------------------
+    # Semantic matching
+    # -------------------------
+    console.print("🔍 Performing semantic matching...")
+    prefilter = LexicalPrefilter() if cascade else None
+    matcher = ConceptMatcher(prefilter=prefilter)
+    match_results = matcher.match(jd_concepts, resume_concepts)
+
+    # -------------------------
+    # ATS score
+    # -------------------------
+    ats_score = compute_ats_score(jd_concepts, match_results)
+    fractions = prefilter.stats.fractions() if prefilter is not None else None
+
+    return match_results, ats_score, fractions
+
+
+def _match_via_daemon(resume: Path, jd: Path, cascade: bool):
+    # None → run in-process; a missing daemon is started for the next call
+    for path in (resume, jd):
+        if not path.exists():
+            raise FileNotFoundError(str(path))
+
+    try:
+        client = DaemonClient()
+    except PermissionError as e:
+        console.print(f"[yellow]{e}; running in-process.[/yellow]")
+        return None
+
+    console.print("⚡ Forwarding to the warm daemon...")
+    try:
+        payload = client.request("/match", {
+            "resume": {"path": str(resume.resolve())},
+            "jd": {"path": str(jd.resolve())},
+            "cascade": cascade,
+        })
+    except DaemonUnavailable:
+        console.print("💤 No daemon running; starting one and running in-process.")
+        spawn_daemon(client.socket_path)
+        return None
+    except RequestError as e:
+        if e.status == 400:
+            raise ValueError(str(e))
+        # Busy, timed out or failed: the in-process path still works
+        console.print(f"[yellow]Daemon could not serve the call ({e}); running in-process.[/yellow]")
+        return None
+
+    return (
+        results_from_dict(payload["match_results"]),
+        payload["ats_score"],
+        payload["cascade"],
+    )
+
+
+def _mb(size) -> str:
+    return "-" if size is None else f"{size / 2**20:.1f}"
+
+
+def _print_profile(recorder: Recorder, out: Console = console) -> None:
+    table = Table(title="⏱️ Stage Profile", title_style="green")
+    table.add_column("Stage", style="bold")
+    table.add_column("Calls", justify="right")
+    table.add_column("Wall (ms)", justify="right")
+    table.add_column("CPU (ms)", justify="right")
+    table.add_column("Items")
+
+    for name, stats in recorder.ordered().items():
+        table.add_row(
+            name,
+            str(stats.calls),
+            f"{stats.wall_seconds * 1000:.1f}",
+            f"{stats.cpu_seconds * 1000:.1f}",
+            ", ".join(f"{k} {v}" for k, v in stats.items.items()) or "-",
+        )
+
+    out.print(table)
+
+
+def _print_memory(recorder: Recorder, out: Console = console) -> None:
+    table = Table(title="🧮 Stage Memory", title_style="green")
+    table.add_column("Stage", style="bold")
+    table.add_column("Peak (MB)", justify="right")
+    table.add_column("Retained (MB)", justify="right")
+    table.add_column("RSS peak (MB)", justify="right")
+    table.add_column("Top site")
+
+    for name, stats in recorder.ordered().items():
+        memory = stats.memory
+        if memory is None:
+            continue
+        top = memory.top_sites(1)
+        table.add_row(
+            name,
+            _mb(memory.peak_bytes),
+            _mb(memory.retained_bytes),
+            _mb(memory.rss_peak_bytes),
+            top[0]["site"] if top else "-",
+        )
+
+    out.print(table)
+
+    sites = Table(title="📍 Top Allocation Sites (retained)", title_style="green")
+    sites.add_column("Site", style="bold")
+    sites.add_column("Stage")
+    sites.add_column("MB", justify="right")
+    sites.add_column("Blocks", justify="right")
+    for site in recorder.top_sites():
+        sites.add_row(site["site"], site["stage"], _mb(site["bytes"]), str(site["blocks"]))
+
+    out.print(sites)
+
+
 @app.command()
 def match(
     resume: Path = typer.Argument(..., help="Path to resume file (PDF/TXT)"),
     jd: Path = typer.Argument(..., help="Path to job description file (TXT)"),
+    cascade: bool = typer.Option(
+        False,
+        "--cascade",
+        help="Resolve exact/clear-cut concepts lexically before the neural model",
+    ),
+    daemon: bool = typer.Option(
+        False,
+        "--daemon/--no-daemon",
+        envvar="RESUME_INTELLIGENCE_DAEMON",
+        help="Score through a warm background daemon (started on first use)",
+    ),
+    profile: bool = typer.Option(
+        False, "--profile", help="Print per-stage time and item counts"
+    ),
+    profile_memory: bool = typer.Option(
+        False,
+        "--profile-memory",
+        help="Print per-stage peak/retained memory and top allocation sites",
+    ),
+    metrics_out: Path = typer.Option(
+        None,
+        "--metrics-out",
+        help="Write stage metrics (.json as JSON, else Prometheus text)",
+    ),
+    result_cache_path: Path = typer.Option(
+        None,
+        "--result-cache",
+        envvar="RESUME_INTELLIGENCE_RESULT_CACHE",
+        help="Result cache file; a repeated resume/JD pair is answered from it",
+    ),
+    result_cache_ttl: float = typer.Option(
+        7 * 24 * 3600.0, "--result-cache-ttl", help="Seconds a cached result stays valid"
+    ),
 ):
     """
     Compare a resume against a job description and compute ATS match score.
@@ -29,50 +238,48 @@ def match(
 
     console.rule("[bold blue]ATS Resume Matcher[/bold blue]")
 
-    try:
-        # -------------------------
-        # Parse & normalize resume
-        # -------------------------
-        console.print("📄 Parsing resume...")
-        resume_text = parse_document(str(resume))
-        resume_doc = Document(raw_text=resume_text)
-        normalize_document(resume_doc)
-
-        # -------------------------
-        # Parse & normalize JD
-        # -------------------------
-        console.print("📄 Parsing job description...")
-        jd_text = parse_document(str(jd))
-        jd_doc = Document(raw_text=jd_text)
-        normalize_document(jd_doc)
-
-        # -------------------------
-        # Extract & consolidate concepts
-        # -------------------------
-        console.print("🧠 Extracting resume concepts...")
-        resume_concepts = consolidate_concepts(
-            extract_concepts(resume_doc, ConceptSource.RESUME)
-        )
+    # Stages can only be measured in this process
+    recorder = (
+        Recorder(memory=profile_memory)
+        if profile or profile_memory or metrics_out else None
+    )
+    if recorder is not None and daemon:
+        console.print("[yellow]Profiling runs in-process; ignoring --daemon.[/yellow]")
+        daemon = False
 
-        console.print("🧠 Extracting JD concepts...")
-        jd_concepts = consolidate_concepts(
-            extract_concepts(jd_doc, ConceptSource.JD)
-        )
+    try:
+        cache = key = cached = None
+        if result_cache_path is not None:
+            from resume_intelligence.core.matching.result_cache import (
+                ResultCache,
+                file_digest,
+            )
 
-        if not jd_concepts:
-            raise ValueError("No valid concepts found in job description.")
+            cache = ResultCache(str(result_cache_path), ttl=result_cache_ttl)
+            key = cache.key(
+                file_digest(str(resume)), file_digest(str(jd)), DEFAULT_MODEL,
+                cascade=cascade,
+            )
+            # A profile measures the pipeline, so it always runs it
+            cached = cache.get(key) if recorder is None else None
 
-        # -------------------------
-        # Semantic matching
-        # -------------------------
-        console.print("🔍 Performing semantic matching...")
-        matcher = ConceptMatcher()
-        match_results = matcher.match(jd_concepts, resume_concepts)
+        if cached is not None:
+            console.print("♻️ Same resume and job description as before; using the cached result.")
+            outcome = (cached.match_results, cached.ats_score, None)
+        else:
+            outcome = _match_via_daemon(resume, jd, cascade) if daemon else None
+        if outcome is None:
+            if recorder is None:
+                outcome = _match_in_process(resume, jd, cascade)
+            else:
+                with profiling(recorder):
+                    outcome = _match_in_process(resume, jd, cascade)
+        match_results, ats_score, fractions = outcome
 
-        # -------------------------
-        # ATS score
-        # -------------------------
-        ats_score = compute_ats_score(jd_concepts, match_results)
+        if cache is not None:
+            if cached is None:
+                cache.put(key, ats_score, match_results)
+            cache.close()
 
     except FileNotFoundError as e:
         console.print(f"[bold red]File not found:[/bold red] {e}")
@@ -97,6 +304,13 @@ def match(
     console.rule("[bold green]ATS Match Result[/bold green]")
     console.print(f"🎯 [bold]ATS Match Score:[/bold] [green]{ats_score}%[/green]\n")
 
+    if fractions is not None:
+        console.print(
+            "⚡ Cascade: "
+            + ", ".join(f"{stage} {share:.0%}" for stage, share in fractions.items())
+            + "\n"
+        )
+
     def render_table(title, rows, color):
         table = Table(title=title, title_style=color)
         table.add_column("JD Concept", style="bold")
@@ -123,8 +337,481 @@ def match(
     if match_results["missing"]:
         render_table("❌ Missing Concepts", match_results["missing"], "red")
 
+    if profile:
+        _print_profile(recorder)
+
+    if profile_memory:
+        _print_memory(recorder)
+
+    if metrics_out:
+        recorder.write(str(metrics_out))
+        console.print(f"📈 Stage metrics written to {metrics_out}")
+
+    console.rule("[bold blue]Done[/bold blue]")
+
+
+@app.command()
+def index(
+    folder: Path = typer.Argument(..., help="Folder of resumes (PDF/DOCX/TXT)"),
+    store: Path = typer.Option(..., "--store", help="Corpus store directory"),
+    verbose: bool = typer.Option(False, "--verbose", help="Print every file"),
+):
+    """
+    Incrementally index a folder of resumes into a corpus store.
+    """
+    from resume_intelligence.core.corpus.store import CorpusStore
+    from resume_intelligence.core.corpus.indexer import CorpusIndexer
+
+    console.rule("[bold blue]Corpus Indexing[/bold blue]")
+
+    if not folder.is_dir():
+        console.print(f"[bold red]Not a folder:[/bold red] {folder}")
+        raise typer.Exit(code=1)
+
+    def on_file(path, outcome):
+        if verbose or outcome != "skipped":
+            console.print(f"  {outcome:>8}  {path}")
+
+    try:
+        with CorpusStore(str(store)) as corpus:
+            embedder = (
+                ConceptEmbedder(corpus.model_name)
+                if corpus.model_name else ConceptEmbedder()
+            )
+            # Pin the model so later runs can't mix embedding spaces
+            corpus.pin_model(embedder.model_name)
+
+            report = CorpusIndexer(corpus, embedder).index(str(folder), on_file)
+
+    except CorpusStoreError as e:
+        console.print(f"[bold red]Corpus store error:[/bold red] {e}")
+        raise typer.Exit(code=1)
+
+    for path, reason in report.failed:
+        console.print(f"[yellow]Skipped unreadable {path}:[/yellow] {reason}")
+
+    console.print(
+        f"✅ added {report.added}, updated {report.updated}, "
+        f"skipped {report.skipped}, removed {report.removed}, "
+        f"failed {len(report.failed)} in {report.seconds:.1f}s"
+    )
     console.rule("[bold blue]Done[/bold blue]")
 
 
+@app.command()
+def rank(
+    jd: Path = typer.Argument(..., help="Path to job description file (TXT)"),
+    store: Path = typer.Option(..., "--store", help="Corpus store directory"),
+    top: int = typer.Option(10, "--top", help="Number of candidates to show"),
+    sharded: bool = typer.Option(
+        False, "--sharded", help="--store is a root of shards made by `shard`"
+    ),
+    shard_timeout: float = typer.Option(
+        None, "--shard-timeout", help="Seconds to wait for shards before ranking without the rest"
+    ),
+):
+    """
+    Rank every resume in a corpus store against a job description.
+    """
+    from resume_intelligence.core.corpus.sharded import ShardedRanker, shard_directories
+    from resume_intelligence.core.corpus.store import SQLITE_NAME, CorpusStore
+    from resume_intelligence.core.pipeline import analyze_file
+
+    console.rule("[bold blue]ATS Corpus Ranking[/bold blue]")
+
+    try:
+        directories = shard_directories(str(store)) if sharded else [str(store)]
+        if not (Path(directories[0]) / SQLITE_NAME).exists():
+            raise CorpusStoreError(f"No corpus store at {directories[0]}")
+
+        console.print("📄 Processing job description...")
+        jd_concepts = analyze_file(str(jd), ConceptSource.JD)
+
+        if not jd_concepts:
+            raise ValueError("No valid concepts found in job description.")
+
+        with CorpusStore(directories[0]) as corpus:
+            # Stored vectors are only comparable with the same model
+            embedder = (
+                ConceptEmbedder(corpus.model_name)
+                if corpus.model_name else ConceptEmbedder()
+            )
+            jd_vectors = embedder.embed_texts([c.text for c in jd_concepts])
+
+            if not sharded:
+                console.print(f"🔍 Ranking {len(corpus)} stored resumes...")
+                ranked, prune_report = corpus.rank_candidates_pruned(
+                    jd_concepts, jd_vectors, top_n=top
+                )
+
+        if sharded:
+            console.print(f"🔍 Ranking across {len(directories)} shards...")
+            with ShardedRanker(directories, timeout=shard_timeout) as ranker:
+                ranking = ranker.rank(jd_concepts, jd_vectors, top_n=top)
+            ranked = ranking.candidates
+
+    except DocumentParseError as e:
+        console.print(f"[bold red]Document error:[/bold red] {e}")
+        raise typer.Exit(code=1)
+
+    except CorpusStoreError as e:
+        console.print(f"[bold red]Corpus store error:[/bold red] {e}")
+        raise typer.Exit(code=1)
+
+    except ValueError as e:
+        console.print(f"[bold red]Invalid input:[/bold red] {e}")
+        raise typer.Exit(code=1)
+
+    table = Table(title="🏆 Top Candidates", title_style="green")
+    table.add_column("#", justify="right")
+    table.add_column("Resume", style="bold")
+    table.add_column("ATS Score")
+    table.add_column("Matched")
+    table.add_column("Partial")
+
+    for position, entry in enumerate(ranked, start=1):
+        table.add_row(
+            str(position),
+            entry.candidate_id,
+            f"{entry.ats_score}%",
+            str(len(entry.match_results["matched"])),
+            str(len(entry.match_results["partial"])),
+        )
+
+    console.print(table)
+    if sharded:
+        for shard, reason in ranking.missing.items():
+            console.print(f"[yellow]Shard {shard} left out:[/yellow] {reason}")
+        console.print(
+            f"🧩 {ranking.shards - len(ranking.missing)} of {ranking.shards} shards "
+            f"answered; scored {ranking.scored} of {ranking.resumes} resumes"
+        )
+    else:
+        console.print(
+            f"✂️ Scored {prune_report.scored} of {prune_report.candidates} resumes "
+            f"({prune_report.pruned_fraction:.0%} pruned by upper bound)"
+        )
+    console.rule("[bold blue]Done[/bold blue]")
+
+
+@app.command()
+def shard(
+    store: Path = typer.Option(..., "--store", help="Corpus store directory"),
+    into: Path = typer.Option(..., "--into", help="New directory for the shards"),
+    shards: int = typer.Option(..., "--shards", help="Number of shards"),
+):
+    """
+    Partition a corpus store into shards for `rank --sharded`.
+    """
+    from resume_intelligence.core.corpus.sharded import partition_store
+    from resume_intelligence.core.corpus.store import SQLITE_NAME, CorpusStore
+
+    console.rule("[bold blue]Corpus Sharding[/bold blue]")
+
+    try:
+        if not (store / SQLITE_NAME).exists():
+            raise CorpusStoreError(f"No corpus store at {store}")
+        with CorpusStore(str(store)) as corpus:
+            directories = partition_store(corpus, str(into), shards)
+
+    except CorpusStoreError as e:
+        console.print(f"[bold red]Corpus store error:[/bold red] {e}")
+        raise typer.Exit(code=1)
+
+    except ValueError as e:
+        console.print(f"[bold red]Invalid input:[/bold red] {e}")
+        raise typer.Exit(code=1)
+
+    for directory in directories:
+        with CorpusStore(directory) as part:
+            console.print(f"  {len(part):>6} resumes  {directory}")
+    console.rule("[bold blue]Done[/bold blue]")
+
+
+@app.command()
+def batch(
+    jd: Path = typer.Argument(..., help="Path to job description file (TXT)"),
+    resumes: str = typer.Argument(..., help="Folder of resumes or a glob pattern"),
+    output: Path = typer.Option(
+        None, "--output", "-o", help="Result file (.jsonl/.csv); stdout if omitted"
+    ),
+    fmt: str = typer.Option(
+        None, "--format", help="jsonl or csv (default: from --output suffix)"
+    ),
+    workers: int = typer.Option(
+        os.cpu_count() or 1, "--workers", help="Normalize/extract processes"
+    ),
+    parse_workers: int = typer.Option(1, "--parse-workers", help="Parsing processes"),
+    batch_size: int = typer.Option(32, "--batch-size", help="Resumes per embedding call"),
+    cascade: bool = typer.Option(
+        False,
+        "--cascade",
+        help="Resolve exact/clear-cut concepts lexically before the neural model",
+    ),
+    checkpoint: Path = typer.Option(
+        None, "--checkpoint", help="Checkpoint directory; rerun to resume"
+    ),
+    checkpoint_every: int = typer.Option(
+        1000,
+        "--checkpoint-every",
+        help="Resumes between checkpoints (rounded up to whole batches)",
+    ),
+    top: int = typer.Option(10, "--top", help="Number of top candidates to show"),
+    profile_memory: bool = typer.Option(
+        False,
+        "--profile-memory",
+        help="Attribute memory to stages (ingests in-process; much slower)",
+    ),
+    metrics_out: Path = typer.Option(
+        None,
+        "--metrics-out",
+        help="Write stage metrics (.json as JSON, else Prometheus text)",
+    ),
+):
+    """
+    Match every resume in a folder (or glob) against one job description,
+    streaming one result row per resume.
+    """
+    from resume_intelligence.core.batch import BatchJob, format_for, resolve_inputs
+    from resume_intelligence.core.matching.lexical import LexicalPrefilter
+    from resume_intelligence.core.orchestrator import Pipeline
+    from resume_intelligence.core.pipeline import analyze_file
+
+    # Results may go to stdout, so all chatter goes to stderr
+    err = Console(stderr=True)
+    err.rule("[bold blue]ATS Batch Matcher[/bold blue]")
+
+    paths = resolve_inputs(resumes)
+    if not paths:
+        err.print(f"[bold red]No supported resumes found:[/bold red] {resumes}")
+        raise typer.Exit(code=1)
+
+    recorder = Recorder(memory=profile_memory) if profile_memory or metrics_out else None
+    if recorder is not None and (workers > 0 or parse_workers > 0):
+        # Worker processes are invisible to the recorder
+        err.print("[yellow]Profiling parses and extracts in-process; ignoring --workers.[/yellow]")
+        workers = parse_workers = 0
+
+    if recorder is not None:
+        enable_instrumentation(recorder)
+
+    try:
+        err.print("📄 Processing job description...")
+        jd_concepts = analyze_file(str(jd), ConceptSource.JD)
+
+        pipeline = Pipeline(
+            jd_concepts,
+            ConceptEmbedder(),
+            parse_workers=parse_workers,
+            analyze_workers=workers,
+            batch_size=batch_size,
+            prefilter=LexicalPrefilter() if cascade else None,
+        )
+        with pipeline:
+            job = BatchJob(
+                pipeline,
+                output_path=str(output) if output else None,
+                fmt=format_for(str(output) if output else None, fmt),
+                checkpoint_dir=str(checkpoint) if checkpoint else None,
+                checkpoint_every=checkpoint_every,
+                top_k=top,
+            )
+
+            done = job.prepare(paths)
+            if done:
+                err.print(f"♻️ Resuming from checkpoint: {done} resumes already done")
+
+            with Progress(
+                "[progress.description]{task.description}",
+                BarColumn(),
+                MofNCompleteColumn(),
+                TimeRemainingColumn(),
+                console=err,
+            ) as progress:
+                task = progress.add_task("🔍 Matching", total=len(paths), completed=done)
+                for _ in job.run():
+                    progress.advance(task)
+
+    except FileNotFoundError as e:
+        err.print(f"[bold red]File not found:[/bold red] {e}")
+        raise typer.Exit(code=1)
+
+    except DocumentParseError as e:
+        err.print(f"[bold red]Document error:[/bold red] {e}")
+        raise typer.Exit(code=1)
+
+    except ValueError as e:
+        err.print(f"[bold red]Invalid input:[/bold red] {e}")
+        raise typer.Exit(code=1)
+
+    finally:
+        if recorder is not None:
+            disable_instrumentation()
+
+    report = pipeline.report.as_dict()
+
+    table = Table(title="⏱️ Stage Throughput", title_style="green")
+    table.add_column("Stage", style="bold")
+    table.add_column("Workers", justify="right")
+    table.add_column("Items", justify="right")
+    table.add_column("Busy (s)", justify="right")
+    table.add_column("Utilisation", justify="right")
+
+    for name, stats in report["stages"].items():
+        label = f"{name} (bottleneck)" if name == report["bottleneck"] else name
+        table.add_row(
+            label,
+            str(stats["workers"]),
+            str(stats["items"]),
+            str(stats["busy_seconds"]),
+            str(stats["utilisation"]),
+        )
+
+    err.print(table)
+
+    if job.top:
+        ranking = Table(title="🏆 Top Candidates", title_style="green")
+        ranking.add_column("#", justify="right")
+        ranking.add_column("Resume", style="bold")
+        ranking.add_column("ATS Score")
+        for position, entry in enumerate(job.top, start=1):
+            ranking.add_row(str(position), entry["resume"], f"{entry['ats_score']}%")
+        err.print(ranking)
+
+    err.print(
+        f"✅ {report['resumes']} resumes ({report['failed']} failed) in "
+        f"{report['wall_seconds']}s — {report['resumes_per_second']} resumes/s, "
+        f"embedding cache {pipeline.embedder.hits} hits / {pipeline.embedder.misses} misses"
+    )
+
+    if profile_memory:
+        _print_memory(recorder, err)
+
+    if metrics_out:
+        recorder.write(str(metrics_out))
+        err.print(f"📈 Stage metrics written to {metrics_out}")
+
+    err.rule("[bold blue]Done[/bold blue]")
+
+
+@app.command()
+def serve(
+    host: str = typer.Option("127.0.0.1", "--host", help="Interface to bind"),
+    port: int = typer.Option(8765, "--port", help="Port to listen on"),
+    workers: int = typer.Option(
+        os.cpu_count() or 1, "--workers", help="Parse/extract processes"
+    ),
+    max_concurrent: int = typer.Option(
+        8, "--max-concurrent", help="Requests served at once (others get 503)"
+    ),
+    timeout: float = typer.Option(30.0, "--timeout", help="Per-request timeout (s)"),
+    result_cache_path: Path = typer.Option(
+        None,
+        "--result-cache",
+        envvar="RESUME_INTELLIGENCE_RESULT_CACHE",
+        help="Result cache file for /match; omit to always recompute",
+    ),
+    result_cache_ttl: float = typer.Option(
+        7 * 24 * 3600.0, "--result-cache-ttl", help="Seconds a cached result stays valid"
+    ),
+    document_root: Path = typer.Option(
+        None,
+        "--document-root",
+        help="Folder path documents may be read from; omit to accept only text and content",
+    ),
+):
+    """
+    Run the local HTTP scoring service with the model kept resident.
+    """
+    from resume_intelligence.app.service import ScoringService, make_server
+    from resume_intelligence.core.matching.result_cache import ResultCache
+
+    console.rule("[bold blue]ATS Scoring Service[/bold blue]")
+    console.print("🧠 Loading embedding model...")
+
+    service = ScoringService(
+        ConceptEmbedder(),
+        workers=workers,
+        max_concurrent=max_concurrent,
+        timeout=timeout,
+        result_cache=(
+            ResultCache(str(result_cache_path), ttl=result_cache_ttl)
+            if result_cache_path else None
+        ),
+        document_root=str(document_root) if document_root else None,
+    )
+    server = make_server(service, host, port)
+
+    console.print(f"🚀 Listening on http://{host}:{server.server_address[1]}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+        if service.result_cache is not None:
+            service.result_cache.close()
+
+    console.rule("[bold blue]Done[/bold blue]")
+
+
+def _daemon_client() -> DaemonClient:
+    try:
+        return DaemonClient()
+    except PermissionError as e:
+        console.print(f"[bold red]Daemon socket:[/bold red] {e}")
+        raise typer.Exit(code=1)
+
+
+@daemon_app.command("start")
+def daemon_start(
+    idle_timeout: float = typer.Option(
+        DEFAULT_IDLE_TIMEOUT, "--idle-timeout", help="Exit after this many idle seconds"
+    ),
+):
+    """
+    Start the daemon in the background (if it isn't running).
+    """
+    client = _daemon_client()
+    if client.is_running():
+        console.print(f"Daemon already running on {client.socket_path}")
+        return
+
+    spawn_daemon(client.socket_path, idle_timeout)
+    console.print(f"🚀 Daemon starting on {client.socket_path}")
+
+
+@daemon_app.command("stop")
+def daemon_stop():
+    """
+    Stop the running daemon.
+    """
+    try:
+        _daemon_client().request("/shutdown")
+    except DaemonUnavailable:
+        console.print("No daemon running.")
+        return
+    console.print("🛑 Daemon stopped.")
+
+
+@daemon_app.command("status")
+def daemon_status():
+    """
+    Show whether the daemon is running and what it serves.
+    """
+    client = _daemon_client()
+    try:
+        health = client.request("/health", method="GET")
+    except DaemonUnavailable:
+        console.print("No daemon running.")
+        raise typer.Exit(code=1)
+
+    console.print(
+        f"✅ Daemon on {client.socket_path}: model {health['model']}, "
+        f"{health['in_flight']} request(s) in flight"
+    )
+
+
 if __name__ == "__main__":
     app()
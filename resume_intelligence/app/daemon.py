@@ -0,0 +1,358 @@
+# Warm background daemon behind the CLI, over a Unix domain socket.
+
+# A cold `match` pays interpreter start-up, heavy imports and the model
+# load on every call. The daemon pays them once and serves later calls
+# over a local socket:
+
+# CLI ──(one JSON line)──► daemon socket ──► ScoringService.handle
+#     ◄──(one JSON line)──
+
+# No daemon listening → the CLI runs in-process as before and starts one
+# in the background for the next call. The daemon exits after
+# idle_timeout seconds without requests and removes its socket.
+
+# Protocol: request  {"method": "POST", "path": "/match", "body": {...}}
+#           response {"status": 200, "payload": {...}}
+
+# The client half imports only the standard library, so a forwarding CLI
+# call starts fast; the service is imported when a daemon starts.
+
+import argparse
+import importlib
+import json
+import os
+import socket
+import socketserver
+import stat
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from resume_intelligence.core.exception import (
+    DocumentParseError,
+    RequestError,
+    UnsupportedFileTypeError,
+)
+from resume_intelligence.core.semantics.concept import ConceptType
+
+if TYPE_CHECKING:
+    from resume_intelligence.app.service import ScoringService
+
+
+DEFAULT_IDLE_TIMEOUT = 600.0
+
+_MAX_LINE = 64 * 1024 * 1024
+
+
+class DaemonUnavailable(ConnectionError):
+    """Raised when no daemon is listening on the socket."""
+    pass
+
+
+def default_socket_path() -> str:
+    if os.environ.get("RESUME_INTELLIGENCE_SOCKET"):
+        return os.environ["RESUME_INTELLIGENCE_SOCKET"]
+
+    if os.environ.get("XDG_RUNTIME_DIR"):
+        return os.path.join(
+            os.environ["XDG_RUNTIME_DIR"], f"resume-intelligence-{os.getuid()}.sock"
+        )
+
+    # The tempdir is shared with every other user: keep the socket in a
+    # directory only we can enter, so nobody else can bind it first
+    directory = os.path.join(tempfile.gettempdir(), f"resume-intelligence-{os.getuid()}")
+    _private_dir(directory)
+    return os.path.join(directory, "daemon.sock")
+
+
+def _private_dir(directory: str) -> None:
+    """
+    Create ``directory`` owner-only, or check that an existing one is.
+
+    Raises:
+        PermissionError: The directory belongs to another user or is
+            open to group or others
+    """
+    try:
+        os.mkdir(directory, 0o700)
+    except FileExistsError:
+        pass
+
+    info = os.lstat(directory)
+    if (
+        not stat.S_ISDIR(info.st_mode)
+        or info.st_uid != os.getuid()
+        or info.st_mode & 0o077
+    ):
+        raise PermissionError(
+            f"Refusing to use {directory}: not a directory private to this user"
+        )
+
+
+# -------------------------
+# Client
+# -------------------------
+class DaemonClient:
+    def __init__(self, socket_path: Optional[str] = None, timeout: float = 60.0):
+        self.socket_path = socket_path or default_socket_path()
+        self.timeout = timeout
+
+    def request(self, path: str, body: Optional[Dict] = None, method: str = "POST") -> Dict:
+        """
+        Send one request and return the payload.
+
+        Raises:
+            DaemonUnavailable: Nothing is listening on the socket, or it
+                belongs to another user
+            RequestError: The daemon answered with an error status
+        """
+        # A socket another user made could answer with anything
+        try:
+            owner = os.stat(self.socket_path).st_uid
+        except FileNotFoundError as e:
+            raise DaemonUnavailable(str(e))
+        if owner != os.getuid():
+            raise DaemonUnavailable(f"{self.socket_path} belongs to another user")
+
+        try:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(self.timeout)
+            sock.connect(self.socket_path)
+        except (FileNotFoundError, ConnectionRefusedError, TimeoutError) as e:
+            sock.close()
+            raise DaemonUnavailable(str(e))
+
+        with sock, sock.makefile("rwb") as stream:
+            message = {"method": method, "path": path, "body": body or {}}
+            try:
+                stream.write(json.dumps(message).encode("utf-8") + b"\n")
+                stream.flush()
+                line = stream.readline(_MAX_LINE)
+            except (ConnectionError, TimeoutError) as e:
+                raise DaemonUnavailable(str(e))
+
+            if not line:
+                raise DaemonUnavailable("Daemon closed the connection.")
+            response = json.loads(line)
+
+        if response["status"] != 200:
+            raise RequestError(response["status"], response["payload"]["error"])
+        return response["payload"]
+
+    def is_running(self) -> bool:
+        try:
+            self.request("/health", method="GET")
+            return True
+        except (DaemonUnavailable, OSError):
+            return False
+
+
+def results_from_dict(payload: Dict) -> Dict[str, List[Dict]]:
+    """
+    Match results as returned by the service, with ConceptType restored.
+    """
+    return {
+        bucket: [{**r, "jd_type": ConceptType(r["jd_type"])} for r in records]
+        for bucket, records in payload.items()
+    }
+
+
+def spawn_daemon(
+    socket_path: Optional[str] = None,
+    idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+) -> subprocess.Popen:
+    """
+    Start a detached daemon; returns immediately, before the model loads.
+    """
+    return subprocess.Popen(
+        [
+            sys.executable, "-m", "resume_intelligence.app.daemon",
+            "--socket", socket_path or default_socket_path(),
+            "--idle-timeout", str(idle_timeout),
+        ],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+
+# -------------------------
+# Server
+# -------------------------
+class _Handler(socketserver.StreamRequestHandler):
+    server: "DaemonServer"
+
+    def handle(self) -> None:
+        line = self.rfile.readline(_MAX_LINE)
+        if not line:
+            return
+
+        self.server.touch(+1)
+        try:
+            message = json.loads(line)
+            if message.get("path") == "/shutdown":
+                status, payload = 200, {"status": "stopping"}
+                threading.Thread(target=self.server.shutdown, daemon=True).start()
+            else:
+                status, payload = 200, self.server.service.handle(
+                    message.get("method", "POST"),
+                    message.get("path", ""),
+                    message.get("body") or {},
+                )
+        except RequestError as e:
+            status, payload = e.status, {"error": str(e)}
+        except (
+            DocumentParseError,
+            UnsupportedFileTypeError,
+            FileNotFoundError,
+            ValueError,
+        ) as e:
+            status, payload = 400, {"error": str(e)}
+        except Exception as e:
+            # A bug must not take the daemon down; the client reruns the
+            # call in-process, where it surfaces normally
+            status, payload = 500, {"error": f"{type(e).__name__}: {e}"}
+        finally:
+            self.server.touch(-1)
+
+        self.wfile.write(json.dumps({"status": status, "payload": payload}).encode("utf-8") + b"\n")
+
+
+class DaemonServer(socketserver.ThreadingUnixStreamServer):
+    """
+    ScoringService on a Unix socket that stops itself when idle.
+
+    Args:
+        socket_path: Where to listen; a stale socket file is replaced
+        service: Request handler; may be attached after binding, so that
+            callers queue on the socket while the model loads
+        idle_timeout: Seconds without requests before shutting down
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        socket_path: str,
+        service: Optional["ScoringService"],
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+    ):
+        _clear_stale_socket(socket_path)
+
+        # Owner-only socket: requests can name arbitrary local paths
+        previous = os.umask(0o177)
+        try:
+            super().__init__(socket_path, _Handler)
+        finally:
+            os.umask(previous)
+
+        self.socket_path = socket_path
+        self.service = service
+        self.idle_timeout = idle_timeout
+
+        self._lock = threading.Lock()
+        self._active = 0
+        self._last_activity = time.monotonic()
+
+    def touch(self, delta: int) -> None:
+        with self._lock:
+            self._active += delta
+            self._last_activity = time.monotonic()
+
+    def idle_for(self) -> float:
+        with self._lock:
+            if self._active:
+                return 0.0
+            return time.monotonic() - self._last_activity
+
+    def _watch_idle(self) -> None:
+        while True:
+            remaining = self.idle_timeout - self.idle_for()
+            if remaining <= 0:
+                self.shutdown()
+                return
+            time.sleep(min(remaining, 1.0))
+
+    def serve(self) -> None:
+        """
+        Serve until idle for ``idle_timeout`` or asked to stop, then clean up.
+        """
+        self.touch(0)
+        watcher = threading.Thread(target=self._watch_idle, daemon=True)
+        watcher.start()
+        try:
+            self.serve_forever(poll_interval=0.1)
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        self.server_close()
+        if self.service is not None:
+            self.service.close()
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+
+
+def _clear_stale_socket(socket_path: str) -> None:
+    if not os.path.exists(socket_path):
+        return
+
+    if DaemonClient(socket_path, timeout=1.0).is_running():
+        raise RuntimeError(f"A daemon is already listening on {socket_path}")
+
+    # Left behind by a daemon that was killed
+    os.remove(socket_path)
+
+
+def _load_embedder(spec: Optional[str]):
+    # "package.module:ClassName" → instance; default is the real model
+    if not spec:
+        from resume_intelligence.core.matching.embedder import ConceptEmbedder
+        return ConceptEmbedder()
+
+    module_name, _, class_name = spec.partition(":")
+    return getattr(importlib.import_module(module_name), class_name)()
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="resume-intelligence warm daemon")
+    parser.add_argument("--socket", default=default_socket_path())
+    parser.add_argument("--idle-timeout", type=float, default=DEFAULT_IDLE_TIMEOUT)
+    parser.add_argument("--workers", type=int, default=0)
+    parser.add_argument(
+        "--embedder", default=None,
+        help="module:Class of an alternative embedder (benchmarks, tests)",
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        server = DaemonServer(args.socket, None, args.idle_timeout)
+    except (RuntimeError, OSError):
+        # Another CLI call won the race to start the daemon
+        return
+
+    # Bound before the model loads: early callers wait instead of
+    # falling back and spawning daemons of their own
+    try:
+        from resume_intelligence.app.service import ScoringService
+
+        # The socket is owner-only: the CLI forwards the caller's own
+        # files by path, which this process could read anyway
+        server.service = ScoringService(
+            _load_embedder(args.embedder),
+            workers=args.workers,
+            document_root=os.path.abspath(os.sep),
+        )
+    except BaseException:
+        server.close()
+        raise
+
+    server.serve()
+
+
+if __name__ == "__main__":
+    main()
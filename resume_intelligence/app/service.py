@@ -0,0 +1,476 @@
+# Local HTTP scoring service (stdlib only).
+
+# One long-running process keeps the embedding model resident, so an ATS
+# calling it pays the model load once instead of once per request.
+
+# POST /parse    {"document": D}                        → {"text"}
+# POST /analyze  {"document": D, "source": "resume"|"jd"} → {"concepts"}
+# POST /match    {"resume": D, "jd": D, "cascade": bool} → {"ats_score", "match_results",
+#                                                          "cascade" (stage fractions or null),
+#                                                          "cached"}
+# POST /rank     {"jd": D, "resumes": [{"id", ...D}], "top": n}
+#                                                       → {"ranked": [...]}
+# GET  /health                                          → {"status", "model", "in_flight",
+#                                                          "scheduler", "result_cache"}
+
+# /match and /rank also take "priority": "interactive" | "bulk"; by
+# default /match is interactive and /rank is bulk.
+
+# D is {"text": "..."}, {"path": "..."} or {"content": base64, "filename": "cv.pdf"}.
+# Path documents are read by this process, so they are refused unless
+# the service has a document_root, and must resolve (symlinks included)
+# to a file under it.
+
+# With a ResultCache, /match first looks the pair up by the content
+# hashes of both documents (core/matching/result_cache.py); a hit is
+# answered without parsing or the model, with "cascade": null.
+
+# Request flow:
+# handler thread → concurrency slot (503 when all are busy)
+# → parse/extract on the process pool (timeout → 504)
+# → embedding + matching in the handler thread, one task at a time
+#   through the shared CachedEmbedder, in the order the PriorityScheduler
+#   (core/scheduler.py) grants the model: a /match holds it for the whole
+#   match, a /rank for one batch of rank_batch resumes at a time, so
+#   interactive requests overtake a long ranking at its next batch
+
+import base64
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from resume_intelligence.core.exception import (
+    DocumentParseError,
+    RequestError,
+    UnsupportedFileTypeError,
+)
+from resume_intelligence.core.matching.ats_score import compute_ats_score
+from resume_intelligence.core.matching.embedder import CachedEmbedder
+from resume_intelligence.core.matching.lexical import LexicalPrefilter
+from resume_intelligence.core.matching.matcher import ConceptMatcher
+from resume_intelligence.core.matching.result_cache import (
+    ResultCache,
+    content_digest,
+    file_digest,
+)
+from resume_intelligence.core.parser import parse_document
+from resume_intelligence.core.pipeline import analyze_text
+from resume_intelligence.core.scheduler import BULK, INTERACTIVE, PriorityScheduler
+from resume_intelligence.core.semantics.concept import Concept, ConceptSource
+
+
+MAX_BODY_BYTES = 20 * 1024 * 1024
+
+
+# -------------------------
+# Worker-side functions (must stay picklable top-level functions)
+# -------------------------
+def document_text(document: Dict) -> str:
+    """
+    Raw text of a request document spec.
+    """
+    if "text" in document:
+        return str(document["text"])
+
+    if "path" in document:
+        return parse_document(document["path"])
+
+    if "content" in document:
+        suffix = os.path.splitext(document.get("filename", ""))[1]
+        with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as f:
+            f.write(base64.b64decode(document["content"]))
+        try:
+            return parse_document(f.name)
+        finally:
+            os.remove(f.name)
+
+    raise ValueError("A document needs 'text', 'path' or 'content'.")
+
+
+def document_digest(document: Dict) -> str:
+    """
+    Content hash of a request document spec, for the result cache.
+    """
+    if "text" in document:
+        return content_digest(str(document["text"]).encode("utf-8"))
+
+    if "path" in document:
+        return file_digest(document["path"])
+
+    if "content" in document:
+        suffix = os.path.splitext(document.get("filename", ""))[1]
+        return content_digest(base64.b64decode(document["content"]), suffix)
+
+    raise ValueError("A document needs 'text', 'path' or 'content'.")
+
+
+def analyze_document(document: Dict, source: ConceptSource) -> List[Concept]:
+    return analyze_text(document_text(document), source)
+
+
+# -------------------------
+# Serialization
+# -------------------------
+def concept_to_dict(concept: Concept) -> Dict:
+    return {
+        "text": concept.text,
+        "type": concept.type.value,
+        "confidence": concept.confidence,
+        "sentences": concept.sentences,
+        "source": concept.source.value,
+    }
+
+
+def results_to_dict(match_results: Dict[str, List[Dict]]) -> Dict:
+    return {
+        bucket: [{**r, "jd_type": r["jd_type"].value} for r in records]
+        for bucket, records in match_results.items()
+    }
+
+
+def _source(value: Optional[str]) -> ConceptSource:
+    try:
+        return ConceptSource(value or "resume")
+    except ValueError:
+        raise RequestError(400, f"Unknown source: {value}")
+
+
+# -------------------------
+# Service
+# -------------------------
+class ScoringService:
+    """
+    Request handling independent of HTTP, so it can be driven directly.
+
+    Args:
+        embedder: Resident embedder (e.g. ConceptEmbedder); wrapped in a cache
+        workers: Parse/extract processes (0 uses threads in this process)
+        max_concurrent: Requests served at once; more get 503
+        timeout: Seconds a request may spend before it gets 504
+        scheduler: Grants the model to requests by priority class
+        rank_batch: Resumes a /rank matches per model slot
+        result_cache: Finished /match results, reused for repeated pairs
+        document_root: Folder {"path"} documents may be read from; None
+            accepts only text and content
+    """
+
+    def __init__(
+        self,
+        embedder,
+        workers: int = 2,
+        max_concurrent: int = 8,
+        timeout: float = 30.0,
+        scheduler: Optional[PriorityScheduler] = None,
+        rank_batch: int = 16,
+        result_cache: Optional[ResultCache] = None,
+        document_root: Optional[str] = None,
+    ):
+        self.embedder = (
+            embedder if isinstance(embedder, CachedEmbedder)
+            else CachedEmbedder(embedder)
+        )
+        self.timeout = timeout
+        self.max_concurrent = max_concurrent
+
+        self._executor: Executor = (
+            ProcessPoolExecutor(max_workers=workers) if workers > 0
+            else ThreadPoolExecutor(max_workers=max_concurrent)
+        )
+        self._slots = threading.BoundedSemaphore(max_concurrent)
+        self.scheduler = scheduler or PriorityScheduler()
+        self.rank_batch = max(rank_batch, 1)
+        self.result_cache = result_cache
+        self.document_root = os.path.realpath(document_root) if document_root else None
+        self._in_flight = 0
+        self._count_lock = threading.Lock()
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    # -------------------------
+    # Plumbing
+    # -------------------------
+    def handle(self, method: str, path: str, body: Dict) -> Dict:
+        routes = {
+            ("GET", "/health"): self.health,
+            ("POST", "/parse"): self.parse,
+            ("POST", "/analyze"): self.analyze,
+            ("POST", "/match"): self.match,
+            ("POST", "/rank"): self.rank,
+        }
+        route = routes.get((method, path))
+        if route is None:
+            raise RequestError(404, f"No route for {method} {path}")
+
+        if path == "/health":
+            return route(body, None)
+
+        if not self._slots.acquire(blocking=False):
+            raise RequestError(503, "Too many concurrent requests.")
+
+        with self._count_lock:
+            self._in_flight += 1
+        try:
+            return route(body, time.monotonic() + self.timeout)
+        finally:
+            with self._count_lock:
+                self._in_flight -= 1
+            self._slots.release()
+
+    def _wait(self, futures, deadline: float) -> List:
+        try:
+            return [
+                f.result(timeout=max(0.0, deadline - time.monotonic()))
+                for f in futures
+            ]
+        except FutureTimeoutError:
+            for f in futures:
+                f.cancel()
+            raise RequestError(504, "Request timed out.")
+
+    def _document(self, document) -> Dict:
+        if not isinstance(document, dict):
+            raise RequestError(400, "A document must be a JSON object.")
+        if "text" in document or "path" not in document:
+            return document
+
+        if self.document_root is None:
+            raise RequestError(400, "Path documents are disabled; send 'text' or 'content'.")
+        path = os.path.realpath(str(document["path"]))
+        if os.path.commonpath([path, self.document_root]) != self.document_root:
+            raise RequestError(400, f"{document['path']} is outside the document root.")
+        return {"path": path}
+
+    def _check(self, deadline: float) -> None:
+        if time.monotonic() > deadline:
+            raise RequestError(504, "Request timed out.")
+
+    @contextmanager
+    def _model(self, body: Dict, default: str, deadline: float) -> Iterator[None]:
+        priority = body.get("priority", default)
+        if priority not in self.scheduler.stats:
+            raise RequestError(400, f"Unknown priority: {priority}")
+        try:
+            with self.scheduler.slot(priority, max(0.0, deadline - time.monotonic())):
+                yield
+        except TimeoutError:
+            raise RequestError(504, "Request timed out waiting for the model.")
+
+    def _analyze_all(
+        self,
+        documents: List[Tuple[Dict, ConceptSource]],
+        deadline: float,
+    ) -> List[List[Concept]]:
+        futures = [
+            self._executor.submit(analyze_document, document, source)
+            for document, source in documents
+        ]
+        return self._wait(futures, deadline)
+
+    def _matcher(self, cascade: bool) -> ConceptMatcher:
+        return ConceptMatcher(
+            self.embedder, prefilter=LexicalPrefilter() if cascade else None
+        )
+
+    # -------------------------
+    # Endpoints
+    # -------------------------
+    def health(self, body: Dict, deadline: Optional[float]) -> Dict:
+        return {
+            "status": "ok",
+            "model": self.embedder.model_name,
+            "in_flight": self._in_flight,
+            "max_concurrent": self.max_concurrent,
+            "scheduler": self.scheduler.as_dict(),
+            "result_cache": self.result_cache.as_dict() if self.result_cache else None,
+        }
+
+    def parse(self, body: Dict, deadline: float) -> Dict:
+        document = self._document(_require(body, "document"))
+        text = self._wait([self._executor.submit(document_text, document)], deadline)[0]
+        return {"text": text}
+
+    def analyze(self, body: Dict, deadline: float) -> Dict:
+        document = self._document(_require(body, "document"))
+        (concepts,) = self._analyze_all([(document, _source(body.get("source")))], deadline)
+        return {"concepts": [concept_to_dict(c) for c in concepts]}
+
+    def match(self, body: Dict, deadline: float) -> Dict:
+        resume = self._document(_require(body, "resume"))
+        jd = self._document(_require(body, "jd"))
+
+        key = None
+        if self.result_cache is not None:
+            key = self.result_cache.key(
+                document_digest(resume),
+                document_digest(jd),
+                self.embedder.model_name,
+                cascade=bool(body.get("cascade")),
+            )
+            cached = self.result_cache.get(key)
+            if cached is not None:
+                return {
+                    "ats_score": cached.ats_score,
+                    "match_results": results_to_dict(cached.match_results),
+                    "cascade": None,
+                    "cached": True,
+                }
+
+        resume_concepts, jd_concepts = self._analyze_all(
+            [(resume, ConceptSource.RESUME), (jd, ConceptSource.JD)],
+            deadline,
+        )
+        if not jd_concepts:
+            raise ValueError("No valid concepts found in job description.")
+
+        self._check(deadline)
+        prefilter = LexicalPrefilter() if body.get("cascade") else None
+        with self._model(body, INTERACTIVE, deadline):
+            results = ConceptMatcher(self.embedder, prefilter=prefilter).match(
+                jd_concepts, resume_concepts
+            )
+
+        ats_score = compute_ats_score(jd_concepts, results)
+        if key is not None:
+            self.result_cache.put(key, ats_score, results)
+
+        return {
+            "ats_score": ats_score,
+            "match_results": results_to_dict(results),
+            "cascade": prefilter.stats.fractions() if prefilter else None,
+            "cached": False,
+        }
+
+    def rank(self, body: Dict, deadline: float) -> Dict:
+        resumes = _require(body, "resumes")
+        if not isinstance(resumes, list):
+            raise ValueError("'resumes' must be a list.")
+        if not all(isinstance(r, dict) for r in resumes):
+            raise RequestError(400, "Every resume must be a JSON object.")
+        top = body.get("top")
+        if top is not None and (
+            isinstance(top, bool) or not isinstance(top, int) or top < 0
+        ):
+            raise RequestError(400, "'top' must be a non-negative integer.")
+        ids = [str(r.get("id", i)) for i, r in enumerate(resumes)]
+
+        analyzed = self._analyze_all(
+            [(self._document(_require(body, "jd")), ConceptSource.JD)]
+            + [(self._document(r), ConceptSource.RESUME) for r in resumes],
+            deadline,
+        )
+        jd_concepts, resume_concepts = analyzed[0], analyzed[1:]
+        if not jd_concepts:
+            raise ValueError("No valid concepts found in job description.")
+
+        ranked = []
+        matcher = self._matcher(bool(body.get("cascade")))
+        pairs = list(zip(ids, resume_concepts))
+        for start in range(0, len(pairs), self.rank_batch):
+            batch = pairs[start:start + self.rank_batch]
+            with self._model(body, BULK, deadline):
+                # Every concept text in the batch goes to the model at once
+                texts = [c.text for c in jd_concepts]
+                for _, concepts in batch:
+                    texts.extend(c.text for c in concepts)
+                self.embedder.embed_texts(list(dict.fromkeys(texts)))
+
+                for resume_id, concepts in batch:
+                    self._check(deadline)
+                    results = matcher.match(jd_concepts, concepts)
+                    ranked.append({
+                        "id": resume_id,
+                        "ats_score": compute_ats_score(jd_concepts, results),
+                        "matched": len(results["matched"]),
+                        "partial": len(results["partial"]),
+                        "missing": len(results["missing"]),
+                    })
+
+        ranked.sort(key=lambda r: (-r["ats_score"], r["id"]))
+        return {"ranked": ranked[:top] if top else ranked}
+
+
+def _require(body: Dict, key: str):
+    if key not in body:
+        raise RequestError(400, f"Missing '{key}'.")
+    return body[key]
+
+
+# -------------------------
+# HTTP
+# -------------------------
+class _Handler(BaseHTTPRequestHandler):
+    service: ScoringService
+
+    def _respond(self, status: int, payload: Dict) -> None:
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        if status == 503:
+            self.send_header("Retry-After", "1")
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _dispatch(self, method: str) -> None:
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+            if length > MAX_BODY_BYTES:
+                raise RequestError(413, "Request body too large.")
+
+            body = {}
+            if length:
+                try:
+                    body = json.loads(self.rfile.read(length))
+                except json.JSONDecodeError as e:
+                    raise RequestError(400, f"Invalid JSON: {e}")
+                if not isinstance(body, dict):
+                    raise RequestError(400, "Request body must be a JSON object.")
+
+            self._respond(200, self.service.handle(method, self.path, body))
+
+        except RequestError as e:
+            self._respond(e.status, {"error": str(e)})
+
+        except (
+            DocumentParseError,
+            UnsupportedFileTypeError,
+            FileNotFoundError,
+            ValueError,
+        ) as e:
+            self._respond(400, {"error": str(e)})
+
+        except Exception as e:
+            # Answer rather than drop the connection on a bug
+            self._respond(500, {"error": f"{type(e).__name__}: {e}"})
+
+    def do_GET(self) -> None:
+        self._dispatch("GET")
+
+    def do_POST(self) -> None:
+        self._dispatch("POST")
+
+    def log_message(self, format: str, *args) -> None:
+        # Quiet by default; the ATS in front of us does request logging
+        pass
+
+
+def make_server(
+    service: ScoringService,
+    host: str = "127.0.0.1",
+    port: int = 8765,
+) -> ThreadingHTTPServer:
+    """
+    HTTP server bound to ``host:port`` (port 0 picks a free one).
+    """
+    handler = type("Handler", (_Handler,), {"service": service})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
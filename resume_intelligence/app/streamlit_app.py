@@ -1,12 +1,23 @@
+import hashlib
+import os
+import threading
+import time
+
 import streamlit as st
 from pathlib import Path
 import tempfile
 
 from resume_intelligence.core.document import Document
 from resume_intelligence.core.matching.ats_score import compute_ats_score
+from resume_intelligence.core.matching.embedder import (
+    DEFAULT_MODEL,
+    CachedEmbedder,
+    ConceptEmbedder,
+)
 from resume_intelligence.core.normalizer import normalize_document
 from resume_intelligence.core.parser import parse_document
 from resume_intelligence.core.matching.matcher import ConceptMatcher
+from resume_intelligence.core.matching.result_cache import ResultCache, content_digest
 from resume_intelligence.core.semantics.concept import ConceptSource
 from resume_intelligence.core.semantics.consolidator import consolidate_concepts
 from resume_intelligence.core.semantics.extractor import extract_concepts
@@ -16,6 +27,88 @@ st.set_page_config(
     layout="wide",
 )
 
+# ----------------------------
+# Cached stages
+# ----------------------------
+# Every stage is keyed by the SHA-256 of the document content it derives
+# from (arguments starting with "_" are not hashed by Streamlit), so a JD
+# edit recomputes only the JD side and the matching.
+
+# In front of all of them, the ResultCache answers a pair that was
+# scored before, in this server or (with RESUME_INTELLIGENCE_RESULT_CACHE
+# naming a shared file) by the CLI or the service.
+
+# (stage, side) pairs whose cached body actually ran during this script
+# run; anything else timed below was a cache hit
+_computed = set()
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+@st.cache_resource(show_spinner=False)
+def load_embedder():
+    # One model per server process, with its vector cache; the lock keeps
+    # concurrent sessions from using the (not thread-safe) cache at once
+    _computed.add(("model load", "-"))
+    return CachedEmbedder(ConceptEmbedder()), threading.Lock()
+
+
+@st.cache_resource(show_spinner=False)
+def load_result_cache() -> ResultCache:
+    return ResultCache(os.environ.get("RESUME_INTELLIGENCE_RESULT_CACHE"))
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def parse_upload(digest: str, suffix: str, _data: bytes) -> str:
+    _computed.add(("parse", "resume"))
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
+        tmp.write(_data)
+    try:
+        return parse_document(tmp.name)
+    finally:
+        os.remove(tmp.name)
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def normalize(digest: str, side: str, _raw_text: str) -> Document:
+    _computed.add(("normalize", side))
+    doc = Document(raw_text=_raw_text)
+    normalize_document(doc)
+    return doc
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def extract(digest: str, side: str, _doc: Document):
+    _computed.add(("extract", side))
+    return extract_concepts(_doc, ConceptSource(side))
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def consolidate(digest: str, side: str, _concepts):
+    _computed.add(("consolidate", side))
+    return consolidate_concepts(_concepts)
+
+
+def timed(timings, stage, side, fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    timings.append({
+        "Stage": stage,
+        "Side": side,
+        "Time (ms)": round((time.perf_counter() - start) * 1000, 1),
+        "Cache": "computed" if (stage, side) in _computed else "hit",
+    })
+    return result
+
+
+def analyze_side(timings, digest, side, raw_text):
+    doc = timed(timings, "normalize", side, normalize, digest, side, raw_text)
+    concepts = timed(timings, "extract", side, extract, digest, side, doc)
+    return timed(timings, "consolidate", side, consolidate, digest, side, concepts)
+
+
 st.title("📄 Resume Intelligence – ATS Match Analyzer")
 
 st.markdown(
@@ -50,35 +143,66 @@ if analyze:
         st.error("Please upload a resume and paste a job description.")
         st.stop()
 
+    timings = []
+
     with st.spinner("Processing documents..."):
-        # Save resume to temp file
-        with tempfile.NamedTemporaryFile(delete=False, suffix=Path(resume_file.name).suffix) as tmp:
-            tmp.write(resume_file.read())
-            resume_path = Path(tmp.name)
-
-        # Parse documents
-        resume_text = parse_document(str(resume_path))
-        resume_doc = Document(raw_text=resume_text)
-        normalize_document(resume_doc)
-
-        # jd_text = parse_document(str(jd_text))
-        jd_doc = Document(raw_text=jd_text)
-        normalize_document(jd_doc)
-
-        # Extract & consolidate concepts
-        resume_concepts = consolidate_concepts(
-            extract_concepts(resume_doc, ConceptSource.RESUME)
-        )
-        jd_concepts = consolidate_concepts(
-            extract_concepts(jd_doc, ConceptSource.JD)
+        resume_data = resume_file.getvalue()
+        resume_digest = _digest(resume_data)
+        jd_digest = _digest(jd_text.encode("utf-8"))
+        suffix = Path(resume_file.name).suffix
+
+        result_cache = load_result_cache()
+        result_key = result_cache.key(
+            content_digest(resume_data, suffix),
+            content_digest(jd_text.encode("utf-8")),
+            DEFAULT_MODEL,
+            cascade=False,
         )
+        start = time.perf_counter()
+        cached = result_cache.get(result_key)
+        timings.append({
+            "Stage": "result cache",
+            "Side": "-",
+            "Time (ms)": round((time.perf_counter() - start) * 1000, 1),
+            "Cache": "hit" if cached is not None else "miss",
+        })
+
+        if cached is not None:
+            match_results, ats_score = cached.match_results, cached.ats_score
+        else:
+            # Parse & analyze resume
+            resume_text = timed(
+                timings, "parse", "resume", parse_upload,
+                resume_digest, suffix, resume_data,
+            )
+            resume_concepts = analyze_side(
+                timings, resume_digest, ConceptSource.RESUME.value, resume_text
+            )
+
+            # Analyze JD (pasted text, nothing to parse)
+            jd_concepts = analyze_side(
+                timings, jd_digest, ConceptSource.JD.value, jd_text
+            )
+
+            # Match concepts
+            embedder, model_lock = timed(timings, "model load", "-", load_embedder)
 
-        # Match concepts
-        matcher = ConceptMatcher()
-        match_results = matcher.match(jd_concepts, resume_concepts)
+            start = time.perf_counter()
+            with model_lock:
+                hits, misses = embedder.hits, embedder.misses
+                match_results = ConceptMatcher(embedder).match(jd_concepts, resume_concepts)
+                hits, misses = embedder.hits - hits, embedder.misses - misses
 
-        # ATS score
-        ats_score = compute_ats_score(jd_concepts, match_results)
+            timings.append({
+                "Stage": "match",
+                "Side": "-",
+                "Time (ms)": round((time.perf_counter() - start) * 1000, 1),
+                "Cache": f"{hits} vectors reused, {misses} embedded",
+            })
+
+            # ATS score
+            ats_score = compute_ats_score(jd_concepts, match_results)
+            result_cache.put(result_key, ats_score, match_results)
 
     # ----------------------------
     # Output
@@ -108,3 +232,6 @@ if analyze:
 
     with colC:
         render_section("❌ Missing", match_results["missing"], "red")
+
+    with st.expander("⏱️ Stage timings"):
+        st.table(timings)
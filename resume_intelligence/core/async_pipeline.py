@@ -0,0 +1,304 @@
+# asyncio facade over the pipeline, for event-loop servers.
+
+# Nothing here blocks the loop; each stage runs where it fits best:
+# parse_document   → thread pool   (file I/O, pdfplumber / python-docx)
+# analyze_text     → process pool  (CPU-bound normalize + extract)
+# ConceptMatcher   → thread pool, whose embed calls all go through
+# EmbeddingBatcher → one model thread; calls that queue up while the
+#                    model is busy are merged into a single model call
+
+# Per-request deadlines and cancellation: a request that times out or is
+# cancelled drops its queued stage jobs, and its matcher aborts at the
+# next embed call instead of occupying the model.
+
+import asyncio
+import os
+import queue
+import threading
+import time
+from concurrent.futures import (
+    CancelledError,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Dict, List, Optional, Tuple
+
+from resume_intelligence.core.matching.ats_score import compute_ats_score
+from resume_intelligence.core.matching.embedder import CachedEmbedder
+from resume_intelligence.core.matching.lexical import LexicalPrefilter
+from resume_intelligence.core.matching.matcher import ConceptMatcher
+from resume_intelligence.core.parser import parse_document
+from resume_intelligence.core.pipeline import analyze_text
+from resume_intelligence.core.semantics.concept import Concept, ConceptSource
+
+
+class EmbeddingBatcher:
+    """
+    Serializes every model call onto one thread, merging requests that
+    arrive while the model is busy into one ``embed_texts`` call.
+
+    Args:
+        embedder: Model to call; wrapped in a CachedEmbedder, which is
+            only ever touched from the model thread
+        max_batch_texts: Stop merging queued requests past this many texts
+    """
+
+    def __init__(self, embedder, max_batch_texts: int = 4096):
+        self.embedder = (
+            embedder if isinstance(embedder, CachedEmbedder)
+            else CachedEmbedder(embedder)
+        )
+        self.max_batch_texts = max_batch_texts
+
+        self.model_calls = 0
+        self.requests = 0
+
+        self._queue: "queue.Queue[Optional[Tuple[List[str], Future]]]" = queue.Queue()
+        self._thread = threading.Thread(
+            target=self._run, name="ri-model", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, texts: List[str]) -> Future:
+        future: Future = Future()
+        self._queue.put((list(texts), future))
+        return future
+
+    def close(self) -> None:
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+
+            pending = [item]
+            size = len(item[0])
+            while size < self.max_batch_texts:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    self._queue.put(None)
+                    break
+                pending.append(item)
+                size += len(item[0])
+
+            # Requests cancelled while queued never reach the model
+            live = [
+                (texts, future) for texts, future in pending
+                if future.set_running_or_notify_cancel()
+            ]
+            if not live:
+                continue
+
+            unique = list(dict.fromkeys(t for texts, _ in live for t in texts))
+            try:
+                vectors = dict(zip(unique, self.embedder.embed_texts(unique)))
+            except BaseException as e:
+                for _, future in live:
+                    future.set_exception(e)
+                continue
+
+            self.model_calls += 1
+            self.requests += len(live)
+            for texts, future in live:
+                future.set_result([vectors[t] for t in texts])
+
+
+class _BatchedEmbedder:
+    # Embedder seen by a matcher running in a worker thread: blocks on
+    # the batcher, and gives up once its request is cancelled or past its
+    # deadline
+
+    def __init__(self, batcher: EmbeddingBatcher, deadline: Optional[float]):
+        self.batcher = batcher
+        self.deadline = deadline
+        self.model_name = batcher.embedder.model_name
+
+        self._cancelled = False
+        self._future: Optional[Future] = None
+
+    def cancel(self) -> None:
+        self._cancelled = True
+        if self._future is not None:
+            self._future.cancel()
+
+    def embed_texts(self, texts: List[str]) -> List[List[float]]:
+        if not texts:
+            return []
+        if self._cancelled:
+            raise CancelledError()
+
+        timeout = None
+        if self.deadline is not None:
+            timeout = self.deadline - time.monotonic()
+            if timeout <= 0:
+                raise TimeoutError("Request deadline passed before embedding.")
+
+        self._future = self.batcher.submit(texts)
+        try:
+            return self._future.result(timeout=timeout)
+        except FutureTimeoutError:
+            self._future.cancel()
+            raise TimeoutError("Request deadline passed while embedding.")
+
+
+async def _wait_for(coro, timeout: Optional[float]):
+    # Before 3.11 wait_for raises asyncio.TimeoutError, not the builtin
+    try:
+        return await asyncio.wait_for(coro, timeout)
+    except asyncio.TimeoutError:
+        raise TimeoutError(f"Request took longer than {timeout}s.") from None
+
+
+class AsyncPipeline:
+    """
+    Awaitable parse → analyze → match → score.
+
+    Args:
+        embedder: Resident embedding model (e.g. ConceptEmbedder)
+        parse_threads: Threads for document parsing
+        extract_workers: Processes for normalize/extract (0 uses threads)
+        match_threads: Matchers running at once (their model calls are
+            still serialized through the batcher)
+
+    Use as ``async with AsyncPipeline(embedder) as pipeline: ...`` or call
+    ``close()`` when done.
+    """
+
+    def __init__(
+        self,
+        embedder,
+        parse_threads: int = 4,
+        extract_workers: int = min(4, os.cpu_count() or 1),
+        match_threads: int = 4,
+    ):
+        self.batcher = EmbeddingBatcher(embedder)
+
+        self._parse = ThreadPoolExecutor(parse_threads, thread_name_prefix="ri-parse")
+        self._extract: Executor = (
+            ProcessPoolExecutor(extract_workers) if extract_workers > 0
+            else ThreadPoolExecutor(parse_threads, thread_name_prefix="ri-extract")
+        )
+        self._match = ThreadPoolExecutor(match_threads, thread_name_prefix="ri-match")
+
+    async def __aenter__(self) -> "AsyncPipeline":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        loop = asyncio.get_running_loop()
+        for executor in (self._parse, self._extract, self._match):
+            executor.shutdown(wait=False, cancel_futures=True)
+        await loop.run_in_executor(None, self.batcher.close)
+
+    async def _run(self, executor: Executor, fn, *args):
+        # Cancelling the awaiting task cancels the job if it hasn't started
+        return await asyncio.get_running_loop().run_in_executor(executor, fn, *args)
+
+    # -------------------------
+    # Stages
+    # -------------------------
+    async def parse(self, path: str) -> str:
+        return await self._run(self._parse, parse_document, str(path))
+
+    async def analyze_text(self, raw_text: str, source: ConceptSource) -> List[Concept]:
+        return await self._run(self._extract, analyze_text, raw_text, source)
+
+    async def analyze_file(self, path: str, source: ConceptSource) -> List[Concept]:
+        return await self.analyze_text(await self.parse(path), source)
+
+    async def embed(self, texts: List[str]) -> List[List[float]]:
+        return await asyncio.wrap_future(self.batcher.submit(texts))
+
+    async def match(
+        self,
+        jd_concepts: List[Concept],
+        resume_concepts: List[Concept],
+        cascade: bool = False,
+        deadline: Optional[float] = None,
+    ) -> Dict[str, List[Dict]]:
+        """
+        ConceptMatcher.match off the loop.
+
+        Args:
+            deadline: time.monotonic() value after which the matcher
+                stops at its next embed call
+        """
+        embedder = _BatchedEmbedder(self.batcher, deadline)
+        matcher = ConceptMatcher(
+            embedder, prefilter=LexicalPrefilter() if cascade else None
+        )
+        try:
+            return await self._run(
+                self._match, matcher.match, jd_concepts, resume_concepts
+            )
+        except asyncio.CancelledError:
+            # The thread keeps running; stop it feeding the model
+            embedder.cancel()
+            raise
+
+    # -------------------------
+    # End to end
+    # -------------------------
+    async def match_texts(
+        self,
+        resume_text: str,
+        jd_text: str,
+        cascade: bool = False,
+        timeout: Optional[float] = None,
+    ) -> Tuple[float, Dict[str, List[Dict]]]:
+        """
+        (ATS score, match results) for raw texts.
+
+        Raises:
+            TimeoutError: ``timeout`` seconds elapsed
+            ValueError: The job description yields no concepts
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        async def run():
+            resume_concepts, jd_concepts = await asyncio.gather(
+                self.analyze_text(resume_text, ConceptSource.RESUME),
+                self.analyze_text(jd_text, ConceptSource.JD),
+            )
+            return await self._score(jd_concepts, resume_concepts, cascade, deadline)
+
+        return await _wait_for(run(), timeout)
+
+    async def match_files(
+        self,
+        resume_path: str,
+        jd_path: str,
+        cascade: bool = False,
+        timeout: Optional[float] = None,
+    ) -> Tuple[float, Dict[str, List[Dict]]]:
+        """
+        (ATS score, match results) for a resume and JD file; see match_texts.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        async def run():
+            resume_concepts, jd_concepts = await asyncio.gather(
+                self.analyze_file(resume_path, ConceptSource.RESUME),
+                self.analyze_file(jd_path, ConceptSource.JD),
+            )
+            return await self._score(jd_concepts, resume_concepts, cascade, deadline)
+
+        return await _wait_for(run(), timeout)
+
+    async def _score(self, jd_concepts, resume_concepts, cascade, deadline):
+        if not jd_concepts:
+            raise ValueError("No valid concepts found in job description.")
+
+        results = await self.match(jd_concepts, resume_concepts, cascade, deadline)
+        return compute_ats_score(jd_concepts, results), results
@@ -0,0 +1,288 @@
+# Batch matching: one JD against a folder (or glob) of resumes.
+
+# Inputs are resolved and rows written here; the matching itself is
+# core/orchestrator.Pipeline (parse → analyze → embed → match stages, one
+# result row per resume in input order).
+
+# BatchJob runs a Pipeline into an output file, with a running top-K and
+# optional checkpoints (see core/checkpoint.py): a killed job restarts
+# from its last checkpoint, truncates output written after it, and
+# produces the same file an uninterrupted run would have.
+
+import csv
+import glob
+import json
+import os
+import sys
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO
+
+from resume_intelligence.core.checkpoint import BatchCheckpoint, job_fingerprint
+from resume_intelligence.core.parser import SUPPORTED_EXTENSIONS
+
+
+RESULT_FIELDS = ("resume", "ats_score", "matched", "partial", "missing", "error")
+
+
+# -------------------------
+# Inputs
+# -------------------------
+def resolve_inputs(target: str) -> List[str]:
+    """
+    Supported resume paths in a directory (recursive) or matching a glob.
+    """
+    if os.path.isdir(target):
+        candidates = (
+            os.path.join(directory, name)
+            for directory, _, files in os.walk(target)
+            for name in files
+        )
+    else:
+        candidates = glob.iglob(target, recursive=True)
+
+    return sorted(
+        path for path in candidates
+        if os.path.isfile(path)
+        and os.path.splitext(path)[1].lower() in SUPPORTED_EXTENSIONS
+    )
+
+
+# -------------------------
+# Output
+# -------------------------
+def result_row(
+    path: str,
+    ats_score: Optional[float] = None,
+    results: Optional[Dict[str, List[Dict]]] = None,
+    error: Optional[str] = None,
+) -> Dict:
+    """
+    One output row: match counts for a scored resume, or its error.
+    """
+    return {
+        "resume": path,
+        "ats_score": ats_score,
+        "matched": len(results["matched"]) if results is not None else None,
+        "partial": len(results["partial"]) if results is not None else None,
+        "missing": len(results["missing"]) if results is not None else None,
+        "error": error,
+    }
+
+
+class ResultWriter:
+    """
+    Streams result rows as JSONL or CSV, flushing after every row so a
+    partial run still leaves usable output.
+    """
+
+    def __init__(self, stream: TextIO, fmt: str = "jsonl", header: bool = True):
+        if fmt not in ("jsonl", "csv"):
+            raise ValueError(f"Unsupported output format: {fmt}")
+
+        self.stream = stream
+        self.fmt = fmt
+        self._csv = None
+
+        if fmt == "csv":
+            self._csv = csv.DictWriter(stream, fieldnames=RESULT_FIELDS)
+            if header:
+                self._csv.writeheader()
+
+    def write(self, row: Dict) -> None:
+        if self._csv is not None:
+            self._csv.writerow({k: row.get(k) for k in RESULT_FIELDS})
+        else:
+            self.stream.write(json.dumps(row) + "\n")
+        self.stream.flush()
+
+
+def format_for(path: Optional[str], fmt: Optional[str] = None) -> str:
+    """
+    Explicit format, else inferred from the output suffix, else JSONL.
+    """
+    if fmt:
+        return fmt.lower()
+    if path and path.lower().endswith(".csv"):
+        return "csv"
+    return "jsonl"
+
+
+# -------------------------
+# Resumable jobs
+# -------------------------
+class BatchJob:
+    """
+    A Pipeline streaming to an output file, keeping the top-K rows and
+    checkpointing every ``checkpoint_every`` resumes.
+
+    Usage:
+        done = job.prepare(paths)   # resumes from a checkpoint if present
+        for row in job.run():
+            ...
+        job.top                     # best rows, best first
+
+    Args:
+        pipeline: Configured Pipeline (the caller closes it)
+        output_path: Result file; None streams to stdout (no checkpoints)
+        fmt: jsonl or csv
+        checkpoint_dir: Directory for checkpoints; None disables them
+        checkpoint_every: Resumes between checkpoints, rounded up to whole
+            embedding batches so a resumed run batches like an
+            uninterrupted one
+        top_k: Rows kept for the final ranking
+    """
+
+    def __init__(
+        self,
+        pipeline,
+        output_path: Optional[str] = None,
+        fmt: str = "jsonl",
+        checkpoint_dir: Optional[str] = None,
+        checkpoint_every: int = 1000,
+        top_k: int = 10,
+    ):
+        if checkpoint_dir and not output_path:
+            raise ValueError("Checkpointing needs an output file.")
+
+        self.pipeline = pipeline
+        self.output_path = output_path
+        self.fmt = fmt
+        self.checkpoint = BatchCheckpoint(checkpoint_dir) if checkpoint_dir else None
+        batch = pipeline.batch_size
+        self.checkpoint_every = max(1, -(-checkpoint_every // batch)) * batch
+        self.top_k = top_k
+
+        self.top: List[Dict] = []
+        self._paths: List[str] = []
+        self._processed: List[str] = []
+        self._cache: Dict = {}
+        self._saved_texts = set()
+        self._fingerprint = ""
+
+    def prepare(self, paths: Iterable[str]) -> int:
+        """
+        Fix the job's inputs and load its checkpoint, if any.
+
+        Returns:
+            Number of resumes already processed by earlier runs
+        """
+        self._paths = list(paths)
+        self._fingerprint = job_fingerprint(
+            jd=[(c.text, c.type.value, c.confidence) for c in self.pipeline.jd_concepts],
+            model=self.pipeline.embedder.model_name,
+            cascade=self.pipeline.prefilter is not None,
+            paths=self._paths,
+            fmt=self.fmt,
+            top_k=self.top_k,
+        )
+
+        state = self.checkpoint.load() if self.checkpoint else None
+        if state is None:
+            return 0
+
+        if state["fingerprint"] != self._fingerprint:
+            raise ValueError(
+                f"Checkpoint in {self.checkpoint.directory} belongs to a different job."
+            )
+
+        self._processed = state["processed"]
+        self.top = state["top"]
+        self._cache = state["cache"]
+
+        embedder = self.pipeline.embedder
+        texts, vectors = self.checkpoint.load_cache(self._cache, embedder.max_entries)
+        embedder.warm(texts, vectors)
+        self._saved_texts = set(texts)
+
+        # Rows written after the checkpoint are produced again
+        with open(self.output_path, "ab") as f:
+            f.truncate(state["output_bytes"])
+
+        return len(self._processed)
+
+    def run(self) -> Iterator[Dict]:
+        """
+        Yield the result row of every resume not processed yet.
+        """
+        done = set(self._processed)
+        pending = [p for p in self._paths if p not in done]
+        resumed = bool(self._processed)
+
+        if self.output_path:
+            stream = open(
+                self.output_path, "a" if resumed else "w",
+                newline="", encoding="utf-8",
+            )
+        else:
+            stream = sys.stdout
+
+        try:
+            writer = ResultWriter(stream, self.fmt, header=not resumed)
+            since_checkpoint = 0
+
+            for row in self.pipeline.run(pending):
+                writer.write(row)
+                self._processed.append(row["resume"])
+                self._keep(row)
+
+                since_checkpoint += 1
+                if self.checkpoint and since_checkpoint >= self.checkpoint_every:
+                    self._save(stream)
+                    since_checkpoint = 0
+
+                yield row
+
+            if self.checkpoint:
+                self._save(stream)
+
+        finally:
+            if stream is not sys.stdout:
+                stream.close()
+
+    def _keep(self, row: Dict) -> None:
+        if row["ats_score"] is None or self.top_k <= 0:
+            return
+
+        entry = {"resume": row["resume"], "ats_score": row["ats_score"]}
+        if len(self.top) == self.top_k:
+            worst = self.top[-1]
+            if (-entry["ats_score"], entry["resume"]) >= (-worst["ats_score"], worst["resume"]):
+                return
+            self.top.pop()
+
+        self.top.append(entry)
+        self.top.sort(key=lambda r: (-r["ats_score"], r["resume"]))
+
+    def _save(self, stream: TextIO) -> None:
+        # Output first: the state must never point past durable rows
+        stream.flush()
+        os.fsync(stream.fileno())
+
+        embedder = self.pipeline.embedder
+        cached = embedder.texts()
+        new_texts = [t for t in cached if t not in self._saved_texts]
+        logged = self._cache.get("entries", 0) + len(new_texts)
+
+        if embedder.max_entries is not None and logged > 2 * embedder.max_entries:
+            # The log would hold mostly evicted vectors: keep just the
+            # cache, least recently used first as warm() expects
+            self._cache = self.checkpoint.rewrite_cache(
+                self._cache, cached, [embedder.vector(t) for t in cached]
+            )
+            self._saved_texts = set(cached)
+        elif new_texts:
+            self._cache = self.checkpoint.append_cache(
+                self._cache,
+                new_texts,
+                [embedder.vector(t) for t in new_texts],
+            )
+            self._saved_texts.update(new_texts)
+
+        self.checkpoint.save({
+            "fingerprint": self._fingerprint,
+            "processed": self._processed,
+            "top": self.top,
+            "output_bytes": os.path.getsize(self.output_path),
+            "cache": self._cache,
+            "complete": len(self._processed) == len(self._paths),
+        })
+        self.checkpoint.prune_cache(self._cache)
@@ -0,0 +1,185 @@
+# Checkpoints for long-running batch jobs.
+
+# Layout (one directory per job):
+# state.json          → job fingerprint, processed resume ids, top-K rows,
+#                       output byte offset, cache entry count
+# cache_texts.jsonl   → embedding-cache texts, append-only
+# cache_vectors.f64   → their vectors as raw float64 rows, append-only
+
+# state.json is replaced atomically (write temp file, fsync, rename), so a
+# kill at any moment leaves either the previous or the new checkpoint.
+# The cache files may hold entries past the recorded count; they are
+# ignored on load and overwritten by the next append.
+
+# Appending keeps every vector ever embedded, so once the log outgrows the
+# live cache it is rewritten with just the cached entries, under the next
+# log number (cache_texts.1.jsonl, ...). The state names the log it
+# counts in; older logs are deleted only after that state is saved.
+
+# Vectors are kept at float64 so a resumed job scores with exactly the
+# vectors an uninterrupted one would have used.
+
+import glob
+import hashlib
+import json
+import os
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+STATE_NAME = "state.json"
+CACHE_TEXTS_NAME = "cache_texts.jsonl"
+CACHE_VECTORS_NAME = "cache_vectors.f64"
+
+
+def job_fingerprint(**parts) -> str:
+    """
+    Stable hash of everything that determines a job's output.
+    """
+    payload = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class BatchCheckpoint:
+    """
+    Durable progress of one batch job.
+    """
+
+    def __init__(self, directory: str):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.state_path = os.path.join(directory, STATE_NAME)
+
+    def exists(self) -> bool:
+        return os.path.exists(self.state_path)
+
+    # -------------------------
+    # State
+    # -------------------------
+    def load(self) -> Optional[Dict]:
+        if not self.exists():
+            return None
+        with open(self.state_path, encoding="utf-8") as f:
+            return json.load(f)
+
+    def save(self, state: Dict) -> None:
+        tmp_path = self.state_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.state_path)
+
+    # -------------------------
+    # Embedding cache
+    # -------------------------
+    def _cache_paths(self, log: int) -> Tuple[str, str]:
+        paths = []
+        for name in (CACHE_TEXTS_NAME, CACHE_VECTORS_NAME):
+            if log:
+                stem, ext = os.path.splitext(name)
+                name = f"{stem}.{log}{ext}"
+            paths.append(os.path.join(self.directory, name))
+        return paths[0], paths[1]
+
+    def append_cache(
+        self,
+        committed: Dict,
+        texts: Sequence[str],
+        vectors,
+    ) -> Dict:
+        """
+        Append cache entries after the ones recorded in ``committed``.
+
+        Args:
+            committed: Cache position from the last saved state
+                ({"entries", "dim", "text_bytes", "log"}; empty for a
+                new job)
+            texts / vectors: New entries
+
+        Returns:
+            New cache position, to be recorded in the next saved state
+        """
+        entries = committed.get("entries", 0)
+        text_bytes = committed.get("text_bytes", 0)
+        if not texts:
+            return dict(committed)
+
+        vectors = np.ascontiguousarray(vectors, dtype=np.float64)
+        dim = committed.get("dim") or vectors.shape[1]
+
+        texts_path, vectors_path = self._cache_paths(committed.get("log", 0))
+        payload = "".join(json.dumps(t) + "\n" for t in texts).encode("utf-8")
+        with open(texts_path, "ab") as f:
+            f.truncate(text_bytes)
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+
+        with open(vectors_path, "ab") as f:
+            f.truncate(entries * dim * 8)
+            f.write(vectors.tobytes())
+            f.flush()
+            os.fsync(f.fileno())
+
+        return {
+            "entries": entries + len(texts),
+            "dim": dim,
+            "text_bytes": text_bytes + len(payload),
+            "log": committed.get("log", 0),
+        }
+
+    def rewrite_cache(self, committed: Dict, texts: Sequence[str], vectors) -> Dict:
+        """
+        Write ``texts`` / ``vectors`` as a fresh log after the one in
+        ``committed``; the old log stays until prune_cache.
+
+        Returns:
+            New cache position, to be recorded in the next saved state
+        """
+        fresh = {"log": committed.get("log", 0) + 1}
+        for path in self._cache_paths(fresh["log"]):
+            if os.path.exists(path):
+                os.remove(path)  # left by a rewrite whose state never landed
+        return self.append_cache(fresh, texts, vectors)
+
+    def prune_cache(self, committed: Dict) -> None:
+        """
+        Delete every cache log but the one ``committed`` counts in.
+        """
+        keep = set(self._cache_paths(committed.get("log", 0)))
+        for name in (CACHE_TEXTS_NAME, CACHE_VECTORS_NAME):
+            stem, ext = os.path.splitext(name)
+            for path in glob.glob(os.path.join(self.directory, f"{stem}*{ext}")):
+                if path not in keep:
+                    os.remove(path)
+
+    def load_cache(
+        self,
+        committed: Dict,
+        limit: Optional[int] = None,
+    ) -> Tuple[List[str], np.ndarray]:
+        """
+        The cache entries recorded in ``committed``; with ``limit``, only
+        the last (most recently cached) ``limit`` of them.
+        """
+        entries = committed.get("entries", 0)
+        if not entries:
+            return [], np.zeros((0, 0))
+
+        texts_path, vectors_path = self._cache_paths(committed.get("log", 0))
+        with open(texts_path, "rb") as f:
+            payload = f.read(committed["text_bytes"])
+        texts = [json.loads(line) for line in payload.decode("utf-8").splitlines()]
+
+        skip = entries - min(entries, limit) if limit is not None else 0
+        dim = committed["dim"]
+        vectors = np.fromfile(
+            vectors_path,
+            dtype=np.float64,
+            count=(entries - skip) * dim,
+            offset=skip * dim * 8,
+        ).reshape(entries - skip, dim)
+
+        return texts[skip:], vectors
@@ -0,0 +1,328 @@
+# Sharded candidate corpus, ranked by scatter-gather.
+
+# Layout (one root directory):
+# shard-000/ … shard-NNN/  → an ordinary CorpusStore each
+# A resume lives in exactly one shard, chosen by a stable hash of its id.
+
+# Query:
+# coordinator → JD concepts + vectors to every shard (scatter)
+# shard       → its own top-K by pruned ranking (rank_candidates_pruned)
+# coordinator → merge the local lists by (ATS score desc, resume id)
+
+# A candidate is scored whole by the one shard that holds it, and no
+# shard can place more than K candidates in the global top-K, so the
+# merge is exact: when every shard answers it equals ranking one store
+# holding the whole corpus.
+
+# Each shard is served by its own single-process pool, standing in for a
+# remote node: it opens its store once and keeps the memmap, row table
+# and bounds warm between queries. A query has a deadline. Shards that
+# miss it, fail, or are still busy with an earlier query are left out
+# and reported, and the answer is exact over the shards that responded.
+# A shard whose process died is restarted for the next query.
+
+import hashlib
+import multiprocessing
+import os
+import signal
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from resume_intelligence.core.corpus.store import CorpusStore
+from resume_intelligence.core.exception import CorpusStoreError
+from resume_intelligence.core.retrieval.ann import RankedCandidate, merge_ranked
+from resume_intelligence.core.semantics.concept import Concept
+
+
+SHARD_PREFIX = "shard-"
+
+
+def shard_for(resume_id: str, n_shards: int) -> int:
+    """
+    The shard a resume belongs to; stable across runs and machines.
+    """
+    digest = hashlib.blake2b(resume_id.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") % n_shards
+
+
+def shard_directories(root: str) -> List[str]:
+    """
+    Shard store directories under ``root``, in shard order.
+    """
+    names = sorted(
+        name for name in os.listdir(root) if name.startswith(SHARD_PREFIX)
+    ) if os.path.isdir(root) else []
+    if not names:
+        raise CorpusStoreError(f"No corpus shards under {root}")
+    return [os.path.join(root, name) for name in names]
+
+
+def partition_store(store: CorpusStore, root: str, n_shards: int) -> List[str]:
+    """
+    Copy a store's resumes into ``n_shards`` new shard stores under
+    ``root``, with their concepts and vectors; returns their directories.
+    """
+    if n_shards < 1:
+        raise ValueError("n_shards must be at least 1.")
+    if os.path.isdir(root) and os.listdir(root):
+        raise CorpusStoreError(f"{root} is not empty.")
+
+    directories = [
+        os.path.join(root, f"{SHARD_PREFIX}{i:03d}") for i in range(n_shards)
+    ]
+    shards = [CorpusStore(d, store.model_name) for d in directories]
+    try:
+        paths = dict(store.connection.execute("SELECT resume_id, path FROM resumes"))
+        embeddings = store.embeddings
+
+        for resume_id in store.resume_ids():
+            shards[shard_for(resume_id, n_shards)].add_resume(
+                resume_id,
+                store.load_concepts(resume_id),
+                embeddings[store.concept_rows(resume_id)],
+                path=paths[resume_id],
+            )
+    finally:
+        for shard in shards:
+            shard.close()
+
+    return directories
+
+
+# -------------------------
+# Shard side
+# -------------------------
+@dataclass
+class ShardAnswer:
+    candidates: List[RankedCandidate]
+    resumes: int
+    scored: int
+    seconds: float
+    cpu_seconds: float
+
+
+_shard_store: Optional[CorpusStore] = None
+_shard_generation = -1
+
+
+def _open_shard(directory: str, pids) -> None:
+    global _shard_store
+    pids.put(os.getpid())
+    _shard_store = CorpusStore(directory)
+
+
+def _rank_shard(
+    jd_concepts: List[Concept],
+    jd_vectors: np.ndarray,
+    top_n: int,
+) -> ShardAnswer:
+    global _shard_generation
+    start = time.perf_counter()
+    cpu_start = time.process_time()
+    store = _shard_store
+
+    # Another process may have written to the shard since the last query
+    generation = store.generation
+    if generation != _shard_generation:
+        store.refresh()
+        _shard_generation = generation
+
+    ranked, report = store.rank_candidates_pruned(jd_concepts, jd_vectors, top_n)
+    return ShardAnswer(
+        candidates=ranked,
+        resumes=report.candidates,
+        scored=report.scored,
+        seconds=time.perf_counter() - start,
+        cpu_seconds=time.process_time() - cpu_start,
+    )
+
+
+# -------------------------
+# Coordinator
+# -------------------------
+@dataclass
+class ShardedRanking:
+    """
+    Merged top-N, and which shards it covers.
+
+    ``missing`` maps each shard left out to why: "timeout", "busy" (still
+    on an earlier query) or the error it failed with. Shard CPU seconds
+    approximate each shard's time on a node of its own; wall seconds
+    include waiting for a CPU shared with other shards.
+    """
+
+    candidates: List[RankedCandidate]
+    shards: int
+    missing: Dict[int, str] = field(default_factory=dict)
+    resumes: int = 0
+    scored: int = 0
+    shard_seconds: Dict[int, float] = field(default_factory=dict)
+    shard_cpu_seconds: Dict[int, float] = field(default_factory=dict)
+    seconds: float = 0.0
+
+    @property
+    def complete(self) -> bool:
+        return not self.missing
+
+    def as_dict(self) -> Dict:
+        return {
+            "shards": self.shards,
+            "answered": self.shards - len(self.missing),
+            "missing": {str(shard): reason for shard, reason in self.missing.items()},
+            "resumes": self.resumes,
+            "scored": self.scored,
+            "seconds": round(self.seconds, 4),
+            "slowest_shard_seconds": round(max(self.shard_seconds.values(), default=0.0), 4),
+            "slowest_shard_cpu_seconds": round(
+                max(self.shard_cpu_seconds.values(), default=0.0), 4
+            ),
+        }
+
+
+class ShardedRanker:
+    """
+    Scatter-gather ranking over shard stores, one worker process each.
+
+    Args:
+        directories: Shard store directories (see shard_directories)
+        timeout: Default per-query deadline in seconds; None waits for
+            every shard
+    """
+
+    def __init__(self, directories: Sequence[str], timeout: Optional[float] = None):
+        if not directories:
+            raise ValueError("At least one shard is required.")
+
+        self.directories = list(directories)
+        self.timeout = timeout
+        self.restarts = 0
+
+        self._pools: List[Optional[ProcessPoolExecutor]] = [None] * len(self.directories)
+        self._pending: List[Optional[Future]] = [None] * len(self.directories)
+
+        # Workers report their pid from the initializer
+        self._pid_queues: List[Optional[multiprocessing.SimpleQueue]] = [None] * len(self._pools)
+        self._pids: List[Optional[int]] = [None] * len(self._pools)
+
+    def _pool(self, shard: int) -> ProcessPoolExecutor:
+        pool = self._pools[shard]
+        if pool is None:
+            self._pid_queues[shard] = multiprocessing.SimpleQueue()
+            pool = ProcessPoolExecutor(
+                1,
+                initializer=_open_shard,
+                initargs=(self.directories[shard], self._pid_queues[shard]),
+            )
+            self._pools[shard] = pool
+        return pool
+
+    def _pid(self, shard: int) -> Optional[int]:
+        queue = self._pid_queues[shard]
+        while queue is not None and not queue.empty():
+            self._pids[shard] = queue.get()
+        return self._pids[shard]
+
+    def _stop(self, shard: int, kill: bool = False) -> None:
+        pool = self._pools[shard]
+        if pool is None:
+            return
+        pid = self._pid(shard)
+        if kill and pid is not None:
+            try:
+                os.kill(pid, getattr(signal, "SIGKILL", signal.SIGTERM))
+            except ProcessLookupError:
+                pass
+        pool.shutdown(wait=not kill, cancel_futures=True)
+        self._pid_queues[shard].close()
+        self._pools[shard] = None
+        self._pending[shard] = None
+        self._pid_queues[shard] = None
+        self._pids[shard] = None
+
+    def _submit(self, shard: int, *args) -> Future:
+        try:
+            return self._pool(shard).submit(_rank_shard, *args)
+        except BrokenProcessPool:
+            # The shard's process died after its last query; restart it
+            self._stop(shard)
+            self.restarts += 1
+            return self._pool(shard).submit(_rank_shard, *args)
+
+    def shard_pids(self) -> Dict[int, int]:
+        """
+        Worker process id per started shard (for monitoring).
+        """
+        pids = {shard: self._pid(shard) for shard in range(len(self.directories))}
+        return {shard: pid for shard, pid in pids.items() if pid is not None}
+
+    def rank(
+        self,
+        jd_concepts: Sequence[Concept],
+        jd_vectors,
+        top_n: int = 10,
+        timeout: Optional[float] = None,
+    ) -> ShardedRanking:
+        """
+        Top-N stored resumes across all shards that answer in time.
+        """
+        start = time.perf_counter()
+        timeout = self.timeout if timeout is None else timeout
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        jd_concepts = list(jd_concepts)
+        jd_vectors = np.asarray(jd_vectors, dtype=np.float32)
+        ranking = ShardedRanking(candidates=[], shards=len(self.directories))
+
+        futures: Dict[int, Future] = {}
+        for shard in range(len(self.directories)):
+            previous = self._pending[shard]
+            if previous is not None and not previous.done():
+                ranking.missing[shard] = "busy"
+                continue
+            futures[shard] = self._submit(shard, jd_concepts, jd_vectors, top_n)
+            self._pending[shard] = futures[shard]
+
+        answers: List[ShardAnswer] = []
+        for shard, future in futures.items():
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                answer = future.result(timeout=remaining)
+            except FutureTimeoutError:
+                ranking.missing[shard] = "timeout"
+                continue
+            except BrokenProcessPool as e:
+                ranking.missing[shard] = f"failed: {e}"
+                self._stop(shard)
+                self.restarts += 1
+                continue
+            except Exception as e:
+                ranking.missing[shard] = f"error: {e!r}"
+                continue
+
+            answers.append(answer)
+            ranking.resumes += answer.resumes
+            ranking.scored += answer.scored
+            ranking.shard_seconds[shard] = answer.seconds
+            ranking.shard_cpu_seconds[shard] = answer.cpu_seconds
+
+        ranking.candidates = merge_ranked([a.candidates for a in answers], top_n)
+        ranking.missing = dict(sorted(ranking.missing.items()))
+        ranking.seconds = time.perf_counter() - start
+        return ranking
+
+    def close(self) -> None:
+        # Shards still stuck on a query are abandoned rather than awaited
+        for shard, pending in enumerate(self._pending):
+            self._stop(shard, kill=pending is not None and not pending.done())
+
+    def __enter__(self) -> "ShardedRanker":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,348 @@
+# Corpus embeddings in shared memory, for ranking across processes.
+
+# SharedCorpus publishes a snapshot of a CorpusStore once:
+# embeddings  → float32 [rows, dim]
+# row_types   → int8  [rows]  (type code, -1 for dead rows)
+# row_resumes → int64 [rows]  (resume primary key)
+# as multiprocessing.shared_memory blocks. Workers attach by name when
+# they start and map the blocks as NumPy arrays without copying, so the
+# machine holds one copy of the matrix whatever the worker count.
+
+# Lifecycle: the publishing process owns the blocks. It unlinks them on
+# close(), when the SharedCorpus is garbage-collected, at interpreter
+# exit, and (through the multiprocessing resource tracker) if it dies.
+# Workers only attach; they are kept from registering the blocks with a
+# resource tracker, which would otherwise unlink them (or warn about a
+# leak) as soon as the first worker exits.
+
+# SharedRanker scores row ranges in a process pool attached to a
+# SharedCorpus and merges the hits in row order. Ranges are whole blocks
+# of block_rows, so its results equal CorpusStore.rank_candidates run
+# with the same block_rows, bit for bit. A write to the store makes the
+# snapshot stale; the next query publishes a fresh one.
+
+import multiprocessing
+import os
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from resume_intelligence.core.corpus.store import CorpusStore, prepare_jd, score_rows
+from resume_intelligence.core.exception import CorpusStoreError
+from resume_intelligence.core.matching.matcher import PARTIAL_MATCH_THRESHOLD
+from resume_intelligence.core.retrieval.ann import (
+    CandidateHits,
+    RankedCandidate,
+    merge_hits,
+)
+from resume_intelligence.core.semantics.concept import Concept
+
+
+_ARRAYS = ("embeddings", "row_types", "row_resumes")
+
+# Rows copied into shared memory at a time
+_COPY_ROWS = 65536
+
+
+@dataclass(frozen=True)
+class SharedArray:
+    name: str
+    shape: Tuple[int, ...]
+    dtype: str
+
+
+@dataclass(frozen=True)
+class SharedCorpusHandle:
+    """
+    Everything a worker needs to attach; small and picklable.
+    """
+
+    embeddings: SharedArray
+    row_types: SharedArray
+    row_resumes: SharedArray
+    generation: int
+
+
+def _attach(name: str) -> SharedMemory:
+    try:
+        return SharedMemory(name=name, track=False)  # Python 3.13+
+    except TypeError:
+        pass
+
+    # Earlier versions register every attach with the resource tracker
+    register = resource_tracker.register
+    resource_tracker.register = lambda *args, **kwargs: None
+    try:
+        return SharedMemory(name=name)
+    finally:
+        resource_tracker.register = register
+
+
+def _view(block: SharedMemory, spec: SharedArray) -> np.ndarray:
+    array = np.ndarray(spec.shape, dtype=spec.dtype, buffer=block.buf)
+    array.flags.writeable = False
+    return array
+
+
+def _release(blocks: List[SharedMemory], unlink: bool) -> None:
+    # Module-level so weakref.finalize doesn't keep the owner alive
+    for block in blocks:
+        try:
+            block.close()
+        except BufferError:
+            pass  # a view outlived its owner; the mapping goes at exit
+        if unlink:
+            try:
+                block.unlink()
+            except FileNotFoundError:
+                pass
+
+
+def _shm_free_bytes() -> Optional[int]:
+    try:
+        stats = os.statvfs("/dev/shm")
+    except (OSError, AttributeError):
+        return None
+    return stats.f_bavail * stats.f_frsize
+
+
+class SharedCorpus:
+    """
+    A store's embeddings and row tables, published to shared memory.
+
+    Use as a context manager or call ``close()``; the owner's close
+    unlinks the blocks, an attached copy's close only unmaps them.
+    """
+
+    def __init__(self, handle: SharedCorpusHandle, blocks: List[SharedMemory], owner: bool):
+        self.handle = handle
+        self.owner = owner
+        self._blocks = blocks
+
+        specs = [getattr(handle, name) for name in _ARRAYS]
+        self.embeddings, self.row_types, self.row_resumes = (
+            _view(block, spec) for block, spec in zip(blocks, specs)
+        )
+        self._finalizer = weakref.finalize(self, _release, blocks, owner)
+
+    @classmethod
+    def publish(cls, store: CorpusStore) -> "SharedCorpus":
+        """
+        Copy the store's current rows into new shared memory blocks.
+
+        Raises:
+            CorpusStoreError: /dev/shm has no room for the snapshot
+        """
+        embeddings = store.embeddings
+        row_types, row_resumes = store._row_table()
+        sources = (embeddings, row_types, row_resumes)
+
+        needed = sum(max(a.nbytes, 1) for a in sources)
+        free = _shm_free_bytes()
+        if free is not None and needed > free:
+            raise CorpusStoreError(
+                f"Shared memory snapshot needs {needed} bytes but /dev/shm "
+                f"has {free} free."
+            )
+
+        blocks: List[SharedMemory] = []
+        specs = []
+        try:
+            for source in sources:
+                # SharedMemory refuses zero-sized blocks
+                block = SharedMemory(create=True, size=max(source.nbytes, 1))
+                blocks.append(block)
+                spec = SharedArray(block.name, tuple(source.shape), source.dtype.str)
+                specs.append(spec)
+
+                target = np.ndarray(spec.shape, dtype=spec.dtype, buffer=block.buf)
+                for start in range(0, len(source), _COPY_ROWS):
+                    target[start:start + _COPY_ROWS] = source[start:start + _COPY_ROWS]
+                del target
+        except BaseException:
+            _release(blocks, unlink=True)
+            raise
+
+        handle = SharedCorpusHandle(*specs, generation=store.generation)
+        return cls(handle, blocks, owner=True)
+
+    @classmethod
+    def attach(cls, handle: SharedCorpusHandle) -> "SharedCorpus":
+        """
+        Map a published snapshot (e.g. in a worker) without copying.
+        """
+        blocks = [_attach(getattr(handle, name).name) for name in _ARRAYS]
+        return cls(handle, blocks, owner=False)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(getattr(self, name).nbytes for name in _ARRAYS)
+
+    def close(self) -> None:
+        # Views must go before their buffers can be released
+        self.embeddings = self.row_types = self.row_resumes = None
+        self._finalizer()
+
+    def __enter__(self) -> "SharedCorpus":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+# -------------------------
+# Worker side
+# -------------------------
+_worker_corpus: Optional[SharedCorpus] = None
+
+
+def _init_worker(handle: SharedCorpusHandle, pids) -> None:
+    global _worker_corpus
+    pids.put(os.getpid())
+    _worker_corpus = SharedCorpus.attach(handle)
+
+
+def _score_range(
+    jd: Tuple[np.ndarray, np.ndarray],
+    threshold: float,
+    block_rows: int,
+    start: int,
+    end: int,
+) -> Dict[int, CandidateHits]:
+    corpus = _worker_corpus
+    return score_rows(
+        corpus.embeddings,
+        corpus.row_types,
+        corpus.row_resumes,
+        jd,
+        threshold,
+        block_rows,
+        start=start,
+        end=end,
+    )
+
+
+# -------------------------
+# Ranking
+# -------------------------
+class SharedRanker:
+    """
+    Ranks a CorpusStore's resumes for a JD across worker processes that
+    share one copy of its embeddings.
+
+    Args:
+        store: Open CorpusStore; stays owned by the caller
+        workers: Ranking processes
+        block_rows: Rows scored per matrix product; also the unit rows
+            are split across workers in
+    """
+
+    def __init__(
+        self,
+        store: CorpusStore,
+        workers: int = os.cpu_count() or 1,
+        block_rows: int = 16384,
+    ):
+        if workers < 1 or block_rows < 1:
+            raise ValueError("workers and block_rows must be at least 1.")
+
+        self.store = store
+        self.workers = workers
+        self.block_rows = block_rows
+
+        self.shared: Optional[SharedCorpus] = None
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+        # Workers report their pid from the initializer
+        self._pid_queue: Optional[multiprocessing.SimpleQueue] = None
+        self._pids: List[int] = []
+
+    def _ready(self) -> SharedCorpus:
+        # (Re)publish when the store was written to since the snapshot
+        if self.shared is not None and self.shared.handle.generation == self.store.generation:
+            return self.shared
+
+        self.close()
+        self.shared = SharedCorpus.publish(self.store)
+        self._pid_queue = multiprocessing.SimpleQueue()
+        self._pool = ProcessPoolExecutor(
+            self.workers,
+            initializer=_init_worker,
+            initargs=(self.shared.handle, self._pid_queue),
+        )
+        return self.shared
+
+    def worker_pids(self) -> List[int]:
+        """
+        Process ids of the started workers (for monitoring).
+        """
+        while self._pid_queue is not None and not self._pid_queue.empty():
+            self._pids.append(self._pid_queue.get())
+        return list(self._pids)
+
+    def _ranges(self, rows: int) -> List[Tuple[int, int]]:
+        blocks = -(-rows // self.block_rows)
+        parts = np.array_split(np.arange(blocks), min(self.workers, blocks) or 1)
+        return [
+            (int(part[0]) * self.block_rows, min(int(part[-1] + 1) * self.block_rows, rows))
+            for part in parts if len(part)
+        ]
+
+    def candidate_hits(
+        self,
+        jd_concepts: Sequence[Concept],
+        jd_vectors,
+        threshold: float = PARTIAL_MATCH_THRESHOLD,
+    ) -> Dict[str, CandidateHits]:
+        """
+        As CorpusStore.candidate_hits, scored by the workers.
+        """
+        if not jd_concepts or not self.store.rows:
+            return {}
+
+        shared = self._ready()
+        jd = prepare_jd(jd_concepts, jd_vectors)
+        futures = [
+            self._pool.submit(_score_range, jd, threshold, self.block_rows, start, end)
+            for start, end in self._ranges(len(shared.row_types))
+        ]
+
+        hits: Dict[int, CandidateHits] = {}
+        for future in futures:
+            merge_hits(hits, future.result())
+        return self.store.name_hits(hits)
+
+    def rank_candidates(
+        self,
+        jd_concepts: Sequence[Concept],
+        jd_vectors,
+        top_n: int = 10,
+    ) -> List[RankedCandidate]:
+        """
+        As CorpusStore.rank_candidates, scored by the workers.
+        """
+        hits = self.candidate_hits(jd_concepts, jd_vectors)
+        return self.store.rank_hits(jd_concepts, hits, top_n)
+
+    def close(self) -> None:
+        # Workers first: they hold mappings of the blocks being unlinked
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pid_queue.close()
+            self._pool = None
+            self._pid_queue = None
+            self._pids = []
+        if self.shared is not None:
+            self.shared.close()
+            self.shared = None
+
+    def __enter__(self) -> "SharedRanker":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,761 @@
+# Persistent candidate corpus: SQLite metadata + memory-mapped embeddings.
+
+# Layout (one directory):
+# corpus.sqlite   → resumes, consolidated Concept records, store metadata
+# embeddings.f32  → append-only float32 matrix, one row per stored concept
+
+# concepts.row is the concept's row in embeddings.f32. Replacing or
+# removing a resume deletes its metadata; its old rows stay in the file
+# as dead rows that are masked out at query time.
+
+# Write order: vectors first, then the SQLite transaction that records
+# the new row count. A crash in between leaves a longer file than the
+# committed count, and the tail is truncated on the next open.
+
+# Matching a new JD against the store only needs JD processing and
+# similarity: resumes are never re-parsed, re-extracted or re-embedded.
+
+# bounds.npz caches the per-resume similarity bounds used by pruned top-K
+# ranking. It is tagged with the store's write generation and rebuilt
+# when stale.
+
+import json
+import os
+import sqlite3
+import time
+import zipfile
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from resume_intelligence.core.exception import CorpusStoreError
+from resume_intelligence.core.matching.ats_score import compute_ats_score
+from resume_intelligence.core.matching.matcher import (
+    PARTIAL_MATCH_THRESHOLD,
+    build_match_results,
+)
+from resume_intelligence.core.retrieval.ann import (
+    CandidateHits,
+    RankedCandidate,
+    _ALLOWED,
+    _TYPE_CODES,
+    _normalize,
+    collect_hits,
+    rank_hits,
+)
+from resume_intelligence.core.retrieval.pruning import (
+    CandidateBounds,
+    PruneReport,
+    ats_upper_bounds,
+    prune_top_k,
+)
+from resume_intelligence.core.semantics.concept import (
+    Concept,
+    ConceptSource,
+    ConceptType,
+)
+
+
+SQLITE_NAME = "corpus.sqlite"
+VECTORS_NAME = "embeddings.f32"
+BOUNDS_NAME = "bounds.npz"
+
+_BOUNDS_BLOCK_ROWS = 65536
+_CODEBOOK_SAMPLE = 16384
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS resumes (
+    id        INTEGER PRIMARY KEY,
+    resume_id TEXT NOT NULL UNIQUE,
+    path      TEXT,
+    added_at  REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS concepts (
+    row        INTEGER PRIMARY KEY,
+    resume     INTEGER NOT NULL REFERENCES resumes(id) ON DELETE CASCADE,
+    text       TEXT NOT NULL,
+    type       TEXT NOT NULL,
+    confidence REAL NOT NULL,
+    sentences  TEXT NOT NULL,
+    source     TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS concepts_resume ON concepts(resume);
+"""
+
+_TYPES_BY_VALUE = {t.value: t for t in ConceptType}
+
+
+# -------------------------
+# Scoring (shared with core/corpus/shared.py workers)
+# -------------------------
+def prepare_jd(
+    jd_concepts: Sequence[Concept],
+    jd_vectors,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    (unit JD vectors, JD type codes), as score_rows takes them.
+    """
+    vectors = _normalize(np.asarray(jd_vectors, dtype=np.float32))
+    codes = np.array([_TYPE_CODES[c.type] for c in jd_concepts], dtype=np.int64)
+    return vectors, codes
+
+
+def score_rows(
+    embeddings: np.ndarray,
+    row_types: np.ndarray,
+    row_resumes: np.ndarray,
+    jd: Tuple[np.ndarray, np.ndarray],
+    threshold: float,
+    block_rows: int,
+    selected: Optional[np.ndarray] = None,
+    start: int = 0,
+    end: Optional[int] = None,
+) -> Dict[int, CandidateHits]:
+    """
+    Best type-compatible hits ≥ threshold per resume pk, scanning
+    positions [start, end) of the rows (or of ``selected`` rows) in
+    blocks of ``block_rows``.
+
+    Block edges fall on multiples of ``block_rows`` from position 0, so
+    any split of the positions at those multiples gives the same hits.
+    """
+    jd_vectors, jd_codes = jd
+    n_jd = len(jd_codes)
+    total = len(row_types) if selected is None else len(selected)
+    end = total if end is None else min(end, total)
+
+    hits: Dict[int, CandidateHits] = {}
+
+    for block_start in range(start, end, block_rows):
+        block_end = min(block_start + block_rows, end)
+
+        if selected is None:
+            rows = np.arange(block_start, block_end)
+            block = np.asarray(embeddings[block_start:block_end])
+        else:
+            rows = selected[block_start:block_end]
+            block = embeddings[rows]
+
+        block_types = row_types[rows]
+        scores = block @ jd_vectors.T
+
+        # Dead rows (type -1) are incompatible with everything
+        live = block_types >= 0
+        allowed = np.zeros((len(rows), n_jd), dtype=bool)
+        allowed[live] = _ALLOWED[jd_codes][:, block_types[live]].T
+        scores[~allowed] = -np.inf
+
+        for j in range(n_jd):
+            local = np.nonzero(scores[:, j] >= threshold)[0]
+            collect_hits(
+                hits,
+                j,
+                n_jd,
+                rows[local],
+                scores[local, j],
+                row_resumes[rows[local]],
+            )
+
+    return hits
+
+
+class CorpusStore:
+    """
+    Stored resumes, their concepts and their concept embeddings.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        model_name: Optional[str] = None,
+    ):
+        os.makedirs(directory, exist_ok=True)
+
+        self.directory = directory
+        self.vectors_path = os.path.join(directory, VECTORS_NAME)
+
+        self._conn = sqlite3.connect(os.path.join(directory, SQLITE_NAME))
+        self._conn.execute("PRAGMA foreign_keys = ON")
+        self._conn.executescript(_SCHEMA)
+
+        if model_name:
+            self.pin_model(model_name)
+
+        self._recover()
+
+        self._embeddings: Optional[np.memmap] = None
+        self._table: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self._bounds = None
+
+    # -------------------------
+    # Metadata helpers
+    # -------------------------
+    def _meta(self, key: str) -> Optional[str]:
+        row = self._conn.execute(
+            "SELECT value FROM meta WHERE key = ?", (key,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+            (key, str(value)),
+        )
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """
+        The store's SQLite connection, for tables kept alongside it
+        (e.g. the indexing manifest).
+        """
+        return self._conn
+
+    @property
+    def model_name(self) -> Optional[str]:
+        return self._meta("model_name")
+
+    def pin_model(self, model_name: str) -> None:
+        """
+        Record the embedding model, or check it against the recorded one.
+        Vectors from different models are not comparable.
+        """
+        stored_model = self.model_name
+        if stored_model and stored_model != model_name:
+            raise CorpusStoreError(
+                f"Store was built with '{stored_model}', not '{model_name}'."
+            )
+        if not stored_model:
+            with self._conn:
+                self._set_meta("model_name", model_name)
+
+    @property
+    def dim(self) -> Optional[int]:
+        value = self._meta("dim")
+        return int(value) if value else None
+
+    @property
+    def rows(self) -> int:
+        return int(self._meta("rows") or 0)
+
+    @property
+    def generation(self) -> int:
+        """
+        Incremented by every committed write.
+        """
+        return int(self._meta("generation") or 0)
+
+    def _row_bytes(self) -> int:
+        return (self.dim or 0) * 4
+
+    def _recover(self) -> None:
+        # Drop vectors written by an add that never committed
+        if not os.path.exists(self.vectors_path):
+            if self.rows:
+                raise CorpusStoreError(
+                    f"{self.vectors_path} is missing for a non-empty store."
+                )
+            return
+
+        committed = self.rows * self._row_bytes()
+        size = os.path.getsize(self.vectors_path)
+
+        if size < committed:
+            raise CorpusStoreError(
+                f"{self.vectors_path} is shorter than the committed rows."
+            )
+        if size > committed:
+            with open(self.vectors_path, "r+b") as f:
+                f.truncate(committed)
+
+    # -------------------------
+    # Writing
+    # -------------------------
+    def add_resume(
+        self,
+        resume_id: str,
+        concepts: Sequence[Concept],
+        vectors,
+        path: Optional[str] = None,
+    ) -> None:
+        """
+        Store (or replace) one resume with its concepts and embeddings.
+        """
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if len(vectors) != len(concepts):
+            raise ValueError("Need exactly one vector per concept.")
+
+        dim = self.dim
+        if len(concepts):
+            if dim is None:
+                dim = vectors.shape[1]
+            elif vectors.shape[1] != dim:
+                raise CorpusStoreError(
+                    f"Store holds {dim}-dimensional vectors, "
+                    f"got {vectors.shape[1]}."
+                )
+            vectors = _normalize(vectors)
+
+        start = self.rows
+
+        if len(concepts):
+            with open(self.vectors_path, "ab") as f:
+                # Overwrite any uncommitted tail from a failed add
+                f.truncate(start * dim * 4)
+                f.write(np.ascontiguousarray(vectors).tobytes())
+                f.flush()
+                os.fsync(f.fileno())
+
+        with self._conn:
+            self._conn.execute(
+                "DELETE FROM resumes WHERE resume_id = ?", (resume_id,)
+            )
+            cursor = self._conn.execute(
+                "INSERT INTO resumes (resume_id, path, added_at) VALUES (?, ?, ?)",
+                (resume_id, path, time.time()),
+            )
+            resume_pk = cursor.lastrowid
+
+            self._conn.executemany(
+                "INSERT INTO concepts "
+                "(row, resume, text, type, confidence, sentences, source) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        start + i,
+                        resume_pk,
+                        c.text,
+                        c.type.value,
+                        c.confidence,
+                        json.dumps(c.sentences),
+                        c.source.value,
+                    )
+                    for i, c in enumerate(concepts)
+                ],
+            )
+
+            if dim is not None:
+                self._set_meta("dim", dim)
+            self._set_meta("rows", start + len(concepts))
+            self._set_meta("generation", self.generation + 1)
+
+        self.refresh()
+
+    def remove_resume(self, resume_id: str) -> bool:
+        with self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM resumes WHERE resume_id = ?", (resume_id,)
+            )
+            if cursor.rowcount:
+                self._set_meta("generation", self.generation + 1)
+        self.refresh()
+        return cursor.rowcount > 0
+
+    def refresh(self) -> None:
+        """
+        Drop the cached memmap, row table and bounds, so the next read
+        sees writes made through another connection.
+        """
+        self._embeddings = None
+        self._table = None
+        self._bounds = None
+
+    # -------------------------
+    # Reading
+    # -------------------------
+    def resume_ids(self) -> List[str]:
+        return [
+            r[0] for r in self._conn.execute(
+                "SELECT resume_id FROM resumes ORDER BY id"
+            )
+        ]
+
+    def __contains__(self, resume_id: str) -> bool:
+        return self._conn.execute(
+            "SELECT 1 FROM resumes WHERE resume_id = ?", (resume_id,)
+        ).fetchone() is not None
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM resumes").fetchone()[0]
+
+    def load_concepts(self, resume_id: str) -> List[Concept]:
+        """
+        Stored Concept records of one resume, in insertion order.
+        """
+        rows = self._conn.execute(
+            "SELECT c.text, c.type, c.confidence, c.sentences, c.source "
+            "FROM concepts c JOIN resumes r ON c.resume = r.id "
+            "WHERE r.resume_id = ? ORDER BY c.row",
+            (resume_id,),
+        ).fetchall()
+
+        return [
+            Concept(
+                text=text,
+                confidence=confidence,
+                sentences=json.loads(sentences),
+                source=ConceptSource(source),
+                type=_TYPES_BY_VALUE[type_value],
+            )
+            for text, type_value, confidence, sentences, source in rows
+        ]
+
+    def concept_rows(self, resume_id: str) -> np.ndarray:
+        """
+        Embedding rows of one resume's concepts, in insertion order.
+        """
+        return np.array([
+            r[0] for r in self._conn.execute(
+                "SELECT c.row FROM concepts c JOIN resumes r ON c.resume = r.id "
+                "WHERE r.resume_id = ? ORDER BY c.row",
+                (resume_id,),
+            )
+        ], dtype=np.int64)
+
+    @property
+    def embeddings(self) -> np.memmap:
+        """
+        Read-only, zero-copy view of every stored row (live and dead).
+        """
+        if self._embeddings is None:
+            if not self.rows:
+                return np.zeros((0, self.dim or 0), dtype=np.float32)
+            self._embeddings = np.memmap(
+                self.vectors_path,
+                dtype=np.float32,
+                mode="r",
+                shape=(self.rows, self.dim),
+            )
+        return self._embeddings
+
+    def _row_table(self) -> Tuple[np.ndarray, np.ndarray]:
+        # (row → type code, row → resume pk); -1 marks dead rows
+        if self._table is None:
+            types = np.full(self.rows, -1, dtype=np.int8)
+            resumes = np.full(self.rows, -1, dtype=np.int64)
+
+            for row, resume_pk, type_value in self._conn.execute(
+                "SELECT row, resume, type FROM concepts"
+            ):
+                types[row] = _TYPE_CODES[_TYPES_BY_VALUE[type_value]]
+                resumes[row] = resume_pk
+
+            self._table = (types, resumes)
+
+        return self._table
+
+    def _texts_for(self, rows: Sequence[int]) -> Dict[int, str]:
+        texts: Dict[int, str] = {}
+        rows = list(rows)
+
+        # Stay below SQLite's bound-parameter limit
+        for start in range(0, len(rows), 900):
+            chunk = rows[start:start + 900]
+            placeholders = ",".join("?" * len(chunk))
+            texts.update(self._conn.execute(
+                f"SELECT row, text FROM concepts WHERE row IN ({placeholders})",
+                chunk,
+            ).fetchall())
+
+        return texts
+
+    # -------------------------
+    # Matching
+    # -------------------------
+    def _resume_pks(self, resume_ids: Sequence[str]) -> np.ndarray:
+        pks = []
+        resume_ids = list(resume_ids)
+        for start in range(0, len(resume_ids), 900):
+            chunk = resume_ids[start:start + 900]
+            placeholders = ",".join("?" * len(chunk))
+            pks.extend(r[0] for r in self._conn.execute(
+                f"SELECT id FROM resumes WHERE resume_id IN ({placeholders})",
+                chunk,
+            ))
+        return np.array(pks, dtype=np.int64)
+
+    def candidate_hits(
+        self,
+        jd_concepts: Sequence[Concept],
+        jd_vectors,
+        threshold: float = PARTIAL_MATCH_THRESHOLD,
+        block_rows: int = 65536,
+        resume_ids: Optional[Sequence[str]] = None,
+    ) -> Dict[str, CandidateHits]:
+        """
+        Best type-compatible score ≥ threshold per stored resume and
+        JD concept, streamed over the memmap in row blocks.
+
+        ``resume_ids`` restricts scoring to a pre-selected subset; only
+        their rows are read from the memmap.
+        """
+        if not jd_concepts or not self.rows:
+            return {}
+
+        row_types, row_resumes = self._row_table()
+
+        selected = None
+        if resume_ids is not None:
+            selected = np.flatnonzero(
+                np.isin(row_resumes, self._resume_pks(resume_ids))
+            )
+
+        hits = score_rows(
+            self.embeddings,
+            row_types,
+            row_resumes,
+            prepare_jd(jd_concepts, jd_vectors),
+            threshold,
+            block_rows,
+            selected=selected,
+        )
+        return self.name_hits(hits)
+
+    def name_hits(self, hits: Dict[int, CandidateHits]) -> Dict[str, CandidateHits]:
+        """
+        Re-key hits from resume primary keys to resume ids.
+        """
+        names = dict(self._conn.execute("SELECT id, resume_id FROM resumes"))
+        return {names[pk]: entry for pk, entry in hits.items()}
+
+    def rank_candidates(
+        self,
+        jd_concepts: Sequence[Concept],
+        jd_vectors,
+        top_n: int = 10,
+        resume_ids: Optional[Sequence[str]] = None,
+    ) -> List[RankedCandidate]:
+        """
+        Rank stored resumes (all, or the ``resume_ids`` subset) for a JD
+        by ATS score.
+        """
+        hits = self.candidate_hits(
+            jd_concepts, jd_vectors, resume_ids=resume_ids
+        )
+
+        return self.rank_hits(jd_concepts, hits, top_n)
+
+    def rank_hits(
+        self,
+        jd_concepts: Sequence[Concept],
+        hits: Dict[str, CandidateHits],
+        top_n: int,
+    ) -> List[RankedCandidate]:
+        """
+        ATS-rank candidate hits, reading only the concept texts they use.
+        """
+        referenced = {
+            int(r) for entry in hits.values() for r in entry.rows if r >= 0
+        }
+        texts = self._texts_for(sorted(referenced))
+
+        return rank_hits(jd_concepts, hits, texts, top_n)
+
+    # -------------------------
+    # Pruned top-K ranking
+    # -------------------------
+    def _resume_spans(self) -> Tuple[List[str], np.ndarray, np.ndarray]:
+        # A resume's rows are written in one append, so they are contiguous
+        spans = self._conn.execute(
+            "SELECT r.resume_id, MIN(c.row), COUNT(*) "
+            "FROM concepts c JOIN resumes r ON c.resume = r.id "
+            "GROUP BY c.resume ORDER BY MIN(c.row)"
+        ).fetchall()
+
+        names = [name for name, _, _ in spans]
+        starts = np.array([start for _, start, _ in spans], dtype=np.int64)
+        counts = np.array([count for _, _, count in spans], dtype=np.int64)
+        return names, starts, counts
+
+    def _build_bounds(
+        self,
+        starts: np.ndarray,
+        counts: np.ndarray,
+        n_cells: int,
+    ) -> CandidateBounds:
+        row_types, _ = self._row_table()
+        embeddings = self.embeddings
+
+        live = np.flatnonzero(row_types >= 0)
+        rng = np.random.default_rng(0)
+        sample = np.sort(
+            rng.choice(live, min(len(live), _CODEBOOK_SAMPLE), replace=False)
+        )
+        codebook = CandidateBounds.train_codebook(embeddings[sample], n_cells)
+
+        parts = []
+
+        # Groups of whole resumes, about _BOUNDS_BLOCK_ROWS rows at a time
+        first = 0
+        while first < len(starts):
+            last = first + 1
+            total = counts[first]
+            while last < len(starts) and total + counts[last] <= _BOUNDS_BLOCK_ROWS:
+                total += counts[last]
+                last += 1
+
+            rows = np.concatenate([
+                np.arange(start, start + count)
+                for start, count in zip(starts[first:last], counts[first:last])
+            ])
+            parts.append(CandidateBounds.build(
+                codebook, embeddings[rows], counts[first:last], row_types[rows]
+            ))
+            first = last
+
+        return CandidateBounds.concatenate(parts)
+
+    @staticmethod
+    def _load_bounds(
+        path: str,
+        generation: int,
+        resumes: int,
+    ) -> Optional[CandidateBounds]:
+        # A damaged or stale file is a cache miss; the caller rebuilds it
+        try:
+            with np.load(path) as data:
+                if (
+                    int(data["generation"]) != generation
+                    or len(data["offsets"]) != resumes
+                ):
+                    return None
+                return CandidateBounds(
+                    data["codebook"],
+                    data["offsets"],
+                    data["cells"],
+                    data["types"],
+                    data["spread"],
+                )
+        except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile):
+            return None
+
+    def candidate_bounds(
+        self,
+        n_cells: int = 256,
+    ) -> Tuple[List[str], np.ndarray, np.ndarray, CandidateBounds]:
+        """
+        (resume ids, first rows, row counts, similarity bounds), loaded
+        from bounds.npz when it matches the current generation.
+        """
+        if self._bounds is not None:
+            return self._bounds
+
+        names, starts, counts = self._resume_spans()
+        path = os.path.join(self.directory, BOUNDS_NAME)
+        generation = self.generation
+        bounds = None
+
+        if os.path.exists(path):
+            bounds = self._load_bounds(path, generation, len(names))
+
+        if bounds is None and names:
+            bounds = self._build_bounds(starts, counts, n_cells)
+            # Readers (other processes, shard workers) only ever see a
+            # whole file: write aside, then rename over
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                np.savez(
+                    f,
+                    generation=generation,
+                    codebook=bounds.codebook,
+                    offsets=bounds.offsets,
+                    cells=bounds.cells,
+                    types=bounds.types,
+                    spread=bounds.spread,
+                )
+            os.replace(tmp_path, path)
+
+        self._bounds = (names, starts, counts, bounds)
+        return self._bounds
+
+    def rank_candidates_pruned(
+        self,
+        jd_concepts: Sequence[Concept],
+        jd_vectors,
+        top_n: int = 10,
+        threshold: float = PARTIAL_MATCH_THRESHOLD,
+    ) -> Tuple[List[RankedCandidate], PruneReport]:
+        """
+        Same result as rank_candidates, scoring only the resumes whose
+        ATS upper bound can still beat the current top-N.
+        """
+        if not jd_concepts or not self.rows:
+            return [], PruneReport()
+
+        jd_concepts = list(jd_concepts)
+        jd_vectors = _normalize(np.asarray(jd_vectors, dtype=np.float32))
+        jd_codes = np.array(
+            [_TYPE_CODES[c.type] for c in jd_concepts], dtype=np.int64
+        )
+        names, starts, counts, candidate_bounds = self.candidate_bounds()
+        if not names:
+            return [], PruneReport()
+        row_types, _ = self._row_table()
+        embeddings = self.embeddings
+        n_jd = len(jd_concepts)
+
+        bounds = ats_upper_bounds(
+            jd_concepts,
+            candidate_bounds.similarity_bounds(jd_concepts, jd_vectors),
+        )
+        hits: Dict[str, CandidateHits] = {}
+
+        def score(position: int) -> Optional[float]:
+            start = starts[position]
+            rows = np.arange(start, start + counts[position])
+
+            scores = np.asarray(embeddings[start:start + counts[position]]) @ jd_vectors.T
+            scores[~_ALLOWED[jd_codes][:, row_types[rows]].T] = -np.inf
+
+            best = scores.argmax(axis=0)
+            best_scores = scores[best, np.arange(n_jd)]
+            found = best_scores >= threshold
+            if not found.any():
+                return None
+
+            entry = CandidateHits(
+                scores=np.where(found, best_scores, 0.0).astype(np.float32),
+                rows=np.where(found, rows[best], -1),
+            )
+            hits[names[position]] = entry
+
+            # Scores only depend on which JD concepts found a text
+            results = build_match_results(
+                jd_concepts, entry.scores, ["" if f else None for f in found]
+            )
+            return compute_ats_score(jd_concepts, results)
+
+        positions, report = prune_top_k(bounds, score, top_n, names)
+
+        top = {names[p]: hits[names[p]] for p in positions}
+        referenced = {
+            int(r) for entry in top.values() for r in entry.rows if r >= 0
+        }
+        texts = self._texts_for(sorted(referenced))
+
+        return rank_hits(jd_concepts, top, texts, top_n), report
+
+    def iter_concept_texts(self):
+        """
+        (resume_id, concept text) for every live stored concept.
+        """
+        return self._conn.execute(
+            "SELECT r.resume_id, c.text FROM concepts c "
+            "JOIN resumes r ON c.resume = r.id ORDER BY r.id, c.row"
+        )
+
+    # -------------------------
+    # Lifecycle
+    # -------------------------
+    def close(self) -> None:
+        self.refresh()
+        self._conn.close()
+
+    def __enter__(self) -> "CorpusStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
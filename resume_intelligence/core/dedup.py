@@ -0,0 +1,254 @@
+# Near-duplicate detection for normalized Documents (MinHash + LSH).
+
+# Much of the incoming volume is the same candidate re-applying with tiny
+# edits, or agency clones of one template. Grouping those first lets the
+# expensive extract_concepts + ConceptMatcher pipeline run once per group.
+
+# Document.sentences → word 3-gram shingles (per sentence)
+# → MinHash signature (num_perm values, universal hashing mod 2^31 - 1)
+# → LSH: signature split into bands; same band hash → candidate pair
+# → verify with estimated Jaccard ≥ threshold → union-find clusters
+
+# Only documents that collide in some band are ever compared, so grouping
+# is sub-quadratic in practice.
+
+import time
+import zlib
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Callable, Dict, Hashable, List, Optional, Set, Tuple, TypeVar
+
+import numpy as np
+
+from resume_intelligence.core.document import Document
+
+
+_PRIME = (1 << 31) - 1
+_MAX_HASH = (1 << 32) - 1
+
+T = TypeVar("T")
+
+
+def _shingles(document: Document, k: int) -> Set[int]:
+    if not document.sentences:
+        raise ValueError("Document must be normalized before deduplication.")
+
+    shingles = set()
+    for sentence in document.sentences:
+        tokens = sentence.split()
+        if len(tokens) < k:
+            shingles.add(zlib.crc32(sentence.encode("utf-8")))
+            continue
+        for i in range(len(tokens) - k + 1):
+            shingles.add(zlib.crc32(" ".join(tokens[i:i + k]).encode("utf-8")))
+
+    return shingles
+
+
+class MinHasher:
+    """
+    Fixed family of ``num_perm`` universal hash functions.
+    """
+
+    def __init__(self, num_perm: int = 128, shingle_size: int = 3, seed: int = 1):
+        rng = np.random.default_rng(seed)
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self._a = rng.integers(1, _PRIME, size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, _PRIME, size=num_perm, dtype=np.uint64)
+
+    def signature(self, document: Document) -> np.ndarray:
+        shingles = np.fromiter(
+            _shingles(document, self.shingle_size), dtype=np.uint64
+        )
+        if not len(shingles):
+            return np.full(self.num_perm, _MAX_HASH, dtype=np.uint64)
+
+        # (num_perm, S) hash table; values < 2^31 so products fit in uint64
+        shingles %= np.uint64(_PRIME)
+        hashed = (self._a[:, None] * shingles[None, :] + self._b[:, None]) % _PRIME
+        return hashed.min(axis=1)
+
+
+def estimated_jaccard(sig_a: np.ndarray, sig_b: np.ndarray) -> float:
+    return float(np.mean(sig_a == sig_b))
+
+
+@dataclass
+class DedupReport:
+    documents: int
+    clusters: List[List[Hashable]]
+    pipeline_runs: int = 0
+    reused: int = 0
+    seconds_spent: float = 0.0
+
+    @property
+    def cluster_sizes(self) -> Dict[int, int]:
+        """
+        Cluster size → number of clusters of that size.
+        """
+        sizes: Dict[int, int] = defaultdict(int)
+        for cluster in self.clusters:
+            sizes[len(cluster)] += 1
+        return dict(sorted(sizes.items()))
+
+    @property
+    def estimated_seconds_saved(self) -> float:
+        if not self.pipeline_runs:
+            return 0.0
+        return self.seconds_spent / self.pipeline_runs * self.reused
+
+    def as_dict(self) -> Dict:
+        return {
+            "documents": self.documents,
+            "clusters": len(self.clusters),
+            "cluster_sizes": self.cluster_sizes,
+            "pipeline_runs": self.pipeline_runs,
+            "reused": self.reused,
+            "seconds_spent": round(self.seconds_spent, 3),
+            "estimated_seconds_saved": round(self.estimated_seconds_saved, 3),
+        }
+
+
+class NearDuplicateIndex:
+    """
+    MinHash LSH over normalized Documents.
+
+    ``bands × rows`` must equal the hasher's ``num_perm``. With 32 bands
+    of 4 rows, pairs at Jaccard 0.8 collide with probability ≈ 1.0 and
+    pairs at 0.3 with ≈ 0.23 (filtered by the verification step).
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.8,
+        bands: int = 32,
+        rows: int = 4,
+        hasher: Optional[MinHasher] = None,
+    ):
+        self.hasher = hasher or MinHasher(num_perm=bands * rows)
+        if bands * rows != self.hasher.num_perm:
+            raise ValueError("bands × rows must equal num_perm.")
+
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = rows
+
+        self._signatures: Dict[Hashable, np.ndarray] = {}
+        self._buckets: List[Dict[bytes, List[Hashable]]] = [
+            defaultdict(list) for _ in range(bands)
+        ]
+        self._parent: Dict[Hashable, Hashable] = {}
+        self._order: Dict[Hashable, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def __contains__(self, doc_id: Hashable) -> bool:
+        return doc_id in self._signatures
+
+    # -------------------------
+    # Union-find
+    # -------------------------
+    def _find(self, doc_id: Hashable) -> Hashable:
+        root = doc_id
+        while self._parent[root] != root:
+            root = self._parent[root]
+        while self._parent[doc_id] != root:
+            self._parent[doc_id], doc_id = root, self._parent[doc_id]
+        return root
+
+    def _union(self, a: Hashable, b: Hashable) -> None:
+        root_a, root_b = self._find(a), self._find(b)
+        if root_a == root_b:
+            return
+        # Earliest-added document stays the representative, also when a
+        # new document bridges two existing clusters
+        if self._order[root_b] < self._order[root_a]:
+            root_a, root_b = root_b, root_a
+        self._parent[root_b] = root_a
+
+    # -------------------------
+    # Public API
+    # -------------------------
+    def add(self, doc_id: Hashable, document: Document) -> Hashable:
+        """
+        Index a document and return its cluster representative.
+        """
+        if doc_id in self._signatures:
+            raise ValueError(f"Document {doc_id!r} is already indexed.")
+
+        signature = self.hasher.signature(document)
+        self._signatures[doc_id] = signature
+        self._parent[doc_id] = doc_id
+        self._order[doc_id] = len(self._order)
+
+        checked = set()
+        for band in range(self.bands):
+            key = signature[band * self.rows:(band + 1) * self.rows].tobytes()
+            bucket = self._buckets[band][key]
+
+            for other in bucket:
+                if other in checked:
+                    continue
+                checked.add(other)
+                if estimated_jaccard(signature, self._signatures[other]) >= self.threshold:
+                    self._union(other, doc_id)
+
+            bucket.append(doc_id)
+
+        return self._find(doc_id)
+
+    def representative(self, doc_id: Hashable) -> Hashable:
+        return self._find(doc_id)
+
+    def clusters(self) -> List[List[Hashable]]:
+        """
+        Groups of near-duplicates (singletons included), in insertion order.
+        """
+        groups: Dict[Hashable, List[Hashable]] = {}
+        for doc_id in self._signatures:
+            groups.setdefault(self._find(doc_id), []).append(doc_id)
+        return list(groups.values())
+
+
+def run_deduplicated(
+    documents: Dict[Hashable, Document],
+    pipeline: Callable[[Document], T],
+    index: Optional[NearDuplicateIndex] = None,
+) -> Tuple[Dict[Hashable, T], DedupReport]:
+    """
+    Run ``pipeline`` once per near-duplicate cluster and share the result.
+
+    Args:
+        documents: Normalized documents by id
+        pipeline: Expensive per-document work (extraction, matching, ...)
+        index: Optional NearDuplicateIndex (may already hold some ids)
+
+    Returns:
+        (result per document id, DedupReport)
+    """
+    index = index or NearDuplicateIndex()
+    for doc_id, document in documents.items():
+        if doc_id not in index:
+            index.add(doc_id, document)
+
+    clusters = [
+        [doc_id for doc_id in cluster if doc_id in documents]
+        for cluster in index.clusters()
+    ]
+    clusters = [cluster for cluster in clusters if cluster]
+    report = DedupReport(documents=len(documents), clusters=clusters)
+    results: Dict[Hashable, T] = {}
+
+    for cluster in clusters:
+        start = time.perf_counter()
+        result = pipeline(documents[cluster[0]])
+        report.seconds_spent += time.perf_counter() - start
+        report.pipeline_runs += 1
+        report.reused += len(cluster) - 1
+
+        for doc_id in cluster:
+            results[doc_id] = result
+
+    return results, report
@@ -1,6 +1,7 @@
 # UnsupportedFileTypeError
 # DocumentParseError
 # EmptyDocumentError
+# RequestError
 
 class DocumentParseError(Exception):
     """Raised when a document cannot be parsed properly."""
@@ -10,3 +11,16 @@ class DocumentParseError(Exception):
 class UnsupportedFileTypeError(Exception):
     """Raised when an unsupported file type is provided."""
     pass
+
+
+class CorpusStoreError(Exception):
+    """Raised when the persistent corpus store is missing or inconsistent."""
+    pass
+
+
+class RequestError(Exception):
+    """Raised for requests the scoring service rejects, with an HTTP status."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
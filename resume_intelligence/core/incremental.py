@@ -0,0 +1,226 @@
+# Incremental re-analysis for editing UIs.
+
+# Every edit re-scores the resume against the JD. Instead of rerunning
+# the whole pipeline, each side keeps its previous version:
+
+# new text → normalize_document (whole text; linear regex passes)
+#          → sentence diff against the previous version
+#          → _sentence_phrases only for inserted sentences (cached by text)
+#          → rebuild only concepts whose phrase occurs in a changed sentence
+#          → consolidate_concepts
+# matching → vectors from a CachedEmbedder, so only new concept texts
+#            reach the model; the previous match is reused outright when
+#            neither side's concept texts/types changed
+
+# Results are identical to a full analyze_text + ConceptMatcher.match:
+# concepts are rebuilt from the same per-sentence occurrences, in the
+# same document order. The similarity product itself is recomputed in one
+# call whenever any concept changed: float32 matrix products differ in
+# the last bits depending on matrix shape, so patching rows or columns
+# into an earlier product would not reproduce a full recompute exactly.
+
+from dataclasses import dataclass, field
+from difflib import SequenceMatcher
+from typing import Dict, List, Optional, Tuple
+
+from resume_intelligence.core.document import Document
+from resume_intelligence.core.matching.ats_score import compute_ats_score
+from resume_intelligence.core.matching.embedder import CachedEmbedder
+from resume_intelligence.core.matching.matcher import ConceptMatcher
+from resume_intelligence.core.normalizer import normalize_document
+from resume_intelligence.core.semantics.concept import Concept, ConceptSource
+from resume_intelligence.core.semantics.consolidator import consolidate_concepts
+from resume_intelligence.core.semantics.extractor import (
+    _build_concept,
+    _sentence_phrases,
+)
+
+
+@dataclass
+class DocumentDelta:
+    """
+    What one update of a document changed and recomputed.
+    """
+    sentences: int = 0
+    changed_sentences: int = 0
+    reextracted_sentences: int = 0
+    rebuilt_concepts: int = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return {
+            "sentences": self.sentences,
+            "changed_sentences": self.changed_sentences,
+            "reextracted_sentences": self.reextracted_sentences,
+            "rebuilt_concepts": self.rebuilt_concepts,
+        }
+
+
+class IncrementalDocument:
+    """
+    One side (resume or JD) whose concepts are updated edit by edit.
+    """
+
+    def __init__(self, source: ConceptSource):
+        self.source = source
+        self.concepts: List[Concept] = []
+
+        self._sentences: List[str] = []
+        # sentence text → its (phrase, from_action) occurrences
+        self._occurrences: Dict[str, List[Tuple[str, bool]]] = {}
+        # phrase → concept (None: phrase present but not kept)
+        self._raw: Dict[str, Optional[Concept]] = {}
+
+    @property
+    def loaded(self) -> bool:
+        return bool(self._sentences)
+
+    def update(self, raw_text: str) -> DocumentDelta:
+        """
+        Bring the concepts up to date with ``raw_text``.
+
+        Raises:
+            DocumentParseError: The text normalizes to nothing (the
+                previous version is kept)
+        """
+        doc = Document(raw_text=raw_text)
+        normalize_document(doc)
+        sentences = doc.sentences
+
+        removed: List[str] = []
+        inserted: List[str] = []
+        diff = SequenceMatcher(None, self._sentences, sentences, autojunk=False)
+        for tag, i1, i2, j1, j2 in diff.get_opcodes():
+            if tag != "equal":
+                removed.extend(self._sentences[i1:i2])
+                inserted.extend(sentences[j1:j2])
+
+        delta = DocumentDelta(
+            sentences=len(sentences),
+            changed_sentences=len(removed) + len(inserted),
+        )
+        if not removed and not inserted:
+            return delta
+
+        for sentence in inserted:
+            if sentence not in self._occurrences:
+                self._occurrences[sentence] = _sentence_phrases(sentence)
+                delta.reextracted_sentences += 1
+
+        # Only phrases occurring in a changed sentence can have changed
+        affected = {
+            phrase
+            for sentence in removed + inserted
+            for phrase, _ in self._occurrences[sentence]
+        }
+
+        # First-occurrence order of every phrase, plus the document-order
+        # occurrences of the affected ones, exactly as extract_concepts
+        # accumulates them
+        order: Dict[str, None] = {}
+        gathered: Dict[str, List] = {phrase: [[], False] for phrase in affected}
+        for sentence in sentences:
+            for phrase, from_action in self._occurrences[sentence]:
+                order[phrase] = None
+                data = gathered.get(phrase)
+                if data is not None:
+                    data[0].append(sentence)
+                    data[1] = data[1] or from_action
+
+        for phrase, (phrase_sentences, from_action) in gathered.items():
+            if not phrase_sentences:
+                self._raw.pop(phrase, None)
+                continue
+            self._raw[phrase] = _build_concept(
+                phrase, phrase_sentences, from_action, self.source
+            )
+            delta.rebuilt_concepts += 1
+
+        self._sentences = sentences
+        self._occurrences = {s: self._occurrences[s] for s in sentences}
+
+        raw = [self._raw[phrase] for phrase in order]
+        self.concepts = consolidate_concepts([c for c in raw if c is not None])
+        return delta
+
+
+@dataclass
+class SessionUpdate:
+    ats_score: float
+    match_results: Dict[str, List[Dict]]
+    resume: DocumentDelta = field(default_factory=DocumentDelta)
+    jd: DocumentDelta = field(default_factory=DocumentDelta)
+    texts_embedded: int = 0
+    match_reused: bool = False
+
+
+class AnalysisSession:
+    """
+    Resume ↔ JD analysis kept up to date across edits.
+
+    Args:
+        embedder: Embedding model (e.g. ConceptEmbedder); wrapped in a
+            CachedEmbedder so unchanged concepts are never re-embedded
+    """
+
+    def __init__(self, embedder):
+        self.embedder = (
+            embedder if isinstance(embedder, CachedEmbedder)
+            else CachedEmbedder(embedder)
+        )
+        self.resume = IncrementalDocument(ConceptSource.RESUME)
+        self.jd = IncrementalDocument(ConceptSource.JD)
+
+        self._match_key: Optional[Tuple] = None
+        self._match_results: Optional[Dict[str, List[Dict]]] = None
+
+    def update(
+        self,
+        resume_text: Optional[str] = None,
+        jd_text: Optional[str] = None,
+    ) -> SessionUpdate:
+        """
+        Apply new versions of either side (None leaves it unchanged) and
+        re-score.
+
+        Raises:
+            DocumentParseError: A new version normalizes to nothing
+            ValueError: A side was never given, or the JD has no concepts
+        """
+        resume_delta = (
+            self.resume.update(resume_text) if resume_text is not None
+            else DocumentDelta(sentences=len(self.resume._sentences))
+        )
+        jd_delta = (
+            self.jd.update(jd_text) if jd_text is not None
+            else DocumentDelta(sentences=len(self.jd._sentences))
+        )
+
+        if not self.resume.loaded or not self.jd.loaded:
+            raise ValueError("Both a resume and a job description are needed.")
+
+        jd_concepts = self.jd.concepts
+        resume_concepts = self.resume.concepts
+        if not jd_concepts:
+            raise ValueError("No valid concepts found in job description.")
+
+        # Match records depend only on concept texts and types, in order
+        key = (
+            tuple((c.text, c.type) for c in jd_concepts),
+            tuple((c.text, c.type) for c in resume_concepts),
+        )
+        misses = self.embedder.misses
+        reused = key == self._match_key
+        if not reused:
+            self._match_results = ConceptMatcher(self.embedder).match(
+                jd_concepts, resume_concepts
+            )
+            self._match_key = key
+
+        return SessionUpdate(
+            ats_score=compute_ats_score(jd_concepts, self._match_results),
+            match_results=self._match_results,
+            resume=resume_delta,
+            jd=jd_delta,
+            texts_embedded=self.embedder.misses - misses,
+            match_reused=reused,
+        )
@@ -0,0 +1,539 @@
+# Per-stage instrumentation: wall time, CPU time, item counts and cache
+# hits for every pipeline stage.
+
+# parse → normalize → extract → consolidate → embed → similarity → score
+
+# Each stage wraps its work in ``with stage("extract") as s:`` and reports
+# what it processed through ``s.count(sentences=...)``. Recording is off
+# by default: stage() then hands back a shared no-op object, so a disabled
+# hook costs one global lookup and an empty with-block.
+
+# Recording is process-wide and thread-safe, so stages running in worker
+# threads are included. Stages run in worker processes (batch ingestion,
+# AsyncPipeline extraction) are not. CPU time is time.process_time, which
+# includes helper threads such as torch's; stages running concurrently in
+# several threads therefore overlap in their CPU totals.
+
+# Memory mode (Recorder(memory=True)) adds, per stage:
+# peak      → tracemalloc high-water above the stage's starting point
+# retained  → traced bytes still reachable when the stage returns (the
+#             collector runs at stage entry and exit, so cyclic garbage
+#             is neither blamed on the stage that made it nor credited
+#             to the one that happens to free it)
+# RSS       → resident set size sampled every few ms by a helper thread
+# sites     → source lines that allocated the retained bytes, from the
+#             first few calls of each stage (a snapshot costs time
+#             proportional to the whole traced heap)
+# tracemalloc counts every thread at once, so memory figures are only
+# attributable when stages don't overlap (the CLI, the benchmark suite,
+# batch runs with in-process ingestion). Tracing slows Python-heavy
+# stages several times over; use it to find memory, not to time.
+
+import gc
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional
+
+
+# Display order; stages not listed here follow in first-recorded order
+STAGES = (
+    "parse", "normalize", "extract", "consolidate", "embed", "similarity", "score",
+)
+
+
+@dataclass
+class MemoryStats:
+    peak_bytes: int = 0          # largest traced growth in any one call
+    retained_bytes: int = 0      # traced growth left behind, summed over calls
+    rss_peak_bytes: Optional[int] = None   # highest RSS sampled in any call
+    rss_growth_bytes: Optional[int] = None  # RSS growth, summed over calls
+    # "file:line" → [retained bytes, retained blocks], over sampled calls
+    sites: Dict[str, List[int]] = field(default_factory=dict)
+    sampled_calls: int = 0
+
+    def top_sites(self, n: int = 10) -> List[Dict]:
+        ranked = sorted(self.sites.items(), key=lambda item: -item[1][0])[:n]
+        return [
+            {"site": site, "bytes": size, "blocks": blocks}
+            for site, (size, blocks) in ranked
+            if size > 0
+        ]
+
+    def as_dict(self, top: int = 10) -> Dict:
+        return {
+            "peak_bytes": self.peak_bytes,
+            "retained_bytes": self.retained_bytes,
+            "rss_peak_bytes": self.rss_peak_bytes,
+            "rss_growth_bytes": self.rss_growth_bytes,
+            "sampled_calls": self.sampled_calls,
+            "top_sites": self.top_sites(top),
+        }
+
+
+@dataclass
+class StageStats:
+    calls: int = 0
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    items: Dict[str, int] = field(default_factory=dict)
+    memory: Optional[MemoryStats] = None
+
+    def as_dict(self, top: int = 10) -> Dict:
+        stats = {
+            "calls": self.calls,
+            "wall_seconds": round(self.wall_seconds, 6),
+            "cpu_seconds": round(self.cpu_seconds, 6),
+            "items": dict(self.items),
+        }
+        if self.memory is not None:
+            stats["memory"] = self.memory.as_dict(top)
+        return stats
+
+
+# -------------------------
+# Memory sampling
+# -------------------------
+try:
+    _PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+except (AttributeError, OSError, ValueError):
+    _PAGE_SIZE = 4096
+
+
+def rss_bytes() -> Optional[int]:
+    """
+    Current resident set size, or None where /proc is unavailable.
+    """
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """
+    Highest RSS of this process so far.
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+    # Linux reports kilobytes, macOS bytes
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class _RssSampler:
+    # Polls RSS and raises the high-water mark of every open window, so
+    # nested and concurrent stages each see the peak during their own span
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self._windows: List[List[int]] = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="ri-rss-sampler", daemon=True
+        )
+        self._thread.start()
+
+    def open(self) -> List[int]:
+        rss = rss_bytes() or 0
+        window = [rss, rss]  # [at entry, peak]
+        with self._lock:
+            self._windows.append(window)
+        return window
+
+    def close(self, window: List[int]) -> None:
+        rss = rss_bytes() or 0
+        with self._lock:
+            # By identity: nested windows often hold equal readings
+            self._windows = [w for w in self._windows if w is not window]
+        window[1] = max(window[1], rss)
+        window.append(rss)  # at exit
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            rss = rss_bytes() or 0
+            with self._lock:
+                for window in self._windows:
+                    if rss > window[1]:
+                        window[1] = rss
+
+
+class _MemoryFrame:
+    __slots__ = ("start", "peak", "snapshot", "rss")
+
+    def __init__(self, start: int, snapshot, rss):
+        self.start = start
+        self.peak = start
+        self.snapshot = snapshot
+        self.rss = rss
+
+
+# The profiler's own allocations; dropped from the per-line diff rather
+# than with Snapshot.filter_traces, which matches every trace in Python
+_OWN_FILES = (tracemalloc.__file__, __file__)
+
+
+class Recorder:
+    """
+    Accumulates StageStats per stage name.
+
+    Args:
+        memory: Also attribute memory to stages (see the module header)
+        site_calls: In memory mode, attribute retained bytes to source
+            lines for this many calls of each stage (0 disables)
+        frames: Traceback depth tracemalloc keeps per allocation
+    """
+
+    def __init__(self, memory: bool = False, site_calls: int = 3, frames: int = 1):
+        self.stages: Dict[str, StageStats] = {}
+        self.memory = memory
+        self.site_calls = site_calls
+        self.frames = frames
+        self._lock = threading.Lock()
+
+        self._local = threading.local()
+        self._sampler: Optional[_RssSampler] = None
+        self._started_tracing = False
+
+    # -------------------------
+    # Lifecycle (memory mode)
+    # -------------------------
+    def start(self) -> None:
+        if not self.memory or self._sampler is not None:
+            return
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._started_tracing = True
+        if rss_bytes() is not None:
+            self._sampler = _RssSampler()
+
+    def stop(self) -> None:
+        if self._sampler is not None:
+            self._sampler.stop()
+            self._sampler = None
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def _wants_sites(self, name: str) -> bool:
+        with self._lock:
+            stats = self.stages.get(name)
+            sampled = stats.memory.sampled_calls if stats and stats.memory else 0
+        return sampled < self.site_calls
+
+    def _memory_enter(self, name: str) -> _MemoryFrame:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+
+        if stack:
+            # reset_peak below would lose the enclosing stage's peak so far
+            stack[-1].peak = max(stack[-1].peak, tracemalloc.get_traced_memory()[1])
+
+        # The snapshot is itself traced memory that lives until exit, so it
+        # is taken before the baseline
+        gc.collect()
+        snapshot = tracemalloc.take_snapshot() if self._wants_sites(name) else None
+        current = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+
+        frame = _MemoryFrame(
+            current,
+            snapshot,
+            self._sampler.open() if self._sampler is not None else None,
+        )
+        stack.append(frame)
+        return frame
+
+    def _memory_exit(self, name: str, frame: _MemoryFrame) -> None:
+        # Read the peak before collecting: the collector may allocate
+        _, peak = tracemalloc.get_traced_memory()
+        gc.collect()
+        current = tracemalloc.get_traced_memory()[0]
+        stack = self._local.stack
+        stack.remove(frame)
+        peak = max(frame.peak, peak)
+        if stack:
+            stack[-1].peak = max(stack[-1].peak, peak)
+
+        sites = None
+        if frame.snapshot is not None:
+            sites = []
+            for stat in tracemalloc.take_snapshot().compare_to(frame.snapshot, "lineno"):
+                origin = stat.traceback[0]
+                if stat.size_diff > 0 and origin.filename not in _OWN_FILES:
+                    sites.append(
+                        (f"{origin.filename}:{origin.lineno}", stat.size_diff, stat.count_diff)
+                    )
+            frame.snapshot = None
+
+        if frame.rss is not None:
+            self._sampler.close(frame.rss)
+
+        with self._lock:
+            stats = self._stats(name)
+            memory = stats.memory
+            if memory is None:
+                memory = stats.memory = MemoryStats()
+
+            memory.peak_bytes = max(memory.peak_bytes, peak - frame.start)
+            memory.retained_bytes += current - frame.start
+            if frame.rss is not None:
+                entry, rss_peak, exit_ = frame.rss
+                memory.rss_peak_bytes = max(memory.rss_peak_bytes or 0, rss_peak)
+                memory.rss_growth_bytes = (memory.rss_growth_bytes or 0) + exit_ - entry
+            if sites is not None:
+                memory.sampled_calls += 1
+            for site, size, blocks in sites or ():
+                totals = memory.sites.setdefault(site, [0, 0])
+                totals[0] += size
+                totals[1] += blocks
+
+    def _stats(self, name: str) -> StageStats:
+        stats = self.stages.get(name)
+        if stats is None:
+            stats = self.stages[name] = StageStats()
+        return stats
+
+    def record(self, name: str, wall: float, cpu: float, items: Dict[str, int]) -> None:
+        with self._lock:
+            stats = self._stats(name)
+            stats.calls += 1
+            stats.wall_seconds += wall
+            stats.cpu_seconds += cpu
+            for key, value in items.items():
+                stats.items[key] = stats.items.get(key, 0) + value
+
+    def add(self, name: str, items: Dict[str, int]) -> None:
+        """
+        Add item counts to a stage without recording a call.
+        """
+        with self._lock:
+            stats = self._stats(name)
+            for key, value in items.items():
+                stats.items[key] = stats.items.get(key, 0) + value
+
+    def ordered(self) -> Dict[str, StageStats]:
+        with self._lock:
+            names = [n for n in STAGES if n in self.stages]
+            names += [n for n in self.stages if n not in STAGES]
+            return {n: self.stages[n] for n in names}
+
+    # -------------------------
+    # Exporters
+    # -------------------------
+    def as_dict(self, top: int = 10) -> Dict[str, Dict]:
+        return {name: stats.as_dict(top) for name, stats in self.ordered().items()}
+
+    def top_sites(self, n: int = 10) -> List[Dict]:
+        """
+        Allocation sites retaining the most memory, across all stages.
+        """
+        sites = [
+            dict(site, stage=name)
+            for name, stats in self.ordered().items()
+            if stats.memory is not None
+            for site in stats.memory.top_sites(n)
+        ]
+        return sorted(sites, key=lambda site: -site["bytes"])[:n]
+
+    def to_json(self) -> str:
+        report = {"stages": self.as_dict()}
+        if self.memory:
+            report["memory"] = {
+                "process_rss_peak_bytes": peak_rss_bytes(),
+                "top_sites": self.top_sites(),
+            }
+        return json.dumps(report, indent=2)
+
+    def to_prometheus(self, prefix: str = "resume_intelligence") -> str:
+        """
+        Prometheus text exposition format.
+        """
+        stages = self.ordered()
+        lines = []
+
+        def family(name: str, help_text: str, samples, kind: str = "counter") -> None:
+            metric = f"{prefix}_{name}"
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} {kind}")
+            for labels, value in samples:
+                rendered = ",".join(f'{k}="{_escape(v)}"' for k, v in labels)
+                lines.append(f"{metric}{{{rendered}}} {value}")
+
+        family("stage_calls_total", "Calls per pipeline stage.", [
+            ((("stage", n),), s.calls) for n, s in stages.items()
+        ])
+        family("stage_wall_seconds_total", "Wall time spent per pipeline stage.", [
+            ((("stage", n),), repr(s.wall_seconds)) for n, s in stages.items()
+        ])
+        family("stage_cpu_seconds_total", "Process CPU time spent per pipeline stage.", [
+            ((("stage", n),), repr(s.cpu_seconds)) for n, s in stages.items()
+        ])
+        family("stage_items_total", "Items processed per pipeline stage.", [
+            ((("stage", n), ("item", item)), value)
+            for n, s in stages.items()
+            for item, value in s.items.items()
+        ])
+
+        memory = {n: s.memory for n, s in stages.items() if s.memory is not None}
+        if memory:
+            family(
+                "stage_peak_traced_bytes",
+                "Largest traced allocation growth in one stage call.",
+                [((("stage", n),), m.peak_bytes) for n, m in memory.items()],
+                kind="gauge",
+            )
+            family(
+                "stage_retained_bytes_total",
+                "Traced bytes left allocated by stage calls.",
+                [((("stage", n),), m.retained_bytes) for n, m in memory.items()],
+            )
+            family(
+                "stage_rss_peak_bytes",
+                "Highest resident set size sampled during a stage.",
+                [
+                    ((("stage", n),), m.rss_peak_bytes)
+                    for n, m in memory.items() if m.rss_peak_bytes is not None
+                ],
+                kind="gauge",
+            )
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str) -> None:
+        """
+        Write JSON for a ``.json`` path, Prometheus text otherwise.
+        """
+        text = self.to_json() if str(path).endswith(".json") else self.to_prometheus()
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+# -------------------------
+# Hooks
+# -------------------------
+class _NoopStage:
+    __slots__ = ()
+
+    def __enter__(self) -> "_NoopStage":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        return None
+
+    def count(self, **items: int) -> None:
+        return None
+
+
+_NOOP = _NoopStage()
+
+
+class _Stage:
+    __slots__ = ("recorder", "name", "items", "_wall", "_cpu", "_memory")
+
+    def __init__(self, recorder: Recorder, name: str):
+        self.recorder = recorder
+        self.name = name
+        self.items: Dict[str, int] = {}
+        self._memory: Optional[_MemoryFrame] = None
+
+    def __enter__(self) -> "_Stage":
+        if self.recorder.memory:
+            self._memory = self.recorder._memory_enter(self.name)
+        self._wall = time.perf_counter()
+        self._cpu = time.process_time()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        wall = time.perf_counter() - self._wall
+        cpu = time.process_time() - self._cpu
+        if self._memory is not None:
+            self.recorder._memory_exit(self.name, self._memory)
+            # A stage object can outlive its block (``with stage(..) as s``)
+            self._memory = None
+
+        # Failed calls are recorded too: their time was still spent
+        self.recorder.record(self.name, wall, cpu, self.items)
+
+    def count(self, **items: int) -> None:
+        for key, value in items.items():
+            self.items[key] = self.items.get(key, 0) + value
+
+
+_recorder: Optional[Recorder] = None
+
+
+def stage(name: str):
+    """
+    Context manager timing one call of stage ``name``.
+    """
+    recorder = _recorder
+    if recorder is None:
+        return _NOOP
+    return _Stage(recorder, name)
+
+
+def count(name: str, **items: int) -> None:
+    """
+    Add item counts (e.g. cache hits) to stage ``name``.
+    """
+    recorder = _recorder
+    if recorder is not None:
+        recorder.add(name, items)
+
+
+def enable(recorder: Optional[Recorder] = None) -> Recorder:
+    """
+    Start recording into ``recorder`` (a new one if omitted).
+    """
+    global _recorder
+    _recorder = recorder if recorder is not None else Recorder()
+    _recorder.start()
+    return _recorder
+
+
+def disable() -> Optional[Recorder]:
+    """
+    Stop recording; returns the recorder that was active.
+    """
+    global _recorder
+    recorder, _recorder = _recorder, None
+    if recorder is not None:
+        recorder.stop()
+    return recorder
+
+
+def current() -> Optional[Recorder]:
+    return _recorder
+
+
+@contextmanager
+def profiling(recorder: Optional[Recorder] = None) -> Iterator[Recorder]:
+    """
+    Record stages inside the block; the previous recorder is restored after.
+    """
+    global _recorder
+    previous = _recorder
+    active = enable(recorder)
+    try:
+        yield active
+    finally:
+        active.stop()
+        _recorder = previous
@@ -19,6 +19,7 @@
 # ATS score = 1.208 / 1.72 = 70.2%
 from typing import Dict, List
 
+from resume_intelligence.core.instrumentation import stage
 from resume_intelligence.core.semantics.concept import Concept, ConceptType
 
 
@@ -51,43 +52,46 @@ def compute_ats_score(
         ATS score as a percentage (0–100)
     """
 
-    # Map JD concept → similarity score
-    match_map = {}
+    with stage("score") as s:
+        s.count(concepts=len(jd_concepts))
 
-    for bucket in ("matched", "partial", "missing"):
-        for record in match_results[bucket]:
-            match_map[record["jd_concept"]] = {
-                "similarity": record["score"],
-                "bucket": bucket,
-            }
+        # Map JD concept → similarity score
+        match_map = {}
 
-    total_weighted_score = 0.0
-    total_possible_score = 0.0
+        for bucket in ("matched", "partial", "missing"):
+            for record in match_results[bucket]:
+                match_map[record["jd_concept"]] = {
+                    "similarity": record["score"],
+                    "bucket": bucket,
+                }
 
-    for concept in jd_concepts:
-        confidence = concept.confidence
-        type_weight = TYPE_WEIGHTS.get(concept.type, 0.5)
+        total_weighted_score = 0.0
+        total_possible_score = 0.0
 
-        base_weight = confidence * type_weight
-        total_possible_score += base_weight
+        for concept in jd_concepts:
+            confidence = concept.confidence
+            type_weight = TYPE_WEIGHTS.get(concept.type, 0.5)
 
-        entry = match_map.get(concept.text)
-        if not entry:
-            continue
+            base_weight = confidence * type_weight
+            total_possible_score += base_weight
 
-        similarity = entry["similarity"]
-        quality_weight = MATCH_QUALITY_WEIGHTS[entry["bucket"]]
+            entry = match_map.get(concept.text)
+            if not entry:
+                continue
 
-        # similarity floor
-        if similarity < 0.4:
-            continue
+            similarity = entry["similarity"]
+            quality_weight = MATCH_QUALITY_WEIGHTS[entry["bucket"]]
 
-        # similarity squashing
-        effective_similarity = similarity ** 2
+            # similarity floor
+            if similarity < 0.4:
+                continue
 
-        total_weighted_score += base_weight * quality_weight * effective_similarity
+            # similarity squashing
+            effective_similarity = similarity ** 2
 
-    if total_possible_score == 0:
-        return 0.0
+            total_weighted_score += base_weight * quality_weight * effective_similarity
 
-    return round((total_weighted_score / total_possible_score) * 100, 2)
+        if total_possible_score == 0:
+            return 0.0
+
+        return round((total_weighted_score / total_possible_score) * 100, 2)
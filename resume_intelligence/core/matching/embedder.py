@@ -3,16 +3,27 @@
 # INPUT : ["api integration", "unit testing"]
 # OUTPUT : [[0.12, -0.44, ..., 0.33],[-0.18, 0.91, ..., -0.05]]
 
-from typing import List
+from collections import OrderedDict
+from typing import List, Optional
+
+from resume_intelligence.core.instrumentation import count
+
+
+DEFAULT_MODEL = "all-MiniLM-L6-v2"
 
-from sentence_transformers import SentenceTransformer
 
 class ConceptEmbedder:
     """
     Converts text concepts into semantic vector embeddings.
     """
 
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2"):
+    def __init__(self, model_name: str = DEFAULT_MODEL):
+        # Imported here so that modules which only reference the embedder
+        # (matcher, lexical pre-filter) don't pay the torch import cost.
+        from sentence_transformers import SentenceTransformer
+
+        self.model_name = model_name
+
         # Load model once
         self._model = SentenceTransformer(model_name)
 
@@ -37,3 +48,83 @@ class ConceptEmbedder:
 
         # Convert numpy arrays to Python lists for portability
         return embeddings.tolist()
+
+
+class CachedEmbedder:
+    """
+    LRU cache of concept vectors in front of any embedder.
+
+    Concept texts repeat heavily across resumes ("python", "unit
+    testing"), so only texts not seen recently reach the model, in one
+    call per ``embed_texts``.
+    """
+
+    def __init__(self, embedder, max_entries: Optional[int] = 100_000):
+        self.embedder = embedder
+        self.model_name = getattr(embedder, "model_name", None)
+        self.max_entries = max_entries
+
+        self.hits = 0
+        self.misses = 0
+        self._vectors: "OrderedDict[str, List[float]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._vectors)
+
+    def __contains__(self, text: str) -> bool:
+        return text in self._vectors
+
+    def texts(self) -> List[str]:
+        """
+        Cached texts, least recently used first.
+        """
+        return list(self._vectors)
+
+    def vector(self, text: str) -> List[float]:
+        """
+        Cached vector of ``text``, without touching LRU order or counters.
+        """
+        return self._vectors[text]
+
+    def warm(self, texts: List[str], vectors) -> None:
+        """
+        Pre-load vectors (e.g. from a checkpoint) without calling the model.
+        """
+        for text, vector in zip(texts, vectors):
+            self._vectors[text] = [float(x) for x in vector]
+            self._vectors.move_to_end(text)
+
+        self._evict()
+
+    def embed_texts(self, texts: List[str]) -> List[List[float]]:
+        if not texts:
+            return []
+
+        missing = list(dict.fromkeys(t for t in texts if t not in self._vectors))
+        self.misses += len(missing)
+        self.hits += len(texts) - len(missing)
+        count("embed", cache_hits=len(texts) - len(missing), cache_misses=len(missing))
+
+        found = {}
+        if missing:
+            found = dict(zip(missing, self.embedder.embed_texts(missing)))
+
+        vectors = []
+        for text in texts:
+            vector = found.get(text)
+            if vector is None:
+                vector = self._vectors[text]
+                self._vectors.move_to_end(text)
+            vectors.append(vector)
+
+        for text, vector in found.items():
+            self._vectors[text] = vector
+
+        self._evict()
+        return vectors
+
+    def _evict(self) -> None:
+        if self.max_entries is not None:
+            while len(self._vectors) > self.max_entries:
+                self._vectors.popitem(last=False)
+
@@ -0,0 +1,269 @@
+# Cheap lexical pre-filter in front of the neural matcher.
+
+# Most JD concepts either appear (almost) verbatim in the resume or share
+# nothing with it. Resolving those cases lexically means the transformer
+# only sees the ambiguous middle band.
+
+# Cascade stages (per JD concept, over type-compatible resume concepts):
+# exact   → same normalized token set                 → score 1.0
+# lexical → char n-gram TF-IDF cosine ≥ accept (0.9)   → lexical score
+#           char n-gram TF-IDF cosine < reject (0.1)   → lexical score
+# neural  → everything in between goes to the embedder
+
+# OUTPUT (CascadeReport):
+# stage_fractions   → {"exact": 0.42, "lexical": 0.31, "neural": 0.27, ...}
+# mean_abs_deviation → average |cascade score − neural score| per JD concept
+
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+import numpy as np
+
+from resume_intelligence.core.semantics.concept import Concept
+
+
+CASCADE_STAGES = ("exact", "lexical", "neural", "empty")
+
+DEFAULT_ACCEPT_THRESHOLD = 0.9
+DEFAULT_REJECT_THRESHOLD = 0.1
+
+
+def _token_key(text: str) -> FrozenSet[str]:
+    return frozenset(text.lower().split())
+
+
+@dataclass
+class CascadeStats:
+    """
+    Running count of how many JD concepts each cascade stage resolved.
+    """
+
+    counts: Dict[str, int] = field(
+        default_factory=lambda: {stage: 0 for stage in CASCADE_STAGES}
+    )
+
+    def record(self, stage: str) -> None:
+        self.counts[stage] += 1
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+    def fractions(self) -> Dict[str, float]:
+        total = self.total
+        if total == 0:
+            return {stage: 0.0 for stage in self.counts}
+        return {
+            stage: round(count / total, 4)
+            for stage, count in self.counts.items()
+        }
+
+    def reset(self) -> None:
+        for stage in self.counts:
+            self.counts[stage] = 0
+
+
+@dataclass
+class LexicalView:
+    """
+    Lexical scores for one ``ConceptMatcher.match`` call.
+    """
+
+    scores: np.ndarray
+    jd_keys: List[FrozenSet[str]]
+    resume_keys: List[FrozenSet[str]]
+
+
+class LexicalPrefilter:
+    """
+    Resolves exact and clear-cut concept pairs with a hashed
+    character n-gram TF-IDF vectorizer.
+    """
+
+    def __init__(
+        self,
+        accept_threshold: float = DEFAULT_ACCEPT_THRESHOLD,
+        reject_threshold: float = DEFAULT_REJECT_THRESHOLD,
+        ngram_range: Tuple[int, int] = (3, 4),
+        n_features: int = 2 ** 18,
+    ):
+        if not (0.0 <= reject_threshold <= accept_threshold <= 1.0):
+            raise ValueError(
+                "Thresholds must satisfy 0 <= reject <= accept <= 1."
+            )
+
+        self.accept_threshold = accept_threshold
+        self.reject_threshold = reject_threshold
+        self.stats = CascadeStats()
+
+        # Imported here so that importing the CLI (e.g. a daemon client
+        # call) doesn't pay the sklearn/scipy import cost.
+        from sklearn.feature_extraction.text import HashingVectorizer
+
+        self._vectorizer = HashingVectorizer(
+            analyzer="char_wb",
+            ngram_range=ngram_range,
+            n_features=n_features,
+            alternate_sign=False,
+            norm=None,
+        )
+
+    def prepare(
+        self,
+        jd_texts: List[str],
+        resume_texts: List[str],
+    ) -> LexicalView:
+        """
+        Vectorize both sides and compute the lexical cosine matrix.
+
+        IDF is fitted on the texts of this call only, so concepts that
+        appear everywhere ("development") carry little lexical weight.
+        """
+        jd_keys = [_token_key(t) for t in jd_texts]
+        resume_keys = [_token_key(t) for t in resume_texts]
+
+        if not jd_texts or not resume_texts:
+            return LexicalView(
+                scores=np.zeros((len(jd_texts), len(resume_texts))),
+                jd_keys=jd_keys,
+                resume_keys=resume_keys,
+            )
+
+        from sklearn.feature_extraction.text import TfidfTransformer
+
+        counts = self._vectorizer.transform(jd_texts + resume_texts)
+        tfidf = TfidfTransformer(sublinear_tf=True).fit_transform(counts)
+
+        jd_matrix = tfidf[: len(jd_texts)]
+        resume_matrix = tfidf[len(jd_texts):]
+
+        scores = (jd_matrix @ resume_matrix.T).toarray()
+
+        return LexicalView(
+            scores=np.clip(scores, 0.0, 1.0),
+            jd_keys=jd_keys,
+            resume_keys=resume_keys,
+        )
+
+    def decide(
+        self,
+        view: LexicalView,
+        jd_index: int,
+        candidate_indices: List[int],
+    ) -> Optional[Tuple[int, float]]:
+        """
+        Try to resolve one JD concept without the neural model.
+
+        Args:
+            view: Output of ``prepare``
+            jd_index: Row of the JD concept in ``view``
+            candidate_indices: Type-compatible resume concept columns
+
+        Returns:
+            (position within candidate_indices, score), or None when the
+            concept falls in the ambiguous band and must go to the model.
+        """
+        jd_key = view.jd_keys[jd_index]
+
+        for position, resume_index in enumerate(candidate_indices):
+            if view.resume_keys[resume_index] == jd_key:
+                self.stats.record("exact")
+                return position, 1.0
+
+        row = view.scores[jd_index, candidate_indices]
+        best_position = int(np.argmax(row))
+        best_score = float(row[best_position])
+
+        if best_score >= self.accept_threshold or best_score < self.reject_threshold:
+            self.stats.record("lexical")
+            return best_position, best_score
+
+        self.stats.record("neural")
+        return None
+
+
+# -------------------------------------------------------------------
+# Cascade vs full-neural comparison
+# -------------------------------------------------------------------
+@dataclass
+class CascadeReport:
+    """
+    How a cascade run compares to full neural matching.
+    """
+
+    stage_fractions: Dict[str, float]
+    mean_abs_deviation: float
+    max_abs_deviation: float
+    bucket_agreement: float
+    ats_neural: float
+    ats_cascade: float
+
+    def as_dict(self) -> Dict:
+        return {
+            "stage_fractions": self.stage_fractions,
+            "mean_abs_deviation": self.mean_abs_deviation,
+            "max_abs_deviation": self.max_abs_deviation,
+            "bucket_agreement": self.bucket_agreement,
+            "ats_neural": self.ats_neural,
+            "ats_cascade": self.ats_cascade,
+        }
+
+
+def _flatten(match_results: Dict[str, List[Dict]]) -> Dict[str, Tuple[str, float]]:
+    flat = {}
+    for bucket, records in match_results.items():
+        for record in records:
+            flat[record["jd_concept"]] = (bucket, record["score"])
+    return flat
+
+
+def cascade_report(
+    jd_concepts: List[Concept],
+    resume_concepts: List[Concept],
+    embedder,
+    prefilter: Optional[LexicalPrefilter] = None,
+) -> CascadeReport:
+    """
+    Run the same pair through full neural and cascade matching.
+
+    Args:
+        jd_concepts: Consolidated JD concepts
+        resume_concepts: Consolidated resume concepts
+        embedder: Embedder shared by both runs
+        prefilter: Pre-filter to evaluate (defaults to a fresh one)
+
+    Returns:
+        CascadeReport with stage fractions and score deviation
+    """
+    # Imported lazily: matcher only references this module for typing.
+    from resume_intelligence.core.matching.ats_score import compute_ats_score
+    from resume_intelligence.core.matching.matcher import ConceptMatcher
+
+    prefilter = prefilter or LexicalPrefilter()
+    prefilter.stats.reset()
+
+    neural = ConceptMatcher(embedder=embedder).match(jd_concepts, resume_concepts)
+    cascade = ConceptMatcher(embedder=embedder, prefilter=prefilter).match(
+        jd_concepts, resume_concepts
+    )
+
+    neural_flat = _flatten(neural)
+    cascade_flat = _flatten(cascade)
+
+    deviations = []
+    agreements = 0
+    for text, (bucket, score) in neural_flat.items():
+        cascade_bucket, cascade_score = cascade_flat[text]
+        deviations.append(abs(cascade_score - score))
+        agreements += int(cascade_bucket == bucket)
+
+    count = max(len(deviations), 1)
+
+    return CascadeReport(
+        stage_fractions=prefilter.stats.fractions(),
+        mean_abs_deviation=round(sum(deviations) / count, 4),
+        max_abs_deviation=round(max(deviations, default=0.0), 4),
+        bucket_agreement=round(agreements / count, 4),
+        ats_neural=compute_ats_score(jd_concepts, neural),
+        ats_cascade=compute_ats_score(jd_concepts, cascade),
+    )
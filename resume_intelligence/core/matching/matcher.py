@@ -43,13 +43,21 @@
 #   ]
 # }
 
-from typing import Dict, List
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
 
 import numpy as np
+from scipy import sparse
 
+from resume_intelligence.core.instrumentation import stage
 from resume_intelligence.core.semantics.concept import Concept, ConceptType
 from resume_intelligence.core.matching.embedder import ConceptEmbedder
-from resume_intelligence.core.matching.similarity import similarity_matrix
+from resume_intelligence.core.matching.similarity import (
+    sparse_similarity,
+    top_k_similarity,
+)
+
+if TYPE_CHECKING:
+    from resume_intelligence.core.matching.lexical import LexicalPrefilter
 
 
 # Thresholds for semantic matching
@@ -68,14 +76,53 @@ TYPE_COMPATIBILITY = {
 }
 
 
+def _bucket_for(score: float) -> str:
+    if score >= STRONG_MATCH_THRESHOLD:
+        return "matched"
+    if score >= PARTIAL_MATCH_THRESHOLD:
+        return "partial"
+    return "missing"
+
+
+def _resolve(
+    jd_concept: Concept,
+    best_score: float,
+    best_resume_text: str,
+) -> Tuple[str, Dict]:
+    record = {
+        "jd_concept": jd_concept.text,
+        "jd_type": jd_concept.type,
+        "score": round(best_score, 2),
+        "matched_resume_concept": best_resume_text,
+    }
+    return _bucket_for(best_score), record
+
+
 class ConceptMatcher:
     """
     Matches JD concepts against resume concepts using
     type-aware semantic similarity.
+
+    When a ``LexicalPrefilter`` is supplied the matcher runs in cascade
+    mode: exact and clearly (un)related pairs are resolved lexically and
+    only the ambiguous middle band is embedded.
     """
 
-    def __init__(self, embedder: ConceptEmbedder | None = None):
-        self._embedder = embedder or ConceptEmbedder()
+    def __init__(
+        self,
+        embedder: ConceptEmbedder | None = None,
+        prefilter: "LexicalPrefilter | None" = None,
+    ):
+        self._embedder = embedder
+        self._prefilter = prefilter
+
+    @property
+    def embedder(self) -> ConceptEmbedder:
+        # Load the model on first use; a cascade run that resolves every
+        # concept lexically never needs it.
+        if self._embedder is None:
+            self._embedder = ConceptEmbedder()
+        return self._embedder
 
     def match(
         self,
@@ -86,21 +133,32 @@ class ConceptMatcher:
         if not jd_concepts:
             return {"matched": [], "partial": [], "missing": []}
 
-        results = {
-            "matched": [],
-            "partial": [],
-            "missing": [],
-        }
+        lexical_view = None
+        if self._prefilter is not None:
+            lexical_view = self._prefilter.prepare(
+                [c.text for c in jd_concepts],
+                [rc.text for rc in resume_concepts],
+            )
+
+        resume_texts = [rc.text for rc in resume_concepts]
 
-        for jd_concept in jd_concepts:
+        # One (bucket, record) slot per JD concept, so bucket order follows
+        # JD order no matter which stage resolved the concept.
+        resolved: List[Tuple[str, Dict] | None] = [None] * len(jd_concepts)
+        pending: List[int] = []
+
+        for jd_index, jd_concept in enumerate(jd_concepts):
             # 🔒 Filter resume concepts by compatible types
             allowed_types = TYPE_COMPATIBILITY.get(jd_concept.type, set())
-            filtered_resume = [
-                rc for rc in resume_concepts if rc.type in allowed_types
+            filtered_indices = [
+                i for i, rc in enumerate(resume_concepts)
+                if rc.type in allowed_types
             ]
 
-            if not filtered_resume:
-                results["missing"].append({
+            if not filtered_indices:
+                if lexical_view is not None:
+                    self._prefilter.stats.record("empty")
+                resolved[jd_index] = ("missing", {
                     "jd_concept": jd_concept.text,
                     "jd_type": jd_concept.type,
                     "score": 0.0,
@@ -108,31 +166,201 @@ class ConceptMatcher:
                 })
                 continue
 
-            jd_vector = self._embedder.embed_texts([jd_concept.text])[0]
-            resume_texts = [rc.text for rc in filtered_resume]
-            resume_vectors = self._embedder.embed_texts(resume_texts)
+            # ⚡ Cascade: resolve cheap cases before touching the model
+            if lexical_view is not None:
+                decision = self._prefilter.decide(
+                    lexical_view, jd_index, filtered_indices
+                )
+                if decision is not None:
+                    best_position, best_score = decision
+                    resolved[jd_index] = _resolve(
+                        jd_concept,
+                        best_score,
+                        resume_texts[filtered_indices[best_position]],
+                    )
+                    continue
+
+            pending.append(jd_index)
+
+        if pending:
+            # Embed every text once and let the blocked kernel apply the
+            # type mask, instead of re-embedding the resume per JD concept.
+            with stage("embed") as s:
+                jd_vectors = self.embedder.embed_texts(
+                    [jd_concepts[i].text for i in pending]
+                )
+                resume_vectors = self.embedder.embed_texts(resume_texts)
+                s.count(texts=len(pending) + len(resume_texts))
+
+            with stage("similarity") as s:
+                best_indices, best_scores = top_k_similarity(
+                    jd_vectors,
+                    resume_vectors,
+                    k=1,
+                    jd_types=[jd_concepts[i].type for i in pending],
+                    resume_types=[rc.type for rc in resume_concepts],
+                    compatibility=TYPE_COMPATIBILITY,
+                )
+                s.count(pairs=len(pending) * len(resume_texts))
+
+            for row, jd_index in enumerate(pending):
+                resolved[jd_index] = _resolve(
+                    jd_concepts[jd_index],
+                    float(best_scores[row, 0]),
+                    resume_texts[int(best_indices[row, 0])],
+                )
+
+        results = {
+            "matched": [],
+            "partial": [],
+            "missing": [],
+        }
+
+        for bucket, record in resolved:
+            results[bucket].append(record)
+
+        return results
+
+    def similarity_graph(
+        self,
+        jd_concepts: List[Concept],
+        resume_concepts: List[Concept],
+        threshold: float = PARTIAL_MATCH_THRESHOLD,
+    ) -> sparse.csr_matrix:
+        """
+        Type-aware JD × resume similarities at or above ``threshold``.
+
+        Rows follow ``jd_concepts`` and columns ``resume_concepts``.
+        Feed the result to ``match_from_graph`` or ``supporting_concepts``.
+        """
+        if not jd_concepts or not resume_concepts:
+            return sparse.csr_matrix(
+                (len(jd_concepts), len(resume_concepts)), dtype=np.float32
+            )
 
-            similarities = similarity_matrix(
-                [jd_vector],
+        with stage("embed") as s:
+            jd_vectors = self.embedder.embed_texts([c.text for c in jd_concepts])
+            resume_vectors = self.embedder.embed_texts(
+                [rc.text for rc in resume_concepts]
+            )
+            s.count(texts=len(jd_concepts) + len(resume_concepts))
+
+        with stage("similarity") as s:
+            s.count(pairs=len(jd_concepts) * len(resume_concepts))
+            return sparse_similarity(
+                jd_vectors,
                 resume_vectors,
-            )[0]
+                threshold=threshold,
+                jd_types=[c.type for c in jd_concepts],
+                resume_types=[rc.type for rc in resume_concepts],
+                compatibility=TYPE_COMPATIBILITY,
+            )
+
+
+# -------------------------
+# Precomputed-score consumers
+# -------------------------
+def build_match_results(
+    jd_concepts: List[Concept],
+    best_scores: Sequence[float],
+    best_texts: Sequence[Optional[str]],
+) -> Dict[str, List[Dict]]:
+    """
+    Build ``ConceptMatcher.match``-shaped results from best scores
+    computed elsewhere (an index, a corpus store, a ranking worker).
 
-            best_idx = int(np.argmax(similarities))
-            best_score = float(similarities[best_idx])
-            best_resume_text = resume_texts[best_idx]
+    A JD concept whose best text is None is missing with score 0.0.
+    """
+    results = {
+        "matched": [],
+        "partial": [],
+        "missing": [],
+    }
 
-            record = {
+    for jd_concept, score, text in zip(jd_concepts, best_scores, best_texts):
+        if text is None:
+            results["missing"].append({
                 "jd_concept": jd_concept.text,
                 "jd_type": jd_concept.type,
-                "score": round(best_score, 2),
-                "matched_resume_concept": best_resume_text,
-            }
+                "score": 0.0,
+                "matched_resume_concept": None,
+            })
+            continue
 
-            if best_score >= STRONG_MATCH_THRESHOLD:
-                results["matched"].append(record)
-            elif best_score >= PARTIAL_MATCH_THRESHOLD:
-                results["partial"].append(record)
-            else:
-                results["missing"].append(record)
+        bucket, record = _resolve(jd_concept, float(score), text)
+        results[bucket].append(record)
 
-        return results
+    return results
+
+
+def match_from_graph(
+    jd_concepts: List[Concept],
+    resume_concepts: List[Concept],
+    graph: sparse.csr_matrix,
+) -> Dict[str, List[Dict]]:
+    """
+    Build ``ConceptMatcher.match``-shaped results from a sparse graph.
+
+    Matched and partial records are identical to dense matching. A JD
+    concept with no stored pair is missing with score 0.0 and no resume
+    concept, since its sub-threshold best score was never kept.
+    """
+    results = {
+        "matched": [],
+        "partial": [],
+        "missing": [],
+    }
+
+    for jd_index, jd_concept in enumerate(jd_concepts):
+        start, end = graph.indptr[jd_index], graph.indptr[jd_index + 1]
+
+        if start == end:
+            results["missing"].append({
+                "jd_concept": jd_concept.text,
+                "jd_type": jd_concept.type,
+                "score": 0.0,
+                "matched_resume_concept": None,
+            })
+            continue
+
+        # Column indices are sorted, so argmax keeps the first best column
+        best = start + int(np.argmax(graph.data[start:end]))
+        bucket, record = _resolve(
+            jd_concept,
+            float(graph.data[best]),
+            resume_concepts[graph.indices[best]].text,
+        )
+        results[bucket].append(record)
+
+    return results
+
+
+def supporting_concepts(
+    jd_concepts: List[Concept],
+    resume_concepts: List[Concept],
+    graph: sparse.csr_matrix,
+) -> Dict[str, List[Dict]]:
+    """
+    Every resume concept supporting each JD concept, best first.
+
+    Returns:
+        {jd_concept_text: [{"resume_concept", "score", "sentences"}, ...]}
+    """
+    support: Dict[str, List[Dict]] = {}
+
+    for jd_index, jd_concept in enumerate(jd_concepts):
+        start, end = graph.indptr[jd_index], graph.indptr[jd_index + 1]
+        columns = graph.indices[start:end]
+        scores = graph.data[start:end]
+
+        order = np.argsort(-scores, kind="stable")
+        support[jd_concept.text] = [
+            {
+                "resume_concept": resume_concepts[columns[i]].text,
+                "score": round(float(scores[i]), 2),
+                "sentences": resume_concepts[columns[i]].sentences,
+            }
+            for i in order
+        ]
+
+    return support
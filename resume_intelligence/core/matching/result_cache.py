@@ -0,0 +1,297 @@
+# Cache of finished matches: ATS score + match_results per (resume, JD)
+# pair, so re-opening a pair skips parsing, extraction and matching.
+
+# Key = SHA-256 over
+# resume digest, JD digest → content hashes of the documents as received
+# model name               → vectors differ between models
+# options                  → e.g. cascade, which changes the results
+# scoring fingerprint      → STRONG/PARTIAL_MATCH_THRESHOLD,
+#                            TYPE_COMPATIBILITY, TYPE_WEIGHTS,
+#                            MATCH_QUALITY_WEIGHTS, RESULT_FORMAT
+
+# A change to any of them gives new keys, so a stale result is never
+# returned. Each entry also records the fingerprint it was scored under,
+# and opening the cache with a different one deletes it.
+
+# Eviction: entries expire ``ttl`` seconds after they were stored; past
+# ``max_entries`` or ``max_bytes`` of payload the least recently read go.
+
+# Storage: one SQLite table, in a file the CLI, the service and the
+# Streamlit app can share, or in memory (path=None). Safe across threads;
+# SQLite serializes writers across processes.
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from resume_intelligence.core.matching import ats_score as scoring
+from resume_intelligence.core.matching import matcher as matching
+from resume_intelligence.core.semantics.concept import ConceptType
+
+
+# Bump when match_results or the ATS formula change shape
+RESULT_FORMAT = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key         TEXT PRIMARY KEY,
+    fingerprint TEXT NOT NULL,
+    stored_at   REAL NOT NULL,
+    read_at     REAL NOT NULL,
+    size        INTEGER NOT NULL,
+    payload     TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_read_at ON results(read_at);
+"""
+
+
+def _hasher(kind: str):
+    return hashlib.sha256(kind.lower().encode("utf-8") + b"\0")
+
+
+def content_digest(data: bytes, kind: str = "text") -> str:
+    """
+    Hash of a document as received. ``kind`` is "text" for pasted text
+    or the file suffix, so equal bytes that parse differently differ.
+    """
+    digest = _hasher(kind)
+    digest.update(data)
+    return digest.hexdigest()
+
+
+def file_digest(path: str) -> str:
+    """
+    content_digest of a file's bytes with its suffix, read in chunks.
+    """
+    digest = _hasher(os.path.splitext(path)[1])
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def scoring_fingerprint() -> str:
+    """
+    Hash of everything besides the documents and model that a match
+    result depends on; read at call time, so runtime changes count.
+    """
+    config = {
+        "format": RESULT_FORMAT,
+        "strong": matching.STRONG_MATCH_THRESHOLD,
+        "partial": matching.PARTIAL_MATCH_THRESHOLD,
+        "compatibility": {
+            t.value: sorted(c.value for c in allowed)
+            for t, allowed in matching.TYPE_COMPATIBILITY.items()
+        },
+        "type_weights": {t.value: w for t, w in scoring.TYPE_WEIGHTS.items()},
+        "quality_weights": scoring.MATCH_QUALITY_WEIGHTS,
+    }
+    return hashlib.sha256(
+        json.dumps(config, sort_keys=True).encode("utf-8")
+    ).hexdigest()
+
+
+@dataclass
+class CachedResult:
+    ats_score: float
+    match_results: Dict[str, List[Dict]]
+    stored_at: float
+
+
+class ResultCache:
+    """
+    Persistent (or in-memory) cache of match results.
+
+    Args:
+        path: SQLite file; None keeps the cache in memory
+        ttl: Seconds an entry stays valid; None never expires
+        max_entries: Entries kept at most; None is unbounded
+        max_bytes: Payload bytes kept at most; None is unbounded
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        ttl: Optional[float] = 7 * 24 * 3600.0,
+        max_entries: Optional[int] = 10_000,
+        max_bytes: Optional[int] = 64 * 2**20,
+    ):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            path or ":memory:", timeout=30.0, check_same_thread=False
+        )
+        if path:
+            # A cache can lose its last writes; readers needn't block writers
+            self._conn.execute("PRAGMA journal_mode = WAL")
+            self._conn.execute("PRAGMA synchronous = NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+        self.purge()
+
+    def key(
+        self,
+        resume_digest: str,
+        jd_digest: str,
+        model_name: Optional[str],
+        **options,
+    ) -> str:
+        """
+        Cache key for a pair under the current scoring configuration.
+        """
+        parts = {
+            "resume": resume_digest,
+            "jd": jd_digest,
+            "model": model_name,
+            "options": options,
+            "scoring": scoring_fingerprint(),
+        }
+        return hashlib.sha256(
+            json.dumps(parts, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+
+    # -------------------------
+    # Reading and writing
+    # -------------------------
+    def get(self, key: str) -> Optional[CachedResult]:
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT stored_at, payload FROM results WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is not None and self.ttl is not None and now - row[0] > self.ttl:
+                self._conn.execute("DELETE FROM results WHERE key = ?", (key,))
+                self.evictions += 1
+                row = None
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            self._conn.execute(
+                "UPDATE results SET read_at = ? WHERE key = ?", (now, key)
+            )
+            self.hits += 1
+
+        payload = json.loads(row[1])
+        return CachedResult(
+            ats_score=payload["ats_score"],
+            match_results={
+                bucket: [{**r, "jd_type": ConceptType(r["jd_type"])} for r in records]
+                for bucket, records in payload["match_results"].items()
+            },
+            stored_at=row[0],
+        )
+
+    def put(
+        self,
+        key: str,
+        ats_score: float,
+        match_results: Dict[str, List[Dict]],
+    ) -> None:
+        payload = json.dumps({
+            "ats_score": ats_score,
+            "match_results": {
+                bucket: [{**r, "jd_type": r["jd_type"].value} for r in records]
+                for bucket, records in match_results.items()
+            },
+        })
+        now = time.time()
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?)",
+                (key, scoring_fingerprint(), now, now, len(payload), payload),
+            )
+            self._evict()
+
+    # -------------------------
+    # Eviction
+    # -------------------------
+    def _evict(self) -> None:
+        # Called with the lock held, inside a transaction
+        count, total = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results"
+        ).fetchone()
+
+        excess_entries = count - self.max_entries if self.max_entries is not None else 0
+        excess_bytes = total - self.max_bytes if self.max_bytes is not None else 0
+        if excess_entries <= 0 and excess_bytes <= 0:
+            return
+
+        victims = []
+        for key, size in self._conn.execute(
+            "SELECT key, size FROM results ORDER BY read_at, stored_at"
+        ):
+            if excess_entries <= 0 and excess_bytes <= 0:
+                break
+            victims.append((key,))
+            excess_entries -= 1
+            excess_bytes -= size
+
+        self._conn.executemany("DELETE FROM results WHERE key = ?", victims)
+        self.evictions += len(victims)
+
+    def purge(self) -> int:
+        """
+        Delete expired entries and those scored under another
+        configuration; returns how many went.
+        """
+        with self._lock, self._conn:
+            removed = self._conn.execute(
+                "DELETE FROM results WHERE fingerprint != ?"
+                + (" OR stored_at < ?" if self.ttl is not None else ""),
+                (scoring_fingerprint(),)
+                + ((time.time() - self.ttl,) if self.ttl is not None else ()),
+            ).rowcount
+            self.evictions += removed
+        return removed
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM results")
+
+    # -------------------------
+    # Reporting & lifecycle
+    # -------------------------
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def as_dict(self) -> Dict:
+        with self._lock:
+            count, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results"
+            ).fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "entries": count,
+            "bytes": total,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+            "evictions": self.evictions,
+        }
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "ResultCache":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -19,9 +19,20 @@
 # JD[1] weakly matches Resume[0]
 # JD[1] does NOT match Resume[1]
 
-from typing import List
+from typing import (
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 import numpy as np
+from scipy import sparse
 
 
 def cosine_similarity(vec_a: List[float], vec_b: List[float]) -> float:
@@ -55,3 +66,270 @@ def similarity_matrix(
 
     # Matrix multiplication gives all pairwise dot products
     return np.dot(jd, resume.T)
+
+
+# -------------------------------------------------------------------
+# Blocked top-k kernel
+# -------------------------------------------------------------------
+
+# The dense matrix above is J × R float64. For one JD against millions of
+# stored resume concepts that doesn't fit, and callers only need the best
+# few columns of each row anyway. top_k_similarity walks the product in
+# (block_rows × block_cols) float32 tiles and keeps a running top-k per
+# row, so peak memory is O(block_rows × block_cols + J × k).
+
+def _type_codes(
+    jd_types: Sequence[Hashable],
+    resume_types: Sequence[Hashable],
+    compatibility: Mapping[Hashable, Iterable[Hashable]],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    vocab: Dict[Hashable, int] = {}
+    for t in list(jd_types) + list(resume_types) + list(compatibility):
+        vocab.setdefault(t, len(vocab))
+    for allowed in compatibility.values():
+        for t in allowed:
+            vocab.setdefault(t, len(vocab))
+
+    allowed_matrix = np.zeros((len(vocab), len(vocab)), dtype=bool)
+    for t, allowed in compatibility.items():
+        for other in allowed:
+            allowed_matrix[vocab[t], vocab[other]] = True
+
+    jd_codes = np.array([vocab[t] for t in jd_types], dtype=np.int32)
+    resume_codes = np.array([vocab[t] for t in resume_types], dtype=np.int32)
+
+    return jd_codes, resume_codes, allowed_matrix
+
+
+def _iter_tiles(
+    jd: np.ndarray,
+    resume_vectors,
+    block_rows: int,
+    block_cols: int,
+    jd_types: Optional[Sequence[Hashable]],
+    resume_types: Optional[Sequence[Hashable]],
+    compatibility: Optional[Mapping[Hashable, Iterable[Hashable]]],
+    threshold: Optional[float],
+) -> Iterator[Tuple[int, int, np.ndarray, np.ndarray]]:
+    # Yields (row_start, row_end, col_ids, tile) with masked-out and
+    # below-threshold entries set to -inf.
+    if block_rows < 1 or block_cols < 1:
+        raise ValueError("Block sizes must be positive.")
+
+    use_types = jd_types is not None or resume_types is not None
+    if use_types:
+        if jd_types is None or resume_types is None or compatibility is None:
+            raise ValueError(
+                "jd_types, resume_types and compatibility must be given together."
+            )
+        jd_codes, resume_codes, allowed = _type_codes(
+            jd_types, resume_types, compatibility
+        )
+
+    n_rows = len(jd)
+    n_cols = len(resume_vectors)
+
+    for col_start in range(0, n_cols, block_cols):
+        col_end = min(col_start + block_cols, n_cols)
+        resume_block = np.asarray(
+            resume_vectors[col_start:col_end], dtype=np.float32
+        )
+        col_ids = np.arange(col_start, col_end, dtype=np.int64)
+
+        for row_start in range(0, n_rows, block_rows):
+            row_end = min(row_start + block_rows, n_rows)
+
+            tile = jd[row_start:row_end] @ resume_block.T
+
+            if use_types:
+                mask = allowed[
+                    jd_codes[row_start:row_end, None],
+                    resume_codes[None, col_start:col_end],
+                ]
+                tile[~mask] = -np.inf
+
+            if threshold is not None:
+                tile[tile < threshold] = -np.inf
+
+            yield row_start, row_end, col_ids, tile
+
+
+def top_k_similarity(
+    jd_vectors,
+    resume_vectors,
+    k: int = 1,
+    block_rows: int = 256,
+    block_cols: int = 65536,
+    jd_types: Optional[Sequence[Hashable]] = None,
+    resume_types: Optional[Sequence[Hashable]] = None,
+    compatibility: Optional[Mapping[Hashable, Iterable[Hashable]]] = None,
+    threshold: Optional[float] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Best ``k`` resume columns per JD row, without materializing J × R.
+
+    Args:
+        jd_vectors: (J, d) normalized vectors (lists, arrays or memmaps)
+        resume_vectors: (R, d) normalized vectors (lists, arrays or memmaps)
+        k: Number of neighbours to keep per row
+        block_rows: JD rows per tile
+        block_cols: Resume columns per tile
+        jd_types: Optional per-row type labels
+        resume_types: Optional per-column type labels
+        compatibility: Type → allowed resume types (required with types)
+        threshold: Drop pairs scoring below this value
+
+    Returns:
+        (indices, scores), both of shape (J, k), sorted by descending
+        score. Unfilled slots (masked out, below threshold, or R < k)
+        have index -1 and score -inf. With k == 1 ties resolve to the
+        lowest column index, like ``np.argmax``.
+    """
+    if k < 1:
+        raise ValueError("k must be at least 1.")
+
+    jd = np.asarray(jd_vectors, dtype=np.float32)
+    n_rows = len(jd)
+    n_cols = len(resume_vectors)
+
+    best_idx = np.full((n_rows, k), -1, dtype=np.int64)
+    best_scores = np.full((n_rows, k), -np.inf, dtype=np.float32)
+
+    if n_rows == 0 or n_cols == 0:
+        return best_idx, best_scores
+
+    tiles = _iter_tiles(
+        jd,
+        resume_vectors,
+        block_rows,
+        block_cols,
+        jd_types,
+        resume_types,
+        compatibility,
+        threshold,
+    )
+
+    for row_start, row_end, col_ids, tile in tiles:
+        _merge_tile(
+            best_idx[row_start:row_end],
+            best_scores[row_start:row_end],
+            tile,
+            col_ids,
+            k,
+        )
+
+    best_idx[~np.isfinite(best_scores)] = -1
+
+    return best_idx, best_scores
+
+
+def _merge_tile(
+    best_idx: np.ndarray,
+    best_scores: np.ndarray,
+    tile: np.ndarray,
+    col_ids: np.ndarray,
+    k: int,
+) -> None:
+    # Updates best_idx / best_scores (views into the caller's arrays) in place.
+    rows = np.arange(len(tile))
+
+    if k == 1:
+        tile_best = np.argmax(tile, axis=1)
+        tile_scores = tile[rows, tile_best]
+        better = tile_scores > best_scores[:, 0]
+        best_scores[better, 0] = tile_scores[better]
+        best_idx[better, 0] = col_ids[tile_best[better]]
+        return
+
+    width = tile.shape[1]
+    if width > k:
+        part = np.argpartition(-tile, k - 1, axis=1)[:, :k]
+    else:
+        part = np.broadcast_to(np.arange(width), (len(tile), width))
+
+    cand_scores = np.concatenate(
+        [best_scores, np.take_along_axis(tile, part, axis=1)], axis=1
+    )
+    cand_idx = np.concatenate([best_idx, col_ids[part]], axis=1)
+
+    top = np.argpartition(-cand_scores, k - 1, axis=1)[:, :k]
+    top_scores = np.take_along_axis(cand_scores, top, axis=1)
+    top_idx = np.take_along_axis(cand_idx, top, axis=1)
+
+    order = np.argsort(-top_scores, axis=1, kind="stable")
+    best_scores[:] = np.take_along_axis(top_scores, order, axis=1)
+    best_idx[:] = np.take_along_axis(top_idx, order, axis=1)
+
+
+# -------------------------------------------------------------------
+# Sparse thresholded output
+# -------------------------------------------------------------------
+
+# Only pairs at or above PARTIAL_MATCH_THRESHOLD matter for matching and
+# explanations. sparse_similarity keeps exactly those, tile by tile, so
+# the dense J × R intermediate never exists.
+
+def sparse_similarity(
+    jd_vectors,
+    resume_vectors,
+    threshold: float,
+    block_rows: int = 256,
+    block_cols: int = 65536,
+    jd_types: Optional[Sequence[Hashable]] = None,
+    resume_types: Optional[Sequence[Hashable]] = None,
+    compatibility: Optional[Mapping[Hashable, Iterable[Hashable]]] = None,
+) -> sparse.csr_matrix:
+    """
+    Similarity matrix holding only pairs with score >= threshold.
+
+    Args:
+        jd_vectors: (J, d) normalized vectors
+        resume_vectors: (R, d) normalized vectors
+        threshold: Minimum score to keep
+        block_rows: JD rows per tile
+        block_cols: Resume columns per tile
+        jd_types / resume_types / compatibility: Optional type mask,
+            as in ``top_k_similarity``
+
+    Returns:
+        float32 CSR matrix of shape (J, R) with sorted column indices
+    """
+    jd = np.asarray(jd_vectors, dtype=np.float32)
+    n_rows = len(jd)
+    n_cols = len(resume_vectors)
+
+    rows: List[np.ndarray] = []
+    cols: List[np.ndarray] = []
+    data: List[np.ndarray] = []
+
+    if n_rows and n_cols:
+        tiles = _iter_tiles(
+            jd,
+            resume_vectors,
+            block_rows,
+            block_cols,
+            jd_types,
+            resume_types,
+            compatibility,
+            threshold,
+        )
+
+        for row_start, _, col_ids, tile in tiles:
+            tile_rows, tile_cols = np.nonzero(np.isfinite(tile))
+            rows.append(tile_rows + row_start)
+            cols.append(col_ids[tile_cols])
+            data.append(tile[tile_rows, tile_cols])
+
+    if rows:
+        coo = sparse.coo_matrix(
+            (np.concatenate(data), (np.concatenate(rows), np.concatenate(cols))),
+            shape=(n_rows, n_cols),
+            dtype=np.float32,
+        )
+    else:
+        coo = sparse.coo_matrix((n_rows, n_cols), dtype=np.float32)
+
+    graph = coo.tocsr()
+    graph.sort_indices()
+
+    return graph
@@ -14,6 +14,7 @@ from typing import List
 
 from resume_intelligence.core.document import Document
 from resume_intelligence.core.exception import DocumentParseError
+from resume_intelligence.core.instrumentation import stage
 
 
 BULLET_PATTERNS = [
@@ -72,30 +73,32 @@ def normalize_document(doc: Document) -> Document:
     if not doc.raw_text or not doc.raw_text.strip() or not doc or not doc.raw_text:
         raise DocumentParseError("Cannot normalize empty document.")
 
-    text = doc.raw_text
+    with stage("normalize") as s:
+        text = doc.raw_text
 
-    # 1️⃣ Unicode normalization
-    text = _normalize_unicode(text)
+        # 1️⃣ Unicode normalization
+        text = _normalize_unicode(text)
 
-    # 2️⃣ Lowercase
-    text = text.lower()
+        # 2️⃣ Lowercase
+        text = text.lower()
 
-    # 3️⃣ Bullet normalization
-    text = _normalize_bullets(text)
+        # 3️⃣ Bullet normalization
+        text = _normalize_bullets(text)
 
-    # 4️⃣ Remove noisy lines
-    text = _remove_noise_lines(text)
+        # 4️⃣ Remove noisy lines
+        text = _remove_noise_lines(text)
 
-    # 5️⃣ Whitespace normalization
-    text = _normalize_whitespace(text)
+        # 5️⃣ Whitespace normalization
+        text = _normalize_whitespace(text)
 
-    if not text.strip():
-        raise DocumentParseError("Document became empty after normalization.")
+        if not text.strip():
+            raise DocumentParseError("Document became empty after normalization.")
 
-    # 6️⃣ Sentence splitting
-    sentences = _split_sentences(text)
+        # 6️⃣ Sentence splitting
+        sentences = _split_sentences(text)
 
-    doc.set_clean_text(text)
-    doc.set_sentences(sentences)
+        doc.set_clean_text(text)
+        doc.set_sentences(sentences)
+        s.count(documents=1, sentences=len(sentences))
 
     return doc
@@ -0,0 +1,533 @@
+# Staged streaming pipeline: the resume → ATS chain as concurrent stages
+# joined by bounded queues, yielding one result row per resume.
+
+# paths ─► parse    (processes)         parse_document
+#       ─► analyze  (processes)         normalize → extract → consolidate
+#       ─► embed    (one thread)        one model call per batch of resumes
+#       ─► match    (threads)           ConceptMatcher → compute_ats_score
+#       ─► rows, in input order
+
+# Each stage has a driver thread that takes items from its inbox, submits
+# them to the stage's executor (at most 2 × width jobs in flight) and
+# hands finished jobs on in submission order. Inboxes hold at most
+# queue_size items, so a stage that falls behind fills its inbox and the
+# stage above it blocks on the put: work never piles up in front of the
+# bottleneck, and the number of resumes inside the pipeline is bounded by
+# max_in_flight however long the input is.
+
+# The embed stage always groups batch_size consecutive resumes (failed
+# ones included) into one model call, so a job resumed from a checkpoint
+# taken at a batch boundary embeds exactly the batches an uninterrupted
+# run would have.
+
+# The embedding cache is only touched from the embed thread. Each resume
+# leaves that stage with its own vectors and the JD's, so the match
+# threads look them up instead of sharing the cache. In cascade mode
+# (with a LexicalPrefilter) the matcher decides what to embed, so embed
+# passes resumes through and the single match thread uses the cache.
+
+# Utilisation per stage is busy / (wall × width), with busy measured
+# inside the workers; the stage nearest 1.0 is the bottleneck. blocked is
+# time a stage's driver waited on a full downstream queue, starved time
+# it waited on an empty inbox. Busy time is wall time, so with more
+# workers than free cores a stage can report more than 1.0.
+
+import os
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass, field
+from typing import Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from resume_intelligence.core.batch import result_row
+from resume_intelligence.core.exception import (
+    DocumentParseError,
+    UnsupportedFileTypeError,
+)
+from resume_intelligence.core.matching.ats_score import compute_ats_score
+from resume_intelligence.core.matching.embedder import CachedEmbedder
+from resume_intelligence.core.matching.matcher import ConceptMatcher
+from resume_intelligence.core.parser import parse_document
+from resume_intelligence.core.pipeline import analyze_text
+from resume_intelligence.core.semantics.concept import Concept, ConceptSource
+
+
+PIPELINE_STAGES = ("parse", "analyze", "embed", "match")
+
+# How long drivers wait before re-checking for finished jobs or a stop
+_POLL = 0.01
+
+_DONE = object()
+
+
+# -------------------------
+# Worker side
+# -------------------------
+def _analyze(raw_text: str) -> List[Concept]:
+    return analyze_text(raw_text, ConceptSource.RESUME)
+
+
+def _run_job(fn: Callable, values: List, batched: bool) -> Tuple[List[Tuple], float]:
+    # Runs in a worker: must stay a picklable top-level function. Expected
+    # per-document failures become error strings; anything else is a bug
+    # and propagates.
+    start = time.perf_counter()
+    if batched:
+        outputs = [(value, None) for value in fn(values)]
+    else:
+        outputs = []
+        for value in values:
+            try:
+                outputs.append((fn(value), None))
+            except (DocumentParseError, UnsupportedFileTypeError, ValueError) as e:
+                outputs.append((None, str(e)))
+    return outputs, time.perf_counter() - start
+
+
+class _VectorLookup:
+    # Embedder seen by a match thread: serves the vectors the embed stage
+    # attached to its resume, and the JD's
+
+    def __init__(self, vectors, model_name: Optional[str]):
+        self.vectors = vectors
+        self.model_name = model_name
+
+    def embed_texts(self, texts: List[str]) -> List[List[float]]:
+        return [self.vectors[t] for t in texts]
+
+
+# -------------------------
+# Reporting
+# -------------------------
+@dataclass
+class StageReport:
+    workers: int
+    items: int = 0
+    jobs: int = 0
+    busy_seconds: float = 0.0
+    blocked_seconds: float = 0.0   # waiting on a full downstream queue
+    starved_seconds: float = 0.0   # waiting on an empty inbox
+    peak_queued: int = 0           # deepest the inbox got
+
+    def utilisation(self, wall_seconds: float) -> float:
+        if not wall_seconds:
+            return 0.0
+        return self.busy_seconds / (wall_seconds * self.workers)
+
+
+@dataclass
+class PipelineReport:
+    resumes: int = 0
+    failed: int = 0
+    wall_seconds: float = 0.0
+    stages: Dict[str, StageReport] = field(default_factory=dict)
+
+    @property
+    def bottleneck(self) -> Optional[str]:
+        if not self.stages:
+            return None
+        return max(
+            self.stages, key=lambda name: self.stages[name].utilisation(self.wall_seconds)
+        )
+
+    def as_dict(self) -> Dict:
+        return {
+            "resumes": self.resumes,
+            "failed": self.failed,
+            "wall_seconds": round(self.wall_seconds, 3),
+            "resumes_per_second": round(
+                self.resumes / self.wall_seconds if self.wall_seconds else 0.0, 2
+            ),
+            "bottleneck": self.bottleneck,
+            "stages": {
+                name: {
+                    "workers": stats.workers,
+                    "items": stats.items,
+                    "jobs": stats.jobs,
+                    "busy_seconds": round(stats.busy_seconds, 3),
+                    "blocked_seconds": round(stats.blocked_seconds, 3),
+                    "starved_seconds": round(stats.starved_seconds, 3),
+                    "peak_queued": stats.peak_queued,
+                    "utilisation": round(stats.utilisation(self.wall_seconds), 3),
+                }
+                for name, stats in self.stages.items()
+            },
+        }
+
+
+# -------------------------
+# Stages
+# -------------------------
+class _Item:
+    __slots__ = ("path", "value", "error")
+
+    def __init__(self, path: str):
+        self.path = path
+        self.value = path
+        self.error: Optional[str] = None
+
+
+class _Stage:
+    def __init__(
+        self,
+        name: str,
+        fn: Callable,
+        executor: Executor,
+        workers: int,
+        batch_size: int = 1,
+        batched: bool = False,
+    ):
+        self.name = name
+        self.fn = fn
+        self.executor = executor
+        self.batch_size = batch_size
+        self.batched = batched
+        self.max_jobs = 2 * workers
+        self.report = StageReport(workers=workers)
+
+
+class _Run:
+    # The threads and queues of one Pipeline.run call
+
+    def __init__(self, stages: List[_Stage], queue_size: int):
+        self.stages = stages
+        self.queues: List[queue.Queue] = [
+            queue.Queue(maxsize=queue_size) for _ in range(len(stages) + 1)
+        ]
+        self.stop = threading.Event()
+        self.error: Optional[BaseException] = None
+        self.threads: List[threading.Thread] = []
+
+    def start(self, paths: Iterable[str]) -> None:
+        self.threads.append(threading.Thread(
+            target=self._guard, args=(self._feed, paths), name="ri-stage-feed", daemon=True,
+        ))
+        for i, stage in enumerate(self.stages):
+            self.threads.append(threading.Thread(
+                target=self._guard,
+                args=(self._drive, stage, self.queues[i], self.queues[i + 1]),
+                name=f"ri-stage-{stage.name}",
+                daemon=True,
+            ))
+        for thread in self.threads:
+            thread.start()
+
+    def close(self) -> None:
+        self.stop.set()
+        for thread in self.threads:
+            thread.join()
+
+    def results(self) -> Iterator[_Item]:
+        outbox = self.queues[-1]
+        while True:
+            try:
+                item = outbox.get(timeout=_POLL)
+            except queue.Empty:
+                if self.stop.is_set():
+                    break
+                continue
+            if item is _DONE:
+                break
+            yield item
+
+        if self.error is not None:
+            raise self.error
+
+    # -------------------------
+    # Threads
+    # -------------------------
+    def _guard(self, target, *args) -> None:
+        try:
+            target(*args)
+        except BaseException as e:
+            # First failure wins; every other thread winds down
+            if self.error is None:
+                self.error = e
+            self.stop.set()
+
+    def _put(self, q: queue.Queue, item, stats: Optional[StageReport] = None) -> bool:
+        start = time.perf_counter()
+        while not self.stop.is_set():
+            try:
+                q.put(item, timeout=_POLL)
+                break
+            except queue.Full:
+                continue
+        if stats is not None:
+            stats.blocked_seconds += time.perf_counter() - start
+        return not self.stop.is_set()
+
+    def _feed(self, paths: Iterable[str]) -> None:
+        first = self.queues[0]
+        for path in paths:
+            if not self._put(first, _Item(str(path))):
+                return
+            self._note_depth(self.stages[0], first)
+        self._put(first, _DONE)
+
+    def _note_depth(self, stage: _Stage, inbox: queue.Queue) -> None:
+        stage.report.peak_queued = max(stage.report.peak_queued, inbox.qsize())
+
+    def _take(
+        self,
+        stage: _Stage,
+        inbox: queue.Queue,
+        pending: List[_Item],
+    ) -> Tuple[List[_Item], bool]:
+        # Moves queued items into ``pending``; returns a batch once it
+        # holds batch_size items (or the input ended), and whether the
+        # end of the input was reached
+        start = time.perf_counter()
+        try:
+            item = inbox.get(timeout=_POLL)
+        except queue.Empty:
+            stage.report.starved_seconds += time.perf_counter() - start
+            return [], False
+        stage.report.starved_seconds += time.perf_counter() - start
+
+        while item is not _DONE:
+            pending.append(item)
+            if len(pending) == stage.batch_size:
+                batch = pending[:]
+                pending.clear()
+                return batch, False
+            try:
+                item = inbox.get_nowait()
+            except queue.Empty:
+                return [], False
+
+        batch = pending[:]
+        pending.clear()
+        return batch, True
+
+    def _drive(self, stage: _Stage, inbox: queue.Queue, outbox: queue.Queue) -> None:
+        window: Deque[Tuple[List[_Item], Optional[Future]]] = deque()
+        pending: List[_Item] = []
+        ended = False
+
+        while not self.stop.is_set():
+            # Hand on finished jobs, oldest first, so order is kept
+            while window and (window[0][1] is None or window[0][1].done()):
+                if not self._emit(stage, *window.popleft(), outbox):
+                    return
+
+            if ended:
+                if not window:
+                    break
+                wait([window[0][1]], timeout=_POLL)
+                continue
+            if len(window) >= stage.max_jobs:
+                wait([window[0][1]], timeout=_POLL)
+                continue
+
+            batch, ended = self._take(stage, inbox, pending)
+            if not batch:
+                continue
+
+            # Resumes that failed upstream pass through untouched
+            live = [item.value for item in batch if item.error is None]
+            future = None
+            if live:
+                future = stage.executor.submit(
+                    _run_job, stage.fn, live, stage.batched
+                )
+            window.append((batch, future))
+
+        if not self.stop.is_set():
+            self._put(outbox, _DONE)
+
+    def _emit(
+        self,
+        stage: _Stage,
+        batch: List[_Item],
+        future: Optional[Future],
+        outbox: queue.Queue,
+    ) -> bool:
+        if future is not None:
+            outputs, seconds = future.result()
+            stats = stage.report
+            stats.jobs += 1
+            stats.items += len(outputs)
+            stats.busy_seconds += seconds
+
+            results = iter(outputs)
+            for item in batch:
+                if item.error is None:
+                    item.value, item.error = next(results)
+
+        downstream = self._downstream(stage)
+        for item in batch:
+            if not self._put(outbox, item, stage.report):
+                return False
+            if downstream is not None:
+                self._note_depth(downstream, outbox)
+        return True
+
+    def _downstream(self, stage: _Stage) -> Optional[_Stage]:
+        i = self.stages.index(stage)
+        return self.stages[i + 1] if i + 1 < len(self.stages) else None
+
+
+# -------------------------
+# Pipeline
+# -------------------------
+class Pipeline:
+    """
+    Matches a stream of resumes against one JD with every stage running
+    concurrently; see the module header for the layout.
+
+    Args:
+        jd_concepts: Consolidated JD concepts
+        embedder: Any object with ``embed_texts``; wrapped in a cache
+        parse_workers: Processes for parsing (0 runs it on one thread)
+        analyze_workers: Processes for normalize/extract/consolidate
+            (0 runs it on one thread)
+        match_threads: Threads matching and scoring resumes (one with
+            a prefilter)
+        batch_size: Resumes per embedding call
+        queue_size: Items each stage's inbox holds before upstream blocks
+        prefilter: Optional LexicalPrefilter for cascade matching
+
+    Use as ``with Pipeline(jd, embedder) as pipeline:`` or call
+    ``close()`` when done; ``run`` may be called any number of times.
+    """
+
+    def __init__(
+        self,
+        jd_concepts: List[Concept],
+        embedder,
+        parse_workers: int = 1,
+        analyze_workers: int = max(1, min(4, (os.cpu_count() or 1) - 1)),
+        match_threads: int = 1,
+        batch_size: int = 32,
+        queue_size: int = 64,
+        cache_entries: Optional[int] = 100_000,
+        prefilter=None,
+    ):
+        if not jd_concepts:
+            raise ValueError("No valid concepts found in job description.")
+        if batch_size < 1 or queue_size < 1 or match_threads < 1:
+            raise ValueError("batch_size, queue_size and match_threads must be at least 1.")
+        if prefilter is not None and match_threads > 1:
+            raise ValueError("Cascade matching runs on one match thread.")
+
+        self.jd_concepts = jd_concepts
+        self.embedder = (
+            embedder if isinstance(embedder, CachedEmbedder)
+            else CachedEmbedder(embedder, cache_entries)
+        )
+        self.batch_size = batch_size
+        self.queue_size = queue_size
+        self.prefilter = prefilter
+        self.report = PipelineReport()
+
+        self._executors: List[Executor] = []
+        self._stages = [
+            _Stage("parse", parse_document, self._processes("parse", parse_workers),
+                   max(parse_workers, 1)),
+            _Stage("analyze", _analyze, self._processes("analyze", analyze_workers),
+                   max(analyze_workers, 1)),
+            _Stage("embed", self._embed, self._threads("embed", 1), 1,
+                   batch_size=batch_size, batched=True),
+            _Stage("match", self._match, self._threads("match", match_threads),
+                   match_threads),
+        ]
+        for stage in self._stages:
+            self.report.stages[stage.name] = stage.report
+
+    def _threads(self, name: str, workers: int) -> Executor:
+        executor = ThreadPoolExecutor(workers, thread_name_prefix=f"ri-{name}")
+        self._executors.append(executor)
+        return executor
+
+    def _processes(self, name: str, workers: int) -> Executor:
+        if workers <= 0:
+            return self._threads(name, 1)
+        executor = ProcessPoolExecutor(workers)
+        self._executors.append(executor)
+        return executor
+
+    @property
+    def max_in_flight(self) -> int:
+        """
+        Most resumes that can be inside the pipeline at once.
+        """
+        # Every inbox, every job window, the finished-rows queue, and the
+        # one resume each end holds while waiting on a queue
+        return sum(
+            self.queue_size + stage.max_jobs * stage.batch_size for stage in self._stages
+        ) + self.queue_size + 2
+
+    def __enter__(self) -> "Pipeline":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        for executor in self._executors:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    # -------------------------
+    # Stage functions (threads)
+    # -------------------------
+    def _embed(
+        self, batch: List[List[Concept]]
+    ) -> List[Tuple[List[Concept], Optional[Dict]]]:
+        if self.prefilter is not None:
+            return [(concepts, None) for concepts in batch]
+
+        # One model call for every concept text in the batch not cached yet
+        jd_texts = [c.text for c in self.jd_concepts]
+        texts = list(dict.fromkeys(
+            jd_texts + [c.text for concepts in batch for c in concepts]
+        ))
+        vectors = dict(zip(texts, self.embedder.embed_texts(texts)))
+        return [
+            (concepts, {t: vectors[t] for t in jd_texts + [c.text for c in concepts]})
+            for concepts in batch
+        ]
+
+    def _match(self, value: Tuple[List[Concept], Optional[Dict]]) -> Tuple[float, Dict]:
+        concepts, vectors = value
+        if vectors is None:
+            matcher = ConceptMatcher(self.embedder, prefilter=self.prefilter)
+        else:
+            matcher = ConceptMatcher(_VectorLookup(vectors, self.embedder.model_name))
+        results = matcher.match(self.jd_concepts, concepts)
+        return compute_ats_score(self.jd_concepts, results), results
+
+    # -------------------------
+    # Run
+    # -------------------------
+    def run(self, paths: Iterable[str]) -> Iterator[Dict]:
+        """
+        Yield one result row per resume, in input order.
+
+        ``paths`` is consumed lazily, only as fast as rows are taken.
+        Closing the generator early stops every stage.
+        """
+        run = _Run(self._stages, self.queue_size)
+        start = time.perf_counter()
+        run.start(paths)
+
+        try:
+            for item in run.results():
+                self.report.resumes += 1
+                if item.error is not None:
+                    self.report.failed += 1
+                    yield result_row(item.path, error=item.error)
+                else:
+                    score, results = item.value
+                    yield result_row(item.path, score, results)
+        finally:
+            run.close()
+            self.report.wall_seconds += time.perf_counter() - start
@@ -27,6 +27,7 @@ from resume_intelligence.core.exception import (
     UnsupportedFileTypeError,
     DocumentParseError
 )
+from resume_intelligence.core.instrumentation import stage
 
 
 def _parse_pdf(path: str) -> str:
@@ -68,6 +69,8 @@ _PARSERS: dict[str, Callable[[str], str]] = {
     ".txt": _parse_text,
 }
 
+SUPPORTED_EXTENSIONS = tuple(_PARSERS)
+
 
 def parse_document(path: str) -> str:
     if not path or not os.path.exists(path):
@@ -81,7 +84,9 @@ def parse_document(path: str) -> str:
             f"Unsupported file type: {ext}"
         )
 
-    raw_text = _PARSERS[ext](path)
+    with stage("parse") as s:
+        raw_text = _PARSERS[ext](path)
+        s.count(documents=1, characters=len(raw_text))
 
     if not raw_text or not raw_text.strip():
         raise DocumentParseError(
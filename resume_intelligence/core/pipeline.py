@@ -0,0 +1,33 @@
+# Document → consolidated concepts, in one call.
+
+# parse_document → Document → normalize_document
+# → extract_concepts → consolidate_concepts
+
+# Every entry point (CLI, Streamlit, corpus indexing) runs the same chain;
+# keeping it here means they can't drift apart.
+
+from typing import List
+
+from resume_intelligence.core.document import Document
+from resume_intelligence.core.normalizer import normalize_document
+from resume_intelligence.core.parser import parse_document
+from resume_intelligence.core.semantics.concept import Concept, ConceptSource
+from resume_intelligence.core.semantics.consolidator import consolidate_concepts
+from resume_intelligence.core.semantics.extractor import extract_concepts
+
+
+def analyze_text(raw_text: str, source: ConceptSource) -> List[Concept]:
+    """
+    Normalize raw text and return its consolidated concepts.
+    """
+    doc = Document(raw_text=raw_text)
+    normalize_document(doc)
+
+    return consolidate_concepts(extract_concepts(doc, source))
+
+
+def analyze_file(path: str, source: ConceptSource) -> List[Concept]:
+    """
+    Parse a file and return its consolidated concepts.
+    """
+    return analyze_text(parse_document(path), source)
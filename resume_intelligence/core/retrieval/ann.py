@@ -0,0 +1,483 @@
+# Approximate nearest-neighbour index over stored resume concept vectors.
+
+# Question it answers:
+# "Which of our stored candidates best fit this new JD?"
+# without re-running ConceptMatcher against every candidate.
+
+# Structure (IVF, pure NumPy):
+# centroids   → n_lists spherical k-means centroids
+# lists       → concept rows grouped by nearest centroid, stored contiguously
+# row tags    → candidate id, ConceptType, concept text
+
+# Query:
+# JD concept vector → n_probe closest centroids → scan only those lists
+# → keep type-compatible rows ≥ PARTIAL_MATCH_THRESHOLD
+# → best score per (candidate, JD concept) → compute_ats_score
+
+# Only pairs ≥ PARTIAL_MATCH_THRESHOLD ever earn ATS credit, so with
+# n_probe == n_lists candidate scores equal exact matching.
+
+import heapq
+from dataclasses import dataclass
+from itertools import islice
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from resume_intelligence.core.matching.ats_score import compute_ats_score
+from resume_intelligence.core.matching.matcher import (
+    PARTIAL_MATCH_THRESHOLD,
+    TYPE_COMPATIBILITY,
+    build_match_results,
+)
+from resume_intelligence.core.matching.similarity import top_k_similarity
+from resume_intelligence.core.semantics.concept import Concept, ConceptType
+
+
+_TYPE_CODES = {t: code for code, t in enumerate(ConceptType)}
+
+# allowed[jd_code, resume_code]
+_ALLOWED = np.zeros((len(_TYPE_CODES), len(_TYPE_CODES)), dtype=bool)
+for _jd_type, _resume_types in TYPE_COMPATIBILITY.items():
+    for _resume_type in _resume_types:
+        _ALLOWED[_TYPE_CODES[_jd_type], _TYPE_CODES[_resume_type]] = True
+
+
+@dataclass
+class CandidateHits:
+    """
+    Best stored concept per JD concept for one candidate.
+
+    ``rows[j]`` is -1 when nothing compatible reached the threshold.
+    """
+
+    scores: np.ndarray
+    rows: np.ndarray
+
+
+@dataclass
+class RankedCandidate:
+    candidate_id: str
+    ats_score: float
+    match_results: Dict[str, List[Dict]]
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+# -------------------------
+# Shared by every concept index
+# -------------------------
+def spherical_kmeans(
+    vectors: np.ndarray,
+    n_clusters: int,
+    iterations: int = 10,
+    seed: int = 0,
+) -> np.ndarray:
+    """
+    Unit centroids: assign by dot product, re-normalize the means.
+    """
+    rng = np.random.default_rng(seed)
+    centroids = vectors[rng.choice(len(vectors), n_clusters, replace=False)].copy()
+
+    for _ in range(iterations):
+        assignments = top_k_similarity(vectors, centroids, k=1)[0][:, 0]
+
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assignments, vectors)
+        counts = np.bincount(assignments, minlength=n_clusters)
+
+        filled = counts > 0
+        centroids[filled] = _normalize(sums[filled])
+
+    return centroids
+
+
+def collect_hits(
+    hits: Dict[int, CandidateHits],
+    jd_index: int,
+    n_jd: int,
+    rows: np.ndarray,
+    scores: np.ndarray,
+    candidates: np.ndarray,
+) -> None:
+    """
+    Fold one JD concept's scored rows into per-candidate best hits.
+
+    Args:
+        hits: Candidate code → CandidateHits, updated in place
+        jd_index: Which JD concept these rows were scored against
+        n_jd: Total number of JD concepts
+        rows / scores / candidates: Parallel arrays of surviving rows
+    """
+    if not len(rows):
+        return
+
+    # Best row per candidate: sort by (candidate, -score, row), take firsts
+    order = np.lexsort((rows, -scores, candidates))
+    _, first = np.unique(candidates[order], return_index=True)
+    best = order[first]
+
+    for candidate, score, row in zip(candidates[best], scores[best], rows[best]):
+        entry = hits.get(candidate)
+        if entry is None:
+            entry = CandidateHits(
+                scores=np.zeros(n_jd, dtype=np.float32),
+                rows=np.full(n_jd, -1, dtype=np.int64),
+            )
+            hits[candidate] = entry
+        # Callers may fold the same JD concept in several blocks
+        if entry.rows[jd_index] < 0 or score > entry.scores[jd_index]:
+            entry.scores[jd_index] = score
+            entry.rows[jd_index] = row
+
+
+def merge_hits(
+    hits: Dict,
+    other: Dict,
+) -> None:
+    """
+    Fold hits scored over later rows into ``hits`` (in place).
+
+    Ties keep the existing (earlier) row, as collect_hits does within a
+    scan, so merging partial scans in row order reproduces a full scan.
+    """
+    for candidate, entry in other.items():
+        mine = hits.get(candidate)
+        if mine is None:
+            hits[candidate] = entry
+            continue
+        better = (entry.rows >= 0) & ((mine.rows < 0) | (entry.scores > mine.scores))
+        mine.scores[better] = entry.scores[better]
+        mine.rows[better] = entry.rows[better]
+
+
+def rank_hits(
+    jd_concepts: Sequence[Concept],
+    hits: Dict[str, CandidateHits],
+    texts: Sequence[str],
+    top_n: int,
+) -> List[RankedCandidate]:
+    """
+    Turn per-candidate hits into ATS-scored, best-first candidates.
+    """
+    jd_concepts = list(jd_concepts)
+    ranked = []
+
+    for candidate_id, entry in hits.items():
+        match_results = build_match_results(
+            jd_concepts,
+            entry.scores,
+            [texts[r] if r >= 0 else None for r in entry.rows],
+        )
+        ranked.append(
+            RankedCandidate(
+                candidate_id=candidate_id,
+                ats_score=compute_ats_score(jd_concepts, match_results),
+                match_results=match_results,
+            )
+        )
+
+    ranked.sort(key=_rank_key)
+    return ranked[:top_n]
+
+
+def _rank_key(candidate: RankedCandidate) -> Tuple[float, str]:
+    return -candidate.ats_score, candidate.candidate_id
+
+
+def merge_ranked(
+    rankings: Sequence[Sequence[RankedCandidate]],
+    top_n: int,
+) -> List[RankedCandidate]:
+    """
+    Global top-N of best-first rankings over disjoint candidate sets.
+
+    Exact when each ranking holds its set's own top-N, as the global
+    top-N can only draw that many from any one set.
+    """
+    return list(islice(heapq.merge(*rankings, key=_rank_key), top_n))
+
+
+class IVFIndex:
+    """
+    Inverted-file ANN index over resume concept embeddings.
+    """
+
+    def __init__(
+        self,
+        n_lists: Optional[int] = None,
+        n_probe: int = 8,
+        train_iterations: int = 10,
+        seed: int = 0,
+    ):
+        if n_probe < 1:
+            raise ValueError("n_probe must be at least 1.")
+
+        self.n_lists = n_lists
+        self.n_probe = n_probe
+        self.train_iterations = train_iterations
+        self.seed = seed
+
+        self._pending_vectors: List[np.ndarray] = []
+        self._pending_candidates: List[str] = []
+        self._pending_types: List[ConceptType] = []
+        self._pending_texts: List[str] = []
+
+        self.candidate_ids: List[str] = []
+        self._candidate_codes: Dict[str, int] = {}
+
+        self.centroids: Optional[np.ndarray] = None
+        self.vectors = np.zeros((0, 0), dtype=np.float32)
+        self.row_candidates = np.zeros(0, dtype=np.int64)
+        self.row_types = np.zeros(0, dtype=np.int8)
+        self.texts: List[str] = []
+        self.list_offsets = np.zeros(1, dtype=np.int64)
+
+    # -------------------------
+    # Building
+    # -------------------------
+    def add(
+        self,
+        candidate_id: str,
+        concepts: Sequence[Concept],
+        vectors,
+    ) -> None:
+        """
+        Queue one candidate's concepts; call ``build`` once all are added.
+        """
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if len(vectors) != len(concepts):
+            raise ValueError("Need exactly one vector per concept.")
+        if not len(concepts):
+            return
+
+        self._pending_vectors.append(vectors)
+        self._pending_candidates.extend([candidate_id] * len(concepts))
+        self._pending_types.extend(c.type for c in concepts)
+        self._pending_texts.extend(c.text for c in concepts)
+
+    def build(self) -> "IVFIndex":
+        """
+        Train centroids on everything added so far and lay out the lists.
+        """
+        if not self._pending_vectors:
+            raise ValueError("Cannot build an empty index.")
+
+        vectors = np.concatenate(
+            [self.vectors] + self._pending_vectors
+            if len(self.vectors) else self._pending_vectors
+        )
+        vectors = _normalize(vectors.astype(np.float32, copy=False))
+
+        for candidate_id in self._pending_candidates:
+            if candidate_id not in self._candidate_codes:
+                self._candidate_codes[candidate_id] = len(self.candidate_ids)
+                self.candidate_ids.append(candidate_id)
+
+        candidates = np.concatenate([
+            self.row_candidates,
+            np.array(
+                [self._candidate_codes[c] for c in self._pending_candidates],
+                dtype=np.int64,
+            ),
+        ])
+        types = np.concatenate([
+            self.row_types,
+            np.array([_TYPE_CODES[t] for t in self._pending_types], dtype=np.int8),
+        ])
+        texts = self.texts + self._pending_texts
+
+        n_lists = self.n_lists or max(1, int(np.sqrt(len(vectors))))
+        n_lists = min(n_lists, len(vectors))
+
+        self.centroids = self._train(vectors, n_lists)
+        assignments = top_k_similarity(vectors, self.centroids, k=1)[0][:, 0]
+
+        # Lay lists out contiguously so a probe is a slice, not a gather
+        order = np.argsort(assignments, kind="stable")
+        counts = np.bincount(assignments, minlength=n_lists)
+
+        self.vectors = np.ascontiguousarray(vectors[order])
+        self.row_candidates = candidates[order]
+        self.row_types = types[order]
+        self.texts = [texts[i] for i in order]
+        self.list_offsets = np.concatenate([[0], np.cumsum(counts)])
+
+        self._pending_vectors = []
+        self._pending_candidates = []
+        self._pending_types = []
+        self._pending_texts = []
+
+        return self
+
+    def _train(self, vectors: np.ndarray, n_lists: int) -> np.ndarray:
+        return spherical_kmeans(
+            vectors, n_lists, self.train_iterations, self.seed
+        )
+
+    def __len__(self) -> int:
+        return len(self.vectors)
+
+    # -------------------------
+    # Querying
+    # -------------------------
+    def _probe_rows(self, query: np.ndarray, n_probe: int) -> np.ndarray:
+        lists = top_k_similarity(query[None, :], self.centroids, k=n_probe)[0][0]
+        lists = lists[lists >= 0]
+        return np.concatenate([
+            np.arange(self.list_offsets[l], self.list_offsets[l + 1])
+            for l in lists
+        ])
+
+    def search(
+        self,
+        queries,
+        k: int = 10,
+        n_probe: Optional[int] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Approximate top-k stored rows per query vector.
+
+        Returns:
+            (rows, scores) of shape (Q, k); unfilled slots are -1 / -inf.
+        """
+        self._require_built()
+        queries = _normalize(np.asarray(queries, dtype=np.float32))
+        n_probe = min(n_probe or self.n_probe, len(self.centroids))
+
+        rows = np.full((len(queries), k), -1, dtype=np.int64)
+        scores = np.full((len(queries), k), -np.inf, dtype=np.float32)
+
+        for q, query in enumerate(queries):
+            probed = self._probe_rows(query, n_probe)
+            local, local_scores = top_k_similarity(
+                query[None, :], self.vectors[probed], k=k
+            )
+            found = local[0] >= 0
+            rows[q, found] = probed[local[0][found]]
+            scores[q] = local_scores[0]
+
+        return rows, scores
+
+    def candidate_hits(
+        self,
+        jd_concepts: Sequence[Concept],
+        jd_vectors,
+        threshold: float = PARTIAL_MATCH_THRESHOLD,
+        n_probe: Optional[int] = None,
+    ) -> Dict[str, CandidateHits]:
+        """
+        Best type-compatible score ≥ threshold per candidate and JD concept.
+
+        Only candidates with at least one hit are returned.
+        """
+        self._require_built()
+        jd_vectors = _normalize(np.asarray(jd_vectors, dtype=np.float32))
+        n_probe = min(n_probe or self.n_probe, len(self.centroids))
+        n_jd = len(jd_concepts)
+
+        hits: Dict[int, CandidateHits] = {}
+
+        for j, (concept, query) in enumerate(zip(jd_concepts, jd_vectors)):
+            probed = self._probe_rows(query, n_probe)
+
+            allowed = _ALLOWED[_TYPE_CODES[concept.type], self.row_types[probed]]
+            probed = probed[allowed]
+            if not len(probed):
+                continue
+
+            scores = self.vectors[probed] @ query
+            keep = scores >= threshold
+            probed, scores = probed[keep], scores[keep]
+            if not len(probed):
+                continue
+
+            collect_hits(
+                hits, j, n_jd, probed, scores, self.row_candidates[probed]
+            )
+
+        return {self.candidate_ids[c]: entry for c, entry in hits.items()}
+
+    def rank_candidates(
+        self,
+        jd_concepts: Sequence[Concept],
+        jd_vectors,
+        top_n: int = 10,
+        n_probe: Optional[int] = None,
+    ) -> List[RankedCandidate]:
+        """
+        Rank stored candidates for a JD by ATS score.
+        """
+        hits = self.candidate_hits(jd_concepts, jd_vectors, n_probe=n_probe)
+        return rank_hits(jd_concepts, hits, self.texts, top_n)
+
+    def _require_built(self) -> None:
+        if self.centroids is None or self._pending_vectors:
+            raise ValueError("Index must be built before querying.")
+
+    # -------------------------
+    # Evaluation
+    # -------------------------
+    def recall_at_k(
+        self,
+        queries,
+        k: int = 10,
+        n_probe: Optional[int] = None,
+    ) -> float:
+        """
+        Fraction of exact top-k rows that the probed search also returns.
+        """
+        self._require_built()
+        queries = _normalize(np.asarray(queries, dtype=np.float32))
+
+        exact, _ = top_k_similarity(queries, self.vectors, k=k)
+        approx, _ = self.search(queries, k=k, n_probe=n_probe)
+
+        found = 0
+        total = 0
+        for exact_row, approx_row in zip(exact, approx):
+            truth = set(exact_row[exact_row >= 0].tolist())
+            found += len(truth & set(approx_row.tolist()))
+            total += len(truth)
+
+        return found / total if total else 1.0
+
+    # -------------------------
+    # Persistence
+    # -------------------------
+    def save(self, path: str) -> None:
+        self._require_built()
+        np.savez(
+            path,
+            centroids=self.centroids,
+            vectors=self.vectors,
+            row_candidates=self.row_candidates,
+            row_types=self.row_types,
+            list_offsets=self.list_offsets,
+            texts=np.array(self.texts, dtype=object),
+            candidate_ids=np.array(self.candidate_ids, dtype=object),
+            n_probe=self.n_probe,
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "IVFIndex":
+        data = np.load(path, allow_pickle=True)
+
+        index = cls(n_probe=int(data["n_probe"]))
+        index.centroids = data["centroids"]
+        index.n_lists = len(index.centroids)
+        index.vectors = data["vectors"]
+        index.row_candidates = data["row_candidates"]
+        index.row_types = data["row_types"]
+        index.list_offsets = data["list_offsets"]
+        index.texts = data["texts"].tolist()
+        index.candidate_ids = data["candidate_ids"].tolist()
+        index._candidate_codes = {
+            c: i for i, c in enumerate(index.candidate_ids)
+        }
+
+        return index
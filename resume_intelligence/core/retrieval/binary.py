@@ -0,0 +1,303 @@
+# Binary-quantized concept index with exact rescoring.
+
+# Holding float32 vectors for every stored concept costs d × 4 bytes per
+# row (1.5 KB at d=384). This index keeps only the sign bits in RAM
+# (d / 8 bytes, 48 B at d=384) and leaves full precision on disk.
+
+# Query (per JD concept):
+# sign bits → XOR + popcount Hamming distance against every code
+# → type mask → n_survivors closest rows
+# → exact float32 dot products, read from a memory-mapped vectors file
+# → keep rows ≥ PARTIAL_MATCH_THRESHOLD → per-candidate best → ATS
+
+import os
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from resume_intelligence.core.matching.matcher import PARTIAL_MATCH_THRESHOLD
+from resume_intelligence.core.retrieval.ann import (
+    CandidateHits,
+    RankedCandidate,
+    _ALLOWED,
+    _TYPE_CODES,
+    _normalize,
+    collect_hits,
+    rank_hits,
+)
+from resume_intelligence.core.semantics.concept import Concept
+
+
+if hasattr(np, "bitwise_count"):
+    _popcount = np.bitwise_count
+else:
+    _POPCOUNT_TABLE = np.array(
+        [bin(i).count("1") for i in range(256)], dtype=np.uint8
+    )
+
+    def _popcount(codes: np.ndarray) -> np.ndarray:
+        return _POPCOUNT_TABLE[codes]
+
+
+def quantize(vectors) -> np.ndarray:
+    """
+    Sign-bit codes, packed 8 dimensions per byte.
+    """
+    return np.packbits(np.asarray(vectors) > 0, axis=1)
+
+
+def hamming_distances(codes: np.ndarray, query_code: np.ndarray) -> np.ndarray:
+    """
+    Hamming distance from one packed query code to every packed row.
+    """
+    return _popcount(np.bitwise_xor(codes, query_code)).sum(
+        axis=1, dtype=np.int32
+    )
+
+
+class BinaryIndex:
+    """
+    Sign-bit codes in memory, full-precision vectors memory-mapped.
+
+    Vectors are appended to ``vectors_path`` as raw float32 rows, so the
+    file doubles as the rescoring store and survives process restarts.
+    """
+
+    def __init__(
+        self,
+        vectors_path: str,
+        dim: int,
+        n_survivors: int = 256,
+    ):
+        if n_survivors < 1:
+            raise ValueError("n_survivors must be at least 1.")
+
+        self.vectors_path = vectors_path
+        self.dim = dim
+        self.n_survivors = n_survivors
+
+        self.codes = np.zeros((0, (dim + 7) // 8), dtype=np.uint8)
+        self.row_candidates = np.zeros(0, dtype=np.int64)
+        self.row_types = np.zeros(0, dtype=np.int8)
+        self.texts: List[str] = []
+
+        self.candidate_ids: List[str] = []
+        self._candidate_codes: Dict[str, int] = {}
+
+        # Appended chunks, concatenated once before the next query;
+        # _rows counts them too, so adding never concatenates
+        self._rows = 0
+        self._pending_codes: List[np.ndarray] = []
+        self._pending_candidates: List[np.ndarray] = []
+        self._pending_types: List[np.ndarray] = []
+
+        self._full: Optional[np.memmap] = None
+
+    def __len__(self) -> int:
+        return self._rows
+
+    # -------------------------
+    # Building
+    # -------------------------
+    def add(
+        self,
+        candidate_id: str,
+        concepts: Sequence[Concept],
+        vectors,
+    ) -> None:
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if len(vectors) != len(concepts):
+            raise ValueError("Need exactly one vector per concept.")
+        if not len(concepts):
+            return
+        if vectors.shape[1] != self.dim:
+            raise ValueError(f"Expected {self.dim}-dimensional vectors.")
+
+        vectors = _normalize(vectors)
+
+        # A stale or foreign file would misalign memmap rows with codes
+        on_disk = (
+            os.path.getsize(self.vectors_path)
+            if os.path.exists(self.vectors_path) else 0
+        )
+        if on_disk != self._rows * self.dim * 4:
+            raise ValueError(
+                f"{self.vectors_path} does not match the index "
+                f"({on_disk} bytes for {self._rows} rows)."
+            )
+
+        with open(self.vectors_path, "ab") as f:
+            f.write(np.ascontiguousarray(vectors, dtype=np.float32).tobytes())
+
+        if candidate_id not in self._candidate_codes:
+            self._candidate_codes[candidate_id] = len(self.candidate_ids)
+            self.candidate_ids.append(candidate_id)
+        code = self._candidate_codes[candidate_id]
+
+        self._pending_codes.append(quantize(vectors))
+        self._pending_candidates.append(
+            np.full(len(concepts), code, dtype=np.int64)
+        )
+        self._pending_types.append(
+            np.array([_TYPE_CODES[c.type] for c in concepts], dtype=np.int8)
+        )
+        self.texts.extend(c.text for c in concepts)
+        self._rows += len(concepts)
+
+        # The file grew; remap on next query
+        self._full = None
+
+    def _consolidate(self) -> None:
+        if not self._pending_codes:
+            return
+
+        self.codes = np.concatenate([self.codes] + self._pending_codes)
+        self.row_candidates = np.concatenate(
+            [self.row_candidates] + self._pending_candidates
+        )
+        self.row_types = np.concatenate([self.row_types] + self._pending_types)
+
+        self._pending_codes = []
+        self._pending_candidates = []
+        self._pending_types = []
+
+    @property
+    def full_vectors(self) -> np.memmap:
+        self._consolidate()
+        if self._full is None:
+            self._full = np.memmap(
+                self.vectors_path,
+                dtype=np.float32,
+                mode="r",
+                shape=(len(self.codes), self.dim),
+            )
+        return self._full
+
+    # -------------------------
+    # Querying
+    # -------------------------
+    def _survivors(
+        self,
+        query: np.ndarray,
+        allowed_rows: Optional[np.ndarray],
+        n_survivors: int,
+    ) -> np.ndarray:
+        distances = hamming_distances(self.codes, quantize(query[None, :])[0])
+
+        if allowed_rows is not None:
+            # Push incompatible rows past any real distance
+            distances = np.where(allowed_rows, distances, self.dim + 1)
+
+        if n_survivors < len(distances):
+            rows = np.argpartition(distances, n_survivors - 1)[:n_survivors]
+        else:
+            rows = np.arange(len(distances))
+
+        if allowed_rows is not None:
+            rows = rows[allowed_rows[rows]]
+
+        # Sorted row ids keep memmap reads sequential
+        return np.sort(rows)
+
+    def candidate_hits(
+        self,
+        jd_concepts: Sequence[Concept],
+        jd_vectors,
+        threshold: float = PARTIAL_MATCH_THRESHOLD,
+        n_survivors: Optional[int] = None,
+    ) -> Dict[str, CandidateHits]:
+        """
+        Best type-compatible score ≥ threshold per candidate and JD concept.
+        """
+        self._consolidate()
+        jd_vectors = _normalize(np.asarray(jd_vectors, dtype=np.float32))
+        n_survivors = n_survivors or self.n_survivors
+        n_jd = len(jd_concepts)
+
+        hits: Dict[int, CandidateHits] = {}
+
+        if not len(self.codes):
+            return {}
+
+        for j, (concept, query) in enumerate(zip(jd_concepts, jd_vectors)):
+            allowed = _ALLOWED[_TYPE_CODES[concept.type], self.row_types]
+            rows = self._survivors(query, allowed, n_survivors)
+            if not len(rows):
+                continue
+
+            scores = np.asarray(self.full_vectors[rows]) @ query
+            keep = scores >= threshold
+
+            collect_hits(
+                hits,
+                j,
+                n_jd,
+                rows[keep],
+                scores[keep],
+                self.row_candidates[rows[keep]],
+            )
+
+        return {self.candidate_ids[c]: entry for c, entry in hits.items()}
+
+    def rank_candidates(
+        self,
+        jd_concepts: Sequence[Concept],
+        jd_vectors,
+        top_n: int = 10,
+        n_survivors: Optional[int] = None,
+    ) -> List[RankedCandidate]:
+        hits = self.candidate_hits(
+            jd_concepts, jd_vectors, n_survivors=n_survivors
+        )
+        return rank_hits(jd_concepts, hits, self.texts, top_n)
+
+    def memory_bytes(self) -> int:
+        """
+        Resident bytes for codes and row tags (texts excluded).
+        """
+        self._consolidate()
+        return (
+            self.codes.nbytes
+            + self.row_candidates.nbytes
+            + self.row_types.nbytes
+        )
+
+    # -------------------------
+    # Persistence
+    # -------------------------
+    def save(self, path: str) -> None:
+        """
+        Save codes and tags; the vectors file is already on disk.
+        """
+        self._consolidate()
+        np.savez(
+            path,
+            codes=self.codes,
+            row_candidates=self.row_candidates,
+            row_types=self.row_types,
+            texts=np.array(self.texts, dtype=object),
+            candidate_ids=np.array(self.candidate_ids, dtype=object),
+            dim=self.dim,
+            n_survivors=self.n_survivors,
+        )
+
+    @classmethod
+    def load(cls, path: str, vectors_path: str) -> "BinaryIndex":
+        data = np.load(path, allow_pickle=True)
+
+        index = cls(
+            vectors_path=vectors_path,
+            dim=int(data["dim"]),
+            n_survivors=int(data["n_survivors"]),
+        )
+        index.codes = data["codes"]
+        index.row_candidates = data["row_candidates"]
+        index.row_types = data["row_types"]
+        index._rows = len(index.codes)
+        index.texts = data["texts"].tolist()
+        index.candidate_ids = data["candidate_ids"].tolist()
+        index._candidate_codes = {
+            c: i for i, c in enumerate(index.candidate_ids)
+        }
+
+        return index
@@ -0,0 +1,230 @@
+# Inverted concept index: exact-hit candidate pre-selection.
+
+# Before any vector math, narrow a large pool to the resumes that share
+# canonical concepts with the JD. Consolidated concept texts already are
+# canonical forms ("testing", "api integration", exact n-grams), so the
+# concept text itself is the term.
+
+# term ("api integration") → interned id → sorted candidate codes
+#                                            [3, 17, 42, 1051, ...]
+
+# Candidate codes only grow, so appending keeps every posting list
+# sorted. Replacing a resume tombstones its old code and appends a new
+# one; tombstoned codes are filtered out at query time. Once more than
+# ``compact_ratio`` of all codes are tombstones, live codes are renumbered
+# in order (so postings stay sorted) and the dead ones dropped.
+
+import math
+from array import array
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from resume_intelligence.core.matching.ats_score import TYPE_WEIGHTS
+from resume_intelligence.core.semantics.concept import Concept
+
+
+class InvertedConceptIndex:
+    """
+    Concept text → compact sorted arrays of candidate codes.
+    """
+
+    def __init__(self, compact_ratio: float = 0.5):
+        self.compact_ratio = compact_ratio
+
+        self.terms: List[str] = []
+        self._term_ids: Dict[str, int] = {}
+        self._postings: List[array] = []
+        self._frozen: Dict[int, np.ndarray] = {}
+
+        self.candidate_ids: List[str] = []
+        self._codes: Dict[str, int] = {}
+        self._alive = array("b")
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    def __contains__(self, candidate_id: str) -> bool:
+        return candidate_id in self._codes
+
+    # -------------------------
+    # Maintenance
+    # -------------------------
+    def add(self, candidate_id: str, concept_texts: Iterable[str]) -> None:
+        """
+        Index (or re-index) one candidate's concept texts.
+        """
+        if candidate_id in self._codes:
+            self.remove(candidate_id)
+
+        code = len(self.candidate_ids)
+        self.candidate_ids.append(candidate_id)
+        self._codes[candidate_id] = code
+        self._alive.append(1)
+
+        for term in set(concept_texts):
+            term_id = self._term_ids.get(term)
+            if term_id is None:
+                term_id = len(self.terms)
+                self._term_ids[term] = term_id
+                self.terms.append(term)
+                self._postings.append(array("q"))
+
+            self._postings[term_id].append(code)
+            self._frozen.pop(term_id, None)
+
+    def remove(self, candidate_id: str) -> bool:
+        code = self._codes.pop(candidate_id, None)
+        if code is None:
+            return False
+
+        self._alive[code] = 0
+        dead = len(self.candidate_ids) - len(self._codes)
+        if dead > self.compact_ratio * len(self.candidate_ids):
+            self.compact()
+        return True
+
+    def compact(self) -> None:
+        """
+        Drop tombstoned codes and renumber live candidates in order.
+        """
+        alive = np.frombuffer(self._alive, dtype=np.int8)
+        new_codes = np.cumsum(alive, dtype=np.int64) - 1
+
+        for term_id, posting in enumerate(self._postings):
+            codes = np.array(posting, dtype=np.int64)
+            self._postings[term_id] = array(
+                "q", new_codes[codes[alive[codes] == 1]].tolist()
+            )
+        self._frozen.clear()
+
+        self.candidate_ids = [
+            candidate_id
+            for candidate_id, live in zip(self.candidate_ids, self._alive)
+            if live
+        ]
+        self._codes = {c: code for code, c in enumerate(self.candidate_ids)}
+        self._alive = array("b", [1]) * len(self.candidate_ids)
+
+    @classmethod
+    def from_store(cls, store) -> "InvertedConceptIndex":
+        """
+        Build from every live resume in a CorpusStore.
+        """
+        index = cls()
+
+        current: Optional[str] = None
+        texts: List[str] = []
+        for resume_id, text in store.iter_concept_texts():
+            if resume_id != current:
+                if current is not None:
+                    index.add(current, texts)
+                current, texts = resume_id, []
+            texts.append(text)
+
+        if current is not None:
+            index.add(current, texts)
+
+        return index
+
+    # -------------------------
+    # Posting lists
+    # -------------------------
+    def postings(self, term: str) -> np.ndarray:
+        """
+        Sorted live candidate codes containing ``term``.
+        """
+        term_id = self._term_ids.get(term)
+        if term_id is None:
+            return np.zeros(0, dtype=np.int64)
+
+        frozen = self._frozen.get(term_id)
+        if frozen is None:
+            frozen = np.array(self._postings[term_id], dtype=np.int64)
+            self._frozen[term_id] = frozen
+
+        alive = np.frombuffer(self._alive, dtype=np.int8)
+        return frozen[alive[frozen] == 1]
+
+    def _ids(self, codes: np.ndarray) -> List[str]:
+        return [self.candidate_ids[c] for c in codes]
+
+    def intersect(self, terms: Sequence[str]) -> List[str]:
+        """
+        Candidates containing every term.
+        """
+        if not terms:
+            return []
+
+        # Smallest list first keeps every intersection cheap
+        lists = sorted((self.postings(t) for t in terms), key=len)
+        result = lists[0]
+        for other in lists[1:]:
+            if not len(result):
+                break
+            result = np.intersect1d(result, other, assume_unique=True)
+
+        return self._ids(result)
+
+    def union(self, terms: Sequence[str]) -> List[str]:
+        """
+        Candidates containing at least one term.
+        """
+        lists = [self.postings(t) for t in terms]
+        if not lists:
+            return []
+        return self._ids(np.unique(np.concatenate(lists)))
+
+    # -------------------------
+    # Weighted pre-selection
+    # -------------------------
+    def score(self, jd_concepts: Sequence[Concept]) -> Dict[str, float]:
+        """
+        Weighted shared-concept score per candidate.
+
+        Each shared JD concept contributes
+        confidence × type weight × idf, with idf = log(1 + N / df),
+        so ubiquitous concepts count for little.
+        """
+        live = len(self._codes)
+        if not live:
+            return {}
+
+        totals = np.zeros(len(self.candidate_ids), dtype=np.float64)
+
+        for concept in jd_concepts:
+            codes = self.postings(concept.text)
+            if not len(codes):
+                continue
+
+            idf = math.log(1.0 + live / len(codes))
+            weight = concept.confidence * TYPE_WEIGHTS.get(concept.type, 0.5)
+            totals[codes] += weight * idf
+
+        hit = np.flatnonzero(totals)
+        return {self.candidate_ids[c]: float(totals[c]) for c in hit}
+
+    def preselect(
+        self,
+        jd_concepts: Sequence[Concept],
+        limit: Optional[int] = None,
+        min_shared: int = 1,
+    ) -> List[Tuple[str, float]]:
+        """
+        Candidates sharing at least ``min_shared`` JD concepts, best first.
+        """
+        shared = np.zeros(len(self.candidate_ids), dtype=np.int32)
+        for concept in jd_concepts:
+            shared[self.postings(concept.text)] += 1
+
+        scores = self.score(jd_concepts)
+        ranked = sorted(
+            (
+                (candidate_id, score)
+                for candidate_id, score in scores.items()
+                if shared[self._codes[candidate_id]] >= min_shared
+            ),
+            key=lambda item: (-item[1], item[0]),
+        )
+
+        return ranked[:limit] if limit is not None else ranked
@@ -0,0 +1,301 @@
+# Upper-bound pruning for top-K candidate ranking.
+
+# compute_ats_score is a weighted sum over JD concepts of
+# base_weight × quality(bucket) × similarity², so a candidate's ATS score
+# can never exceed the same sum evaluated at the best similarity it could
+# possibly reach per JD concept.
+
+# Cheap similarity bound from a coarse quantization of concept vectors:
+# codebook → K spherical k-means cells shared by all candidates
+# pairs    → per (candidate, cell, ConceptType): the widest angle between
+#            the cell centroid c and any of the candidate's concepts in it
+# for a JD vector q and a concept x in that cell:
+#   ∠(q, x) ≥ ∠(q, c) − spread   →   cos(q, x) ≤ cos(max(0, ∠(q, c) − spread))
+
+# One JD × K product plus a gather over the pairs gives every bound, far
+# cheaper than d-dimensional dot products against every stored row.
+# Candidates are then scored exactly in descending-bound order; once a
+# bound falls below the current K-th best exact score, no remaining
+# candidate can enter the top K and the rest are skipped.
+
+import heapq
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from resume_intelligence.core.matching.ats_score import (
+    MATCH_QUALITY_WEIGHTS,
+    TYPE_WEIGHTS,
+)
+from resume_intelligence.core.matching.matcher import (
+    PARTIAL_MATCH_THRESHOLD,
+    STRONG_MATCH_THRESHOLD,
+)
+from resume_intelligence.core.matching.similarity import top_k_similarity
+from resume_intelligence.core.retrieval.ann import (
+    _ALLOWED,
+    _TYPE_CODES,
+    _normalize,
+    spherical_kmeans,
+)
+from resume_intelligence.core.semantics.concept import Concept
+
+
+# Cosines are nudged before arccos so float32 dot-product error can only
+# widen a bound, never tighten it
+_COS_SLACK = 1e-6
+
+_PAIR_BLOCK = 65536
+
+
+@dataclass
+class PruneReport:
+    candidates: int = 0
+    scored: int = 0
+
+    @property
+    def pruned(self) -> int:
+        return self.candidates - self.scored
+
+    @property
+    def pruned_fraction(self) -> float:
+        if not self.candidates:
+            return 0.0
+        return self.pruned / self.candidates
+
+    def as_dict(self):
+        return {
+            "candidates": self.candidates,
+            "scored": self.scored,
+            "pruned": self.pruned,
+            "pruned_fraction": round(self.pruned_fraction, 4),
+        }
+
+
+class CandidateBounds:
+    """
+    Per-candidate (cell, type, spread) pairs over a shared codebook.
+
+    Args:
+        codebook: (K, d) unit cell centroids
+        offsets: (n_candidates,) first pair of each candidate
+        cells / types / spread: parallel per-pair arrays; ``spread`` is
+            the widest angle (radians) from the cell centroid
+    """
+
+    def __init__(
+        self,
+        codebook: np.ndarray,
+        offsets: np.ndarray,
+        cells: np.ndarray,
+        types: np.ndarray,
+        spread: np.ndarray,
+    ):
+        self.codebook = codebook
+        self.offsets = offsets
+        self.cells = cells
+        self.types = types
+        self.spread = spread
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    @staticmethod
+    def train_codebook(
+        sample: np.ndarray,
+        n_cells: int = 256,
+        seed: int = 0,
+    ) -> np.ndarray:
+        sample = _normalize(np.asarray(sample, dtype=np.float32))
+        return spherical_kmeans(sample, min(n_cells, len(sample)), seed=seed)
+
+    @classmethod
+    def build(
+        cls,
+        codebook: np.ndarray,
+        vectors: np.ndarray,
+        counts: np.ndarray,
+        row_types: np.ndarray,
+    ) -> "CandidateBounds":
+        """
+        Args:
+            codebook: (K, d) unit cell centroids
+            vectors: (n_rows, d) unit vectors, grouped by candidate
+            counts: (n_candidates,) rows per candidate, all non-zero
+            row_types: (n_rows,) ConceptType codes
+        """
+        vectors = np.asarray(vectors, dtype=np.float32)
+        owners = np.repeat(np.arange(len(counts)), counts)
+
+        nearest, cosines = top_k_similarity(vectors, codebook, k=1)
+        cells = nearest[:, 0]
+
+        order = np.lexsort((row_types, cells, owners))
+        keys = np.stack([owners[order], cells[order], row_types[order]])
+        starts = np.flatnonzero(
+            np.concatenate(([True], (keys[:, 1:] != keys[:, :-1]).any(axis=0)))
+        )
+
+        widest = np.minimum.reduceat(cosines[order, 0].astype(np.float64), starts)
+        pair_owners = keys[0, starts]
+
+        return cls(
+            codebook,
+            np.searchsorted(pair_owners, np.arange(len(counts))),
+            keys[1, starts].astype(np.int32),
+            keys[2, starts].astype(np.int8),
+            np.arccos(np.clip(widest - _COS_SLACK, -1.0, 1.0)),
+        )
+
+    @classmethod
+    def concatenate(cls, parts: Sequence["CandidateBounds"]) -> "CandidateBounds":
+        shifts = np.cumsum([0] + [len(p.cells) for p in parts[:-1]])
+        return cls(
+            parts[0].codebook,
+            np.concatenate([p.offsets + shift for p, shift in zip(parts, shifts)]),
+            np.concatenate([p.cells for p in parts]),
+            np.concatenate([p.types for p in parts]),
+            np.concatenate([p.spread for p in parts]),
+        )
+
+    def similarity_bounds(
+        self,
+        jd_concepts: Sequence[Concept],
+        jd_vectors,
+    ) -> np.ndarray:
+        """
+        (n_jd, n_candidates) upper bound on each candidate's best
+        type-compatible similarity per JD concept.
+        """
+        jd_vectors = _normalize(np.asarray(jd_vectors, dtype=np.float32))
+        jd_codes = np.array([_TYPE_CODES[c.type] for c in jd_concepts])
+
+        # (K, n_jd) angles; pair rows are gathered from it below
+        to_cell = np.arccos(np.clip(
+            (self.codebook @ jd_vectors.T).astype(np.float64) + _COS_SLACK,
+            -1.0,
+            1.0,
+        ))
+        # Incompatible types are pushed a half-turn away (bound ≤ 0)
+        penalty = np.where(_ALLOWED[jd_codes].T, 0.0, np.pi)
+
+        # cos is decreasing on [0, π]: the best pair has the smallest gap
+        gaps = np.empty((len(self.offsets), len(jd_concepts)))
+        ends = np.append(self.offsets[1:], len(self.cells))
+
+        # Whole candidates per block, about _PAIR_BLOCK pairs at a time
+        first = 0
+        while first < len(self.offsets):
+            last = int(np.searchsorted(
+                ends, self.offsets[first] + _PAIR_BLOCK, side="right"
+            ))
+            last = max(last, first + 1)
+            lo, hi = self.offsets[first], ends[last - 1]
+
+            pair = to_cell[self.cells[lo:hi]] - self.spread[lo:hi, None]
+            pair += penalty[self.types[lo:hi]]
+
+            gaps[first:last] = np.minimum.reduceat(
+                pair, self.offsets[first:last] - lo, axis=0
+            )
+            first = last
+
+        bounds = np.cos(np.clip(gaps, 0.0, np.pi)).T
+        return np.minimum(bounds + _COS_SLACK, 1.0)
+
+
+def ats_upper_bounds(
+    jd_concepts: Sequence[Concept],
+    similarity_bounds: np.ndarray,
+) -> np.ndarray:
+    """
+    Highest ATS score (0–100) each candidate could reach given
+    per-JD-concept similarity bounds, mirroring compute_ats_score.
+    """
+    base = np.array([
+        c.confidence * TYPE_WEIGHTS.get(c.type, 0.5) for c in jd_concepts
+    ])
+    possible = base.sum()
+    if possible == 0:
+        return np.zeros(similarity_bounds.shape[1])
+
+    # The score squares the similarity rounded to 2 decimals, which can
+    # round up past the bound: bound the rounded value instead
+    similarity = np.ceil(similarity_bounds * 100) / 100
+
+    # quality × similarity² is non-decreasing in similarity
+    quality = np.select(
+        [
+            similarity >= STRONG_MATCH_THRESHOLD,
+            similarity >= PARTIAL_MATCH_THRESHOLD,
+        ],
+        [MATCH_QUALITY_WEIGHTS["matched"], MATCH_QUALITY_WEIGHTS["partial"]],
+        default=MATCH_QUALITY_WEIGHTS["missing"],
+    )
+    quality[similarity < 0.4] = 0.0
+
+    return (base @ (quality * similarity ** 2)) / possible * 100
+
+
+def prune_top_k(
+    bounds: np.ndarray,
+    score: Callable[[int], Optional[float]],
+    top_n: int,
+    names: Sequence[str],
+) -> Tuple[List[int], PruneReport]:
+    """
+    Exact top-N candidate positions, scoring as few as the bounds allow.
+
+    Args:
+        bounds: ATS upper bound per candidate position
+        score: Exact ATS score of a candidate position, or None if it
+            has no hit at all (and would not be ranked)
+        top_n: How many candidates to keep
+        names: Candidate ids, for the (score desc, id asc) tie-break
+
+    Returns:
+        (positions of the top-N candidates, best first; PruneReport)
+    """
+    report = PruneReport(candidates=len(bounds))
+    if top_n <= 0:
+        return [], report
+
+    # Min-heap of the current top N by (score, reversed id order)
+    heap: List[Tuple[float, "_Reversed", int]] = []
+
+    for position in np.argsort(-bounds, kind="stable"):
+        # compute_ats_score rounds to 2 decimals; rounding is monotone
+        if len(heap) == top_n and round(float(bounds[position]), 2) < heap[0][0]:
+            break
+
+        report.scored += 1
+        exact = score(int(position))
+        if exact is None:
+            continue
+
+        item = (exact, _Reversed(names[position]), int(position))
+        if len(heap) < top_n:
+            heapq.heappush(heap, item)
+        elif item[:2] > heap[0][:2]:
+            heapq.heapreplace(heap, item)
+
+    best = sorted(heap, key=lambda item: (-item[0], names[item[2]]))
+    return [position for _, _, position in best], report
+
+
+class _Reversed:
+    # Orders strings backwards so smaller ids win ties in a min-heap
+    __slots__ = ("value",)
+
+    def __init__(self, value: str):
+        self.value = value
+
+    def __lt__(self, other: "_Reversed") -> bool:
+        return self.value > other.value
+
+    def __gt__(self, other: "_Reversed") -> bool:
+        return self.value < other.value
+
+    def __eq__(self, other) -> bool:
+        return self.value == other.value
@@ -0,0 +1,231 @@
+# Priority scheduler for the resident model: decides which waiting task
+# runs its embedding + matching next.
+
+# interactive → single-resume requests a recruiter is waiting on
+# bulk        → ranking jobs over many resumes
+
+# A task holds the model for one slot: a whole interactive request, or
+# one batch of a bulk job, which asks for a new slot per batch. So a bulk
+# job is preempted at its next batch boundary whenever interactive work
+# is waiting, and an interactive request waits at most one batch.
+
+# Each class may be guaranteed a minimum share of model time. Busy time
+# per class decays with a half-life of ``window`` seconds; while a class
+# with waiting tasks is below its share it goes first, otherwise the
+# highest-priority class with waiting tasks does. Tasks within a class
+# run in arrival order.
+
+# Per class: queue depth (now and peak), slots granted, wait time (total
+# and p50/p99 over the last 1024 grants) and busy time.
+
+import math
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Deque, Dict, Iterator, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+INTERACTIVE = "interactive"
+BULK = "bulk"
+
+# (class, minimum share), highest priority first
+DEFAULT_CLASSES: Tuple[Tuple[str, float], ...] = ((INTERACTIVE, 0.0), (BULK, 0.2))
+
+
+@dataclass
+class ClassStats:
+    min_share: float
+    queued: int = 0
+    peak_queued: int = 0
+    running: int = 0
+    granted: int = 0
+    wait_seconds: float = 0.0
+    busy_seconds: float = 0.0
+    recent_waits: Deque[float] = field(default_factory=lambda: deque(maxlen=1024))
+
+    def as_dict(self) -> Dict:
+        waits = np.array(self.recent_waits) * 1000 if self.recent_waits else None
+        return {
+            "min_share": self.min_share,
+            "queued": self.queued,
+            "peak_queued": self.peak_queued,
+            "running": self.running,
+            "granted": self.granted,
+            "wait_seconds_total": round(self.wait_seconds, 3),
+            "wait_p50_ms": round(float(np.percentile(waits, 50)), 2) if waits is not None else None,
+            "wait_p99_ms": round(float(np.percentile(waits, 99)), 2) if waits is not None else None,
+            "busy_seconds_total": round(self.busy_seconds, 3),
+        }
+
+
+class _Waiter:
+    __slots__ = ("priority", "arrived", "granted")
+
+    def __init__(self, priority: str):
+        self.priority = priority
+        self.arrived = time.monotonic()
+        self.granted = False
+
+
+class PriorityScheduler:
+    """
+    Grants the model to one task at a time, by priority class.
+
+    Args:
+        classes: (name, minimum share) pairs, highest priority first;
+            shares must sum to at most 1
+        window: Half-life in seconds of the busy time shares are
+            measured over
+        slots: Tasks allowed to hold the model at once
+    """
+
+    def __init__(
+        self,
+        classes: Sequence[Tuple[str, float]] = DEFAULT_CLASSES,
+        window: float = 2.0,
+        slots: int = 1,
+    ):
+        if not classes:
+            raise ValueError("At least one priority class is required.")
+        if sum(share for _, share in classes) > 1.0 + 1e-9:
+            raise ValueError("Minimum shares must sum to at most 1.")
+
+        self.order = [name for name, _ in classes]
+        self.window = window
+        self.slots = slots
+        self.stats: Dict[str, ClassStats] = {
+            name: ClassStats(min_share=share) for name, share in classes
+        }
+
+        self._cond = threading.Condition()
+        self._queues: Dict[str, Deque[_Waiter]] = {name: deque() for name in self.order}
+        self._free = slots
+        # Decayed busy seconds per class, as of _decayed_at
+        self._recent: Dict[str, float] = {name: 0.0 for name in self.order}
+        self._decayed_at = time.monotonic()
+
+    # -------------------------
+    # Slots
+    # -------------------------
+    @contextmanager
+    def slot(self, priority: str, timeout: Optional[float] = None) -> Iterator[None]:
+        """
+        Hold the model for the duration of the block.
+
+        Raises:
+            TimeoutError: No slot was granted within ``timeout`` seconds
+        """
+        if not self.acquire(priority, timeout):
+            raise TimeoutError(f"No {priority} slot within {timeout}s.")
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.release(priority, time.monotonic() - start)
+
+    def acquire(self, priority: str, timeout: Optional[float] = None) -> bool:
+        if priority not in self._queues:
+            raise ValueError(f"Unknown priority class: {priority}")
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        waiter = _Waiter(priority)
+        stats = self.stats[priority]
+
+        with self._cond:
+            self._queues[priority].append(waiter)
+            stats.queued += 1
+            stats.peak_queued = max(stats.peak_queued, stats.queued)
+            self._dispatch()
+
+            while not waiter.granted:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    self._queues[priority].remove(waiter)
+                    stats.queued -= 1
+                    return False
+                self._cond.wait(remaining)
+
+            waited = time.monotonic() - waiter.arrived
+            stats.granted += 1
+            stats.wait_seconds += waited
+            stats.recent_waits.append(waited)
+            return True
+
+    def release(self, priority: str, busy_seconds: float) -> None:
+        with self._cond:
+            self._decay()
+            self._recent[priority] += busy_seconds
+            stats = self.stats[priority]
+            stats.running -= 1
+            stats.busy_seconds += busy_seconds
+            self._free += 1
+            self._dispatch()
+
+    def _decay(self) -> None:
+        now = time.monotonic()
+        factor = math.pow(0.5, (now - self._decayed_at) / self.window)
+        for name in self._recent:
+            self._recent[name] *= factor
+        self._decayed_at = now
+
+    def _next_class(self) -> Optional[str]:
+        waiting = [name for name in self.order if self._queues[name]]
+        if not waiting:
+            return None
+
+        self._decay()
+        total = sum(self._recent.values())
+        if total > 0:
+            # The most under-served class below its share goes first
+            shortfalls = [
+                (self._recent[name] / total - self.stats[name].min_share, name)
+                for name in waiting
+                if self._recent[name] / total < self.stats[name].min_share
+            ]
+            if shortfalls:
+                return min(shortfalls)[1]
+        return waiting[0]
+
+    def _dispatch(self) -> None:
+        # Called with the condition held
+        granted = False
+        while self._free > 0:
+            name = self._next_class()
+            if name is None:
+                break
+            waiter = self._queues[name].popleft()
+            waiter.granted = True
+            stats = self.stats[name]
+            stats.queued -= 1
+            stats.running += 1
+            self._free -= 1
+            granted = True
+        if granted:
+            self._cond.notify_all()
+
+    # -------------------------
+    # Reporting
+    # -------------------------
+    def shares(self) -> Dict[str, float]:
+        """
+        Each class's fraction of recent (decayed) model time.
+        """
+        with self._cond:
+            self._decay()
+            total = sum(self._recent.values())
+            return {
+                name: (busy / total if total else 0.0) for name, busy in self._recent.items()
+            }
+
+    def as_dict(self) -> Dict[str, Dict]:
+        shares = self.shares()
+        with self._cond:
+            return {
+                name: dict(self.stats[name].as_dict(), recent_share=round(shares[name], 3))
+                for name in self.order
+            }
+
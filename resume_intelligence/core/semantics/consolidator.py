@@ -1,5 +1,6 @@
 from typing import Dict, List
 
+from resume_intelligence.core.instrumentation import stage
 from resume_intelligence.core.semantics.concept import Concept
 
 
@@ -40,35 +41,38 @@ _DROP_ALWAYS = {
 # Public API
 # -------------------------------------------------------------------
 def consolidate_concepts(concepts: List[Concept]) -> List[Concept]:
-    merged: Dict[str, Concept] = {}
-
-    for concept in concepts:
-        text = concept.text
-
-        if text in _DROP_ALWAYS:
-            continue
-
-        canonical = _CANONICAL_MAP.get(text, text)
-
-        if canonical not in merged:
-            merged[canonical] = Concept(
-                text=canonical,
-                confidence=concept.confidence,
-                sentences=list(concept.sentences),
-                source=concept.source,
-                type=concept.type,
-            )
-        else:
-            existing = merged[canonical]
-
-            merged[canonical] = Concept(
-                text=canonical,
-                confidence=max(existing.confidence, concept.confidence),
-                sentences=list(
-                    set(existing.sentences + concept.sentences)
-                ),
-                source=existing.source,
-                type=existing.type,
-            )
+    with stage("consolidate") as s:
+        merged: Dict[str, Concept] = {}
+
+        for concept in concepts:
+            text = concept.text
+
+            if text in _DROP_ALWAYS:
+                continue
+
+            canonical = _CANONICAL_MAP.get(text, text)
+
+            if canonical not in merged:
+                merged[canonical] = Concept(
+                    text=canonical,
+                    confidence=concept.confidence,
+                    sentences=list(concept.sentences),
+                    source=concept.source,
+                    type=concept.type,
+                )
+            else:
+                existing = merged[canonical]
+
+                merged[canonical] = Concept(
+                    text=canonical,
+                    confidence=max(existing.confidence, concept.confidence),
+                    sentences=list(
+                        set(existing.sentences + concept.sentences)
+                    ),
+                    source=existing.source,
+                    type=existing.type,
+                )
+
+        s.count(concepts_in=len(concepts), concepts=len(merged))
 
     return list(merged.values())
\ No newline at end of file
@@ -40,9 +40,10 @@
 # Store the sentence for explanation
 
 from collections import defaultdict
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 from resume_intelligence.core.document import Document
+from resume_intelligence.core.instrumentation import stage
 from resume_intelligence.core.semantics.concept import (
     Concept,
     ConceptSource,
@@ -169,6 +170,57 @@ def _infer_concept_type(text: str) -> ConceptType:
     return ConceptType.SKILL
 
 
+def _sentence_phrases(sentence: str) -> List[Tuple[str, bool]]:
+    """
+    (phrase, from_action) occurrences of one sentence, in extraction order.
+    """
+    tokens = _tokenize(sentence)
+
+    # 1️⃣ N-gram noun-like concepts
+    occurrences = [(phrase, False) for phrase in _extract_ngrams(tokens)]
+
+    # 2️⃣ Verb-driven concepts
+    for token in tokens:
+        if token in _ACTION_VERBS:
+            canonical = _VERB_CANONICAL_MAP.get(token)
+            if canonical:
+                occurrences.append((canonical, True))
+
+    return occurrences
+
+
+def _build_concept(
+    phrase: str,
+    sentences: List[str],
+    from_action: bool,
+    source: ConceptSource,
+) -> Optional[Concept]:
+    """
+    Concept for a phrase given every sentence it occurs in (document
+    order, one entry per occurrence), or None if it isn't kept.
+    """
+    if not _is_valid_concept(phrase):
+        return None
+
+    concept_type = _infer_concept_type(phrase)
+    if concept_type == ConceptType.ROLE_CONTEXT:
+        return None
+
+    confidence = _calculate_confidence(
+        phrase=phrase,
+        sentences=sentences,
+        from_action=from_action,
+    )
+
+    return Concept(
+        text=phrase,
+        confidence=confidence,
+        sentences=list(set(sentences)),
+        source=source,
+        type=concept_type,
+    )
+
+
 # -------------------------------------------------------------------
 # Public API
 # -------------------------------------------------------------------
@@ -181,49 +233,32 @@ def extract_concepts(
     if not document.sentences:
         raise ValueError("Document must be normalized before concept extraction.")
 
-    phrase_to_data: Dict[str, Dict[str, Any]] = defaultdict(
-        lambda: {"sentences": [], "from_action": False}
-    )
-
-    for sentence in document.sentences:
-        tokens = _tokenize(sentence)
-
-        # 1️⃣ N-gram noun-like concepts
-        for phrase in _extract_ngrams(tokens):
-            phrase_to_data[phrase]["sentences"].append(sentence)
-
-        # 2️⃣ Verb-driven concepts
-        for token in tokens:
-            if token in _ACTION_VERBS:
-                canonical = _VERB_CANONICAL_MAP.get(token)
-                if canonical:
-                    phrase_to_data[canonical]["sentences"].append(sentence)
-                    phrase_to_data[canonical]["from_action"] = True
-
-    concepts: List[Concept] = []
+    with stage("extract") as s:
+        phrase_to_data: Dict[str, Dict[str, Any]] = defaultdict(
+            lambda: {"sentences": [], "from_action": False}
+        )
+        occurrences = 0
 
-    for phrase, data in phrase_to_data.items():
-        if not _is_valid_concept(phrase):
-            continue
+        for sentence in document.sentences:
+            for phrase, from_action in _sentence_phrases(sentence):
+                occurrences += 1
+                phrase_to_data[phrase]["sentences"].append(sentence)
+                if from_action:
+                    phrase_to_data[phrase]["from_action"] = True
 
-        concept_type = _infer_concept_type(phrase)
-        if concept_type == ConceptType.ROLE_CONTEXT:
-            continue
+        concepts: List[Concept] = []
 
-        confidence = _calculate_confidence(
-            phrase=phrase,
-            sentences=data["sentences"],
-            from_action=data["from_action"],
-        )
-
-        concepts.append(
-            Concept(
-                text=phrase,
-                confidence=confidence,
-                sentences=list(set(data["sentences"])),
-                source=source,
-                type=concept_type,
+        for phrase, data in phrase_to_data.items():
+            concept = _build_concept(
+                phrase, data["sentences"], data["from_action"], source
             )
+            if concept is not None:
+                concepts.append(concept)
+
+        s.count(
+            sentences=len(document.sentences),
+            ngrams=occurrences,
+            concepts=len(concepts),
         )
 
     return concepts
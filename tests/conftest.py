@@ -0,0 +1,103 @@
+import numpy as np
+import pytest
+
+from benchmarks.common import HashingEmbedder
+from resume_intelligence.core.semantics.concept import (
+    Concept,
+    ConceptSource,
+    ConceptType,
+)
+
+
+# Two of these make a resume concept in fill_store
+WORDS = [
+    "api", "integration", "state", "management", "unit", "testing",
+    "docker", "deployment", "cloud", "python", "design", "security",
+    "review", "rest", "painting", "history",
+]
+
+JD_TEXTS = ["api integration", "state management", "docker deployment"]
+
+
+def _type_for(text):
+    return ConceptType.TOOL if "docker" in text else ConceptType.SKILL
+
+
+@pytest.fixture
+def stub_embedder():
+    # The offline embedder the benchmarks use; no model download
+    return HashingEmbedder()
+
+
+@pytest.fixture
+def words():
+    return list(WORDS)
+
+
+@pytest.fixture
+def make_concept():
+    """
+    make_concept(text, source, concept_type=SKILL, confidence=0.8)
+    """
+
+    def make(
+        text,
+        source=ConceptSource.RESUME,
+        concept_type=ConceptType.SKILL,
+        confidence=0.8,
+    ):
+        return Concept(
+            text=text,
+            confidence=confidence,
+            sentences=[f"worked on {text}"],
+            source=source,
+            type=concept_type,
+        )
+
+    return make
+
+
+@pytest.fixture
+def jd_concepts(make_concept):
+    return [make_concept(t, ConceptSource.JD, _type_for(t)) for t in JD_TEXTS]
+
+
+@pytest.fixture
+def jd_vectors(jd_concepts, stub_embedder):
+    return stub_embedder.embed_texts([c.text for c in jd_concepts])
+
+
+@pytest.fixture
+def fill_store(make_concept, stub_embedder):
+    """
+    fill_store(store, resumes=24, seed=0, mixed_types=False) adds
+    resumes r000 … of one to five random two-word concepts each. Docker
+    concepts are tools and the rest skills, or with ``mixed_types`` any
+    ConceptType. Returns resume id → concepts.
+    """
+
+    def fill(store, resumes=24, seed=0, mixed_types=False):
+        rng = np.random.default_rng(seed)
+        types = list(ConceptType)
+        added = {}
+        for i in range(resumes):
+            texts = list(dict.fromkeys(
+                " ".join(rng.choice(WORDS, size=2, replace=False))
+                for _ in range(rng.integers(1, 6))
+            ))
+            concepts = [
+                make_concept(
+                    t,
+                    ConceptSource.RESUME,
+                    types[rng.integers(len(types))] if mixed_types else _type_for(t),
+                )
+                for t in texts
+            ]
+            resume_id = f"r{i:03d}"
+            store.add_resume(
+                resume_id, concepts, stub_embedder.embed_texts(texts), path=f"/cv/{i}.pdf"
+            )
+            added[resume_id] = concepts
+        return added
+
+    return fill
@@ -0,0 +1,63 @@
+import numpy as np
+
+from resume_intelligence.core.matching.ats_score import compute_ats_score
+from resume_intelligence.core.matching.matcher import ConceptMatcher
+from resume_intelligence.core.retrieval.ann import IVFIndex
+from resume_intelligence.core.semantics.concept import ConceptSource
+
+
+CANDIDATES = {
+    "alice": ["api integration", "state management", "unit testing"],
+    "bob": ["rest api design", "docker deployment"],
+    "carol": ["watercolor painting", "art history"],
+    "dave": ["api integration", "ci cd pipeline", "state machine design"],
+}
+
+
+def _build(stub_embedder, make_concept, n_lists):
+    index = IVFIndex(n_lists=n_lists, seed=1)
+    resumes = {}
+    for candidate_id, texts in CANDIDATES.items():
+        concepts = [make_concept(t, ConceptSource.RESUME) for t in texts]
+        resumes[candidate_id] = concepts
+        index.add(candidate_id, concepts, stub_embedder.embed_texts(texts))
+    return index.build(), resumes
+
+
+def test_full_probe_ranking_matches_exact_matcher(
+    stub_embedder, make_concept, jd_concepts, jd_vectors
+):
+    index, resumes = _build(stub_embedder, make_concept, n_lists=3)
+
+    ranked = index.rank_candidates(jd_concepts, jd_vectors, top_n=10, n_probe=3)
+
+    matcher = ConceptMatcher(stub_embedder)
+    for entry in ranked:
+        exact = matcher.match(jd_concepts, resumes[entry.candidate_id])
+        assert entry.ats_score == compute_ats_score(jd_concepts, exact)
+
+    assert ranked[0].candidate_id in {"alice", "dave"}
+    assert "carol" not in {r.candidate_id for r in ranked}
+
+
+def test_recall_is_perfect_with_full_probe(stub_embedder, make_concept):
+    index, _ = _build(stub_embedder, make_concept, n_lists=4)
+    queries = stub_embedder.embed_texts(["api integration", "painting"])
+
+    assert index.recall_at_k(queries, k=3, n_probe=4) == 1.0
+
+
+def test_save_and_load_round_trip(tmp_path, stub_embedder, make_concept):
+    index, _ = _build(stub_embedder, make_concept, n_lists=2)
+    path = tmp_path / "index.npz"
+    index.save(str(path))
+
+    loaded = IVFIndex.load(str(path))
+    queries = stub_embedder.embed_texts(["api integration"])
+
+    rows, scores = index.search(queries, k=2, n_probe=2)
+    loaded_rows, loaded_scores = loaded.search(queries, k=2, n_probe=2)
+
+    assert np.array_equal(rows, loaded_rows)
+    assert np.array_equal(scores, loaded_scores)
+    assert loaded.candidate_ids == index.candidate_ids
@@ -0,0 +1,165 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from benchmarks.common import HashingEmbedder
+from resume_intelligence.core.async_pipeline import AsyncPipeline, EmbeddingBatcher
+from resume_intelligence.core.matching.ats_score import compute_ats_score
+from resume_intelligence.core.matching.matcher import ConceptMatcher
+from resume_intelligence.core.pipeline import analyze_text
+from resume_intelligence.core.semantics.concept import ConceptSource
+
+
+JD_TEXT = (
+    "We need api integration experience and state management skills. "
+    "Unit testing and docker deployment are a plus."
+)
+RESUME_TEXT = "Built scalable api integration services with unit testing."
+
+
+class SlowEmbedder(HashingEmbedder):
+    def __init__(self, delay: float):
+        super().__init__()
+        self.delay = delay
+        self.batches = []
+
+    def embed_texts(self, texts):
+        self.batches.append(list(texts))
+        time.sleep(self.delay)
+        return super().embed_texts(texts)
+
+
+def _expected(cascade=False):
+    from resume_intelligence.core.matching.lexical import LexicalPrefilter
+
+    jd_concepts = analyze_text(JD_TEXT, ConceptSource.JD)
+    resume_concepts = analyze_text(RESUME_TEXT, ConceptSource.RESUME)
+    matcher = ConceptMatcher(
+        HashingEmbedder(), prefilter=LexicalPrefilter() if cascade else None
+    )
+    results = matcher.match(jd_concepts, resume_concepts)
+    return compute_ats_score(jd_concepts, results), results
+
+
+@pytest.mark.parametrize("cascade", [False, True])
+def test_match_texts_equals_sync_pipeline(cascade):
+    async def run():
+        async with AsyncPipeline(HashingEmbedder(), extract_workers=0) as pipeline:
+            return await pipeline.match_texts(RESUME_TEXT, JD_TEXT, cascade=cascade)
+
+    assert asyncio.run(run()) == _expected(cascade)
+
+
+def test_match_files_with_process_pool(tmp_path):
+    resume = tmp_path / "resume.txt"
+    jd = tmp_path / "jd.txt"
+    resume.write_text(RESUME_TEXT)
+    jd.write_text(JD_TEXT)
+
+    async def run():
+        async with AsyncPipeline(HashingEmbedder(), extract_workers=1) as pipeline:
+            return await pipeline.match_files(str(resume), str(jd))
+
+    assert asyncio.run(run()) == _expected()
+
+
+def test_empty_jd_raises():
+    async def run():
+        async with AsyncPipeline(HashingEmbedder(), extract_workers=0) as pipeline:
+            await pipeline.match_texts(RESUME_TEXT, "Yes.")
+
+    with pytest.raises(ValueError):
+        asyncio.run(run())
+
+
+def test_batcher_merges_queued_requests():
+    embedder = SlowEmbedder(delay=0.2)
+    batcher = EmbeddingBatcher(embedder)
+
+    first = batcher.submit(["api integration"])
+    time.sleep(0.05)  # model is now busy with the first call
+    queued = [batcher.submit([f"skill {i}", "unit testing"]) for i in range(5)]
+
+    assert first.result(timeout=5) == HashingEmbedder().embed_texts(["api integration"])
+    for i, future in enumerate(queued):
+        assert future.result(timeout=5) == HashingEmbedder().embed_texts(
+            [f"skill {i}", "unit testing"]
+        )
+
+    assert batcher.model_calls == 2
+    assert batcher.requests == 6
+    # Shared texts are embedded once per merged call
+    assert embedder.batches[1].count("unit testing") == 1
+    batcher.close()
+
+
+def test_cancelled_requests_never_reach_the_model():
+    embedder = SlowEmbedder(delay=0.2)
+    batcher = EmbeddingBatcher(embedder)
+
+    batcher.submit(["api integration"])
+    time.sleep(0.05)
+    dropped = batcher.submit(["dropped text"])
+    kept = batcher.submit(["kept text"])
+    assert dropped.cancel()
+
+    kept.result(timeout=5)
+    assert all("dropped text" not in batch for batch in embedder.batches)
+    batcher.close()
+
+
+def test_deadline_times_out_and_pipeline_recovers():
+    async def run():
+        embedder = SlowEmbedder(delay=0.5)
+        async with AsyncPipeline(embedder, extract_workers=0) as pipeline:
+            with pytest.raises(TimeoutError):
+                await pipeline.match_texts(RESUME_TEXT, JD_TEXT, timeout=0.1)
+
+            embedder.delay = 0.0
+            return await pipeline.match_texts(RESUME_TEXT, JD_TEXT, timeout=10)
+
+    assert asyncio.run(run()) == _expected()
+
+
+def test_cancellation_stops_feeding_the_model():
+    started = threading.Event()
+
+    class BlockingEmbedder(SlowEmbedder):
+        def embed_texts(self, texts):
+            started.set()
+            return super().embed_texts(texts)
+
+    async def run():
+        embedder = BlockingEmbedder(delay=0.3)
+        async with AsyncPipeline(embedder, extract_workers=0) as pipeline:
+            task = asyncio.ensure_future(pipeline.match_texts(RESUME_TEXT, JD_TEXT))
+            while not started.is_set():
+                await asyncio.sleep(0.01)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+            await asyncio.sleep(0.5)
+            return embedder.batches
+
+    # JD vectors were in flight; the resume-side call never happens
+    assert len(asyncio.run(run())) == 1
+
+
+def test_event_loop_stays_responsive():
+    async def run():
+        async with AsyncPipeline(SlowEmbedder(delay=0.3), extract_workers=0) as pipeline:
+            work = asyncio.ensure_future(pipeline.match_texts(RESUME_TEXT, JD_TEXT))
+
+            worst = 0.0
+            while not work.done():
+                start = time.perf_counter()
+                await asyncio.sleep(0.01)
+                worst = max(worst, time.perf_counter() - start - 0.01)
+
+            await work
+            return worst
+
+    assert asyncio.run(run()) < 0.1
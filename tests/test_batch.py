@@ -0,0 +1,45 @@
+import csv
+import io
+import json
+
+from resume_intelligence.core.batch import ResultWriter, format_for, resolve_inputs
+
+
+RESUMES = {
+    "a.txt": "Built scalable api integration services with unit testing.",
+    "b.txt": "Designed state management for mobile apps.",
+    "c.txt": "Painted watercolor landscapes for local galleries.",
+    "d.txt": "Deployed docker containers and wrote unit testing suites.",
+    "empty.txt": "",
+}
+
+
+def _write_resumes(folder):
+    folder.mkdir()
+    for name, text in RESUMES.items():
+        (folder / name).write_text(text, encoding="utf-8")
+    (folder / "notes.csv").write_text("ignored,file", encoding="utf-8")
+    return sorted(str(folder / name) for name in RESUMES)
+
+
+def test_inputs_from_folder_or_glob(tmp_path):
+    paths = _write_resumes(tmp_path / "resumes")
+
+    assert resolve_inputs(str(tmp_path / "resumes")) == paths
+    assert resolve_inputs(str(tmp_path / "resumes" / "[ab].txt")) == paths[:2]
+
+
+def test_writers_stream_jsonl_and_csv():
+    row = {
+        "resume": "a.txt", "ats_score": 71.5, "matched": 2,
+        "partial": 1, "missing": 0, "error": None,
+    }
+
+    jsonl = io.StringIO()
+    ResultWriter(jsonl, "jsonl").write(row)
+    assert json.loads(jsonl.getvalue()) == row
+
+    table = io.StringIO()
+    ResultWriter(table, format_for("out.csv")).write(row)
+    parsed = list(csv.DictReader(io.StringIO(table.getvalue())))
+    assert parsed[0]["resume"] == "a.txt" and parsed[0]["ats_score"] == "71.5"
@@ -0,0 +1,223 @@
+import json
+import multiprocessing
+import os
+import random
+import signal
+import time
+
+import numpy as np
+import pytest
+from benchmarks.common import HashingEmbedder
+from resume_intelligence.core.batch import BatchJob
+from resume_intelligence.core.checkpoint import STATE_NAME
+from resume_intelligence.core.orchestrator import Pipeline
+from resume_intelligence.core.pipeline import analyze_text
+from resume_intelligence.core.semantics.concept import ConceptSource
+
+
+JD_TEXT = (
+    "We need api integration experience and state management skills. "
+    "Unit testing and docker deployment are a plus."
+)
+
+WORDS = [
+    "api", "integration", "state", "management", "unit", "testing",
+    "docker", "deployment", "mobile", "cloud", "python", "security",
+]
+
+
+class BatchSensitiveEmbedder(HashingEmbedder):
+    # Like a real model, a text's vector shifts with the batch it is in
+    def embed_texts(self, texts):
+        shift = np.zeros(self.dim)
+        shift[len(texts) % self.dim] = 0.2
+        return [
+            list((v + shift) / np.linalg.norm(v + shift))
+            for v in np.array(super().embed_texts(texts))
+        ]
+
+
+class SlowEmbedder(BatchSensitiveEmbedder):
+    def embed_texts(self, texts):
+        time.sleep(0.05)
+        return super().embed_texts(texts)
+
+
+def _corpus(folder, count=60):
+    folder.mkdir()
+    paths = []
+    for i in range(count):
+        words = random.Random(i).sample(WORDS, 6)
+        path = folder / f"resume_{i:03d}.txt"
+        path.write_text(
+            f"Built {' '.join(words[:3])} services. Led {' '.join(words[3:])} work.",
+            encoding="utf-8",
+        )
+        paths.append(str(path))
+    return paths
+
+
+def _job(tmp_path, name, embedder, fmt="jsonl", cache_entries=100_000, queue_size=64):
+    pipeline = Pipeline(
+        analyze_text(JD_TEXT, ConceptSource.JD),
+        embedder,
+        parse_workers=0,
+        analyze_workers=0,
+        batch_size=4,
+        cache_entries=cache_entries,
+        queue_size=queue_size,
+    )
+    return BatchJob(
+        pipeline,
+        output_path=str(tmp_path / f"{name}.{fmt}"),
+        fmt=fmt,
+        checkpoint_dir=str(tmp_path / f"{name}-checkpoint"),
+        checkpoint_every=6,  # not whole batches
+        top_k=5,
+    )
+
+
+def _run_in_child(tmp_path, paths, fmt):
+    job = _job(tmp_path, "resumed", SlowEmbedder(), fmt)
+    job.prepare(paths)
+    with job.pipeline:
+        for _ in job.run():
+            pass
+
+
+@pytest.mark.parametrize("fmt", ["jsonl", "csv"])
+def test_killed_job_resumes_with_identical_output(tmp_path, fmt):
+    paths = _corpus(tmp_path / "resumes")
+
+    reference = _job(tmp_path, "reference", BatchSensitiveEmbedder(), fmt)
+    reference.prepare(paths)
+    with reference.pipeline:
+        list(reference.run())
+
+    # Kill the job hard once a few checkpoints have landed
+    context = multiprocessing.get_context("fork")
+    child = context.Process(target=_run_in_child, args=(tmp_path, paths, fmt))
+    child.start()
+
+    state_path = tmp_path / "resumed-checkpoint" / STATE_NAME
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if state_path.exists() and len(json.loads(state_path.read_text())["processed"]) >= 12:
+            break
+        time.sleep(0.01)
+    os.kill(child.pid, signal.SIGKILL)
+    child.join()
+
+    checkpointed = json.loads(state_path.read_text())
+    assert 12 <= len(checkpointed["processed"]) < len(paths)
+    assert len(checkpointed["processed"]) % 4 == 0  # at a batch boundary
+
+    embedder = BatchSensitiveEmbedder()
+    resumed = _job(tmp_path, "resumed", embedder, fmt)
+    done = resumed.prepare(paths)
+    with resumed.pipeline:
+        rows = list(resumed.run())
+
+    # Nothing before the checkpoint is processed again
+    assert done == len(checkpointed["processed"])
+    assert len(rows) == len(paths) - done
+    assert resumed.pipeline.report.resumes == len(paths) - done
+
+    assert (tmp_path / f"resumed.{fmt}").read_bytes() == (
+        tmp_path / f"reference.{fmt}"
+    ).read_bytes()
+    assert resumed.top == reference.top
+
+
+def test_checkpoint_of_another_job_is_rejected(tmp_path):
+    paths = _corpus(tmp_path / "resumes", count=8)
+
+    job = _job(tmp_path, "job", HashingEmbedder())
+    job.prepare(paths)
+    with job.pipeline:
+        list(job.run())
+
+    other = _job(tmp_path, "job", HashingEmbedder())
+    with other.pipeline, pytest.raises(ValueError):
+        other.prepare(paths[:4])
+
+
+def test_warm_cache_skips_embedding_on_resume(tmp_path):
+    paths = _corpus(tmp_path / "resumes", count=8)
+
+    job = _job(tmp_path, "job", HashingEmbedder())
+    job.prepare(paths)
+    with job.pipeline:
+        list(job.run())
+
+    embedder = HashingEmbedder()
+    again = _job(tmp_path, "job", embedder)
+    with again.pipeline:
+        assert again.prepare(paths) == len(paths)
+        assert list(again.run()) == []
+    assert embedder.calls == 0
+    assert len(again.pipeline.embedder) > 0
+
+
+def test_cache_log_is_compacted_to_the_live_cache(tmp_path):
+    paths = _corpus(tmp_path / "resumes")
+
+    reference = _job(tmp_path, "reference", HashingEmbedder(), cache_entries=8)
+    reference.prepare(paths)
+    with reference.pipeline:
+        list(reference.run())
+
+    # Stop half way, as a kill would
+    job = _job(tmp_path, "job", HashingEmbedder(), cache_entries=8)
+    job.prepare(paths)
+    with job.pipeline:
+        rows = job.run()
+        for _ in range(len(paths) // 2):
+            next(rows)
+        rows.close()
+
+    checkpoint = tmp_path / "job-checkpoint"
+    cache = json.loads((checkpoint / STATE_NAME).read_text())["cache"]
+    assert cache["log"] > 0 and cache["entries"] <= 2 * 8
+    assert len(list(checkpoint.glob("cache_vectors*"))) == 1
+
+    resumed = _job(tmp_path, "job", HashingEmbedder(), cache_entries=8)
+    resumed.prepare(paths)
+    assert len(resumed.pipeline.embedder) == 8
+    with resumed.pipeline:
+        list(resumed.run())
+
+    assert (tmp_path / "job.jsonl").read_bytes() == (
+        tmp_path / "reference.jsonl"
+    ).read_bytes()
+
+
+def test_stopped_job_resumes_on_a_batch_boundary(tmp_path):
+    paths = _corpus(tmp_path / "resumes", count=120)
+
+    def job(name):
+        # Short queues: the stages run only a few batches ahead of the
+        # rows, so most texts are embedded after the checkpoint
+        return _job(tmp_path, name, BatchSensitiveEmbedder(), queue_size=1)
+
+    reference = job("reference")
+    reference.prepare(paths)
+    with reference.pipeline:
+        list(reference.run())
+
+    stopped = job("job")
+    stopped.prepare(paths)
+    with stopped.pipeline:
+        rows = stopped.run()
+        for _ in range(10):
+            next(rows)
+        rows.close()
+
+    resumed = job("job")
+    assert resumed.prepare(paths) == 8  # checkpoint_every=6 → 8
+    with resumed.pipeline:
+        list(resumed.run())
+
+    assert (tmp_path / "job.jsonl").read_bytes() == (
+        tmp_path / "reference.jsonl"
+    ).read_bytes()
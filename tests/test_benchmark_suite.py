@@ -0,0 +1,91 @@
+import json
+
+from benchmarks.corpus import build_corpus, resume_text
+from benchmarks.suite import compare, main, run_suite
+from resume_intelligence.core.document import Document
+from resume_intelligence.core.normalizer import normalize_document
+from resume_intelligence.core.parser import parse_document
+
+
+def _sentences(path):
+    doc = Document(raw_text=parse_document(path))
+    return normalize_document(doc).sentences
+
+
+def test_corpus_is_deterministic_across_formats(tmp_path):
+    first = build_corpus(str(tmp_path / "a"), resumes=2, seed=3)
+    second = build_corpus(str(tmp_path / "b"), resumes=2, seed=3)
+
+    assert resume_text(3, 0, 20) == resume_text(3, 0, 20)
+    assert resume_text(3, 0, 20) != resume_text(3, 1, 20)
+
+    for fmt in ("txt", "pdf"):
+        for a, b in zip(first.resumes[fmt], second.resumes[fmt]):
+            assert open(a, "rb").read() == open(b, "rb").read()
+
+    for i in range(2):
+        expected = _sentences(first.resumes["txt"][i])
+        assert _sentences(first.resumes["docx"][i]) == expected
+        assert _sentences(first.resumes["pdf"][i]) == expected
+
+
+def _results(**medians):
+    return {
+        "config": {"size": "small"},
+        "environment": {"platform": "x", "machine": "y", "cpu_count": 1},
+        "output_checksum": "abc",
+        "cases": {
+            name: {"min_ms": ms, "median_ms": ms} for name, ms in medians.items()
+        },
+    }
+
+
+def test_compare_flags_regressions_past_threshold_and_floor():
+    baseline = _results(parse=100.0, extract=10.0, tiny=0.1, gone=5.0)
+    current = _results(parse=115.0, extract=10.5, tiny=0.3, added=1.0)
+
+    report = compare(baseline, current, threshold=0.10, floor_ms=0.5)
+
+    assert report["regressions"] == ["parse"]
+    assert report["cases"]["extract"]["status"] == "ok"
+    assert report["cases"]["tiny"]["status"] == "ok"  # under the floor
+    assert report["cases"]["added"]["status"] == "new"
+    assert report["cases"]["gone"]["status"] == "missing"
+    assert not report["output_changed"]
+
+    faster = compare(baseline, _results(parse=50.0, extract=10.0, tiny=0.1, gone=5.0))
+    assert faster["cases"]["parse"]["status"] == "improvement"
+    assert faster["regressions"] == []
+
+
+def test_compare_reports_changed_output():
+    current = _results(parse=100.0)
+    current["output_checksum"] = "def"
+    assert compare(_results(parse=100.0), current)["output_changed"]
+
+
+def test_run_and_compare_commands(tmp_path, capsys):
+    results = run_suite(resumes=2, formats=["txt"], rounds=1, only=["parse", "score"])
+    assert list(results["cases"]) == ["parse_txt", "score"]
+    assert results["cases"]["score"]["items"] == 2
+
+    baseline = tmp_path / "baseline.json"
+    assert main([
+        "run", "--resumes", "2", "--formats", "txt", "--rounds", "1",
+        "--cases", "parse", "--out", str(baseline),
+    ]) == 0
+    # A run compared with itself never regresses
+    assert main(["compare", str(baseline), str(baseline)]) == 0
+
+
+def test_memory_pass_and_compare():
+    results = run_suite(resumes=2, formats=["txt"], rounds=1, only=["parse"], memory=True)
+    parse = results["memory"]["parse_txt"]
+    assert parse["peak_bytes"] > 0
+    assert parse["stages"]["parse"]["sampled_calls"] >= 1
+
+    grown = json.loads(json.dumps(results))
+    grown["memory"]["parse_txt"]["peak_bytes"] += 1_000_000
+    report = compare(results, grown)
+    assert report["memory_regressions"] == ["parse_txt"]
+    assert compare(results, results)["memory_regressions"] == []
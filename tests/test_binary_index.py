@@ -0,0 +1,84 @@
+import numpy as np
+
+from resume_intelligence.core.matching.ats_score import compute_ats_score
+from resume_intelligence.core.matching.matcher import ConceptMatcher
+from resume_intelligence.core.retrieval.binary import (
+    BinaryIndex,
+    hamming_distances,
+    quantize,
+)
+from resume_intelligence.core.semantics.concept import ConceptSource
+
+
+CANDIDATES = {
+    "alice": ["api integration", "state management", "unit testing"],
+    "bob": ["rest api design", "docker deployment"],
+    "carol": ["watercolor painting", "art history"],
+}
+
+
+def test_hamming_distance_counts_differing_signs():
+    codes = quantize([[1.0, -1.0, 1.0, -1.0], [-1.0, -1.0, 1.0, 1.0]])
+    query = quantize([[1.0, -1.0, 1.0, -1.0]])[0]
+
+    assert hamming_distances(codes, query).tolist() == [0, 2]
+
+
+def test_rescored_ranking_matches_exact_matcher(
+    tmp_path, stub_embedder, make_concept, jd_concepts, jd_vectors
+):
+    index = BinaryIndex(str(tmp_path / "vectors.f32"), dim=stub_embedder.dim)
+    resumes = {}
+    for candidate_id, texts in CANDIDATES.items():
+        concepts = [make_concept(t, ConceptSource.RESUME) for t in texts]
+        resumes[candidate_id] = concepts
+        index.add(candidate_id, concepts, stub_embedder.embed_texts(texts))
+
+    # With every row surviving the pre-filter, rescoring is exact
+    ranked = index.rank_candidates(jd_concepts, jd_vectors, n_survivors=len(index))
+
+    matcher = ConceptMatcher(stub_embedder)
+    for entry in ranked:
+        exact = matcher.match(jd_concepts, resumes[entry.candidate_id])
+        assert entry.ats_score == compute_ats_score(jd_concepts, exact)
+
+    assert ranked[0].candidate_id == "alice"
+    assert index.memory_bytes() < index.full_vectors.nbytes
+
+
+def test_save_and_load_reuses_vectors_file(tmp_path, stub_embedder, make_concept):
+    vectors_path = str(tmp_path / "vectors.f32")
+    index = BinaryIndex(vectors_path, dim=stub_embedder.dim)
+    texts = CANDIDATES["alice"]
+    index.add(
+        "alice",
+        [make_concept(t, ConceptSource.RESUME) for t in texts],
+        stub_embedder.embed_texts(texts),
+    )
+    index.save(str(tmp_path / "codes.npz"))
+
+    loaded = BinaryIndex.load(str(tmp_path / "codes.npz"), vectors_path)
+
+    assert np.array_equal(loaded.codes, index.codes)
+    assert np.allclose(loaded.full_vectors, index.full_vectors)
+    assert len(loaded) == len(index) == len(texts)
+
+
+def test_adds_are_consolidated_only_before_a_query(
+    tmp_path, stub_embedder, make_concept, jd_concepts, jd_vectors
+):
+    index = BinaryIndex(str(tmp_path / "vectors.f32"), dim=stub_embedder.dim)
+    for candidate_id, texts in CANDIDATES.items():
+        index.add(
+            candidate_id,
+            [make_concept(t, ConceptSource.RESUME) for t in texts],
+            stub_embedder.embed_texts(texts),
+        )
+
+    rows = sum(len(texts) for texts in CANDIDATES.values())
+    assert len(index) == rows
+    assert len(index.codes) == 0
+    assert len(index._pending_codes) == len(CANDIDATES)
+
+    index.rank_candidates(jd_concepts, jd_vectors)
+    assert len(index.codes) == rows and not index._pending_codes
@@ -0,0 +1,81 @@
+import os
+
+from resume_intelligence.core.corpus.indexer import CorpusIndexer
+from resume_intelligence.core.corpus.store import CorpusStore
+from resume_intelligence.core.retrieval.inverted import InvertedConceptIndex
+
+
+def _write(path, text):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+def test_index_adds_skips_updates_and_removes(tmp_path, stub_embedder):
+    folder = tmp_path / "resumes"
+    folder.mkdir()
+    _write(folder / "a.txt", "Built scalable api integration services.")
+    _write(folder / "b.txt", "Designed state management for mobile apps.")
+    _write(folder / "notes.csv", "ignored,file")
+
+    with CorpusStore(str(tmp_path / "store")) as store:
+        indexer = CorpusIndexer(store, stub_embedder)
+
+        first = indexer.index(str(folder))
+        assert (first.added, first.skipped, first.removed) == (2, 0, 0)
+
+        second = indexer.index(str(folder))
+        assert (second.added, second.updated, second.skipped) == (0, 0, 2)
+
+        # Same content, new mtime: hashed but not reprocessed
+        stat = os.stat(folder / "a.txt")
+        os.utime(folder / "a.txt", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        embedded = stub_embedder.texts_embedded
+        touched = indexer.index(str(folder))
+        assert touched.skipped == 2
+        assert stub_embedder.texts_embedded == embedded
+
+        _write(folder / "b.txt", "Deployed docker containers to kubernetes clusters.")
+        os.remove(folder / "a.txt")
+
+        third = indexer.index(str(folder))
+        assert (third.updated, third.removed) == (1, 1)
+        assert store.resume_ids() == ["b.txt"]
+        assert any(
+            "kubernetes" in c.text for c in store.load_concepts("b.txt")
+        )
+
+
+def test_unreadable_file_is_reported_not_fatal(tmp_path, stub_embedder):
+    folder = tmp_path / "resumes"
+    folder.mkdir()
+    _write(folder / "empty.txt", "")
+    _write(folder / "ok.txt", "Built scalable api integration services.")
+
+    with CorpusStore(str(tmp_path / "store")) as store:
+        report = CorpusIndexer(store, stub_embedder).index(str(folder))
+
+    assert report.added == 1
+    assert [path for path, _ in report.failed] == ["empty.txt"]
+
+
+def test_changed_file_that_fails_is_forgotten(tmp_path, stub_embedder):
+    folder = tmp_path / "resumes"
+    folder.mkdir()
+    _write(folder / "a.txt", "Built scalable api integration services.")
+
+    with CorpusStore(str(tmp_path / "store")) as store:
+        inverted = InvertedConceptIndex()
+        indexer = CorpusIndexer(store, stub_embedder, inverted)
+        indexer.index(str(folder))
+        assert "a.txt" in store and "a.txt" in inverted
+
+        _write(folder / "a.txt", "")
+        report = indexer.index(str(folder))
+
+        assert [path for path, _ in report.failed] == ["a.txt"]
+        assert "a.txt" not in store and "a.txt" not in inverted
+        assert "a.txt" not in indexer._manifest()
+
+        # Retried on the next run, and indexed once it parses again
+        _write(folder / "a.txt", "Designed state management for mobile apps.")
+        assert indexer.index(str(folder)).added == 1
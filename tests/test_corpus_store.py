@@ -0,0 +1,115 @@
+import os
+
+import numpy as np
+import pytest
+
+from resume_intelligence.core.corpus.store import VECTORS_NAME, CorpusStore
+from resume_intelligence.core.exception import CorpusStoreError
+from resume_intelligence.core.matching.ats_score import compute_ats_score
+from resume_intelligence.core.matching.matcher import ConceptMatcher
+from resume_intelligence.core.semantics.concept import ConceptSource, ConceptType
+
+
+CANDIDATES = {
+    "alice": ["api integration", "state management", "unit testing"],
+    "bob": ["rest api design", "docker deployment"],
+    "carol": ["watercolor painting", "art history"],
+}
+
+TOOLS = {"docker deployment"}
+
+
+@pytest.fixture
+def resume_concept(make_concept):
+    def make(text):
+        concept_type = ConceptType.TOOL if text in TOOLS else ConceptType.SKILL
+        return make_concept(text, ConceptSource.RESUME, concept_type)
+
+    return make
+
+
+@pytest.fixture
+def fill(stub_embedder, resume_concept):
+    def fill(store):
+        resumes = {}
+        for resume_id, texts in CANDIDATES.items():
+            concepts = [resume_concept(t) for t in texts]
+            resumes[resume_id] = concepts
+            store.add_resume(resume_id, concepts, stub_embedder.embed_texts(texts))
+        return resumes
+
+    return fill
+
+
+def test_concepts_round_trip(tmp_path, stub_embedder, fill):
+    with CorpusStore(str(tmp_path)) as store:
+        resumes = fill(store)
+
+    with CorpusStore(str(tmp_path)) as store:
+        assert store.resume_ids() == list(CANDIDATES)
+        assert store.load_concepts("alice") == resumes["alice"]
+        assert store.embeddings.shape == (7, stub_embedder.dim)
+        assert isinstance(store.embeddings, np.memmap)
+
+
+def test_ranking_matches_exact_matcher(
+    tmp_path, stub_embedder, fill, jd_concepts, jd_vectors
+):
+    with CorpusStore(str(tmp_path)) as store:
+        resumes = fill(store)
+        ranked = store.rank_candidates(jd_concepts, jd_vectors)
+
+    matcher = ConceptMatcher(stub_embedder)
+    for entry in ranked:
+        exact = matcher.match(jd_concepts, resumes[entry.candidate_id])
+        assert entry.ats_score == compute_ats_score(jd_concepts, exact)
+
+    assert [r.candidate_id for r in ranked] == ["alice", "bob"]
+
+
+def test_replaced_resume_rows_are_masked(
+    tmp_path, stub_embedder, fill, resume_concept, jd_concepts, jd_vectors
+):
+    with CorpusStore(str(tmp_path)) as store:
+        fill(store)
+        texts = ["watercolor painting"]
+        store.add_resume(
+            "alice",
+            [resume_concept(t) for t in texts],
+            stub_embedder.embed_texts(texts),
+        )
+
+        ranked = store.rank_candidates(jd_concepts, jd_vectors)
+
+        assert [r.candidate_id for r in ranked] == ["bob"]
+        assert store.rows == 8
+
+
+def test_uncommitted_tail_is_truncated_on_open(tmp_path, fill):
+    with CorpusStore(str(tmp_path)) as store:
+        fill(store)
+
+    vectors_path = tmp_path / VECTORS_NAME
+    with open(vectors_path, "ab") as f:
+        f.write(b"\0" * 100)
+
+    with CorpusStore(str(tmp_path)) as store:
+        assert os.path.getsize(vectors_path) == store.rows * store.dim * 4
+
+
+def test_model_mismatch_is_rejected(tmp_path):
+    CorpusStore(str(tmp_path), model_name="model-a").close()
+
+    with pytest.raises(CorpusStoreError):
+        CorpusStore(str(tmp_path), model_name="model-b")
+
+
+def test_hits_do_not_depend_on_block_size(tmp_path, fill, jd_concepts, jd_vectors):
+    with CorpusStore(str(tmp_path)) as store:
+        fill(store)
+        whole = store.candidate_hits(jd_concepts, jd_vectors)
+        blocked = store.candidate_hits(jd_concepts, jd_vectors, block_rows=2)
+
+    assert whole.keys() == blocked.keys()
+    for resume_id in whole:
+        assert np.array_equal(whole[resume_id].rows, blocked[resume_id].rows)
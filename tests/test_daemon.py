@@ -0,0 +1,214 @@
+import os
+import re
+import shutil
+import socket
+import tempfile
+import threading
+import time
+
+import pytest
+from typer.testing import CliRunner
+
+from benchmarks.common import HashingEmbedder
+from resume_intelligence.app import cli as cli_module
+from resume_intelligence.app.daemon import (
+    DaemonClient,
+    DaemonServer,
+    DaemonUnavailable,
+    default_socket_path,
+    results_from_dict,
+)
+from resume_intelligence.app.service import RequestError, ScoringService
+from resume_intelligence.core.matching import matcher as matcher_module
+from resume_intelligence.core.semantics.concept import ConceptType
+
+
+JD_TEXT = (
+    "We need api integration experience and state management skills. "
+    "Unit testing and docker deployment are a plus."
+)
+RESUME_TEXT = "Built scalable api integration services with unit testing."
+
+
+@pytest.fixture
+def socket_dir():
+    # AF_UNIX paths are limited to ~100 bytes; pytest's tmp_path can be longer
+    directory = tempfile.mkdtemp(prefix="ri-")
+    yield directory
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+def _start(socket_path, idle_timeout=60.0):
+    service = ScoringService(
+        HashingEmbedder(), workers=0, max_concurrent=4, document_root=os.sep
+    )
+    server = DaemonServer(socket_path, service, idle_timeout)
+    thread = threading.Thread(target=server.serve, daemon=True)
+    thread.start()
+    return server, thread
+
+
+@pytest.fixture
+def daemon(socket_dir):
+    socket_path = os.path.join(socket_dir, "d.sock")
+    server, thread = _start(socket_path)
+    yield socket_path
+
+    server.shutdown()
+    thread.join(timeout=5)
+
+
+def test_match_over_socket(daemon):
+    payload = DaemonClient(daemon).request("/match", {
+        "resume": {"text": RESUME_TEXT},
+        "jd": {"text": JD_TEXT},
+    })
+
+    direct = ScoringService(HashingEmbedder(), workers=0).handle("POST", "/match", {
+        "resume": {"text": RESUME_TEXT},
+        "jd": {"text": JD_TEXT},
+    })
+    assert payload == direct
+    assert payload["cascade"] is None
+
+    results = results_from_dict(payload["match_results"])
+    assert all(
+        isinstance(r["jd_type"], ConceptType)
+        for records in results.values() for r in records
+    )
+
+
+def test_errors_are_forwarded(daemon):
+    client = DaemonClient(daemon)
+
+    with pytest.raises(RequestError) as e:
+        client.request("/match", {"resume": {"text": RESUME_TEXT}, "jd": {"text": ""}})
+    assert e.value.status == 400
+
+    with pytest.raises(RequestError) as e:
+        client.request("/nope")
+    assert e.value.status == 404
+
+    # The daemon keeps serving after errors
+    assert client.is_running()
+
+
+def test_missing_daemon_is_unavailable(socket_dir):
+    client = DaemonClient(os.path.join(socket_dir, "none.sock"))
+    with pytest.raises(DaemonUnavailable):
+        client.request("/health", method="GET")
+    assert not client.is_running()
+
+
+def test_default_socket_is_in_a_private_directory(socket_dir, monkeypatch):
+    monkeypatch.delenv("RESUME_INTELLIGENCE_SOCKET", raising=False)
+    monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+    monkeypatch.setattr(tempfile, "gettempdir", lambda: socket_dir)
+
+    socket_path = default_socket_path()
+    directory = os.path.dirname(socket_path)
+    assert os.path.dirname(directory) == socket_dir
+    assert os.stat(directory).st_mode & 0o777 == 0o700
+
+    # Opened up, or made by someone else: refused rather than used
+    os.chmod(directory, 0o777)
+    with pytest.raises(PermissionError):
+        default_socket_path()
+
+    os.chmod(directory, 0o700)
+    monkeypatch.setattr(os, "getuid", lambda: os.stat(directory).st_uid + 1)
+    with pytest.raises(PermissionError):
+        default_socket_path()
+
+
+def test_socket_of_another_user_is_not_used(daemon, monkeypatch):
+    monkeypatch.setattr(os, "getuid", lambda: os.stat(daemon).st_uid + 1)
+
+    client = DaemonClient(daemon)
+    with pytest.raises(DaemonUnavailable, match="another user"):
+        client.request("/health", method="GET")
+    assert not client.is_running()
+
+
+def test_stale_socket_is_replaced(socket_dir):
+    socket_path = os.path.join(socket_dir, "d.sock")
+
+    # A socket file left by a killed daemon: exists, nobody listening
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(socket_path)
+    stale.close()
+    assert os.path.exists(socket_path)
+
+    server, thread = _start(socket_path)
+    assert DaemonClient(socket_path).is_running()
+
+    # A second daemon on a live socket refuses to start
+    with pytest.raises(RuntimeError):
+        DaemonServer(socket_path, None)
+
+    server.shutdown()
+    thread.join(timeout=5)
+
+
+def test_idle_timeout_shuts_down_and_cleans_up(socket_dir):
+    socket_path = os.path.join(socket_dir, "d.sock")
+    _, thread = _start(socket_path, idle_timeout=0.5)
+
+    assert DaemonClient(socket_path).is_running()
+    thread.join(timeout=10)
+
+    assert not thread.is_alive()
+    assert not os.path.exists(socket_path)
+
+
+def test_shutdown_request(daemon):
+    DaemonClient(daemon).request("/shutdown")
+
+    deadline = time.monotonic() + 5
+    while os.path.exists(daemon) and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert not os.path.exists(daemon)
+
+
+def _score(output):
+    return re.search(r"ATS Match Score:\s*([\d.]+)%", output).group(1)
+
+
+def _write_inputs(directory):
+    resume = os.path.join(directory, "resume.txt")
+    jd = os.path.join(directory, "jd.txt")
+    with open(resume, "w", encoding="utf-8") as f:
+        f.write(RESUME_TEXT)
+    with open(jd, "w", encoding="utf-8") as f:
+        f.write(JD_TEXT)
+    return resume, jd
+
+
+def test_cli_daemon_matches_in_process(daemon, socket_dir, monkeypatch):
+    monkeypatch.setattr(matcher_module, "ConceptEmbedder", HashingEmbedder)
+    monkeypatch.setenv("RESUME_INTELLIGENCE_SOCKET", daemon)
+    resume, jd = _write_inputs(socket_dir)
+
+    runner = CliRunner()
+    warm = runner.invoke(cli_module.app, ["match", resume, jd, "--daemon"])
+    cold = runner.invoke(cli_module.app, ["match", resume, jd])
+
+    assert warm.exit_code == 0, warm.output
+    assert cold.exit_code == 0, cold.output
+    assert "warm daemon" in warm.output
+    assert _score(warm.output) == _score(cold.output)
+
+
+def test_cli_falls_back_and_starts_daemon(socket_dir, monkeypatch):
+    monkeypatch.setattr(matcher_module, "ConceptEmbedder", HashingEmbedder)
+    monkeypatch.setenv("RESUME_INTELLIGENCE_SOCKET", os.path.join(socket_dir, "none.sock"))
+    spawned = []
+    monkeypatch.setattr(cli_module, "spawn_daemon", lambda *a: spawned.append(a))
+    resume, jd = _write_inputs(socket_dir)
+
+    result = CliRunner().invoke(cli_module.app, ["match", resume, jd, "--daemon"])
+
+    assert result.exit_code == 0, result.output
+    assert "running in-process" in result.output
+    assert _score(result.output)
+    assert len(spawned) == 1
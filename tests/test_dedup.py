@@ -0,0 +1,86 @@
+from resume_intelligence.core.dedup import (
+    MinHasher,
+    NearDuplicateIndex,
+    estimated_jaccard,
+    run_deduplicated,
+)
+from resume_intelligence.core.document import Document
+from resume_intelligence.core.normalizer import normalize_document
+
+
+BASE = """
+Built scalable api integration services for mobile banking apps.
+Designed state management with redux and mobx across three products.
+Implemented unit testing and integration testing in ci cd pipelines.
+Reviewed code and mentored junior engineers on clean architecture.
+Deployed docker containers to kubernetes clusters on aws.
+"""
+
+EDITED = BASE.replace("three products", "four products")
+
+OTHER = """
+Painted watercolor landscapes for local galleries.
+Taught art history classes to high school students.
+Organized community exhibitions every spring.
+"""
+
+
+def _doc(text):
+    doc = Document(raw_text=text)
+    normalize_document(doc)
+    return doc
+
+
+def test_signatures_estimate_similarity():
+    hasher = MinHasher()
+
+    base = hasher.signature(_doc(BASE))
+    assert estimated_jaccard(base, hasher.signature(_doc(BASE))) == 1.0
+    assert estimated_jaccard(base, hasher.signature(_doc(EDITED))) > 0.8
+    assert estimated_jaccard(base, hasher.signature(_doc(OTHER))) < 0.2
+
+
+def test_near_duplicates_share_a_cluster():
+    index = NearDuplicateIndex()
+    index.add("a", _doc(BASE))
+    index.add("b", _doc(OTHER))
+    index.add("c", _doc(EDITED))
+
+    assert index.clusters() == [["a", "c"], ["b"]]
+    assert index.representative("c") == "a"
+
+
+def test_bridging_document_keeps_the_earliest_representative():
+    sentences = [
+        f"Worked on project {name} with a team of {n} engineers for clients."
+        for n, name in enumerate(["alpha", "beta", "gamma", "delta", "omega", "sigma"])
+    ]
+    first = "\n".join(sentences[:4])
+    second = "\n".join(sentences[2:])
+    bridge = "\n".join(sentences)  # near both, which are not near each other
+
+    for order in (["first", "second"], ["second", "first"]):
+        docs = {"first": first, "second": second}
+        index = NearDuplicateIndex(threshold=0.5)
+        for doc_id in order:
+            index.add(doc_id, _doc(docs[doc_id]))
+        assert len(index.clusters()) == 2
+
+        assert index.add("bridge", _doc(bridge)) == order[0]
+        assert index.clusters() == [order + ["bridge"]]
+
+
+def test_pipeline_runs_once_per_cluster():
+    calls = []
+
+    def pipeline(doc):
+        calls.append(doc)
+        return len(doc.sentences)
+
+    documents = {"a": _doc(BASE), "b": _doc(OTHER), "c": _doc(EDITED)}
+    results, report = run_deduplicated(documents, pipeline)
+
+    assert len(calls) == 2
+    assert results["c"] == results["a"]
+    assert report.reused == 1
+    assert report.cluster_sizes == {1: 1, 2: 1}
@@ -0,0 +1,129 @@
+import random
+
+import pytest
+
+from benchmarks.common import HashingEmbedder
+from resume_intelligence.core.exception import DocumentParseError
+from resume_intelligence.core.incremental import AnalysisSession, IncrementalDocument
+from resume_intelligence.core.matching.ats_score import compute_ats_score
+from resume_intelligence.core.matching.matcher import ConceptMatcher
+from resume_intelligence.core.pipeline import analyze_text
+from resume_intelligence.core.semantics.concept import ConceptSource
+
+
+JD_LINES = [
+    "We need api integration experience and state management skills.",
+    "Unit testing and docker deployment are a plus.",
+    "Experience with kubernetes cluster monitoring is required.",
+]
+
+POOL = [
+    "Built scalable api integration services with unit testing.",
+    "Implemented state management for flutter mobile apps.",
+    "Deployed docker containers to a kubernetes cluster.",
+    "Designed data pipeline architecture for machine learning.",
+    "Optimized database performance and query caching.",
+    "Reviewed backend microservices for security issues.",
+    "Automated deployment pipelines with monitoring alerts.",
+    "Led unit testing efforts across frontend modules.",
+]
+
+
+def _full(resume_text, jd_text):
+    jd = analyze_text(jd_text, ConceptSource.JD)
+    resume = analyze_text(resume_text, ConceptSource.RESUME)
+    results = ConceptMatcher(HashingEmbedder()).match(jd, resume)
+    return jd, resume, compute_ats_score(jd, results), results
+
+
+def test_random_edits_match_full_recompute():
+    rng = random.Random(7)
+    session = AnalysisSession(HashingEmbedder())
+    lines = POOL[:4]
+    jd_lines = list(JD_LINES)
+
+    for _ in range(40):
+        action = rng.choice(["insert", "delete", "replace", "move", "jd"])
+        if action == "insert":
+            lines.insert(rng.randrange(len(lines) + 1), rng.choice(POOL))
+        elif action == "delete" and len(lines) > 1:
+            lines.pop(rng.randrange(len(lines)))
+        elif action == "replace":
+            lines[rng.randrange(len(lines))] = rng.choice(POOL)
+        elif action == "move":
+            lines.insert(rng.randrange(len(lines)), lines.pop())
+        elif action == "jd":
+            jd_lines[rng.randrange(len(jd_lines))] = rng.choice(POOL + JD_LINES)
+
+        resume_text, jd_text = "\n".join(lines), "\n".join(jd_lines)
+        update = session.update(resume_text=resume_text, jd_text=jd_text)
+        jd, resume, ats, results = _full(resume_text, jd_text)
+
+        assert session.jd.concepts == jd
+        assert session.resume.concepts == resume
+        assert update.match_results == results
+        assert update.ats_score == ats
+
+
+def test_single_sentence_edit_reextracts_one_sentence():
+    session = AnalysisSession(HashingEmbedder())
+    session.update(resume_text="\n".join(POOL), jd_text="\n".join(JD_LINES))
+
+    edited = list(POOL)
+    edited[3] = "Designed data pipeline architecture for deep learning."
+    update = session.update(resume_text="\n".join(edited))
+
+    assert update.resume.changed_sentences == 2  # one removed, one inserted
+    assert update.resume.reextracted_sentences == 1
+    assert update.resume.rebuilt_concepts < len(session.resume.concepts)
+    assert update.jd.changed_sentences == 0
+
+
+def test_jd_edit_leaves_resume_untouched():
+    session = AnalysisSession(HashingEmbedder())
+    session.update(resume_text="\n".join(POOL), jd_text="\n".join(JD_LINES))
+
+    update = session.update(jd_text="\n".join([JD_LINES[0], JD_LINES[2]]))
+
+    assert update.resume.reextracted_sentences == 0
+    assert update.resume.rebuilt_concepts == 0
+    assert update.jd.reextracted_sentences == 0  # removal only
+    assert update.texts_embedded == 0  # every remaining vector is cached
+
+
+def test_unchanged_update_reuses_match():
+    embedder = HashingEmbedder()
+    session = AnalysisSession(embedder)
+    first = session.update(resume_text="\n".join(POOL), jd_text="\n".join(JD_LINES))
+    calls = embedder.calls
+
+    again = session.update(resume_text="\n".join(POOL), jd_text="\n".join(JD_LINES))
+
+    assert again.match_reused
+    assert again.texts_embedded == 0
+    assert embedder.calls == calls
+    assert again.match_results == first.match_results
+    assert again.ats_score == first.ats_score
+
+
+def test_reverted_sentence_is_reextracted():
+    doc = IncrementalDocument(ConceptSource.RESUME)
+    doc.update("\n".join(POOL[:3]))
+    doc.update("\n".join([POOL[0], POOL[2]]))
+    delta = doc.update("\n".join(POOL[:3]))
+
+    # The removed sentence was dropped from the cache, so it is re-read
+    assert delta.reextracted_sentences == 1
+    assert doc.concepts == analyze_text("\n".join(POOL[:3]), ConceptSource.RESUME)
+
+
+def test_missing_side_and_empty_text():
+    session = AnalysisSession(HashingEmbedder())
+    with pytest.raises(ValueError):
+        session.update(resume_text="\n".join(POOL))
+
+    with pytest.raises(DocumentParseError):
+        session.update(jd_text="")
+
+    with pytest.raises(ValueError):
+        session.update(jd_text="Yes.")
@@ -0,0 +1,159 @@
+import json
+import tracemalloc
+
+from benchmarks.common import HashingEmbedder
+from resume_intelligence.core import instrumentation
+from resume_intelligence.core.instrumentation import Recorder, profiling, stage
+from resume_intelligence.core.matching.ats_score import compute_ats_score
+from resume_intelligence.core.matching.embedder import CachedEmbedder
+from resume_intelligence.core.matching.matcher import ConceptMatcher
+from resume_intelligence.core.parser import parse_document
+from resume_intelligence.core.pipeline import analyze_text
+from resume_intelligence.core.semantics.concept import ConceptSource
+
+
+JD_TEXT = (
+    "We need api integration experience and state management skills. "
+    "Unit testing and docker deployment are a plus."
+)
+RESUME_TEXT = "Built scalable api integration services with unit testing."
+
+
+def _run_pipeline(tmp_path, embedder):
+    path = tmp_path / "resume.txt"
+    path.write_text(RESUME_TEXT)
+
+    resume = analyze_text(parse_document(str(path)), ConceptSource.RESUME)
+    jd = analyze_text(JD_TEXT, ConceptSource.JD)
+    results = ConceptMatcher(embedder).match(jd, resume)
+    return compute_ats_score(jd, results)
+
+
+def test_disabled_hooks_are_shared_noops():
+    assert instrumentation.current() is None
+    first, second = stage("parse"), stage("embed")
+    assert first is second
+
+    with first as s:
+        s.count(texts=3)
+    instrumentation.count("embed", cache_hits=1)
+
+
+def test_records_every_stage(tmp_path):
+    embedder = CachedEmbedder(HashingEmbedder())
+
+    with profiling() as recorder:
+        score = _run_pipeline(tmp_path, embedder)
+        _run_pipeline(tmp_path, embedder)
+
+    assert instrumentation.current() is None
+    assert score == _run_pipeline(tmp_path, CachedEmbedder(HashingEmbedder()))
+
+    stages = recorder.as_dict()
+    assert list(stages) == list(instrumentation.STAGES)
+    assert stages["parse"]["calls"] == 2
+    assert stages["normalize"]["calls"] == 4
+    assert stages["extract"]["items"]["sentences"] == 2 * (1 + 2)
+    assert stages["extract"]["items"]["ngrams"] >= stages["extract"]["items"]["concepts"]
+    assert stages["score"]["calls"] == 2
+
+    embed = stages["embed"]["items"]
+    assert embed["cache_hits"] + embed["cache_misses"] == embed["texts"]
+    # The second run is served entirely from the cache
+    assert embed["cache_misses"] * 2 <= embed["texts"]
+    assert all(s["wall_seconds"] >= 0 for s in stages.values())
+
+
+def test_failed_calls_are_recorded():
+    recorder = Recorder()
+    with profiling(recorder):
+        try:
+            with stage("parse"):
+                raise OSError("unreadable")
+        except OSError:
+            pass
+
+    assert recorder.stages["parse"].calls == 1
+
+
+def test_profiling_restores_previous_recorder():
+    outer = instrumentation.enable()
+    try:
+        with profiling() as inner:
+            with stage("score"):
+                pass
+        assert instrumentation.current() is outer
+        assert "score" in inner.stages
+        assert "score" not in outer.stages
+    finally:
+        instrumentation.disable()
+
+
+def test_prometheus_and_json_exports(tmp_path):
+    recorder = Recorder()
+    recorder.record("embed", 0.5, 0.25, {"texts": 10, "cache_hits": 4})
+    recorder.record("custom", 0.1, 0.1, {})
+
+    text = recorder.to_prometheus()
+    assert "# TYPE resume_intelligence_stage_calls_total counter" in text
+    assert 'resume_intelligence_stage_calls_total{stage="embed"} 1' in text
+    assert 'resume_intelligence_stage_wall_seconds_total{stage="embed"} 0.5' in text
+    assert 'resume_intelligence_stage_items_total{stage="embed",item="cache_hits"} 4' in text
+
+    recorder.write(str(tmp_path / "metrics.json"))
+    recorder.write(str(tmp_path / "metrics.prom"))
+
+    data = json.loads((tmp_path / "metrics.json").read_text())
+    assert list(data["stages"]) == ["embed", "custom"]
+    assert data["stages"]["embed"]["items"]["texts"] == 10
+    assert (tmp_path / "metrics.prom").read_text() == text
+
+
+def test_memory_mode_attributes_peak_retained_and_sites():
+    kept = []
+    recorder = Recorder(memory=True)
+    with profiling(recorder):
+        with stage("extract"):
+            with stage("embed"):
+                bytearray(4_000_000)  # freed before the stage returns
+            kept.append(bytearray(1_000_000))
+
+    assert not tracemalloc.is_tracing()
+
+    embed = recorder.stages["embed"].memory
+    assert embed.peak_bytes >= 3_500_000
+    assert embed.retained_bytes < 100_000
+
+    # The nested stage's peak counts towards its parent's
+    extract = recorder.stages["extract"].memory
+    assert extract.peak_bytes >= 3_500_000
+    assert extract.retained_bytes >= 900_000
+
+    top = recorder.top_sites(1)[0]
+    assert top["stage"] == "extract"
+    assert top["site"].endswith(f"test_instrumentation.py:{_line_of('kept.append')}")
+
+    data = json.loads(recorder.to_json())
+    assert data["stages"]["extract"]["memory"]["retained_bytes"] >= 900_000
+    assert "process_rss_peak_bytes" in data["memory"]
+
+    text = recorder.to_prometheus()
+    assert "# TYPE resume_intelligence_stage_peak_traced_bytes gauge" in text
+    assert 'resume_intelligence_stage_retained_bytes_total{stage="extract"}' in text
+
+
+def test_memory_sites_are_sampled():
+    recorder = Recorder(memory=True, site_calls=2)
+    with profiling(recorder):
+        for _ in range(5):
+            with stage("parse"):
+                pass
+
+    memory = recorder.stages["parse"].memory
+    assert recorder.stages["parse"].calls == 5
+    assert memory.sampled_calls == 2
+
+
+def _line_of(text):
+    with open(__file__, encoding="utf-8") as f:
+        return next(i for i, line in enumerate(f, 1) if text in line)
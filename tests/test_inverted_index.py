@@ -0,0 +1,110 @@
+import numpy as np
+
+from resume_intelligence.core.corpus.store import CorpusStore
+from resume_intelligence.core.retrieval.inverted import InvertedConceptIndex
+from resume_intelligence.core.semantics.concept import ConceptSource
+
+
+def _index():
+    index = InvertedConceptIndex()
+    index.add("alice", ["api integration", "testing", "state management"])
+    index.add("bob", ["api integration", "docker deployment"])
+    index.add("carol", ["watercolor painting", "testing"])
+    return index
+
+
+def test_postings_are_sorted_and_set_operations_work():
+    index = _index()
+
+    assert index.postings("testing").tolist() == [0, 2]
+    assert index.intersect(["api integration", "testing"]) == ["alice"]
+    assert index.union(["docker deployment", "watercolor painting"]) == [
+        "bob",
+        "carol",
+    ]
+    assert index.intersect(["unknown concept"]) == []
+
+
+def test_readding_a_candidate_replaces_its_terms():
+    index = _index()
+    index.add("alice", ["watercolor painting"])
+
+    assert index.union(["api integration"]) == ["bob"]
+    assert index.union(["watercolor painting"]) == ["carol", "alice"]
+    assert len(index) == 3
+
+    assert index.remove("bob")
+    assert index.union(["api integration"]) == []
+
+
+def test_tombstones_are_compacted(make_concept):
+    index = _index()
+    index.postings("testing")  # frozen before the churn
+    for _ in range(3):
+        index.add("alice", ["api integration", "testing"])
+
+    # The third re-add left three of five codes dead: compacted
+    assert index.candidate_ids == ["bob", "carol", "alice"]
+    assert index.postings("testing").tolist() == [1, 2]
+    assert index.union(["api integration", "watercolor painting"]) == [
+        "bob",
+        "carol",
+        "alice",
+    ]
+
+    index.remove("bob")
+    index.remove("carol")
+    assert index.candidate_ids == ["alice"]
+    jd = [make_concept("testing", ConceptSource.JD)]
+    assert [c for c, _ in index.preselect(jd)] == ["alice"]
+
+    index.add("dave", ["testing"])
+    assert index.intersect(["testing"]) == ["alice", "dave"]
+    assert index.union(["docker deployment", "watercolor painting"]) == []
+
+
+def test_preselect_weights_rare_concepts_higher(make_concept):
+    index = _index()
+    jd = [
+        make_concept("api integration", ConceptSource.JD),
+        make_concept("state management", ConceptSource.JD),
+    ]
+
+    ranked = index.preselect(jd)
+
+    assert [c for c, _ in ranked] == ["alice", "bob"]
+    assert index.preselect(jd, min_shared=2) == ranked[:1]
+
+
+def test_from_store_matches_stored_concepts(tmp_path, stub_embedder, make_concept):
+    with CorpusStore(str(tmp_path)) as store:
+        for resume_id, texts in {
+            "alice": ["api integration", "testing"],
+            "bob": ["docker deployment"],
+        }.items():
+            concepts = [make_concept(t) for t in texts]
+            store.add_resume(resume_id, concepts, stub_embedder.embed_texts(texts))
+
+        index = InvertedConceptIndex.from_store(store)
+
+    assert index.union(["testing", "docker deployment"]) == ["alice", "bob"]
+    assert np.array_equal(index.postings("api integration"), [0])
+
+
+def test_indexer_keeps_inverted_index_in_step(tmp_path, stub_embedder):
+    from resume_intelligence.core.corpus.indexer import CorpusIndexer
+
+    folder = tmp_path / "resumes"
+    folder.mkdir()
+    (folder / "a.txt").write_text("Built scalable api integration services.")
+
+    with CorpusStore(str(tmp_path / "store")) as store:
+        inverted = InvertedConceptIndex()
+        indexer = CorpusIndexer(store, stub_embedder, inverted=inverted)
+
+        indexer.index(str(folder))
+        assert inverted.union(["api integration"]) == ["a.txt"]
+
+        (folder / "a.txt").unlink()
+        indexer.index(str(folder))
+        assert len(inverted) == 0
@@ -0,0 +1,63 @@
+from resume_intelligence.core.matching.lexical import (
+    LexicalPrefilter,
+    cascade_report,
+)
+from resume_intelligence.core.matching.matcher import ConceptMatcher
+from resume_intelligence.core.semantics.concept import ConceptSource, ConceptType
+
+
+def test_exact_match_skips_the_model(stub_embedder, make_concept):
+    jd = [make_concept("api integration", ConceptSource.JD)]
+    resume = [make_concept("integration api", ConceptSource.RESUME)]
+
+    prefilter = LexicalPrefilter()
+    results = ConceptMatcher(stub_embedder, prefilter).match(jd, resume)
+
+    assert stub_embedder.calls == 0
+    assert results["matched"][0]["score"] == 1.0
+    assert results["matched"][0]["matched_resume_concept"] == "integration api"
+    assert prefilter.stats.counts["exact"] == 1
+
+
+def test_unrelated_concept_is_rejected_lexically(stub_embedder, make_concept):
+    jd = [make_concept("kubernetes cluster", ConceptSource.JD)]
+    resume = [make_concept("watercolor painting", ConceptSource.RESUME)]
+
+    prefilter = LexicalPrefilter()
+    results = ConceptMatcher(stub_embedder, prefilter).match(jd, resume)
+
+    assert stub_embedder.calls == 0
+    assert len(results["missing"]) == 1
+    assert prefilter.stats.counts["lexical"] == 1
+
+
+def test_ambiguous_concept_goes_to_neural(stub_embedder, make_concept):
+    jd = [make_concept("state management", ConceptSource.JD)]
+    resume = [make_concept("state machine design", ConceptSource.RESUME)]
+
+    prefilter = LexicalPrefilter()
+    ConceptMatcher(stub_embedder, prefilter).match(jd, resume)
+
+    assert stub_embedder.calls > 0
+    assert prefilter.stats.counts["neural"] == 1
+
+
+def test_cascade_report_fractions_sum_to_one(stub_embedder, make_concept):
+    jd = [
+        make_concept("api integration", ConceptSource.JD),
+        make_concept("state management", ConceptSource.JD),
+        make_concept("kubernetes cluster", ConceptSource.JD),
+        make_concept("ci cd pipeline", ConceptSource.JD, ConceptType.TOOL),
+    ]
+    resume = [
+        make_concept("api integration", ConceptSource.RESUME),
+        make_concept("state machine design", ConceptSource.RESUME),
+        make_concept("watercolor painting", ConceptSource.RESUME),
+    ]
+
+    report = cascade_report(jd, resume, stub_embedder)
+
+    assert abs(sum(report.stage_fractions.values()) - 1.0) < 1e-6
+    assert report.stage_fractions["empty"] == 0.25
+    assert 0.0 <= report.bucket_agreement <= 1.0
+    assert report.max_abs_deviation >= report.mean_abs_deviation
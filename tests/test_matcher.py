@@ -0,0 +1,69 @@
+import pytest
+
+from resume_intelligence.core.matching.matcher import (
+    ConceptMatcher,
+    match_from_graph,
+    supporting_concepts,
+)
+from resume_intelligence.core.semantics.concept import ConceptSource, ConceptType
+
+
+@pytest.fixture
+def jd(make_concept):
+    return [
+        make_concept("api integration", ConceptSource.JD),
+        make_concept("state management", ConceptSource.JD),
+        make_concept("ci cd pipeline", ConceptSource.JD, ConceptType.TOOL),
+        make_concept("watercolor painting", ConceptSource.JD),
+    ]
+
+
+@pytest.fixture
+def resume(make_concept):
+    return [
+        make_concept("api integration"),
+        make_concept("rest api integration"),
+        make_concept("state management redux"),
+        make_concept("ci cd pipeline", concept_type=ConceptType.SKILL),
+    ]
+
+
+def test_match_uses_type_compatibility(stub_embedder, jd, resume):
+    results = ConceptMatcher(stub_embedder).match(jd, resume)
+
+    missing = {r["jd_concept"]: r for r in results["missing"]}
+
+    # The only "ci cd pipeline" in the resume is a SKILL, and TOOL
+    # concepts may only match TOOL concepts.
+    assert missing["ci cd pipeline"]["matched_resume_concept"] is None
+    assert results["matched"][0]["matched_resume_concept"] == "api integration"
+
+
+def test_match_from_graph_agrees_with_dense_match(stub_embedder, jd, resume):
+    matcher = ConceptMatcher(stub_embedder)
+
+    dense = matcher.match(jd, resume)
+    graph = matcher.similarity_graph(jd, resume)
+    from_graph = match_from_graph(jd, resume, graph)
+
+    assert from_graph["matched"] == dense["matched"]
+    assert from_graph["partial"] == dense["partial"]
+    assert [r["jd_concept"] for r in from_graph["missing"]] == [
+        r["jd_concept"] for r in dense["missing"]
+    ]
+
+
+def test_supporting_concepts_lists_all_pairs_best_first(stub_embedder, jd, resume):
+    matcher = ConceptMatcher(stub_embedder)
+    graph = matcher.similarity_graph(jd, resume, threshold=0.5)
+
+    support = supporting_concepts(jd, resume, graph)
+
+    api = support["api integration"]
+    assert [s["resume_concept"] for s in api] == [
+        "api integration",
+        "rest api integration",
+    ]
+    assert api[0]["score"] >= api[1]["score"]
+    assert api[0]["sentences"] == ["worked on api integration"]
+    assert support["watercolor painting"] == []
@@ -0,0 +1,169 @@
+import threading
+
+import pytest
+
+from benchmarks.common import HashingEmbedder
+from resume_intelligence.core.batch import result_row
+from resume_intelligence.core.exception import DocumentParseError
+from resume_intelligence.core.matching.ats_score import compute_ats_score
+from resume_intelligence.core.matching.lexical import LexicalPrefilter
+from resume_intelligence.core.matching.matcher import ConceptMatcher
+from resume_intelligence.core.orchestrator import PIPELINE_STAGES, Pipeline
+from resume_intelligence.core.pipeline import analyze_file, analyze_text
+from resume_intelligence.core.semantics.concept import ConceptSource
+
+
+JD_TEXT = (
+    "We need api integration experience and state management skills. "
+    "Unit testing and docker deployment are a plus."
+)
+
+RESUMES = [
+    "Built scalable api integration services with unit testing.",
+    "Designed state management for mobile apps.",
+    "Painted watercolor landscapes for local galleries.",
+    "",
+    "Deployed docker containers and wrote unit testing suites.",
+]
+
+
+def _write_resumes(folder, copies=1):
+    folder.mkdir()
+    paths = []
+    for i in range(copies):
+        for j, text in enumerate(RESUMES):
+            path = folder / f"resume_{i:03d}_{j}.txt"
+            path.write_text(text, encoding="utf-8")
+            paths.append(str(path))
+    return paths
+
+
+def _jd():
+    return analyze_text(JD_TEXT, ConceptSource.JD)
+
+
+def _expected(paths, prefilter=None):
+    # Each resume matched on its own, the way the match command does it
+    matcher = ConceptMatcher(HashingEmbedder(), prefilter=prefilter)
+    rows = []
+    for path in paths:
+        try:
+            concepts = analyze_file(path, ConceptSource.RESUME)
+        except DocumentParseError as e:
+            rows.append(result_row(path, error=str(e)))
+            continue
+        results = matcher.match(_jd(), concepts)
+        rows.append(result_row(path, compute_ats_score(_jd(), results), results))
+    return rows
+
+
+def test_rows_match_single_pair_matching_in_input_order(tmp_path):
+    paths = _write_resumes(tmp_path / "resumes", copies=3)
+    expected = _expected(paths)
+    assert [row["error"] is not None for row in expected].count(True) == 3
+
+    with Pipeline(_jd(), HashingEmbedder(), parse_workers=0, analyze_workers=0,
+                  match_threads=2, batch_size=4, queue_size=2) as pipeline:
+        rows = list(pipeline.run(paths))
+        # A second run reuses the executors
+        again = list(pipeline.run(paths[:5]))
+
+    assert rows == expected
+    assert again == expected[:5]
+    assert pipeline.report.resumes == len(paths) + 5
+    assert pipeline.report.failed == 3 + 1
+    assert pipeline.report.stages["parse"].items == len(paths) + 5
+    # The empty resume fails in analyze and skips the later stages
+    assert pipeline.report.stages["match"].items == pipeline.report.resumes - 4
+
+
+def test_worker_processes(tmp_path):
+    paths = _write_resumes(tmp_path / "resumes")
+    with Pipeline(_jd(), HashingEmbedder(), parse_workers=1, analyze_workers=1) as pipeline:
+        assert list(pipeline.run(paths)) == _expected(paths)
+
+
+def test_one_model_call_per_batch(tmp_path):
+    paths = _write_resumes(tmp_path / "resumes", copies=2)
+    embedder = HashingEmbedder()
+
+    with Pipeline(_jd(), embedder, parse_workers=0, analyze_workers=0,
+                  batch_size=len(RESUMES), queue_size=1) as pipeline:
+        list(pipeline.run(paths))
+
+    # Batches are always batch_size resumes, however the stages race, so
+    # the second copy of the corpus is one batch of cached texts
+    assert embedder.calls == 1
+    assert pipeline.embedder.misses == embedder.texts_embedded
+    assert pipeline.report.stages["embed"].jobs == 2
+
+
+def test_cascade_matching(tmp_path):
+    paths = _write_resumes(tmp_path / "resumes")
+    prefilter = LexicalPrefilter()
+
+    with Pipeline(_jd(), HashingEmbedder(), parse_workers=0, analyze_workers=0,
+                  prefilter=prefilter) as pipeline:
+        rows = list(pipeline.run(paths))
+
+    assert rows == _expected(paths, LexicalPrefilter())
+    assert prefilter.stats.counts["exact"] > 0
+
+    with pytest.raises(ValueError):
+        Pipeline(_jd(), HashingEmbedder(), match_threads=2, prefilter=prefilter)
+
+
+def test_backpressure_bounds_resumes_in_flight(tmp_path):
+    paths = _write_resumes(tmp_path / "resumes", copies=20)
+    pulled = []
+
+    def source():
+        for path in paths:
+            pulled.append(path)
+            yield path
+
+    with Pipeline(_jd(), HashingEmbedder(), parse_workers=0, analyze_workers=0,
+                  batch_size=2, queue_size=2) as pipeline:
+        rows = pipeline.run(source())
+        next(rows)
+        # A consumer that stops taking rows stalls the whole pipeline
+        threading.Event().wait(0.3)
+        assert len(pulled) - 1 <= pipeline.max_in_flight < len(paths)
+        rows.close()
+
+    for stats in pipeline.report.stages.values():
+        assert stats.peak_queued <= 2
+
+
+def test_report_names_a_bottleneck(tmp_path):
+    paths = _write_resumes(tmp_path / "resumes", copies=2)
+
+    with Pipeline(_jd(), HashingEmbedder(), parse_workers=0, analyze_workers=0) as pipeline:
+        list(pipeline.run(paths))
+
+    report = pipeline.report.as_dict()
+    assert list(report["stages"]) == list(PIPELINE_STAGES)
+    assert report["bottleneck"] in PIPELINE_STAGES
+    for stats in report["stages"].values():
+        assert 0 <= stats["utilisation"] <= 1.05
+    assert report["stages"]["embed"]["jobs"] <= report["stages"]["analyze"]["jobs"]
+
+
+class _BrokenEmbedder(HashingEmbedder):
+    def embed_texts(self, texts):
+        raise RuntimeError("model crashed")
+
+
+def test_stage_failure_stops_the_run(tmp_path):
+    paths = _write_resumes(tmp_path / "resumes", copies=4)
+
+    with Pipeline(_jd(), _BrokenEmbedder(), parse_workers=0, analyze_workers=0) as pipeline:
+        with pytest.raises(RuntimeError, match="model crashed"):
+            list(pipeline.run(paths))
+
+    assert not [t for t in threading.enumerate() if t.name.startswith("ri-stage-")]
+
+
+def test_rejects_empty_jd():
+    with pytest.raises(ValueError):
+        Pipeline([], HashingEmbedder())
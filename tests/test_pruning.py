@@ -0,0 +1,129 @@
+import numpy as np
+import pytest
+
+from resume_intelligence.core.corpus.store import BOUNDS_NAME, CorpusStore
+from resume_intelligence.core.matching.ats_score import compute_ats_score
+from resume_intelligence.core.matching.matcher import _resolve
+from resume_intelligence.core.retrieval.pruning import (
+    CandidateBounds,
+    ats_upper_bounds,
+)
+from resume_intelligence.core.semantics.concept import ConceptSource, ConceptType
+
+
+@pytest.fixture
+def jd(jd_concepts, make_concept):
+    # Every bounded concept type, not only skills and tools
+    return jd_concepts + [
+        make_concept("cloud security", ConceptSource.JD, ConceptType.PRACTICE)
+    ]
+
+
+@pytest.fixture
+def fill(fill_store):
+    def fill(store, resumes=60):
+        return fill_store(store, resumes, mixed_types=True)
+
+    return fill
+
+
+def test_cell_bound_dominates_exact_similarity(stub_embedder, words, jd):
+    rng = np.random.default_rng(1)
+    vectors = np.array(stub_embedder.embed_texts(
+        [" ".join(rng.choice(words, size=3)) for _ in range(40)]
+    ), dtype=np.float32)
+    codebook = CandidateBounds.train_codebook(vectors, n_cells=6)
+    bounds = CandidateBounds.build(
+        codebook, vectors, np.full(8, 5), np.zeros(40, dtype=np.int64)
+    )
+
+    jd_vectors = np.array(
+        stub_embedder.embed_texts([c.text for c in jd]), dtype=np.float32
+    )
+    exact = (jd_vectors @ vectors.T).reshape(len(jd), 8, 5).max(axis=2)
+    skills = [c for c in jd if c.type == ConceptType.SKILL]
+
+    upper = bounds.similarity_bounds(skills, jd_vectors[:len(skills)])
+    assert np.all(upper >= exact[:len(skills)])
+
+
+def test_pruned_ranking_equals_exact_ranking(tmp_path, stub_embedder, fill, jd):
+    with CorpusStore(str(tmp_path)) as store:
+        fill(store)
+        jd_vectors = stub_embedder.embed_texts([c.text for c in jd])
+
+        for top_n in (1, 5, 20, 100):
+            exact = store.rank_candidates(jd, jd_vectors, top_n=top_n)
+            pruned, report = store.rank_candidates_pruned(
+                jd, jd_vectors, top_n=top_n
+            )
+
+            assert [(r.candidate_id, r.ats_score) for r in pruned] == [
+                (r.candidate_id, r.ats_score) for r in exact
+            ]
+            assert [r.match_results for r in pruned] == [
+                r.match_results for r in exact
+            ]
+            assert report.candidates == len(store)
+
+        _, report = store.rank_candidates_pruned(jd, jd_vectors, top_n=1)
+        assert report.pruned_fraction > 0
+
+
+def test_upper_bound_is_never_below_exact_score(tmp_path, stub_embedder, fill, jd):
+    with CorpusStore(str(tmp_path)) as store:
+        fill(store)
+        jd_vectors = stub_embedder.embed_texts([c.text for c in jd])
+
+        names, _, _, candidate_bounds = store.candidate_bounds()
+        bounds = ats_upper_bounds(
+            jd, candidate_bounds.similarity_bounds(jd, jd_vectors)
+        )
+        exact = store.rank_candidates(jd, jd_vectors, top_n=len(store))
+
+    by_name = dict(zip(names, bounds))
+    for entry in exact:
+        assert round(by_name[entry.candidate_id], 2) >= entry.ats_score
+
+
+@pytest.mark.parametrize("similarity", [0.7462, 0.9951])
+def test_upper_bound_covers_similarity_rounded_up(similarity, jd_concepts):
+    # The record keeps round(similarity, 2), above the raw similarity
+    jd = jd_concepts[:1]
+    bucket, record = _resolve(jd[0], similarity, "api integration")
+    match_results = {"matched": [], "partial": [], "missing": []}
+    match_results[bucket].append(record)
+
+    bound = ats_upper_bounds(jd, np.array([[similarity]]))[0]
+    assert round(bound, 2) >= compute_ats_score(jd, match_results) > 0
+
+
+def test_bounds_are_cached_and_rebuilt_after_writes(tmp_path, fill):
+    with CorpusStore(str(tmp_path)) as store:
+        fill(store, resumes=5)
+        assert len(store.candidate_bounds()[3]) == 5
+
+    assert (tmp_path / BOUNDS_NAME).exists()
+
+    with CorpusStore(str(tmp_path)) as store:
+        store.remove_resume("r000")
+        names, _, _, candidate_bounds = store.candidate_bounds()
+
+    assert "r000" not in names
+    assert len(candidate_bounds) == 4
+
+
+def test_truncated_bounds_file_is_rebuilt(tmp_path, fill):
+    path = tmp_path / BOUNDS_NAME
+    with CorpusStore(str(tmp_path)) as store:
+        fill(store, resumes=5)
+        store.candidate_bounds()
+
+    whole = path.read_bytes()
+    path.write_bytes(whole[:len(whole) // 2])  # a writer died mid-file
+
+    with CorpusStore(str(tmp_path)) as store:
+        assert len(store.candidate_bounds()[3]) == 5
+
+    assert path.read_bytes() == whole
+    assert [p.name for p in tmp_path.iterdir() if p.suffix == ".tmp"] == []
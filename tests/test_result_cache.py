@@ -0,0 +1,119 @@
+import time
+
+import pytest
+
+from resume_intelligence.app.service import ScoringService
+from resume_intelligence.core.matching import matcher
+from resume_intelligence.core.matching.result_cache import (
+    ResultCache,
+    content_digest,
+    file_digest,
+)
+from resume_intelligence.core.semantics.concept import ConceptType
+
+
+RESULTS = {
+    "matched": [{
+        "jd_concept": "api integration",
+        "jd_type": ConceptType.SKILL,
+        "score": 0.91,
+        "matched_resume_concept": "api integration",
+    }],
+    "partial": [],
+    "missing": [{
+        "jd_concept": "docker",
+        "jd_type": ConceptType.TOOL,
+        "score": 0.0,
+        "matched_resume_concept": None,
+    }],
+}
+
+
+def _key(cache, resume=b"resume", jd=b"jd", model="stub", **options):
+    return cache.key(content_digest(resume), content_digest(jd), model, **options)
+
+
+def test_round_trip_and_key_parts(tmp_path):
+    with ResultCache(str(tmp_path / "results.sqlite")) as cache:
+        key = _key(cache)
+        assert cache.get(key) is None
+
+        cache.put(key, 71.5, RESULTS)
+        cached = cache.get(key)
+        assert cached.ats_score == 71.5
+        assert cached.match_results == RESULTS
+
+        # Any change to documents, model or options is another entry
+        assert key != _key(cache, resume=b"resume v2")
+        assert key != _key(cache, jd=b"jd v2")
+        assert key != _key(cache, model="other")
+        assert key != _key(cache, cascade=True)
+        assert cache.as_dict()["hits"] == 1 and cache.as_dict()["misses"] == 1
+
+    # Persistent: another process (here, another instance) sees the entry
+    with ResultCache(str(tmp_path / "results.sqlite")) as cache:
+        assert cache.get(key).ats_score == 71.5
+
+
+def test_file_and_uploaded_bytes_share_a_digest(tmp_path):
+    path = tmp_path / "cv.PDF"
+    path.write_bytes(b"%PDF bytes")
+    assert file_digest(str(path)) == content_digest(b"%PDF bytes", ".pdf")
+    assert content_digest(b"%PDF bytes", ".pdf") != content_digest(b"%PDF bytes")
+
+
+def test_threshold_change_invalidates(tmp_path, monkeypatch):
+    path = str(tmp_path / "results.sqlite")
+    with ResultCache(path) as cache:
+        key = _key(cache)
+        cache.put(key, 50.0, RESULTS)
+
+    monkeypatch.setattr(matcher, "STRONG_MATCH_THRESHOLD", 0.8)
+    with ResultCache(path) as cache:
+        assert len(cache) == 0  # purged as scored under other thresholds
+        assert _key(cache) != key
+
+
+def test_ttl_and_size_eviction():
+    cache = ResultCache(ttl=0.05, max_entries=3)
+    keys = [_key(cache, resume=bytes([i])) for i in range(4)]
+    for key in keys[:3]:
+        cache.put(key, 1.0, RESULTS)
+    cache.get(keys[0])  # most recently read now
+
+    cache.put(keys[3], 1.0, RESULTS)
+    assert cache.get(keys[1]) is None  # least recently read went
+    assert cache.get(keys[0]) is not None
+
+    time.sleep(0.1)
+    assert cache.get(keys[0]) is None
+    assert cache.purge() == 2
+
+    small = ResultCache(max_bytes=1000, max_entries=None)
+    for i in range(20):
+        small.put(_key(small, resume=bytes([i])), 1.0, RESULTS)
+    assert 0 < small.as_dict()["bytes"] <= 1000
+    assert small.as_dict()["evictions"] == 20 - len(small)
+
+
+@pytest.mark.parametrize("cascade", [False, True])
+def test_service_answers_repeated_pairs_from_cache(stub_embedder, cascade):
+    service = ScoringService(stub_embedder, workers=0, result_cache=ResultCache())
+    body = {
+        "resume": {"text": "Built api integration services with unit testing."},
+        "jd": {"text": "We need api integration and docker deployment."},
+        "cascade": cascade,
+    }
+    try:
+        first = service.handle("POST", "/match", body)
+        second = service.handle("POST", "/match", body)
+
+        assert not first["cached"] and second["cached"]
+        assert second["ats_score"] == first["ats_score"]
+        assert second["match_results"] == first["match_results"]
+
+        edited = dict(body, jd={"text": "We need docker deployment only."})
+        assert not service.handle("POST", "/match", edited)["cached"]
+        assert service.health({}, None)["result_cache"]["hits"] == 1
+    finally:
+        service.close()
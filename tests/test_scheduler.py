@@ -0,0 +1,115 @@
+import threading
+import time
+
+import pytest
+
+from benchmarks.common import HashingEmbedder
+from resume_intelligence.app.service import RequestError, ScoringService
+from resume_intelligence.core.scheduler import BULK, INTERACTIVE, PriorityScheduler
+
+
+def _queue(scheduler, priority, order, hold=0.0):
+    def run():
+        with scheduler.slot(priority):
+            order.append(priority)
+            time.sleep(hold)
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    return thread
+
+
+def _wait_queued(scheduler, priority, n):
+    while scheduler.stats[priority].queued < n:
+        time.sleep(0.001)
+
+
+def test_interactive_overtakes_queued_bulk():
+    scheduler = PriorityScheduler()
+    order = []
+
+    scheduler.acquire(BULK)
+    threads = [_queue(scheduler, BULK, order)]
+    _wait_queued(scheduler, BULK, 1)
+    threads.append(_queue(scheduler, INTERACTIVE, order))
+    _wait_queued(scheduler, INTERACTIVE, 1)
+
+    # Bulk has had little model time yet, so the share rule stays out of it
+    scheduler.release(BULK, 0.0)
+    for thread in threads:
+        thread.join()
+
+    assert order == [INTERACTIVE, BULK]
+    stats = scheduler.as_dict()
+    assert stats[BULK]["peak_queued"] == 1
+    assert stats[INTERACTIVE]["granted"] == 1
+    assert stats[INTERACTIVE]["wait_p99_ms"] >= 0
+
+
+def test_bulk_keeps_its_minimum_share_under_interactive_load():
+    scheduler = PriorityScheduler(((INTERACTIVE, 0.0), (BULK, 0.3)), window=0.5)
+    stop = threading.Event()
+
+    def worker(priority):
+        while not stop.is_set():
+            with scheduler.slot(priority):
+                time.sleep(0.005)
+
+    threads = [threading.Thread(target=worker, args=(INTERACTIVE,)) for _ in range(3)]
+    threads.append(threading.Thread(target=worker, args=(BULK,)))
+    for thread in threads:
+        thread.start()
+    time.sleep(1.0)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    busy = {name: stats.busy_seconds for name, stats in scheduler.stats.items()}
+    assert 0.2 <= busy[BULK] / sum(busy.values()) <= 0.45
+
+
+def test_acquire_times_out_and_leaves_the_queue():
+    scheduler = PriorityScheduler()
+    scheduler.acquire(INTERACTIVE)
+
+    assert not scheduler.acquire(BULK, timeout=0.02)
+    assert scheduler.stats[BULK].queued == 0
+
+    with pytest.raises(TimeoutError):
+        with scheduler.slot(BULK, timeout=0.0):
+            pass
+
+    scheduler.release(INTERACTIVE, 0.01)
+    with scheduler.slot(BULK, timeout=0.1):
+        assert scheduler.stats[BULK].running == 1
+
+
+def test_rejects_bad_classes():
+    with pytest.raises(ValueError):
+        PriorityScheduler(((INTERACTIVE, 0.6), (BULK, 0.6)))
+    with pytest.raises(ValueError):
+        PriorityScheduler().acquire("urgent")
+
+
+def test_service_ranks_in_bulk_batches_and_reports_classes():
+    service = ScoringService(HashingEmbedder(), workers=0, rank_batch=2)
+    try:
+        jd = {"text": "We need api integration and unit testing skills."}
+        resumes = [
+            {"id": str(i), "text": f"Built api integration services {i} with unit testing."}
+            for i in range(5)
+        ]
+        ranked = service.handle("POST", "/rank", {"jd": jd, "resumes": resumes})["ranked"]
+        assert sorted(r["id"] for r in ranked) == [str(i) for i in range(5)]
+
+        service.handle("POST", "/match", {"resume": resumes[0], "jd": jd})
+        service.handle("POST", "/match", {"resume": resumes[0], "jd": jd, "priority": BULK})
+
+        stats = service.handle("GET", "/health", {})["scheduler"]
+        assert stats[BULK]["granted"] == 3 + 1
+        assert stats[INTERACTIVE]["granted"] == 1
+
+        with pytest.raises(RequestError):
+            service.handle("POST", "/match", {"resume": resumes[0], "jd": jd, "priority": "urgent"})
+    finally:
+        service.close()
@@ -0,0 +1,204 @@
+import base64
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+
+from resume_intelligence.app import service as service_module
+from resume_intelligence.app.service import (
+    RequestError,
+    ScoringService,
+    make_server,
+)
+from resume_intelligence.core.matching.ats_score import compute_ats_score
+from resume_intelligence.core.matching.matcher import ConceptMatcher
+from resume_intelligence.core.pipeline import analyze_text
+from resume_intelligence.core.semantics.concept import ConceptSource
+
+
+JD_TEXT = (
+    "We need api integration experience and state management skills. "
+    "Unit testing and docker deployment are a plus."
+)
+RESUME_TEXT = "Built scalable api integration services with unit testing."
+
+
+@pytest.fixture
+def server(stub_embedder):
+    service = ScoringService(stub_embedder, workers=0, max_concurrent=4)
+    httpd = make_server(service, port=0)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+
+    yield f"http://127.0.0.1:{httpd.server_address[1]}", service
+
+    httpd.shutdown()
+    httpd.server_close()
+    service.close()
+
+
+def _call(base, path, body=None):
+    data = json.dumps(body).encode("utf-8") if body is not None else None
+    request = urllib.request.Request(
+        base + path, data=data, method="POST" if data else "GET"
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=10) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def test_health(server):
+    base, _ = server
+    status, payload = _call(base, "/health")
+    assert status == 200
+    assert payload["status"] == "ok" and payload["model"] == "hashing-bow"
+
+
+def test_parse_uploaded_content(server, tmp_path):
+    base, _ = server
+    content = base64.b64encode(RESUME_TEXT.encode("utf-8")).decode("ascii")
+
+    status, payload = _call(
+        base, "/parse", {"document": {"content": content, "filename": "cv.txt"}}
+    )
+    assert status == 200 and payload["text"] == RESUME_TEXT
+
+
+def test_analyze_returns_concepts(server):
+    base, _ = server
+    status, payload = _call(
+        base, "/analyze", {"document": {"text": JD_TEXT}, "source": "jd"}
+    )
+
+    expected = analyze_text(JD_TEXT, ConceptSource.JD)
+    assert status == 200
+    assert [c["text"] for c in payload["concepts"]] == [c.text for c in expected]
+    assert payload["concepts"][0]["source"] == "jd"
+
+
+def test_match_agrees_with_in_process_matching(server, stub_embedder):
+    base, _ = server
+    status, payload = _call(
+        base, "/match", {"resume": {"text": RESUME_TEXT}, "jd": {"text": JD_TEXT}}
+    )
+
+    jd = analyze_text(JD_TEXT, ConceptSource.JD)
+    resume = analyze_text(RESUME_TEXT, ConceptSource.RESUME)
+    expected = compute_ats_score(jd, ConceptMatcher(stub_embedder).match(jd, resume))
+
+    assert status == 200
+    assert payload["ats_score"] == expected
+    assert set(payload["match_results"]) == {"matched", "partial", "missing"}
+
+
+def test_rank_orders_resumes(server):
+    base, _ = server
+    status, payload = _call(base, "/rank", {
+        "jd": {"text": JD_TEXT},
+        "resumes": [
+            {"id": "painter", "text": "Painted watercolor landscapes."},
+            {"id": "engineer", "text": RESUME_TEXT},
+        ],
+        "top": 1,
+    })
+
+    assert status == 200
+    assert [r["id"] for r in payload["ranked"]] == ["engineer"]
+
+
+def test_errors_map_to_status_codes(server):
+    base, service = server
+
+    assert _call(base, "/nope", {})[0] == 404
+    assert _call(base, "/match", {"resume": {"text": RESUME_TEXT}})[0] == 400
+    assert _call(base, "/parse", {"document": {"path": "/missing.txt"}})[0] == 400
+
+    jd = {"text": JD_TEXT}
+    assert _call(base, "/rank", {"jd": jd, "resumes": [1]})[0] == 400
+    for top in ("5", -1, 1.5):
+        body = {"jd": jd, "resumes": [{"text": RESUME_TEXT}], "top": top}
+        assert _call(base, "/rank", body)[0] == 400
+
+    # Every slot taken → 503
+    for _ in range(service.max_concurrent):
+        service._slots.acquire()
+    try:
+        assert _call(base, "/analyze", {"document": {"text": JD_TEXT}})[0] == 503
+    finally:
+        for _ in range(service.max_concurrent):
+            service._slots.release()
+
+
+def test_unexpected_errors_answer_500(server, monkeypatch):
+    base, service = server
+
+    def broken(*args):
+        raise RuntimeError("bug")
+
+    monkeypatch.setattr(service, "handle", broken)
+    status, payload = _call(base, "/health")
+    assert status == 500 and payload["error"] == "RuntimeError: bug"
+
+
+def test_path_documents_stay_under_the_document_root(stub_embedder, tmp_path):
+    root = tmp_path / "resumes"
+    root.mkdir()
+    (root / "cv.txt").write_text(RESUME_TEXT)
+    (tmp_path / "secret.txt").write_text("not a resume")
+    (root / "link.txt").symlink_to(tmp_path / "secret.txt")
+
+    closed = ScoringService(stub_embedder, workers=0)
+    service = ScoringService(stub_embedder, workers=0, document_root=str(root))
+    try:
+        with pytest.raises(RequestError) as info:
+            closed.handle("POST", "/parse", {"document": {"path": str(root / "cv.txt")}})
+        assert info.value.status == 400
+
+        parsed = service.handle("POST", "/parse", {"document": {"path": str(root / "cv.txt")}})
+        assert parsed["text"].strip() == RESUME_TEXT
+
+        for escape in (tmp_path / "secret.txt", root / ".." / "secret.txt", root / "link.txt"):
+            with pytest.raises(RequestError) as info:
+                service.handle("POST", "/match", {
+                    "resume": {"path": str(escape)},
+                    "jd": {"text": JD_TEXT},
+                })
+            assert info.value.status == 400
+    finally:
+        closed.close()
+        service.close()
+
+
+def test_slow_request_times_out(stub_embedder, monkeypatch):
+    def slow_analyze(document, source):
+        time.sleep(0.5)
+        return []
+
+    monkeypatch.setattr(service_module, "analyze_document", slow_analyze)
+    service = ScoringService(stub_embedder, workers=0, timeout=0.05)
+    try:
+        with pytest.raises(RequestError) as info:
+            service.handle("POST", "/match", {
+                "resume": {"text": RESUME_TEXT}, "jd": {"text": JD_TEXT},
+            })
+    finally:
+        service.close()
+
+    assert info.value.status == 504
+
+
+def test_process_pool_workers(stub_embedder):
+    service = ScoringService(stub_embedder, workers=2)
+    try:
+        payload = service.handle(
+            "POST", "/analyze", {"document": {"text": RESUME_TEXT}}
+        )
+    finally:
+        service.close()
+
+    assert payload["concepts"]
@@ -0,0 +1,119 @@
+import os
+import signal
+import threading
+
+import pytest
+
+from resume_intelligence.core.corpus.sharded import (
+    ShardedRanker,
+    partition_store,
+    shard_directories,
+    shard_for,
+)
+from resume_intelligence.core.corpus.store import CorpusStore
+from resume_intelligence.core.exception import CorpusStoreError
+
+
+@pytest.fixture
+def corpus(tmp_path, fill_store):
+    with CorpusStore(str(tmp_path / "full"), "stub") as store:
+        fill_store(store)
+        directories = partition_store(store, str(tmp_path / "shards"), 3)
+        yield store, directories
+
+
+def _ids(candidates):
+    return [(c.candidate_id, c.ats_score) for c in candidates]
+
+
+def test_partition_places_every_resume_in_its_shard(corpus, tmp_path):
+    store, directories = corpus
+    assert shard_directories(str(tmp_path / "shards")) == directories
+
+    seen = []
+    for shard, directory in enumerate(directories):
+        with CorpusStore(directory) as part:
+            assert part.model_name == "stub"
+            for resume_id in part.resume_ids():
+                assert shard_for(resume_id, 3) == shard
+                assert part.load_concepts(resume_id) == store.load_concepts(resume_id)
+            seen.extend(part.resume_ids())
+    assert sorted(seen) == store.resume_ids()
+
+    with pytest.raises(CorpusStoreError):
+        partition_store(store, str(tmp_path / "shards"), 2)  # not empty
+
+
+def test_merged_ranking_equals_single_store(corpus, jd_concepts, jd_vectors):
+    store, directories = corpus
+
+    with ShardedRanker(directories) as ranker:
+        for top_n in (1, 5, 30):
+            ranking = ranker.rank(jd_concepts, jd_vectors, top_n=top_n)
+            expected = store.rank_candidates(jd_concepts, jd_vectors, top_n=top_n)
+
+            assert ranking.complete
+            assert ranking.resumes == len(store)
+            assert _ids(ranking.candidates) == _ids(expected)
+            assert ranking.candidates == expected
+
+
+def test_failed_shard_gives_partial_results_then_restarts(corpus, jd_concepts, jd_vectors):
+    store, directories = corpus
+
+    with ShardedRanker(directories) as ranker:
+        ranker.rank(jd_concepts, jd_vectors)
+        pid = ranker.shard_pids()[1]
+
+        # Shard 1 dies while the query waits on it
+        os.kill(pid, signal.SIGSTOP)
+        threading.Timer(0.2, os.kill, (pid, signal.SIGKILL)).start()
+        ranking = ranker.rank(jd_concepts, jd_vectors, top_n=30)
+        assert list(ranking.missing) == [1]
+        assert ranking.missing[1].startswith("failed")
+
+        others = [r for r in store.resume_ids() if shard_for(r, 3) != 1]
+        expected = store.rank_candidates(jd_concepts, jd_vectors, 30, resume_ids=others)
+        assert _ids(ranking.candidates) == _ids(expected)
+
+        ranking = ranker.rank(jd_concepts, jd_vectors, top_n=30)
+        assert ranking.complete
+        assert ranker.restarts == 1
+        assert ranker.shard_pids()[1] != pid
+
+
+def test_stalled_shard_times_out_then_recovers(corpus, jd_concepts, jd_vectors):
+    store, directories = corpus
+
+    with ShardedRanker(directories, timeout=0.5) as ranker:
+        ranker.rank(jd_concepts, jd_vectors)
+        pid = ranker.shard_pids()[2]
+        os.kill(pid, signal.SIGSTOP)
+        try:
+            ranking = ranker.rank(jd_concepts, jd_vectors, top_n=30)
+            assert ranking.missing == {2: "timeout"}
+            assert ranking.candidates
+
+            # Its earlier query is still outstanding
+            assert ranker.rank(jd_concepts, jd_vectors).missing == {2: "busy"}
+        finally:
+            os.kill(pid, signal.SIGCONT)
+
+        ranker._pending[2].result(timeout=10)
+        ranking = ranker.rank(jd_concepts, jd_vectors, top_n=30, timeout=10)
+        assert ranking.complete
+        assert ranking.candidates == store.rank_candidates(jd_concepts, jd_vectors, 30)
+
+
+def test_shard_sees_writes_from_another_connection(corpus, jd_concepts, jd_vectors):
+    store, directories = corpus
+
+    with ShardedRanker(directories) as ranker:
+        best = ranker.rank(jd_concepts, jd_vectors, top_n=1).candidates[0].candidate_id
+        with CorpusStore(directories[shard_for(best, 3)]) as shard:
+            shard.remove_resume(best)
+        store.remove_resume(best)
+
+        ranking = ranker.rank(jd_concepts, jd_vectors, top_n=30)
+        assert best not in [c.candidate_id for c in ranking.candidates]
+        assert ranking.candidates == store.rank_candidates(jd_concepts, jd_vectors, 30)
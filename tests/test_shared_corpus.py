@@ -0,0 +1,83 @@
+import gc
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+import pytest
+
+from resume_intelligence.core.corpus import shared
+from resume_intelligence.core.corpus.shared import SharedCorpus, SharedRanker
+from resume_intelligence.core.corpus.store import CorpusStore
+
+
+def _gone(name):
+    try:
+        SharedMemory(name=name).close()
+    except FileNotFoundError:
+        return True
+    return False
+
+
+def test_ranking_equals_single_process_scan(tmp_path, fill_store, jd_concepts, jd_vectors):
+    with CorpusStore(str(tmp_path)) as store:
+        fill_store(store, resumes=12)
+        store.remove_resume("r003")  # leaves dead rows behind
+
+        with SharedRanker(store, workers=2, block_rows=8) as ranker:
+            hits = ranker.candidate_hits(jd_concepts, jd_vectors)
+            ranked = ranker.rank_candidates(jd_concepts, jd_vectors, top_n=20)
+            assert len(ranker._ranges(store.rows)) == 2
+            assert 1 <= len(ranker.worker_pids()) <= 2
+            assert os.getpid() not in ranker.worker_pids()
+
+        expected = store.candidate_hits(jd_concepts, jd_vectors, block_rows=8)
+        assert hits.keys() == expected.keys()
+        for resume_id, entry in expected.items():
+            np.testing.assert_array_equal(hits[resume_id].scores, entry.scores)
+            np.testing.assert_array_equal(hits[resume_id].rows, entry.rows)
+
+        assert ranked == store.rank_candidates(jd_concepts, jd_vectors, top_n=20)
+
+
+def test_store_writes_republish_the_snapshot(tmp_path, fill_store, jd_concepts, jd_vectors):
+    with CorpusStore(str(tmp_path)) as store:
+        fill_store(store, resumes=4)
+
+        with SharedRanker(store, workers=1) as ranker:
+            ranker.rank_candidates(jd_concepts, jd_vectors)
+            first = ranker.shared.handle.embeddings.name
+
+            fill_store(store, resumes=6, seed=1)
+            ranked = ranker.rank_candidates(jd_concepts, jd_vectors, top_n=20)
+
+            assert ranker.shared.handle.embeddings.name != first
+            assert _gone(first)
+            assert ranked == store.rank_candidates(jd_concepts, jd_vectors, top_n=20)
+
+
+def test_attach_is_read_only_and_owner_unlinks(tmp_path, fill_store):
+    with CorpusStore(str(tmp_path)) as store:
+        fill_store(store, resumes=3)
+        owner = SharedCorpus.publish(store)
+
+    names = [getattr(owner.handle, a).name for a in shared._ARRAYS]
+
+    # Workers exiting must not take the blocks with them
+    pids = multiprocessing.SimpleQueue()
+    with ProcessPoolExecutor(1, initializer=shared._init_worker,
+                             initargs=(owner.handle, pids)) as pool:
+        assert pool.submit(os.getpid).result() == pids.get()
+
+    attached = SharedCorpus.attach(owner.handle)
+    np.testing.assert_array_equal(attached.embeddings, owner.embeddings)
+    with pytest.raises(ValueError):
+        attached.embeddings[0, 0] = 1.0
+    attached.close()
+    assert not any(_gone(name) for name in names)
+
+    # Dropping the owner without close() still unlinks
+    del owner
+    gc.collect()
+    assert all(_gone(name) for name in names)
@@ -0,0 +1,77 @@
+import numpy as np
+
+from resume_intelligence.core.matching.similarity import (
+    similarity_matrix,
+    sparse_similarity,
+    top_k_similarity,
+)
+
+
+def _unit_vectors(n, dim, seed):
+    rng = np.random.default_rng(seed)
+    vectors = rng.normal(size=(n, dim))
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def test_top_1_matches_dense_argmax_across_blocks():
+    jd = _unit_vectors(7, 16, seed=0)
+    resume = _unit_vectors(53, 16, seed=1)
+
+    indices, scores = top_k_similarity(jd, resume, k=1, block_rows=3, block_cols=10)
+    dense = similarity_matrix(jd.tolist(), resume.tolist())
+
+    assert np.array_equal(indices[:, 0], np.argmax(dense, axis=1))
+    assert np.allclose(scores[:, 0], dense.max(axis=1), atol=1e-5)
+
+
+def test_top_k_matches_dense_sort():
+    jd = _unit_vectors(5, 8, seed=2)
+    resume = _unit_vectors(40, 8, seed=3)
+
+    indices, scores = top_k_similarity(jd, resume, k=4, block_rows=2, block_cols=7)
+    dense = similarity_matrix(jd.tolist(), resume.tolist())
+    expected = np.argsort(-dense, axis=1)[:, :4]
+
+    assert np.array_equal(indices, expected)
+    assert np.all(np.diff(scores, axis=1) <= 0)
+
+
+def test_type_mask_and_threshold():
+    jd = [[1.0, 0.0], [0.0, 1.0]]
+    resume = [[1.0, 0.0], [0.6, 0.8], [0.0, 1.0]]
+
+    indices, scores = top_k_similarity(
+        jd,
+        resume,
+        k=2,
+        jd_types=["a", "b"],
+        resume_types=["b", "a", "a"],
+        compatibility={"a": {"a"}, "b": {"b"}},
+        threshold=0.5,
+    )
+
+    # Row 0 may only see columns 1 and 2; column 2 scores 0.0 < threshold.
+    assert indices[0].tolist() == [1, -1]
+    assert np.isneginf(scores[0, 1])
+
+    # Row 1 may only see column 0, which scores 0.0.
+    assert indices[1].tolist() == [-1, -1]
+
+
+def test_k_larger_than_columns_pads():
+    indices, scores = top_k_similarity([[1.0, 0.0]], [[1.0, 0.0]], k=3)
+
+    assert indices[0].tolist() == [0, -1, -1]
+    assert scores[0, 0] == 1.0
+
+
+def test_sparse_similarity_keeps_only_pairs_above_threshold():
+    jd = _unit_vectors(6, 8, seed=4)
+    resume = _unit_vectors(30, 8, seed=5)
+
+    graph = sparse_similarity(jd, resume, threshold=0.3, block_rows=4, block_cols=7)
+    dense = similarity_matrix(jd.tolist(), resume.tolist())
+
+    assert graph.shape == (6, 30)
+    assert graph.nnz == int(np.sum(dense >= 0.3))
+    assert np.allclose(graph.toarray()[dense >= 0.3], dense[dense >= 0.3], atol=1e-5)